@@ -0,0 +1,29 @@
+"""add exercise_count to lifts
+
+Revision ID: 3c7e2a9f41b8
+Revises: bd552ba841fd
+Create Date: 2026-10-16 00:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3c7e2a9f41b8"
+down_revision: Union[str, Sequence[str], None] = "bd552ba841fd"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("ALTER TABLE lifts ADD COLUMN exercise_count INT")
+    op.execute("UPDATE lifts SET exercise_count = jsonb_array_length(exercises)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER TABLE lifts DROP COLUMN IF EXISTS exercise_count")
@@ -0,0 +1,34 @@
+"""index lifts on (start_time DESC, id DESC) for keyset pagination
+
+Revision ID: 5d2e8f1a9c37
+Revises: 3c7e2a9f41b8
+Create Date: 2026-10-16 00:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5d2e8f1a9c37"
+down_revision: Union[str, Sequence[str], None] = "3c7e2a9f41b8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Matches the /lifts sort order, so a page after a cursor is an index seek.
+    # It also serves start_time range filters, replacing idx_lifts_start_time.
+    op.execute(
+        "CREATE INDEX idx_lifts_start_time_id ON lifts (start_time DESC, id DESC)"
+    )
+    op.execute("DROP INDEX IF EXISTS idx_lifts_start_time")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("CREATE INDEX idx_lifts_start_time ON lifts (start_time)")
+    op.execute("DROP INDEX IF EXISTS idx_lifts_start_time_id")
@@ -0,0 +1,76 @@
+from collections import defaultdict
+from datetime import date
+from typing import NamedTuple
+
+from fitness.models import Run, DayTrainingLoad, Sex
+from fitness.agg.training_load import hrtss_scorer, _daily_training_load
+from fitness.utils.timezone import localize_activities
+
+
+class DashboardSnapshot(NamedTuple):
+    """Per-local-day totals and training load built from one pass over runs."""
+
+    mileage_by_day: dict[date, float]
+    seconds_by_day: dict[date, float]
+    training_load: list[DayTrainingLoad]
+
+    def mileage_between(self, start: date, end: date) -> float:
+        """Total mileage for local dates in [start, end]."""
+        return sum(m for day, m in self.mileage_by_day.items() if start <= day <= end)
+
+    def seconds_between(self, start: date, end: date) -> float:
+        """Total seconds for local dates in [start, end]."""
+        return sum(s for day, s in self.seconds_by_day.items() if start <= day <= end)
+
+
+def aggregate_all(
+    runs: list[Run],
+    load_start: date,
+    load_end: date,
+    max_hr: float,
+    resting_hr: float,
+    lthr: float,
+    sex: Sex,
+    user_timezone: str | None = None,
+) -> DashboardSnapshot:
+    """
+    Compute daily mileage, daily seconds, and training load in a single pass.
+
+    Equivalent to calling total_mileage, total_seconds, and training_stress_balance
+    separately, but converts runs to the user's timezone once and walks them once,
+    rather than once per metric (and once per date range).
+
+    Args:
+        runs: List of runs (with UTC dates)
+        load_start: Start date of the training load series, in user's timezone
+        load_end: End date of the training load series, in user's timezone
+        max_hr: Maximum heart rate
+        resting_hr: Resting heart rate
+        lthr: Lactate threshold heart rate
+        sex: Sex ("M" or "F")
+        user_timezone: User's timezone (e.g., "America/Chicago"). If None, uses UTC dates.
+    """
+    mileage_by_day: dict[date, float] = defaultdict(float)
+    seconds_by_day: dict[date, float] = defaultdict(float)
+    hrtss_by_local_date: dict[date, float] = defaultdict(float)
+    first_hr_date: date | None = None
+    score = hrtss_scorer(max_hr, resting_hr, lthr, sex)
+
+    for run in localize_activities(runs, user_timezone):
+        day = run.local_date
+        mileage_by_day[day] += run.distance
+        seconds_by_day[day] += run.duration
+        if run.avg_heart_rate is None:
+            continue
+        if first_hr_date is None or day < first_hr_date:
+            first_hr_date = day
+        if day <= load_end:
+            hrtss_by_local_date[day] += score(run)
+
+    return DashboardSnapshot(
+        mileage_by_day=dict(mileage_by_day),
+        seconds_by_day=dict(seconds_by_day),
+        training_load=_daily_training_load(
+            hrtss_by_local_date, first_hr_date, load_start, load_end
+        ),
+    )
@@ -1,15 +1,18 @@
-from collections import deque
 from datetime import timedelta, date
 from typing import Literal
 
 from fitness.models import Run
 from fitness.utils.timezone import (
     filter_runs_by_local_date_range,
-    convert_runs_to_user_timezone,
+    localize_activities,
 )
 
 WeekStart = Literal["monday", "sunday"]
 
+# rolling_sum keeps its window in integer units of 1/10,000 mile (~1.6 cm) so
+# adding and evicting days is exact; results are reported to 4 decimal places.
+MILE_UNITS = 10_000
+
 
 def week_anchor(day: date, week_start: WeekStart = "monday") -> date:
     """
@@ -25,7 +28,11 @@ def week_anchor(day: date, week_start: WeekStart = "monday") -> date:
 
 
 def total_mileage(
-    runs: list[Run], start: date, end: date, user_timezone: str | None = None
+    runs: list[Run],
+    start: date,
+    end: date,
+    user_timezone: str | None = None,
+    presorted: bool = False,
 ) -> float:
     """
     Calculate the total mileage for a list of runs.
@@ -35,9 +42,21 @@ def total_mileage(
         start: Start date in user's timezone
         end: End date in user's timezone
         user_timezone: User's timezone (e.g., "America/Chicago"). If None, uses UTC dates.
+        presorted: Whether `runs` is ordered by `datetime_utc`, which lets the range
+            be binary-searched instead of scanning every run.
     """
-    filtered_runs = filter_runs_by_local_date_range(runs, start, end, user_timezone)
-    return sum(run.distance for run in filtered_runs)
+    if presorted:
+        return sum(
+            run.distance
+            for run in filter_runs_by_local_date_range(
+                runs, start, end, user_timezone, presorted=True
+            )
+        )
+    return sum(
+        run.distance
+        for run in localize_activities(runs, user_timezone)
+        if start <= run.local_date <= end
+    )
 
 
 def avg_miles_per_day(
@@ -96,7 +115,7 @@ def miles_by_week(
         week_start: Which day weeks begin on ("monday" or "sunday").
         user_timezone: User's timezone (e.g., "America/Chicago"). If None, uses UTC dates.
     """
-    user_tz_runs = convert_runs_to_user_timezone(runs, user_timezone)
+    user_tz_runs = localize_activities(runs, user_timezone)
 
     first_week = week_anchor(start, week_start)
     last_week = week_anchor(end, week_start)
@@ -112,7 +131,7 @@ def miles_by_week(
         if anchor in miles_per_week:
             miles_per_week[anchor] += localized_run.distance
 
-    # Round to dodge floating-point accumulation errors, as in rolling_sum.
+    # Round to dodge floating-point accumulation errors in the weekly sums.
     return [(week, round(miles, 4)) for week, miles in sorted(miles_per_week.items())]
 
 
@@ -133,46 +152,55 @@ def rolling_sum(
         runs: List of runs (with UTC dates)
         start: Start date in user's timezone
         end: End date in user's timezone
-        window: Number of days to include in rolling window
+        window: Number of days to include in rolling window (>= 1)
         user_timezone: User's timezone (e.g., "America/Chicago"). If None, uses UTC dates.
     """
+    if window < 1:
+        raise ValueError(f"window must be at least 1, got {window}")
+
     # 1. Convert runs to user timezone if specified
-    user_tz_runs = convert_runs_to_user_timezone(runs, user_timezone)
+    user_tz_runs = localize_activities(runs, user_timezone)
 
-    # 2. Bucket runs into miles-per-day using local dates
+    # 2. Bucket runs into miles-per-day using local dates, then convert each
+    #    day's total to integer mile units for exact window arithmetic
     miles_per_day: dict[date, float] = {}
     for localized_run in user_tz_runs:
         miles_per_day.setdefault(localized_run.local_date, 0.0)
         miles_per_day[localized_run.local_date] += localized_run.distance
+    units_per_day = {
+        day: round(miles * MILE_UNITS) for day, miles in miles_per_day.items()
+    }
 
     # 2. Determine the first day we need to consider
     #    (so that runs up to `window-1` days before `start` are counted)
     initial_date = start - timedelta(days=window - 1)
 
-    result: list[tuple[date, float]] = []
-    window_deque: deque[tuple[date, float]] = deque()
-    window_sum = 0.0
+    # Preallocate one slot per output day rather than growing the list per day.
+    # Day `offset` of the walk below lands at index offset - (window - 1), so
+    # the output starts exactly at `start`.
+    result: list[tuple[date, float]] = [(start, 0.0)] * ((end - start).days + 1)
+    # Ring buffer of the last `window` days' miles. Each day overwrites the slot
+    # of the day that just fell out of the window, so eviction is O(1) and needs
+    # no date comparisons.
+    window_buf = [0] * window
+    window_units = 0
 
     # 3. Walk each day from initial_date up through `end`
     total_days = (end - initial_date).days + 1
     for offset in range(total_days):
         today = initial_date + timedelta(days=offset)
-        today_miles = miles_per_day.get(today, 0.0)
-
-        # add today's miles into the window
-        window_deque.append((today, today_miles))
-        window_sum += today_miles
+        today_units = units_per_day.get(today, 0)
 
-        # evict anything older than `window` days
-        cutoff = today - timedelta(days=window - 1)
-        while window_deque and window_deque[0][0] < cutoff:
-            old_date, old_miles = window_deque.popleft()
-            window_sum -= old_miles
+        # swap today's miles in for the day leaving the window
+        slot = offset % window
+        window_units += today_units - window_buf[slot]
+        window_buf[slot] = today_units
 
         # only start recording once we're at or past the user’s `start` date
-        if today >= start:
-            # It's important to round because otherwise we can get floating point
-            # errors that cause the sum to be off by miniscule amounts.
-            result.append((today, round(window_sum, 4)))
+        out_idx = offset - (window - 1)
+        if out_idx >= 0:
+            # Integer arithmetic means there's no floating-point drift to round
+            # away, however long the range.
+            result[out_idx] = (today, window_units / MILE_UNITS)
 
     return result
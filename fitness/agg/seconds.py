@@ -1,10 +1,17 @@
 from datetime import date
 from fitness.models import Run
-from fitness.utils.timezone import filter_runs_by_local_date_range
+from fitness.utils.timezone import (
+    filter_runs_by_local_date_range,
+    localize_activities,
+)
 
 
 def total_seconds(
-    runs: list[Run], start: date, end: date, user_timezone: str | None = None
+    runs: list[Run],
+    start: date,
+    end: date,
+    user_timezone: str | None = None,
+    presorted: bool = False,
 ) -> float:
     """
     Calculate the total seconds for a list of runs.
@@ -14,6 +21,18 @@ def total_seconds(
         start: Start date in user's timezone
         end: End date in user's timezone
         user_timezone: User's timezone (e.g., "America/Chicago"). If None, uses UTC dates.
+        presorted: Whether `runs` is ordered by `datetime_utc`, which lets the range
+            be binary-searched instead of scanning every run.
     """
-    filtered_runs = filter_runs_by_local_date_range(runs, start, end, user_timezone)
-    return sum(run.duration for run in filtered_runs)
+    if presorted:
+        return sum(
+            run.duration
+            for run in filter_runs_by_local_date_range(
+                runs, start, end, user_timezone, presorted=True
+            )
+        )
+    return sum(
+        run.duration
+        for run in localize_activities(runs, user_timezone)
+        if start <= run.local_date <= end
+    )
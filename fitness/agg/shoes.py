@@ -18,24 +18,20 @@ def mileage_by_shoes(
     Returns:
         List of ShoeMileage objects containing shoe and mileage data
     """
-    # Create lookup dict for shoes by ID
-    shoe_id_lookup = {shoe.id: shoe for shoe in shoes}
+    # Lookup of only the shoes we're reporting on, so retirement is checked
+    # once per shoe rather than once per run.
+    shoe_id_lookup = {
+        shoe.id: shoe for shoe in shoes if include_retired or not shoe.is_retired
+    }
+    if not shoe_id_lookup:
+        return []
 
     # Track mileage by shoe ID
     mileage_by_id: dict[str, float] = {}
 
     for run in runs:
-        if run.shoe_id is None:
+        if run.shoe_id is None or run.shoe_id not in shoe_id_lookup:
             continue
-
-        shoe = shoe_id_lookup.get(run.shoe_id)
-        if not shoe:
-            continue
-
-        # Skip retired shoes if not including them
-        if not include_retired and shoe.is_retired:
-            continue
-
         mileage_by_id[run.shoe_id] = mileage_by_id.get(run.shoe_id, 0.0) + run.distance
 
     # Convert to list of ShoeMileage objects
@@ -1,11 +1,13 @@
 from datetime import date, timedelta
 import math
 from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
+from functools import lru_cache
+from itertools import accumulate, islice
 from typing import NamedTuple
 
 from fitness.models import Run, Ride, DayTrainingLoad, TrainingLoad, Sex
-from fitness.utils.timezone import convert_activities_to_user_timezone
+from fitness.utils.timezone import LocalActivity, localize_activities
 
 
 class DayHrtss(NamedTuple):
@@ -24,6 +26,12 @@ CTL_LOOKBACK = 42
 # bounded as total history grows.
 CONVERGENCE_WARMUP_DAYS = 730
 
+# Banister's sex-based weighting factor Y = a * e^(b x HR_Relative), as (a, b).
+TRIMP_WEIGHTS: dict[Sex, tuple[float, float]] = {
+    "M": (0.64, 1.92),
+    "F": (0.86, 1.67),
+}
+
 
 def trimp(activity: Run | Ride, max_hr: float, resting_hr: float, sex: Sex) -> float:
     """
@@ -40,15 +48,24 @@ def trimp(activity: Run | Ride, max_hr: float, resting_hr: float, sex: Sex) -> f
         raise ValueError(
             "Activity must have an average heart rate to calculate TRIMP."
         )
-    hr_relative = (activity.avg_heart_rate - resting_hr) / (max_hr - resting_hr)
+    return _banister_trimp(
+        activity.avg_heart_rate, activity.duration, max_hr, resting_hr, sex
+    )
+
+
+# Keyed on the inputs rather than the activity ID, so an edited activity never
+# reads a stale score. The dashboard re-scores the same history on every load,
+# so the warm path is a dict hit instead of an exp() per activity.
+@lru_cache(maxsize=65536)
+def _banister_trimp(
+    avg_hr: float, duration: float, max_hr: float, resting_hr: float, sex: Sex
+) -> float:
+    hr_relative = (avg_hr - resting_hr) / (max_hr - resting_hr)
     # Clamp hr_relative to the range [0, 1]
     hr_relative = max(0.0, min(1.0, hr_relative))
-    match sex:
-        case "M":
-            y = 0.64 * math.exp(1.92 * hr_relative)
-        case "F":
-            y = 0.86 * math.exp(1.67 * hr_relative)
-    duration_minutes = activity.duration / 60
+    a, b = TRIMP_WEIGHTS[sex]
+    y = a * math.exp(b * hr_relative)
+    duration_minutes = duration / 60
     return duration_minutes * hr_relative * y
 
 
@@ -59,11 +76,8 @@ def threshold_trimp(max_hr: float, resting_hr: float, lthr: float, sex: Sex) ->
     """
     hr_relative = (lthr - resting_hr) / (max_hr - resting_hr)
     hr_relative = max(0.0, min(1.0, hr_relative))
-    match sex:
-        case "M":
-            y = 0.64 * math.exp(1.92 * hr_relative)
-        case "F":
-            y = 0.86 * math.exp(1.67 * hr_relative)
+    a, b = TRIMP_WEIGHTS[sex]
+    y = a * math.exp(b * hr_relative)
     return 60.0 * hr_relative * y
 
 
@@ -83,15 +97,41 @@ def hrtss(
     return (activity_trimp / thr_trimp) * 100.0
 
 
+def hrtss_scorer(
+    max_hr: float, resting_hr: float, lthr: float, sex: Sex
+) -> Callable[[Run | Ride | LocalActivity], float]:
+    """Return a one-argument hrtss() with the athlete's constants bound.
+
+    Scoring many activities for the same athlete would otherwise recompute the
+    threshold TRIMP for every activity. The returned function gives the same
+    result as hrtss().
+    """
+    thr_trimp = threshold_trimp(max_hr, resting_hr, lthr, sex)
+
+    def score(activity: Run | Ride | LocalActivity) -> float:
+        if activity.avg_heart_rate is None:
+            raise ValueError(
+                "Activity must have an average heart rate to calculate TRIMP."
+            )
+        if thr_trimp == 0:
+            return 0.0
+        activity_trimp = _banister_trimp(
+            activity.avg_heart_rate, activity.duration, max_hr, resting_hr, sex
+        )
+        return (activity_trimp / thr_trimp) * 100.0
+
+    return score
+
+
 def _exponential_training_load(trimp_values: list[float], tau: int) -> list[float]:
     alpha = 1 - math.exp(-1 / tau)
-    load = []
-    prev = 0.0
-    for trimp in trimp_values:
-        current = prev + alpha * (trimp - prev)
-        load.append(current)
-        prev = current
-    return load
+    # Let accumulate() drive the recurrence instead of an interpreted loop with
+    # per-day list appends. `initial` seeds the pre-history load at zero; it's
+    # not a real day, so skip it.
+    loads = accumulate(
+        trimp_values, lambda prev, trimp: prev + alpha * (trimp - prev), initial=0.0
+    )
+    return list(islice(loads, 1, None))
 
 
 def _calculate_atl_and_ctl(
@@ -135,13 +175,48 @@ def training_stress_balance(
         user_timezone: User's timezone (e.g., "America/Chicago"). If None, uses UTC dates.
     """
     hr_activities = [a for a in activities if a.avg_heart_rate is not None]
-    user_tz_activities = convert_activities_to_user_timezone(
-        hr_activities, user_timezone
+    user_tz_activities = localize_activities(hr_activities, user_timezone)
+
+    if not user_tz_activities:
+        return _daily_training_load({}, None, start_date, end_date)
+
+    # Always start calculations from the earliest activity, because these metrics converge over time.
+    # If we start at the start date, metrics will be inaccurately close to zero.
+    first_activity_date = min(a.local_date for a in user_tz_activities)
+
+    # Sum each activity's hrTSS into its local-date bucket in a single pass, so
+    # building the daily series below is O(days) rather than O(days x activities).
+    # (Mirrors the bucketing already used by hrtss_by_day.) Activities after
+    # end_date never enter the series, so don't bother scoring them.
+    score = hrtss_scorer(max_hr, resting_hr, lthr, sex)
+    hrtss_by_local_date: dict[date, float] = defaultdict(float)
+    for a in user_tz_activities:
+        if a.local_date <= end_date:
+            hrtss_by_local_date[a.local_date] += score(a)
+    return _daily_training_load(
+        hrtss_by_local_date, first_activity_date, start_date, end_date
     )
 
+
+def _daily_training_load(
+    hrtss_by_local_date: dict[date, float],
+    first_activity_date: date | None,
+    start_date: date,
+    end_date: date,
+) -> list[DayTrainingLoad]:
+    """
+    Build the CTL/ATL/TSB series for [start_date, end_date] from daily hrTSS totals.
+
+    Args:
+        hrtss_by_local_date: Summed hrTSS per local date; missing days count as zero.
+        first_activity_date: Local date of the earliest HR-bearing activity, where the
+            model starts converging. None if there are no such activities.
+        start_date: Start date in user's timezone
+        end_date: End date in user's timezone
+    """
     hrtss_by_date: list[tuple[date, float]] = []
 
-    if not user_tz_activities:
+    if first_activity_date is None:
         current_date = start_date
         while current_date <= end_date:
             hrtss_by_date.append((current_date, 0.0))
@@ -156,21 +231,6 @@ def training_stress_balance(
             for (d, c, a, t, h) in zip(dates, ctl, atl, tsb, hrtss_values)
         ]
 
-    # Always start calculations from the earliest activity, because these metrics converge over time.
-    # If we start at the start date, metrics will be inaccurately close to zero.
-    first_activity_date = min(a.local_date for a in user_tz_activities)
-
-    # Sum each activity's hrTSS into its local-date bucket in a single pass, so
-    # building the daily series below is O(days) rather than O(days x activities).
-    # (Mirrors the bucketing already used by hrtss_by_day.) Activities after
-    # end_date never enter the series, so don't bother scoring them.
-    hrtss_by_local_date: dict[date, float] = defaultdict(float)
-    for a in user_tz_activities:
-        if a.local_date <= end_date:
-            hrtss_by_local_date[a.local_date] += hrtss(
-                a, max_hr, resting_hr, lthr, sex
-            )
-
     for i in range((end_date - first_activity_date).days + 1):
         current_date = first_activity_date + timedelta(days=i)
         hrtss_by_date.append(
@@ -212,23 +272,17 @@ def hrtss_by_day(
         user_timezone: User's timezone (e.g., "America/Chicago"). If None, uses UTC dates.
     """
     activities_with_hr = [a for a in activities if a.avg_heart_rate is not None]
-    user_tz_activities = convert_activities_to_user_timezone(
-        activities_with_hr, user_timezone
-    )
+    user_tz_activities = localize_activities(activities_with_hr, user_timezone)
 
-    activities_by_date = defaultdict(list)
+    score = hrtss_scorer(max_hr, resting_hr, lthr, sex)
+    hrtss_by_local_date: dict[date, float] = defaultdict(float)
     for a in user_tz_activities:
         if start <= a.local_date <= end:
-            activities_by_date[a.local_date].append(a)
-
-    day_hrtss_list = []
-    current_date = start
-    while current_date <= end:
-        day_activities = activities_by_date[current_date]
-        daily_hrtss = 0.0
-        for a in day_activities:
-            daily_hrtss += hrtss(a, max_hr, resting_hr, lthr, sex)
-        day_hrtss_list.append(DayHrtss(date=current_date, hrtss=daily_hrtss))
-        current_date += timedelta(days=1)
-
-    return day_hrtss_list
+            hrtss_by_local_date[a.local_date] += score(a)
+
+    # Days with no activity read as zero via .get(), so the walk over the range
+    # doesn't insert an empty bucket for every rest day.
+    days = (start + timedelta(days=i) for i in range((end - start).days + 1))
+    return [
+        DayHrtss(date=day, hrtss=hrtss_by_local_date.get(day, 0.0)) for day in days
+    ]
@@ -1,20 +1,24 @@
 # This file loads env variables and must thus be imported before anything else.
 from . import env_loader  # noqa: F401
-from .env_loader import get_current_environment
+from .env_loader import get_current_environment, get_log_level
 
 import os
 import sys
 import logging
-from collections.abc import AsyncIterator, Sequence
+from collections.abc import AsyncIterator, Callable, Sequence
 from contextlib import asynccontextmanager
 from datetime import date, datetime
 from pathlib import Path
-from typing import Literal, TypeVar
+from operator import attrgetter
+from typing import Any, Literal, TypeVar
 
-from fastapi import FastAPI, Depends, Response
+from fastapi import FastAPI, Depends, Request, Response
+from fastapi.responses import JSONResponse
+from psycopg_pool import PoolTimeout
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 
+from fitness.db import rides as rides_db, runs as runs_db
 from fitness.db.runs import get_runs_for_date_range
 from fitness.models import Run
 from fitness.models.run import LocalizedRun
@@ -57,7 +61,7 @@ from .routers import (
 from .models import EnvironmentResponse
 from .auth import require_viewer
 from fitness.models.user import User
-from fitness.utils.timezone import convert_runs_to_user_timezone
+from fitness.utils.timezone import filter_runs_by_local_date_range
 
 # Type alias for values that can be used as sort keys
 SortableValue = datetime | float | str
@@ -81,6 +85,15 @@ T = TypeVar("T", Run, RunDetail, LocalizedRun)
 
 PUBLIC_API_BASE_URL = os.environ["PUBLIC_API_BASE_URL"]
 PUBLIC_DASHBOARD_BASE_URL = os.environ["PUBLIC_DASHBOARD_BASE_URL"]
+# Origins allowed to make credentialed cross-origin requests. A frozenset so the
+# per-request origin check in CORSMiddleware is a hash lookup.
+CORS_ALLOWED_ORIGINS = frozenset(
+    {
+        "http://localhost:5173",  # Vite dev server
+        "http://127.0.0.1:5173",
+        PUBLIC_DASHBOARD_BASE_URL,
+    }
+)
 
 logger = logging.getLogger(__name__)
 
@@ -123,14 +136,31 @@ def check_migrations() -> None:
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     from fitness.db.connection import init_pool, close_pool
+    from fitness.integrations.google.calendar_client import close_calendar_client
+    from fitness.integrations.hevy.client import close_http_client
 
     init_pool()
     check_migrations()
     yield
     close_pool()
+    close_http_client()
+    close_calendar_client()
 
 
 app = FastAPI(lifespan=lifespan)
+
+
+@app.exception_handler(PoolTimeout)
+async def pool_timeout_handler(request: Request, exc: PoolTimeout) -> JSONResponse:
+    """Every DB connection stayed busy; tell the client to retry rather than 500."""
+    logger.warning("Timed out waiting for a database connection: %s", request.url.path)
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Database is busy, please retry"},
+        headers={"Retry-After": "1"},
+    )
+
+
 app.include_router(metrics_router)
 app.include_router(shoe_router)
 app.include_router(shoe_notes_router)
@@ -158,11 +188,7 @@ app.include_router(tags_router)
 app.add_middleware(GZipMiddleware, minimum_size=1000)  # type: ignore[arg-type]
 app.add_middleware(
     CORSMiddleware,  # type: ignore[arg-type]
-    allow_origins=[
-        "http://localhost:5173",  # Vite dev server
-        "http://127.0.0.1:5173",
-        PUBLIC_DASHBOARD_BASE_URL,
-    ],
+    allow_origins=CORS_ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -184,10 +210,7 @@ logging.basicConfig(
     handlers=[_stdout_handler, _stderr_handler],
 )
 # Configure the logging for the API itself if the user specifies it.
-if "LOG_LEVEL" in os.environ:
-    log_level = logging.getLevelNamesMapping().get(os.environ["LOG_LEVEL"].upper())
-    if log_level is None:
-        raise ValueError(f"Invalid log level: {os.environ['LOG_LEVEL']}")
+if (log_level := get_log_level()) is not None:
     logging.getLogger("fitness").setLevel(log_level)
 
 
@@ -211,15 +234,22 @@ def read_all_runs(
     """
     if user_timezone is None:
         return sort_runs_generic(
-            get_runs_for_date_range(start, end), sort_by, sort_order
+            get_runs_for_date_range(start, end), sort_by, sort_order, presorted="asc"
         )
     else:
-        runs = get_runs_for_date_range(start, end, user_timezone)
-        localized_runs = convert_runs_to_user_timezone(runs, user_timezone)
-        filtered_runs = [
-            run for run in localized_runs if start <= run.local_date <= end
-        ]
-        return sort_runs_generic(filtered_runs, sort_by, sort_order)
+        # The DB query is widened by a day on each side; trim it to the exact
+        # local range by binary search (runs come back ordered by datetime_utc).
+        # The kept runs are returned as-is rather than converted to
+        # LocalizedRun: the response is serialized as `Run`, which has no
+        # localized fields, and UTC time already orders them chronologically.
+        runs = filter_runs_by_local_date_range(
+            get_runs_for_date_range(start, end, user_timezone),
+            start,
+            end,
+            user_timezone,
+            presorted=True,
+        )
+        return sort_runs_generic(runs, sort_by, sort_order, presorted="asc")
 
 
 @app.get("/runs/details", response_model=list[RunDetail])
@@ -235,17 +265,16 @@ def read_run_details(
 
     Uses server-side date filtering and ordering by UTC datetime for efficiency.
     """
-    from fitness.db.runs import get_run_details_in_date_range, get_all_run_details
-
     # Get run details from database
     if start != DEFAULT_START or end != DEFAULT_END:
-        details = get_run_details_in_date_range(start, end, synced=synced)
+        details = runs_db.get_run_details_in_date_range(start, end, synced=synced)
     else:
-        details = get_all_run_details(synced=synced)
+        details = runs_db.get_all_run_details(synced=synced)
 
     # Apply sorting
-    # Reuse sort_runs_generic since RunDetail is compatible on the used fields
-    return sort_runs_generic(details, sort_by, sort_order)
+    # Reuse sort_runs_generic since RunDetail is compatible on the used fields;
+    # both readers return details newest-first.
+    return sort_runs_generic(details, sort_by, sort_order, presorted="desc")
 
 
 # Avoid potential ambiguity with dynamic route `/runs/{run_id}` in some setups
@@ -276,14 +305,9 @@ def read_ride_details(
     Optional `synced` filter mirrors `/runs-details`: True for synced rides,
     False for unsynced (or never-synced) rides.
     """
-    from fitness.db.rides import (
-        get_all_ride_details,
-        get_ride_details_in_date_range,
-    )
-
     if start != DEFAULT_START or end != DEFAULT_END:
-        return get_ride_details_in_date_range(start, end, synced=synced)
-    return get_all_ride_details(synced=synced)
+        return rides_db.get_ride_details_in_date_range(start, end, synced=synced)
+    return rides_db.get_all_ride_details(synced=synced)
 
 
 @app.get("/cardio-activity-feed")
@@ -340,56 +364,98 @@ def export_activity_feed(
     )
 
 
+def _pace_sort_key(run: Run | RunDetail) -> float:
+    # Pace as seconds per mile (orders the same as minutes per mile, with one
+    # less division) - avoid division by zero
+    if run.distance > 0:
+        return run.duration / run.distance
+    return float("inf")  # Put zero-distance runs at the end
+
+
+def _heart_rate_sort_key(run: Run | RunDetail) -> float:
+    return run.avg_heart_rate or 0  # Handle None values, put them first when asc
+
+
+def _detail_shoes_sort_key(run: RunDetail) -> str:
+    return run.shoes or ""
+
+
+def _run_shoes_sort_key(run: Run) -> str:
+    return run.shoe_name or ""
+
+
+# Sort keys that read the same field on every supported model. "date" and
+# "shoes" depend on the model type and are resolved in sort_runs_generic.
+_SORT_KEYS: dict[str, Callable[[Any], SortableValue]] = {
+    "distance": attrgetter("distance"),
+    "duration": attrgetter("duration"),
+    "pace": _pace_sort_key,
+    "heart_rate": _heart_rate_sort_key,
+    "source": attrgetter("source"),
+    "type": attrgetter("type"),
+}
+
+
 def sort_runs_generic(
-    runs: Sequence[T], sort_by: RunSortBy, sort_order: SortOrder
+    runs: Sequence[T],
+    sort_by: RunSortBy,
+    sort_order: SortOrder,
+    presorted: SortOrder | None = None,
 ) -> list[T]:
     """Sort runs by the specified field and order.
 
-    Works with both `Run` and `RunDetail` types.
+    Works with both `Run` and `RunDetail` types. The key function is chosen
+    once per call (inspecting the first run for model-specific fields) rather
+    than re-dispatching on `sort_by` for every run. `sorted` evaluates it once
+    per run, not once per comparison, so there's nothing to gain by caching
+    the keys on the models.
+
+    Pass `presorted` when `runs` is already ordered by `datetime_utc` in that
+    direction (as the `fitness.db.runs` readers return them); a date sort then
+    copies or reverses the list instead of sorting it.
     """
+    if sort_by == "date" and presorted is not None:
+        return list(runs) if presorted == sort_order else list(reversed(runs))
+    if not runs:
+        return []
     reverse = sort_order == "desc"
-
-    def get_sort_key(run: T) -> SortableValue:
-        if sort_by == "date":
-            # Use localized_datetime for LocalizedRun, otherwise datetime_utc
-            return getattr(run, "localized_datetime", run.datetime_utc)
-        elif sort_by == "distance":
-            return run.distance
-        elif sort_by == "duration":
-            return run.duration
-        elif sort_by == "pace":
-            # Calculate pace (minutes per mile) - avoid division by zero
-            if run.distance > 0:
-                return (run.duration / 60) / run.distance
-            return float("inf")  # Put zero-distance runs at the end
-        elif sort_by == "heart_rate":
-            return (
-                run.avg_heart_rate or 0
-            )  # Handle None values, put them first when asc
-        elif sort_by == "source":
-            return run.source
-        elif sort_by == "type":
-            return run.type
-        elif sort_by == "shoes":
-            # Handle RunDetail (shoes) and base Run (shoe_name)
-            return str(
-                getattr(run, "shoes", None) or getattr(run, "shoe_name", "") or ""
-            )
-        else:
-            # Default to date if unknown sort field
-            return getattr(run, "localized_datetime", run.datetime_utc)
-
-    return sorted(runs, key=get_sort_key, reverse=reverse)
+    return sorted(runs, key=_sort_key(sort_by, runs[0]), reverse=reverse)
+
+
+def _sort_key(sort_by: RunSortBy, sample: Any) -> Callable[[Any], SortableValue]:
+    """Pick the sort key for `sort_by`, given one of the runs being sorted."""
+    key = _SORT_KEYS.get(sort_by)
+    if key is not None:
+        return key
+    if sort_by == "shoes":
+        # Handle RunDetail (shoes) and base Run (shoe_name)
+        if hasattr(sample, "shoes"):
+            return _detail_shoes_sort_key
+        return _run_shoes_sort_key
+    if hasattr(sample, "localized_datetime"):
+        # Date (also the default): use localized_datetime for LocalizedRun
+        return attrgetter("localized_datetime")
+    return attrgetter("datetime_utc")
+
+
+# The health response never changes, so its body and headers are built once.
+# Each call still gets its own Response, since FastAPI attaches per-request
+# state (background tasks) to the object it's handed.
+_HEALTH_BODY = b'{"status":"healthy"}'
+_HEALTH_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, OPTIONS",
+    "Access-Control-Allow-Headers": "*",
+}
 
 
 @app.get("/health")
 @app.options("/health")
-def health_check(response: Response) -> dict[str, str]:
+def health_check() -> Response:
     """Health check endpoint that returns 200 status with CORS from anywhere."""
-    response.headers["Access-Control-Allow-Origin"] = "*"
-    response.headers["Access-Control-Allow-Methods"] = "GET, OPTIONS"
-    response.headers["Access-Control-Allow-Headers"] = "*"
-    return {"status": "healthy"}
+    return Response(
+        content=_HEALTH_BODY, media_type="application/json", headers=_HEALTH_HEADERS
+    )
 
 
 @app.get("/environment", response_model=EnvironmentResponse)
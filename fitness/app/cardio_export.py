@@ -9,12 +9,11 @@ from __future__ import annotations
 
 import csv
 import io
-import json
 from collections.abc import Iterator, Sequence
 from datetime import date, datetime, timezone
 from zoneinfo import ZoneInfo
 
-from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
 
 from fitness.app.constants import DEFAULT_START, DEFAULT_END
 from fitness.app.routers.run_workouts import (
@@ -26,6 +25,9 @@ from fitness.models.ride_detail import RideDetail
 from fitness.models.run_detail import RunDetail
 
 FeedItem = ActivityFeedRunItem | ActivityFeedWorkoutItem | ActivityFeedRideItem
+# Serializes the feed straight to JSON bytes in pydantic-core, as FastAPI does
+# for the live endpoint's response model.
+_FEED_ADAPTER = TypeAdapter(list[FeedItem])
 
 # Column order for the CSV export. Run-only columns (shoes/notes/workout_*) are
 # left blank for ride rows; pace is blank when distance is 0 (most rides). `name`
@@ -63,10 +65,10 @@ def export_filename(start: date, end: date, fmt: str) -> str:
     return f"cardio-activities_{start_str}_{end_str}.{fmt}"
 
 
-def build_cardio_json(feed: Sequence[FeedItem]) -> str:
-    """Serialize the feed to a JSON string with the same shape the live
+def build_cardio_json(feed: Sequence[FeedItem]) -> bytes:
+    """Serialize the feed to JSON with the same shape the live
     `/cardio-activity-feed` endpoint returns (a discriminated `{type, item}` array)."""
-    return json.dumps(jsonable_encoder(feed))
+    return _FEED_ADAPTER.dump_json(list(feed))
 
 
 def build_cardio_csv(feed: Sequence[FeedItem], user_timezone: str | None) -> str:
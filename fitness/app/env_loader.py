@@ -5,14 +5,19 @@ In K8s, no .env file exists so this is a no-op; env vars come from configmaps
 and secrets instead.
 """
 
+import logging
 import os
 import sys
+from functools import lru_cache
 from typing import Literal, cast
 
-from fitness.config.env_files import load_dotenv_for_current_env
+from fitness.config.env_files import VALID_ENVIRONMENTS, load_dotenv_for_current_env
 
 EnvironmentName = Literal["dev", "staging", "prod"]
 
+# Level names ("DEBUG", "INFO", ...) to their numeric levels, built once.
+_LOG_LEVELS = logging.getLevelNamesMapping()
+
 # Required environment variables that must be set for the app to run.
 # If any are missing, the app will fail to start with a clear error message.
 REQUIRED_ENV_VARS = [
@@ -53,9 +58,29 @@ load_dotenv_for_current_env()
 validate_required_env_vars()
 
 
+@lru_cache(maxsize=1)
 def get_current_environment() -> EnvironmentName:
-    """Get the current environment (dev, staging, or prod)."""
+    """Get the current environment (dev, staging, or prod).
+
+    ENV is fixed for the life of the process, so the result is cached; tests
+    that change ENV must call `get_current_environment.cache_clear()`.
+    """
     env = os.getenv("ENV", "dev")
-    if env in ("dev", "staging", "prod"):
+    if env in VALID_ENVIRONMENTS:
         return cast(EnvironmentName, env)
-    raise ValueError(f"Invalid ENV value: {env}. Must be 'dev', 'staging', or 'prod'.")
+    raise ValueError(f"Invalid ENV value: {env}. Must be one of {VALID_ENVIRONMENTS}.")
+
+
+def get_log_level() -> int | None:
+    """Get the log level from LOG_LEVEL (case-insensitive), or None if unset.
+
+    Raises:
+        ValueError: If LOG_LEVEL is set but isn't a known level name.
+    """
+    raw = os.environ.get("LOG_LEVEL")
+    if raw is None:
+        return None
+    level = _LOG_LEVELS.get(raw.upper())
+    if level is None:
+        raise ValueError(f"Invalid log level: {raw}")
+    return level
@@ -1,6 +1,9 @@
 """JWT validation for OAuth 2.0 access tokens and role-based authorization."""
 
+import hashlib
+import hmac
 import os
+import threading
 import time
 import logging
 from typing import Optional, Dict, Any
@@ -8,6 +11,7 @@ from uuid import UUID
 
 import jwt
 from jwt import PyJWKClient
+from jwt.types import Options
 from fastapi import HTTPException, status, Depends, Header
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
@@ -22,6 +26,21 @@ _jwks_client: Optional[PyJWKClient] = None
 _jwks_cache_time: float = 0
 JWKS_CACHE_DURATION = 3600  # 1 hour
 
+# Verified-token cache, so clients that reuse a bearer token across requests
+# (dashboards polling) don't pay for an ES256 verification each time. Keyed by
+# the token's SHA-256 so raw tokens aren't held in memory; an entry expires at
+# the token's `exp` or after VERIFIED_TOKEN_CACHE_DURATION, whichever is first.
+VERIFIED_TOKEN_CACHE_DURATION = 60
+VERIFIED_TOKEN_CACHE_SIZE = 1024
+_verified_tokens: Dict[bytes, tuple[float, Dict[str, Any]]] = {}
+# Handlers run on threadpool threads, so lookups, evictions and inserts hold
+# this lock; token verification itself happens outside it.
+_verified_tokens_lock = threading.Lock()
+
+# jwt.decode arguments that don't vary per token.
+_JWT_ALGORITHMS = ["ES256"]
+_JWT_DECODE_OPTIONS: Options = {"require": ["exp", "iss", "sub", "aud"]}
+
 
 def get_identity_provider_url() -> str:
     """Get identity provider base URL from environment (used for JWKS fetching)."""
@@ -66,8 +85,35 @@ def get_jwks_client() -> PyJWKClient:
 def validate_jwt_token(token: str) -> Optional[Dict[str, Any]]:
     """Validate JWT access token locally using JWKS.
 
-    Returns decoded claims if valid, None if invalid.
+    Returns decoded claims if valid, None if invalid. Valid tokens are cached
+    briefly (see VERIFIED_TOKEN_CACHE_DURATION); invalid ones are not.
     """
+    key = hashlib.sha256(token.encode()).digest()
+    now = time.time()
+    with _verified_tokens_lock:
+        cached = _verified_tokens.get(key)
+        if cached is not None:
+            expires_at, claims = cached
+            if now < expires_at:
+                return dict(claims)
+            _verified_tokens.pop(key, None)
+
+    claims = _decode_jwt_token(token)
+    if claims is None:
+        return None
+    with _verified_tokens_lock:
+        if len(_verified_tokens) >= VERIFIED_TOKEN_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order).
+            _verified_tokens.pop(next(iter(_verified_tokens)), None)
+        _verified_tokens[key] = (
+            min(now + VERIFIED_TOKEN_CACHE_DURATION, claims["exp"]),
+            claims,
+        )
+    return dict(claims)
+
+
+def _decode_jwt_token(token: str) -> Optional[Dict[str, Any]]:
+    """Verify a JWT's signature and claims. Returns claims, or None if invalid."""
     try:
         jwks_client = get_jwks_client()
         signing_key = jwks_client.get_signing_key_from_jwt(token)
@@ -78,10 +124,10 @@ def validate_jwt_token(token: str) -> Optional[Dict[str, Any]]:
         decoded = jwt.decode(
             token,
             signing_key.key,
-            algorithms=["ES256"],
+            algorithms=_JWT_ALGORITHMS,
             issuer=issuer,
             audience=audience,
-            options={"require": ["exp", "iss", "sub", "aud"]},
+            options=_JWT_DECODE_OPTIONS,
         )
         return decoded
     except jwt.ExpiredSignatureError:
@@ -261,7 +307,9 @@ async def require_viewer_or_api_key(
     # Fall back to API key
     if x_api_key:
         expected_key = get_trmnl_api_key()
-        if x_api_key == expected_key:
+        # Constant-time comparison; bytes, since compare_digest rejects
+        # non-ASCII str and header values can contain any latin-1 character.
+        if hmac.compare_digest(x_api_key.encode(), expected_key.encode()):
             logger.debug("Authenticated via API key")
             return None
 
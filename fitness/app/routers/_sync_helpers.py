@@ -10,7 +10,10 @@ from typing import Any, Callable
 from fastapi import HTTPException, status
 
 from fitness.models.sync import SyncResponse, SyncStatus
-from fitness.integrations.google.calendar_client import GoogleCalendarClient
+from fitness.integrations.google.calendar_client import (
+    GoogleCalendarClient,
+    get_calendar_client,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -51,7 +54,7 @@ def perform_sync(
         )
 
     try:
-        calendar_client = GoogleCalendarClient()
+        calendar_client = get_calendar_client()
         google_event_id = create_calendar_event(calendar_client)
 
         if google_event_id is None:
@@ -150,7 +153,7 @@ def perform_unsync(
             )
 
         # Delete from Google then remove local record
-        calendar_client = GoogleCalendarClient()
+        calendar_client = get_calendar_client()
         success = calendar_client.delete_workout_event(synced_record.google_event_id)
 
         if not success:
@@ -18,7 +18,7 @@ router = APIRouter(prefix="/exercise-templates", tags=["exercise-templates"])
 
 
 @router.get("", response_model=list[ExerciseTemplate])
-async def get_exercise_templates(
+def get_exercise_templates(
     _user: User = Depends(require_viewer),
 ) -> list[ExerciseTemplate]:
     """Get all cached exercise templates (for muscle group mapping)."""
@@ -4,8 +4,10 @@ This router only handles sync operations with the Hevy API.
 For data access, use the generic /lifts and /exercise-templates endpoints.
 """
 
+import asyncio
 import os
 import logging
+from collections.abc import Iterable
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -14,7 +16,7 @@ from pydantic import BaseModel
 from fitness.app.auth import require_editor
 from fitness.models.user import User
 from fitness.models.lift import Lift, ExerciseTemplate
-from fitness.integrations.hevy import HevyClient
+from fitness.integrations.hevy import HevyClient, HevyExerciseTemplate, HevyWorkout
 from fitness.db.lifts import (
     get_existing_lift_ids,
     bulk_create_lifts,
@@ -30,6 +32,14 @@ router = APIRouter(prefix="/hevy", tags=["hevy"])
 # Hevy-specific ID prefix for generic tables
 HEVY_ID_PREFIX = "hevy_"
 PROVIDER_NAME = "hevy"
+# Max exercise template requests in flight at once during a sync. High enough
+# to hide most of the per-request latency, low enough to stay clear of
+# Hevy's rate limit.
+TEMPLATE_FETCH_CONCURRENCY = 8
+# Up to this many fetched workouts, look up just their IDs in the database.
+# Beyond it (a full sync of a long history), one scan of the stored Hevy IDs is
+# cheaper than shipping and probing a very large ID array.
+EXISTING_ID_PROBE_LIMIT = 1000
 
 
 # --- Dependency ---
@@ -58,6 +68,80 @@ class HevySyncResponse(BaseModel):
     synced_at: datetime
 
 
+# In-flight sync per `full_sync` value, so overlapping requests share one run
+# instead of each calling the Hevy API and writing the same rows.
+_inflight_syncs: dict[bool, asyncio.Future[HevySyncResponse]] = {}
+
+
+async def _fetch_exercise_templates(
+    client: HevyClient, template_ids: Iterable[str]
+) -> list[tuple[str, HevyExerciseTemplate | None]]:
+    """Fetch exercise templates by ID concurrently.
+
+    Each fetch is a blocking HTTP call, so it runs in a worker thread; at most
+    TEMPLATE_FETCH_CONCURRENCY of them are in flight at once. Results are
+    returned in the order of `template_ids`.
+    """
+    semaphore = asyncio.Semaphore(TEMPLATE_FETCH_CONCURRENCY)
+
+    async def fetch(template_id: str) -> tuple[str, HevyExerciseTemplate | None]:
+        async with semaphore:
+            return template_id, await asyncio.to_thread(
+                client.get_exercise_template_by_id, template_id
+            )
+
+    return await asyncio.gather(*(fetch(tid) for tid in template_ids))
+
+
+async def _store_new_workouts(
+    client: HevyClient, new_workouts: list[HevyWorkout]
+) -> tuple[int, int]:
+    """Fetch missing exercise templates and insert new workouts and templates.
+
+    Returns:
+        (workouts_synced, templates_synced)
+    """
+    # 3. Extract unique template IDs from new workouts only
+    template_ids_in_new_workouts = {
+        exercise.exercise_template_id
+        for workout in new_workouts
+        for exercise in workout.exercises
+    }
+
+    # 4. Find which templates we don't have cached yet
+    # Note: DB stores prefixed IDs, so ask for them with the prefix stripped
+    existing_template_ids = get_existing_exercise_template_ids(
+        prefix=HEVY_ID_PREFIX, among=template_ids_in_new_workouts
+    )
+    missing_template_ids = template_ids_in_new_workouts - existing_template_ids
+    logger.info(
+        f"Need to fetch {len(missing_template_ids)} new exercise templates "
+        f"({len(existing_template_ids)} already cached)"
+    )
+
+    # 5. Fetch only missing templates and convert to generic ExerciseTemplate
+    new_templates: list[ExerciseTemplate] = []
+    fetched = await _fetch_exercise_templates(client, missing_template_ids)
+    for template_id, hevy_template in fetched:
+        if hevy_template:
+            new_templates.append(
+                ExerciseTemplate.from_hevy(hevy_template, id_prefix=HEVY_ID_PREFIX)
+            )
+        else:
+            logger.warning(f"Could not fetch exercise template {template_id}")
+
+    # 6. Insert new templates
+    templates_synced = bulk_upsert_exercise_templates(new_templates)
+    logger.info(f"Synced {templates_synced} new exercise templates")
+
+    # 7. Convert workouts to generic Lift objects and insert
+    new_lifts = [Lift.from_hevy(w, id_prefix=HEVY_ID_PREFIX) for w in new_workouts]
+    workouts_synced = bulk_create_lifts(new_lifts)
+    logger.info(f"Inserted {workouts_synced} new workouts")
+
+    return workouts_synced, templates_synced
+
+
 # --- Endpoints ---
 
 
@@ -79,7 +163,21 @@ async def sync_hevy_data(
     Requires authentication with editor role. Fetches workouts from Hevy and
     inserts only new ones (preserving local edits). Fetches exercise templates
     only for exercises we haven't seen before.
+
+    A request that arrives while a sync of the same kind is still running
+    waits for that sync and returns its result rather than starting another.
     """
+    inflight = _inflight_syncs.get(full_sync)
+    if inflight is None or inflight.done():
+        inflight = asyncio.ensure_future(_run_sync(full_sync, client))
+        _inflight_syncs[full_sync] = inflight
+    else:
+        logger.info("Hevy sync already in progress; waiting for its result")
+    # Shield so a caller disconnecting doesn't cancel the sync for the others.
+    return await asyncio.shield(inflight)
+
+
+async def _run_sync(full_sync: bool, client: HevyClient) -> HevySyncResponse:
     # Determine sync start time for incremental sync
     since = None
     if not full_sync:
@@ -99,54 +197,28 @@ async def sync_hevy_data(
     logger.info(f"Fetched {len(all_workouts)} workouts from Hevy API")
 
     # 2. Filter to only new workouts (not already in DB)
-    # Note: DB stores prefixed IDs (hevy_xxx), API returns unprefixed (xxx)
-    existing_lift_ids = get_existing_lift_ids()
-    new_workouts = [
-        w for w in all_workouts if f"{HEVY_ID_PREFIX}{w.id}" not in existing_lift_ids
-    ]
+    # Note: DB stores prefixed IDs (hevy_xxx), API returns unprefixed (xxx), so
+    # ask for the existing IDs with the prefix stripped. Usually only the
+    # fetched workouts are checked, not every lift in the table.
+    if len(all_workouts) <= EXISTING_ID_PROBE_LIMIT:
+        existing_lift_ids = get_existing_lift_ids(
+            prefix=HEVY_ID_PREFIX, among=[w.id for w in all_workouts]
+        )
+    else:
+        existing_lift_ids = get_existing_lift_ids(prefix=HEVY_ID_PREFIX)
+    new_workouts = [w for w in all_workouts if w.id not in existing_lift_ids]
     logger.info(
         f"Found {len(new_workouts)} new workouts "
         f"({len(existing_lift_ids)} already in database)"
     )
 
-    # 3. Extract unique template IDs from new workouts only
-    template_ids_in_new_workouts: set[str] = set()
-    for workout in new_workouts:
-        for exercise in workout.exercises:
-            template_ids_in_new_workouts.add(exercise.exercise_template_id)
-
-    # 4. Find which templates we don't have cached yet
-    # Note: DB stores prefixed IDs, so prefix when comparing
-    existing_template_ids = get_existing_exercise_template_ids()
-    missing_template_ids = {
-        tid
-        for tid in template_ids_in_new_workouts
-        if f"{HEVY_ID_PREFIX}{tid}" not in existing_template_ids
-    }
-    logger.info(
-        f"Need to fetch {len(missing_template_ids)} new exercise templates "
-        f"({len(existing_template_ids)} already cached)"
-    )
-
-    # 5. Fetch only missing templates and convert to generic ExerciseTemplate
-    new_templates: list[ExerciseTemplate] = []
-    for template_id in missing_template_ids:
-        hevy_template = client.get_exercise_template_by_id(template_id)
-        if hevy_template:
-            new_templates.append(
-                ExerciseTemplate.from_hevy(hevy_template, id_prefix=HEVY_ID_PREFIX)
-            )
-        else:
-            logger.warning(f"Could not fetch exercise template {template_id}")
-
-    # 6. Insert new templates
-    templates_synced = bulk_upsert_exercise_templates(new_templates)
-    logger.info(f"Synced {templates_synced} new exercise templates")
-
-    # 7. Convert workouts to generic Lift objects and insert
-    new_lifts = [Lift.from_hevy(w, id_prefix=HEVY_ID_PREFIX) for w in new_workouts]
-    workouts_synced = bulk_create_lifts(new_lifts)
-    logger.info(f"Inserted {workouts_synced} new workouts")
+    # 3-7. Fetch missing templates and store everything new. Skipped entirely
+    # for the common no-op incremental sync.
+    workouts_synced = templates_synced = 0
+    if new_workouts:
+        workouts_synced, templates_synced = await _store_new_workouts(
+            client, new_workouts
+        )
 
     # Update last sync time on successful completion
     update_last_sync_time(PROVIDER_NAME, sync_time)
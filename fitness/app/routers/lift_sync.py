@@ -1,21 +1,31 @@
 """Google Calendar sync routes for lifts."""
 
-from fastapi import APIRouter, HTTPException, status, Depends
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from fastapi import APIRouter, BackgroundTasks, HTTPException, status, Depends
 import logging
 
-from fitness.db.lifts import get_lift_by_id
+from fitness.db.lifts import get_lift_with_sync, get_lifts_with_sync
+from fitness.models.lift import Lift
 from fitness.db.synced_lifts import (
     get_synced_lift,
-    create_synced_lift,
-    update_synced_lift,
+    upsert_synced_lift,
+    bulk_upsert_synced_lifts,
     delete_synced_lift,
     get_all_synced_lifts,
     get_failed_lift_syncs,
 )
+from fitness.integrations.google.calendar_client import (
+    get_calendar_client,
+    run_calendar_call,
+)
 from fitness.models.sync import (
+    BatchLiftSyncRequest,
     SyncedLift,
     SyncResponse,
     SyncLiftStatusResponse,
+    SyncStatus,
 )
 from fitness.models.user import User
 from fitness.app.auth import require_viewer, require_editor
@@ -56,50 +66,181 @@ def get_lift_sync_status(
     )
 
 
+# A pending sync older than this is assumed lost (e.g. the process restarted
+# before its background task ran) and may be queued again.
+PENDING_SYNC_TIMEOUT = timedelta(minutes=5)
+
+
+# Declared before /lifts/{lift_id} so "batch" is not taken as a lift ID.
+@router.post("/lifts/batch", response_model=dict[str, SyncResponse])
+def sync_lifts_to_calendar(
+    body: BatchLiftSyncRequest,
+    background_tasks: BackgroundTasks,
+    user: User = Depends(require_editor),
+) -> dict[str, SyncResponse]:
+    """Queue several lifts to be synced to Google Calendar. Requires OAuth 2.0 Bearer token.
+
+    Lifts that are missing, already synced, or already being synced are
+    skipped; the rest are marked pending and their events are created with
+    batched Calendar API calls after the response is sent. Returns one
+    result per requested lift ID.
+    """
+    found = get_lifts_with_sync(body.lift_ids)
+    results: dict[str, SyncResponse] = {}
+    to_sync: list[Lift] = []
+    for lift_id in dict.fromkeys(body.lift_ids):
+        if lift_id not in found:
+            results[lift_id] = SyncResponse(
+                success=False,
+                message=f"Lift {lift_id} not found",
+                sync_status="failed",
+            )
+            continue
+        lift, existing_sync = found[lift_id]
+        if existing_sync and existing_sync.sync_status == "synced":
+            results[lift_id] = SyncResponse(
+                success=False,
+                message=f"Lift {lift_id} is already synced to Google Calendar",
+                google_event_id=existing_sync.google_event_id,
+                sync_status=existing_sync.sync_status,
+                synced_at=existing_sync.synced_at,
+            )
+        elif existing_sync and _is_in_progress(existing_sync):
+            results[lift_id] = SyncResponse(
+                success=False,
+                message=f"Lift {lift_id} is already being synced to Google Calendar",
+                sync_status="pending",
+            )
+        else:
+            to_sync.append(lift)
+            results[lift_id] = SyncResponse(
+                success=True,
+                message=f"Queued lift {lift_id} to sync to Google Calendar",
+                sync_status="pending",
+            )
+
+    if to_sync:
+        bulk_upsert_synced_lifts([(lift.id, "", "pending", None) for lift in to_sync])
+        # Queued through run_calendar_call so the Google calls run on the
+        # calendar executor, not the threadpool a plain-def task would use.
+        background_tasks.add_task(run_calendar_call, _sync_lifts, to_sync)
+    return results
+
+
 @router.post("/lifts/{lift_id}", response_model=SyncResponse)
 def sync_lift_to_calendar(
     lift_id: str,
+    background_tasks: BackgroundTasks,
     user: User = Depends(require_editor),
 ) -> SyncResponse:
-    """Sync a lift to Google Calendar. Requires OAuth 2.0 Bearer token."""
-    existing_sync = get_synced_lift(lift_id)
+    """Queue a lift to be synced to Google Calendar. Requires OAuth 2.0 Bearer token.
 
-    lift = get_lift_by_id(lift_id)
+    The Google Calendar call runs after the response is sent; the returned
+    status is "pending", and /sync/lifts/{lift_id}/status reports the outcome.
+    """
+    lift, existing_sync = get_lift_with_sync(lift_id)
     if lift is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Lift {lift_id} not found",
         )
 
-    return perform_sync(
-        entity_id=lift_id,
+    if existing_sync and existing_sync.sync_status == "synced":
+        return SyncResponse(
+            success=False,
+            message=f"Lift {lift_id} is already synced to Google Calendar",
+            google_event_id=existing_sync.google_event_id,
+            sync_status=existing_sync.sync_status,
+            synced_at=existing_sync.synced_at,
+        )
+    if existing_sync and _is_in_progress(existing_sync):
+        return SyncResponse(
+            success=False,
+            message=f"Lift {lift_id} is already being synced to Google Calendar",
+            google_event_id=None,
+            sync_status="pending",
+            synced_at=None,
+        )
+
+    pending = upsert_synced_lift(lift_id, "", "pending")
+    background_tasks.add_task(run_calendar_call, _sync_lift, lift, pending)
+    return SyncResponse(
+        success=True,
+        message=f"Queued lift {lift_id} to sync to Google Calendar",
+        google_event_id=None,
+        sync_status="pending",
+        synced_at=None,
+    )
+
+
+def _is_in_progress(sync: SyncedLift) -> bool:
+    """Whether a sync was queued recently enough that it may still complete."""
+    if sync.sync_status != "pending":
+        return False
+    # Sync timestamps are stored as naive UTC.
+    updated_at = sync.updated_at
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+    return datetime.now(timezone.utc) - updated_at < PENDING_SYNC_TIMEOUT
+
+
+def _sync_lift(lift: Lift, pending: SyncedLift) -> None:
+    """Create the Google Calendar event for a lift and record the outcome."""
+    # One upsert covers success and failure; the pending row already exists.
+    perform_sync(
+        entity_id=lift.id,
         entity_type="lift",
-        existing_sync=existing_sync,
+        existing_sync=pending,
         create_calendar_event=lambda client: client.create_lift_event(lift),
-        create_sync_record=lambda gid, s: create_synced_lift(
-            lift_id=lift_id, google_event_id=gid, lift_version=1, sync_status=s,
-        ),
-        update_sync_record=lambda gid: update_synced_lift(
-            lift_id=lift_id, google_event_id=gid, sync_status="synced", clear_error_message=True,
-        ),
-        record_failure=lambda gid, msg: (
-            update_synced_lift(lift_id=lift_id, sync_status="failed", error_message=msg)
-            if existing_sync
-            else create_synced_lift(lift_id=lift_id, google_event_id=gid or "", sync_status="failed", error_message=msg)
+        create_sync_record=lambda gid, s: upsert_synced_lift(lift.id, gid, s),
+        update_sync_record=lambda gid: upsert_synced_lift(lift.id, gid, "synced"),
+        record_failure=lambda gid, msg: upsert_synced_lift(
+            lift.id, gid or "", "failed", error_message=msg
         ),
     )
 
 
+def _sync_lifts(lifts: list[Lift]) -> None:
+    """Create Google Calendar events for lifts in batches and record the outcomes."""
+    try:
+        event_ids = get_calendar_client().create_lift_events(lifts)
+    except Exception as e:
+        logger.exception(
+            f"Error batch syncing lifts to Google Calendar: count={len(lifts)}, "
+            f"exception_type={type(e).__name__}, error={str(e)}"
+        )
+        event_ids = {}
+
+    records: list[tuple[str, str, SyncStatus, str | None]] = []
+    for lift in lifts:
+        event_id = event_ids.get(lift.id)
+        if event_id:
+            records.append((lift.id, event_id, "synced", None))
+        else:
+            message = (
+                f"Failed to sync lift {lift.id}: Failed to create Google Calendar event"
+            )
+            records.append((lift.id, "", "failed", message))
+    try:
+        bulk_upsert_synced_lifts(records)
+    except Exception as e:
+        logger.exception(
+            f"Failed to persist batch sync results to database: count={len(records)}, "
+            f"exception_type={type(e).__name__}, error={str(e)}"
+        )
+
+
 @router.delete("/lifts/{lift_id}", response_model=SyncResponse)
-def unsync_lift_from_calendar(
+async def unsync_lift_from_calendar(
     lift_id: str,
     user: User = Depends(require_editor),
 ) -> SyncResponse:
     """Remove a lift's sync from Google Calendar. Requires OAuth 2.0 Bearer token."""
-    return perform_unsync(
+    return await run_calendar_call(
+        perform_unsync,
         entity_id=lift_id,
         entity_type="lift",
-        synced_record=get_synced_lift(lift_id),
+        synced_record=await asyncio.to_thread(get_synced_lift, lift_id),
         delete_sync_record=lambda: delete_synced_lift(lift_id),
     )
 
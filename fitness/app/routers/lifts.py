@@ -1,5 +1,6 @@
 """Generic router for lifting workout data."""
 
+import asyncio
 import logging
 import zoneinfo
 from collections import defaultdict
@@ -19,12 +20,20 @@ from fitness.db.lifts import (
     get_lifts_in_date_range_with_sync,
     get_lift_by_id,
     get_lift_count,
+    get_lift_avg_rpe,
+    get_lift_totals,
+    get_set_counts_by_muscle,
+    get_frequent_exercise_counts,
     get_all_exercise_templates,
 )
 from fitness.models.sync import SyncStatus
 
 logger = logging.getLogger(__name__)
 
+# Handlers are plain `def`: the DB layer is synchronous psycopg, so FastAPI
+# runs them in its threadpool rather than blocking the event loop. A handler
+# that issues independent queries concurrently is `async def` and runs each
+# one with asyncio.to_thread instead.
 router = APIRouter(prefix="/lifts", tags=["lifts"])
 
 
@@ -53,6 +62,7 @@ class LiftsResponse(BaseModel):
 
     lifts: list[LiftSummary]
     total_count: int
+    next_cursor: Optional[str] = None
 
 
 class LiftStatsResponse(BaseModel):
@@ -109,6 +119,19 @@ def _parse_user_timezone(user_timezone: Optional[str]) -> Optional[zoneinfo.Zone
         )
 
 
+def _parse_cursor(cursor: Optional[str]) -> Optional[tuple[datetime, str]]:
+    """Parse a /lifts page cursor into (start_time, id), raising HTTP 400 if invalid."""
+    if not cursor:
+        return None
+    start_time, sep, lift_id = cursor.partition("|")
+    try:
+        if not sep or not lift_id:
+            raise ValueError(cursor)
+        return datetime.fromisoformat(start_time), lift_id
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {cursor}")
+
+
 def _local_midnight_utc(d: date, tz: zoneinfo.ZoneInfo) -> datetime:
     """The UTC instant of local midnight on date ``d`` in timezone ``tz``."""
     return datetime(d.year, d.month, d.day, tzinfo=tz).astimezone(timezone.utc)
@@ -118,7 +141,7 @@ def _local_midnight_utc(d: date, tz: zoneinfo.ZoneInfo) -> datetime:
 
 
 @router.get("", response_model=LiftsResponse)
-async def get_lifts(
+def get_lifts(
     start_date: Optional[date] = Query(
         None, description="Filter lifts on or after this date"
     ),
@@ -131,6 +154,17 @@ async def get_lifts(
             "are compared in UTC, which can drop lifts logged near local midnight."
         ),
     ),
+    limit: Optional[int] = Query(
+        None, ge=1, le=500, description="Return at most this many lifts"
+    ),
+    offset: int = Query(0, ge=0, description="Number of lifts to skip"),
+    cursor: Optional[str] = Query(
+        None,
+        description=(
+            "next_cursor from the previous page; returns the lifts after it. "
+            "Cheaper than offset for deep pages."
+        ),
+    ),
     _user: User = Depends(require_viewer),
 ) -> LiftsResponse:
     """Get lifting sessions from the database.
@@ -141,9 +175,21 @@ async def get_lifts(
     midnight) and converted to the correct UTC bounds; otherwise the dates are
     compared against the stored UTC timestamps directly. Returns lifts in
     descending order by start time.
+
+    With ``limit`` and/or ``offset``, only that page of lifts is returned, and
+    ``total_count`` is the number of lifts matching the filter across all pages.
+    A full page also carries ``next_cursor``; pass it back as ``cursor`` to get
+    the following page by index seek rather than by skipping ``offset`` rows.
     """
     tz = _parse_user_timezone(user_timezone)
+    after = _parse_cursor(cursor)
+    if after is not None and offset:
+        raise HTTPException(
+            status_code=400, detail="Use either cursor or offset, not both"
+        )
 
+    start_bound: date | datetime | None = None
+    end_bound: date | datetime | None = None
     if start_date or end_date:
         if tz is not None:
             start_bound = _local_midnight_utc(start_date, tz) if start_date else None
@@ -151,36 +197,37 @@ async def get_lifts(
         else:
             start_bound = start_date
             end_bound = end_date
-        lifts_with_sync = get_lifts_in_date_range_with_sync(start_bound, end_bound)
+        lifts_with_sync = get_lifts_in_date_range_with_sync(
+            start_bound, end_bound, limit=limit, offset=offset, after=after
+        )
     else:
-        lifts_with_sync = get_all_lifts_with_sync()
-
-    summaries = [
-        LiftSummary(
-            id=lws.lift.id,
-            title=lws.lift.title,
-            start_time=lws.lift.start_time,
-            end_time=lws.lift.end_time,
-            total_volume_kg=lws.lift.total_volume(),
-            total_sets=lws.lift.total_sets(),
-            exercise_count=len(lws.lift.exercises),
-            is_synced=lws.is_synced,
-            sync_status=lws.sync_status,
-            synced_at=lws.synced_at,
-            google_event_id=lws.google_event_id,
-            error_message=lws.error_message,
+        lifts_with_sync = get_all_lifts_with_sync(
+            limit=limit, offset=offset, after=after
         )
-        for lws in lifts_with_sync
-    ]
 
-    return LiftsResponse(
-        lifts=summaries,
-        total_count=len(summaries),
+    # One validation call over the DB rows' attributes; building each
+    # LiftSummary by keyword in Python costs about twice as much on long lists.
+    paginated = limit is not None or offset > 0 or after is not None
+    next_cursor = None
+    if limit is not None and len(lifts_with_sync) == limit:
+        last = lifts_with_sync[-1]
+        next_cursor = f"{last.start_time.isoformat()}|{last.id}"
+    return LiftsResponse.model_validate(
+        {
+            "lifts": lifts_with_sync,
+            "total_count": (
+                get_lift_totals(start_bound, end_bound).sessions
+                if paginated
+                else len(lifts_with_sync)
+            ),
+            "next_cursor": next_cursor,
+        },
+        from_attributes=True,
     )
 
 
 @router.get("/count")
-async def get_lifts_count(
+def get_lifts_count(
     _user: User = Depends(require_viewer),
 ) -> dict[str, int]:
     """Get the total count of lifting sessions in the database."""
@@ -200,47 +247,42 @@ async def get_lifts_stats(
 
     Either, both, or neither date can be provided for period filtering.
     """
-    all_lifts = get_all_lifts()
-    total_sessions = len(all_lifts)
-    total_volume = sum(lift.total_volume() for lift in all_lifts)
-    total_sets = sum(lift.total_sets() for lift in all_lifts)
-    duration_all_time = sum(lift.duration_seconds() for lift in all_lifts)
-
-    # Period-specific stats
+    # Everything is aggregated in SQL; no lifts are loaded. The queries are
+    # independent, so they run concurrently on separate pool connections.
     if start_date or end_date:
-        period_lifts = get_lifts_in_date_range(start_date, end_date)
+        all_time, period, avg_rpe = await asyncio.gather(
+            asyncio.to_thread(get_lift_totals),
+            asyncio.to_thread(get_lift_totals, start_date, end_date),
+            asyncio.to_thread(get_lift_avg_rpe, start_date, end_date),
+        )
     else:
-        period_lifts = all_lifts
-
-    duration_in_period = sum(lift.duration_seconds() for lift in period_lifts)
-    avg_duration = round(duration_in_period / len(period_lifts)) if period_lifts else 0
-
-    # Compute average RPE across non-warmup sets with RPE data
-    rpe_values = [
-        s.rpe
-        for lift in period_lifts
-        for exercise in lift.exercises
-        for s in exercise.sets
-        if s.set_type != "warmup" and s.rpe is not None
-    ]
-    avg_rpe = round(sum(rpe_values) / len(rpe_values), 1) if rpe_values else None
+        all_time, avg_rpe = await asyncio.gather(
+            asyncio.to_thread(get_lift_totals),
+            asyncio.to_thread(get_lift_avg_rpe, start_date, end_date),
+        )
+        period = all_time
+    avg_duration = (
+        round(period.duration_seconds / period.sessions) if period.sessions else 0
+    )
+    if avg_rpe is not None:
+        avg_rpe = round(avg_rpe, 1)
 
     return LiftStatsResponse(
-        total_sessions=total_sessions,
-        total_volume_kg=total_volume,
-        total_sets=total_sets,
-        duration_all_time_seconds=duration_all_time,
-        sessions_in_period=len(period_lifts),
-        volume_in_period_kg=sum(lift.total_volume() for lift in period_lifts),
-        sets_in_period=sum(lift.total_sets() for lift in period_lifts),
-        duration_in_period_seconds=duration_in_period,
+        total_sessions=all_time.sessions,
+        total_volume_kg=all_time.volume_kg,
+        total_sets=all_time.sets,
+        duration_all_time_seconds=all_time.duration_seconds,
+        sessions_in_period=period.sessions,
+        volume_in_period_kg=period.volume_kg,
+        sets_in_period=period.sets,
+        duration_in_period_seconds=period.duration_seconds,
         avg_duration_seconds=avg_duration,
         avg_rpe=avg_rpe,
     )
 
 
 @router.get("/sets-by-muscle", response_model=list[SetsByMuscleItem])
-async def get_sets_by_muscle(
+def get_sets_by_muscle(
     start_date: Optional[date] = Query(
         None, description="Filter on or after this date"
     ),
@@ -251,37 +293,12 @@ async def get_sets_by_muscle(
 
     Returns non-warmup sets counted by muscle group for the given period.
     """
-    # Get lifts in period
-    if start_date or end_date:
-        lifts = get_lifts_in_date_range(start_date, end_date)
-    else:
-        lifts = get_all_lifts()
-
-    # Build template lookup for muscle groups
-    templates = get_all_exercise_templates()
-    template_muscle_map = {t.id: t.primary_muscle_group for t in templates}
-
-    # Count sets by muscle group
-    muscle_sets: dict[str, int] = {}
-    for lift in lifts:
-        for exercise in lift.exercises:
-            exercise_id = exercise.exercise_template_id
-            if exercise_id is None:
-                continue
-            muscle = template_muscle_map.get(exercise_id)
-            if muscle:
-                # Count non-warmup sets
-                non_warmup = sum(1 for s in exercise.sets if s.set_type != "warmup")
-                muscle_sets[muscle] = muscle_sets.get(muscle, 0) + non_warmup
-
-    # Sort by sets descending
-    sorted_muscles = sorted(muscle_sets.items(), key=lambda x: x[1], reverse=True)
-
-    return [SetsByMuscleItem(muscle=m, sets=s) for m, s in sorted_muscles]
+    counts = get_set_counts_by_muscle(start_date, end_date)
+    return [SetsByMuscleItem(muscle=m, sets=s) for m, s in counts]
 
 
 @router.get("/volume-by-muscle", response_model=list[VolumeByMuscleItem])
-async def get_volume_by_muscle(
+def get_volume_by_muscle(
     start_date: Optional[date] = Query(
         None, description="Filter on or after this date"
     ),
@@ -319,7 +336,7 @@ async def get_volume_by_muscle(
 
 
 @router.get("/frequent-exercises", response_model=list[FrequentExerciseItem])
-async def get_frequent_exercises(
+def get_frequent_exercises(
     start_date: Optional[date] = Query(
         None, description="Filter on or after this date"
     ),
@@ -331,30 +348,12 @@ async def get_frequent_exercises(
 
     Returns exercises sorted by occurrence count.
     """
-    # Get lifts in period
-    if start_date or end_date:
-        lifts = get_lifts_in_date_range(start_date, end_date)
-    else:
-        lifts = get_all_lifts()
-
-    # Count exercise occurrences
-    exercise_counts: dict[str, int] = {}
-    for lift in lifts:
-        for exercise in lift.exercises:
-            name = exercise.title
-            exercise_counts[name] = exercise_counts.get(name, 0) + 1
-
-    # Sort by count descending and limit
-    sorted_exercises = sorted(exercise_counts.items(), key=lambda x: x[1], reverse=True)
-    top_exercises = sorted_exercises[:limit]
-
-    return [
-        FrequentExerciseItem(name=name, count=count) for name, count in top_exercises
-    ]
+    counts = get_frequent_exercise_counts(start_date, end_date, limit)
+    return [FrequentExerciseItem(name=name, count=count) for name, count in counts]
 
 
 @router.get("/by-day")
-async def get_lifts_by_day(
+def get_lifts_by_day(
     start_date: date = Query(..., description="Start date (inclusive)"),
     end_date: date = Query(..., description="End date (inclusive)"),
     user_timezone: Optional[str] = Query(
@@ -398,7 +397,7 @@ async def get_lifts_by_day(
 
 
 @router.get("/{lift_id}")
-async def get_lift(
+def get_lift(
     lift_id: str,
     _user: User = Depends(require_viewer),
 ) -> Lift:
@@ -1,6 +1,6 @@
 from datetime import date, timedelta
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 
 from fitness.agg import (
     mileage_by_shoes,
@@ -56,7 +56,7 @@ def read_total_seconds(
         user_timezone: IANA timezone for local-date filtering and display. If None, use UTC dates.
     """
     runs = get_runs_for_date_range(start, end, user_timezone)
-    return total_seconds(runs, start, end, user_timezone)
+    return total_seconds(runs, start, end, user_timezone, presorted=True)
 
 
 @router.get("/mileage/total", response_model=float)
@@ -74,7 +74,7 @@ def read_total_mileage(
         user_timezone: IANA timezone for local-date filtering and display. If None, use UTC dates.
     """
     runs = get_runs_for_date_range(start, end, user_timezone)
-    return total_mileage(runs, start, end, user_timezone)
+    return total_mileage(runs, start, end, user_timezone, presorted=True)
 
 
 @router.get("/mileage/by-day", response_model=list[DayMileage])
@@ -131,7 +131,7 @@ def read_mileage_by_week(
 def read_rolling_mileage_by_day(
     start: date = DEFAULT_START,
     end: date = DEFAULT_END,
-    window: int = 1,
+    window: int = Query(1, ge=1),
     user_timezone: str | None = None,
     _user: User = Depends(require_viewer),
 ) -> list[DayMileage]:
@@ -1,7 +1,6 @@
 import logging
 import os
 from datetime import datetime, timezone as tz
-from io import BytesIO
 
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status
 
@@ -9,7 +8,7 @@ from fitness.app.auth import require_editor
 from fitness.models import Run
 from fitness.models.user import User
 from fitness.models.responses import DataImportResponse
-from fitness.db.runs import get_existing_run_ids, bulk_create_runs
+from fitness.db.runs import bulk_create_runs
 from fitness.load.mmf import load_mmf_runs_from_file
 
 logger = logging.getLogger(__name__)
@@ -43,30 +42,20 @@ async def upload_mmf_csv(
 
         # Load MMF runs from uploaded file
         logger.info(f"Loading MMF data from uploaded file: {file.filename}")
-        file_content = await file.read()
-        file_obj = BytesIO(file_content)
-        mmf_activities = load_mmf_runs_from_file(file_obj, timezone)
+        # UploadFile.file is the spooled upload itself; parse it in place.
+        mmf_activities = load_mmf_runs_from_file(file.file, timezone)
 
         # Convert MMF activities to Run models
         mmf_runs = [Run.from_mmf(activity) for activity in mmf_activities]
 
-        # Get the IDs of all existing runs in the db
-        existing_run_ids = get_existing_run_ids()
-
-        # Filter to only new runs
-        new_runs = [run for run in mmf_runs if run.id not in existing_run_ids]
-
-        if new_runs:
-            inserted_count = bulk_create_runs(new_runs)
-            logger.info(f"Inserted {inserted_count} new MMF runs into the database")
-        else:
-            inserted_count = 0
-            logger.info("No new MMF runs to insert")
+        # The insert skips runs already in the db, so no separate lookup is needed
+        inserted_count = bulk_create_runs(mmf_runs)
+        logger.info(f"Inserted {inserted_count} new MMF runs into the database")
 
         return DataImportResponse(
             inserted_count=inserted_count,
             total_runs_found=len(mmf_runs),
-            existing_runs=len(mmf_runs) - len(new_runs),
+            existing_runs=len(mmf_runs) - inserted_count,
             updated_at=datetime.now(tz.utc),
             message=f"Inserted {inserted_count} new runs into the database",
         )
@@ -16,6 +16,7 @@ from fitness.app.auth import require_viewer, require_editor
 from fitness.app.oauth_state import InvalidOAuthState, issue_state, verify_state
 from fitness.integrations import strava
 from fitness.integrations import google
+from fitness.integrations.google.calendar_client import reset_calendar_client
 
 PUBLIC_API_BASE_URL = os.environ["PUBLIC_API_BASE_URL"]
 PUBLIC_DASHBOARD_BASE_URL = os.environ["PUBLIC_DASHBOARD_BASE_URL"]
@@ -188,6 +189,8 @@ async def google_oauth_callback(
             expires_at=token.expires_at_datetime(),
         )
     )
+    # The shared calendar client still holds the old tokens.
+    reset_calendar_client()
 
     # Redirect back to the frontend.
     return RedirectResponse(PUBLIC_DASHBOARD_BASE_URL)
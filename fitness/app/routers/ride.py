@@ -1,5 +1,6 @@
 """CRUD routes for rides (currently: PATCH only)."""
 
+import asyncio
 import logging
 from datetime import datetime
 from typing import Literal
@@ -23,6 +24,7 @@ from fitness.db.synced_rides import (
     delete_synced_ride,
 )
 from fitness.db.tags import set_ride_tags
+from fitness.integrations.google.calendar_client import run_calendar_call
 from fitness.models import Ride
 from fitness.models.ride_detail import RideDetail
 from fitness.models.tag import Tag
@@ -169,7 +171,7 @@ class MarkDuplicateResponse(BaseModel):
 
 
 @router.post("/{ride_id}/duplicate-of", response_model=MarkDuplicateResponse)
-def mark_ride_as_duplicate(
+async def mark_ride_as_duplicate(
     ride_id: str,
     request: MarkDuplicateRequest,
     _user: User = Depends(require_editor),
@@ -180,7 +182,7 @@ def mark_ride_as_duplicate(
     prevents re-import) and records which ride it duplicates. If the ride is
     synced to Google Calendar, it is unsynced first so no orphaned event remains.
     """
-    if get_ride_by_id(ride_id) is None:
+    if await asyncio.to_thread(get_ride_by_id, ride_id) is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Ride {ride_id} not found",
@@ -195,14 +197,14 @@ def mark_ride_as_duplicate(
 
     # The kept ride must exist and be live. Look it up including soft-deleted so
     # a duplicate (always soft-deleted) yields a precise error, not a plain 404.
-    target = get_ride_by_id(target_id, include_deleted=True)
+    target = await asyncio.to_thread(get_ride_by_id, target_id, include_deleted=True)
     if target is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Ride to keep ({target_id}) not found",
         )
     if target.deleted_at is not None:
-        if get_ride_duplicate_of(target_id) is not None:
+        if await asyncio.to_thread(get_ride_duplicate_of, target_id) is not None:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail=(
@@ -215,11 +217,12 @@ def mark_ride_as_duplicate(
             detail=f"Ride to keep ({target_id}) has been deleted",
         )
 
-    if is_ride_synced(ride_id):
-        result = perform_unsync(
+    if await asyncio.to_thread(is_ride_synced, ride_id):
+        result = await run_calendar_call(
+            perform_unsync,
             entity_id=ride_id,
             entity_type="ride",
-            synced_record=get_synced_ride(ride_id),
+            synced_record=await asyncio.to_thread(get_synced_ride, ride_id),
             delete_sync_record=lambda: delete_synced_ride(ride_id),
         )
         if not result.success:
@@ -228,7 +231,7 @@ def mark_ride_as_duplicate(
                 detail=f"Could not unsync ride before marking duplicate: {result.message}",
             )
 
-    if not mark_ride_duplicate(ride_id, target_id):
+    if not await asyncio.to_thread(mark_ride_duplicate, ride_id, target_id):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"Ride {ride_id} could not be marked as a duplicate",
@@ -1,5 +1,6 @@
 """Google Calendar sync routes for rides."""
 
+import asyncio
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -14,6 +15,7 @@ from fitness.db.synced_rides import (
     get_synced_ride,
     update_synced_ride,
 )
+from fitness.integrations.google.calendar_client import run_calendar_call
 from fitness.models.sync import (
     SyncedRide,
     SyncResponse,
@@ -56,21 +58,22 @@ def get_ride_sync_status(
 
 
 @router.post("/rides/{ride_id}", response_model=SyncResponse)
-def sync_ride_to_calendar(
+async def sync_ride_to_calendar(
     ride_id: str,
     _user: User = Depends(require_editor),
 ) -> SyncResponse:
     """Sync a ride to Google Calendar."""
-    existing_sync = get_synced_ride(ride_id)
+    existing_sync = await asyncio.to_thread(get_synced_ride, ride_id)
 
-    ride = get_ride_by_id(ride_id)
+    ride = await asyncio.to_thread(get_ride_by_id, ride_id)
     if ride is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Ride {ride_id} not found",
         )
 
-    return perform_sync(
+    return await run_calendar_call(
+        perform_sync,
         entity_id=ride_id,
         entity_type="ride",
         existing_sync=existing_sync,
@@ -101,15 +104,16 @@ def sync_ride_to_calendar(
 
 
 @router.delete("/rides/{ride_id}", response_model=SyncResponse)
-def unsync_ride_from_calendar(
+async def unsync_ride_from_calendar(
     ride_id: str,
     _user: User = Depends(require_editor),
 ) -> SyncResponse:
     """Remove a ride's sync from Google Calendar."""
-    return perform_unsync(
+    return await run_calendar_call(
+        perform_unsync,
         entity_id=ride_id,
         entity_type="ride",
-        synced_record=get_synced_ride(ride_id),
+        synced_record=await asyncio.to_thread(get_synced_ride, ride_id),
         delete_sync_record=lambda: delete_synced_ride(ride_id),
     )
 
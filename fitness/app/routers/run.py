@@ -6,6 +6,7 @@ edit history, fetch a specific historical version, and restore a run to a
 previous version.
 """
 
+import asyncio
 import logging
 from datetime import datetime, timezone
 from typing import Any
@@ -29,6 +30,7 @@ from fitness.db.runs_history import (
 )
 from fitness.db.synced_runs import is_run_synced, get_synced_run, delete_synced_run
 from fitness.db.tags import set_run_tags
+from fitness.integrations.google.calendar_client import run_calendar_call
 from fitness.app.auth import require_viewer, require_editor
 from fitness.app.routers._sync_helpers import perform_unsync
 from fitness.models.user import User
@@ -301,7 +303,7 @@ class MarkDuplicateResponse(BaseModel):
 
 
 @router.post("/{run_id}/duplicate-of", response_model=MarkDuplicateResponse)
-def mark_run_as_duplicate(
+async def mark_run_as_duplicate(
     run_id: str,
     request: MarkDuplicateRequest,
     _user: User = Depends(require_editor),
@@ -315,7 +317,7 @@ def mark_run_as_duplicate(
     Side effect: if this run is synced to Google Calendar, it is unsynced first
     (the calendar event is deleted) so no orphaned event is left behind.
     """
-    _get_run_or_404(run_id)
+    await asyncio.to_thread(_get_run_or_404, run_id)
 
     target_id = request.duplicate_of_id
     if target_id == run_id:
@@ -327,14 +329,14 @@ def mark_run_as_duplicate(
     # The kept run must exist and be live. Look it up including soft-deleted so
     # we can give a precise error: a duplicate (always soft-deleted) would
     # otherwise read as a plain 404.
-    target = get_run_by_id(target_id, include_deleted=True)
+    target = await asyncio.to_thread(get_run_by_id, target_id, include_deleted=True)
     if target is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Run to keep ({target_id}) not found",
         )
     if target.deleted_at is not None:
-        if get_run_duplicate_of(target_id) is not None:
+        if await asyncio.to_thread(get_run_duplicate_of, target_id) is not None:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail=(
@@ -348,11 +350,12 @@ def mark_run_as_duplicate(
         )
 
     # Unsync from Google Calendar first so the marked-away run leaves no event.
-    if is_run_synced(run_id):
-        result = perform_unsync(
+    if await asyncio.to_thread(is_run_synced, run_id):
+        result = await run_calendar_call(
+            perform_unsync,
             entity_id=run_id,
             entity_type="run",
-            synced_record=get_synced_run(run_id),
+            synced_record=await asyncio.to_thread(get_synced_run, run_id),
             delete_sync_record=lambda: delete_synced_run(run_id),
         )
         if not result.success:
@@ -361,7 +364,9 @@ def mark_run_as_duplicate(
                 detail=f"Could not unsync run before marking duplicate: {result.message}",
             )
 
-    if not mark_run_duplicate(run_id, target_id, request.changed_by):
+    if not await asyncio.to_thread(
+        mark_run_duplicate, run_id, target_id, request.changed_by
+    ):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"Run {run_id} could not be marked as a duplicate",
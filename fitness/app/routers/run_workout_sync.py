@@ -1,23 +1,38 @@
 """Google Calendar sync routes for run workouts."""
 
+import asyncio
 import logging
 
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, BackgroundTasks, HTTPException, status, Depends
 
-from fitness.db.run_workouts import get_run_workout_by_id, get_run_ids_for_workout
-from fitness.db.runs import get_run_by_id
+from fitness.db.run_workouts import (
+    get_run_workout_by_id,
+    get_run_workouts_by_ids,
+    get_run_ids_for_workouts,
+)
+from fitness.db.runs import get_runs_by_ids, get_runs_for_workout
 from fitness.db.synced_run_workouts import (
     get_synced_run_workout,
-    create_synced_run_workout,
-    update_synced_run_workout,
+    get_synced_run_workouts_by_ids,
+    bulk_upsert_synced_run_workouts,
     delete_synced_run_workout,
     get_all_synced_run_workouts,
     get_failed_run_workout_syncs,
 )
+from fitness.integrations.google.calendar_client import (
+    BATCH_MAX_REQUESTS,
+    GoogleCalendarClient,
+    get_calendar_client,
+    run_calendar_call,
+)
+from fitness.models.run import Run
+from fitness.models.run_workout import RunWorkout
 from fitness.models.sync import (
+    BatchRunWorkoutSyncRequest,
     SyncedRunWorkout,
     SyncResponse,
     SyncRunWorkoutStatusResponse,
+    SyncStatus,
 )
 from fitness.models.user import User
 from fitness.app.auth import require_viewer, require_editor
@@ -27,6 +42,16 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/sync", tags=["sync"])
 
+# How long a single-workout sync waits for others to share its batch request.
+EVENT_BATCH_WINDOW_SECONDS = 0.025
+
+_PendingEvent = tuple[RunWorkout, list[Run], asyncio.Future[str | None]]
+_pending_events: list[_PendingEvent] = []
+_pending_flush: asyncio.Task[None] | None = None
+# The event loop only keeps weak references to tasks, so in-flight batch sends
+# are held here until they finish.
+_batch_tasks: set[asyncio.Task[None]] = set()
+
 
 # Static routes must be registered before parameterized routes to avoid
 # path parameters like {run_workout_id} matching "failed".
@@ -80,13 +105,154 @@ def get_run_workout_sync_status(
     )
 
 
+# Declared before /run-workouts/{run_workout_id} so "batch" is not taken as an ID.
+@router.post("/run-workouts/batch", response_model=dict[str, SyncResponse])
+async def sync_run_workouts_to_calendar(
+    body: BatchRunWorkoutSyncRequest,
+    user: User = Depends(require_editor),
+) -> dict[str, SyncResponse]:
+    """Sync several run workouts to Google Calendar at once.
+
+    Workouts and their runs are loaded with a few queries, the events are
+    created with batched Calendar API calls, and the outcomes are written in
+    one statement. Returns one result per requested run workout ID.
+    """
+    workout_ids = list(dict.fromkeys(body.run_workout_ids))
+    workouts = await asyncio.to_thread(get_run_workouts_by_ids, workout_ids)
+    existing_syncs = {
+        synced.run_workout_id: synced
+        for synced in await asyncio.to_thread(
+            get_synced_run_workouts_by_ids, workout_ids
+        )
+    }
+    run_ids_by_workout = await asyncio.to_thread(
+        get_run_ids_for_workouts, list(workouts)
+    )
+    runs_by_id = {
+        run.id: run
+        for run in await asyncio.to_thread(
+            get_runs_by_ids,
+            [run_id for run_ids in run_ids_by_workout.values() for run_id in run_ids],
+        )
+    }
+
+    results: dict[str, SyncResponse] = {}
+    to_sync: list[tuple[RunWorkout, list[Run]]] = []
+    for workout_id in workout_ids:
+        existing_sync = existing_syncs.get(workout_id)
+        if existing_sync and existing_sync.sync_status == "synced":
+            results[workout_id] = SyncResponse(
+                success=False,
+                message=f"Run workout {workout_id} is already synced to Google Calendar",
+                google_event_id=existing_sync.google_event_id,
+                sync_status=existing_sync.sync_status,
+                synced_at=existing_sync.synced_at,
+            )
+            continue
+        if workout_id not in workouts:
+            results[workout_id] = SyncResponse(
+                success=False,
+                message=f"Run workout {workout_id} not found",
+                sync_status="failed",
+            )
+            continue
+        runs = [
+            runs_by_id[run_id]
+            for run_id in run_ids_by_workout.get(workout_id, [])
+            if run_id in runs_by_id
+        ]
+        if len(runs) < 2:
+            results[workout_id] = SyncResponse(
+                success=False,
+                message=f"Run workout {workout_id} has fewer than 2 valid runs",
+                sync_status="failed",
+            )
+            continue
+        to_sync.append((workouts[workout_id], runs))
+
+    if to_sync:
+        results.update(await run_calendar_call(_sync_run_workouts, to_sync))
+    return results
+
+
+def _sync_run_workouts(
+    workouts: list[tuple[RunWorkout, list[Run]]],
+) -> dict[str, SyncResponse]:
+    """Create Google Calendar events for run workouts in batches and record the outcomes."""
+    try:
+        event_ids = get_calendar_client().create_run_workout_events(workouts)
+    except Exception as e:
+        logger.exception(
+            f"Error batch syncing run workouts to Google Calendar: count={len(workouts)}, "
+            f"exception_type={type(e).__name__}, error={str(e)}"
+        )
+        event_ids = {}
+
+    records: list[tuple[str, str, SyncStatus, str | None]] = []
+    for workout, _ in workouts:
+        event_id = event_ids.get(workout.id)
+        if event_id:
+            records.append((workout.id, event_id, "synced", None))
+        else:
+            message = (
+                f"Failed to sync run workout {workout.id}: "
+                "Failed to create Google Calendar event"
+            )
+            records.append((workout.id, "", "failed", message))
+    try:
+        saved = {
+            synced.run_workout_id: synced
+            for synced in bulk_upsert_synced_run_workouts(records)
+        }
+    except Exception as e:
+        logger.exception(
+            f"Failed to persist batch sync results to database: count={len(records)}, "
+            f"exception_type={type(e).__name__}, error={str(e)}"
+        )
+        saved = {}
+
+    results: dict[str, SyncResponse] = {}
+    for workout_id, event_id, sync_status, error_message in records:
+        if sync_status == "synced":
+            synced = saved.get(workout_id)
+            results[workout_id] = SyncResponse(
+                success=True,
+                message=f"Successfully synced run workout {workout_id} to Google Calendar",
+                google_event_id=event_id,
+                sync_status="synced",
+                synced_at=synced.synced_at if synced else None,
+            )
+        else:
+            results[workout_id] = SyncResponse(
+                success=False, message=error_message or "", sync_status="failed"
+            )
+    return results
+
+
+def _upsert_sync_record(
+    run_workout_id: str,
+    google_event_id: str,
+    sync_status: SyncStatus,
+    error_message: str | None = None,
+) -> SyncedRunWorkout:
+    [synced] = bulk_upsert_synced_run_workouts(
+        [(run_workout_id, google_event_id, sync_status, error_message)]
+    )
+    return synced
+
+
 @router.post("/run-workouts/{run_workout_id}", response_model=SyncResponse)
-def sync_run_workout_to_calendar(
+async def sync_run_workout_to_calendar(
     run_workout_id: str,
+    background_tasks: BackgroundTasks,
     user: User = Depends(require_editor),
 ) -> SyncResponse:
-    """Sync a run workout to Google Calendar as a single event."""
-    existing_sync = get_synced_run_workout(run_workout_id)
+    """Sync a run workout to Google Calendar as a single event.
+
+    Async so that waiting on Google (which can take seconds) doesn't hold a
+    threadpool worker; database calls still run in threads.
+    """
+    existing_sync = await asyncio.to_thread(get_synced_run_workout, run_workout_id)
     if existing_sync and existing_sync.sync_status == "synced":
         return SyncResponse(
             success=False,
@@ -96,16 +262,15 @@ def sync_run_workout_to_calendar(
             synced_at=existing_sync.synced_at,
         )
 
-    workout = get_run_workout_by_id(run_workout_id)
+    workout = await asyncio.to_thread(get_run_workout_by_id, run_workout_id)
     if workout is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Run workout {run_workout_id} not found",
         )
 
-    # Fetch constituent runs
-    run_ids = get_run_ids_for_workout(run_workout_id)
-    runs = [run for rid in run_ids if (run := get_run_by_id(rid)) is not None]
+    # Fetch constituent runs in one query
+    runs = await asyncio.to_thread(get_runs_for_workout, run_workout_id)
 
     if len(runs) < 2:
         raise HTTPException(
@@ -113,34 +278,104 @@ def sync_run_workout_to_calendar(
             detail=f"Run workout {run_workout_id} has fewer than 2 valid runs",
         )
 
-    return perform_sync(
+    # Create the event here, on the event loop; perform_sync (which only
+    # touches the database from here on) is handed the outcome.
+    event_error: Exception | None = None
+    event_id: str | None = None
+    try:
+        client = await asyncio.to_thread(get_calendar_client)
+        event_id = await _create_event_batched(client, workout, runs)
+    except Exception as e:
+        event_error = e
+
+    def create_calendar_event(_client: GoogleCalendarClient) -> str | None:
+        if event_error is not None:
+            raise event_error
+        return event_id
+
+    return await asyncio.to_thread(
+        perform_sync,
         entity_id=run_workout_id,
         entity_type="run workout",
         existing_sync=existing_sync,
-        create_calendar_event=lambda client: client.create_run_workout_event(workout, runs),
-        create_sync_record=lambda gid, s: create_synced_run_workout(
-            run_workout_id=run_workout_id, google_event_id=gid, run_workout_version=1, sync_status=s,
-        ),
-        update_sync_record=lambda gid: update_synced_run_workout(
-            run_workout_id=run_workout_id, google_event_id=gid, sync_status="synced", clear_error_message=True,
+        create_calendar_event=create_calendar_event,
+        # One upsert covers first syncs, retries and failures alike.
+        create_sync_record=lambda gid, s: _upsert_sync_record(run_workout_id, gid, s),
+        update_sync_record=lambda gid: _upsert_sync_record(
+            run_workout_id, gid, "synced"
         ),
-        record_failure=lambda gid, msg: (
-            update_synced_run_workout(run_workout_id=run_workout_id, sync_status="failed", error_message=msg)
-            if existing_sync
-            else create_synced_run_workout(run_workout_id=run_workout_id, google_event_id=gid, sync_status="failed", error_message=msg)
+        # The failed response doesn't need the record, so write it afterwards.
+        record_failure=lambda gid, msg: background_tasks.add_task(
+            _upsert_sync_record, run_workout_id, gid or "", "failed", msg
         ),
     )
 
 
+async def _create_event_batched(
+    client: GoogleCalendarClient, workout: RunWorkout, runs: list[Run]
+) -> str | None:
+    """Create a run workout's calendar event, sharing a batch request with others.
+
+    Requests arriving within EVENT_BATCH_WINDOW_SECONDS of each other (up to
+    BATCH_MAX_REQUESTS) go to Google as one batch; each caller gets back its
+    own event ID, or the exception if the batch request raised.
+    """
+    global _pending_flush
+    future: asyncio.Future[str | None] = asyncio.get_running_loop().create_future()
+    _pending_events.append((workout, runs, future))
+    if len(_pending_events) >= BATCH_MAX_REQUESTS:
+        batch = _pending_events.copy()
+        _pending_events.clear()
+        task = asyncio.ensure_future(_send_event_batch(client, batch))
+        _batch_tasks.add(task)
+        task.add_done_callback(_batch_tasks.discard)
+    elif _pending_flush is None:
+        _pending_flush = asyncio.ensure_future(_flush_after_window(client))
+    return await future
+
+
+async def _flush_after_window(client: GoogleCalendarClient) -> None:
+    global _pending_flush
+    try:
+        await asyncio.sleep(EVENT_BATCH_WINDOW_SECONDS)
+    finally:
+        # Even if cancelled, let the next request schedule a flush, or its
+        # events (and any left here) would never be sent.
+        _pending_flush = None
+    batch = _pending_events.copy()
+    _pending_events.clear()
+    if batch:
+        await _send_event_batch(client, batch)
+
+
+async def _send_event_batch(
+    client: GoogleCalendarClient, batch: list[_PendingEvent]
+) -> None:
+    try:
+        event_ids = await run_calendar_call(
+            client.create_run_workout_events,
+            [(workout, runs) for workout, runs, _ in batch],
+        )
+    except Exception as e:
+        for _, _, future in batch:
+            if not future.done():
+                future.set_exception(e)
+        return
+    for workout, _, future in batch:
+        if not future.done():
+            future.set_result(event_ids.get(workout.id))
+
+
 @router.delete("/run-workouts/{run_workout_id}", response_model=SyncResponse)
-def unsync_run_workout_from_calendar(
+async def unsync_run_workout_from_calendar(
     run_workout_id: str,
     user: User = Depends(require_editor),
 ) -> SyncResponse:
     """Remove a run workout's sync from Google Calendar."""
-    return perform_unsync(
+    return await run_calendar_call(
+        perform_unsync,
         entity_id=run_workout_id,
         entity_type="run workout",
-        synced_record=get_synced_run_workout(run_workout_id),
+        synced_record=await asyncio.to_thread(get_synced_run_workout, run_workout_id),
         delete_sync_record=lambda: delete_synced_run_workout(run_workout_id),
     )
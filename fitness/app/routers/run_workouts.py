@@ -2,6 +2,7 @@
 
 import logging
 from datetime import date, datetime, timedelta, timezone
+from operator import attrgetter, itemgetter
 from typing import Literal, Optional
 from zoneinfo import ZoneInfo
 
@@ -26,13 +27,16 @@ from fitness.db.run_workouts import (
     update_run_workout,
     set_run_workout_runs,
     delete_run_workout,
-    get_run_ids_for_workout,
 )
 from fitness.db.runs import (
     get_all_run_details,
-    get_run_details_by_ids,
+    get_run_details_for_workout,
 )
 
+# Module handles for the activity feed's lookups: resolving the functions at
+# call time keeps them patchable on their source modules in tests.
+from fitness.db import rides as rides_db, runs as runs_db, tags as tags_db
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/run-workouts", tags=["run-workouts"])
@@ -156,8 +160,13 @@ async def list_workouts(
 ) -> list[RunWorkoutSummary]:
     """List all run workouts with summary stats."""
     workouts = get_all_run_workouts()
-    all_details = get_all_run_details()
-    return [_build_workout_summary(w, all_details) for w in workouts]
+    # Group runs by their workout in one pass rather than scanning every run
+    # once per workout.
+    runs_by_workout: dict[str, list[RunDetail]] = {}
+    for run in get_all_run_details():
+        if run.run_workout_id:
+            runs_by_workout.setdefault(run.run_workout_id, []).append(run)
+    return [_build_workout_summary(w, runs_by_workout.get(w.id, [])) for w in workouts]
 
 
 @router.get("/{workout_id}", response_model=RunWorkoutDetailResponse)
@@ -208,15 +217,10 @@ async def replace_workout_runs(
     _reject_if_workout_synced(workout_id)
 
     try:
-        set_run_workout_runs(workout_id, request.run_ids)
+        workout = set_run_workout_runs(workout_id, request.run_ids)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    workout = get_run_workout_by_id(workout_id)
-    if workout is None:
-        raise HTTPException(
-            status_code=404, detail=f"Run workout {workout_id} not found"
-        )
     return _build_workout_detail_response(workout)
 
 
@@ -249,17 +253,16 @@ def fetch_cardio_activity_feed(
     `user_timezone` is provided, `start`/`end` are interpreted as dates in that
     timezone and each activity is filtered by its local date.
 
-    DB lookups are imported function-locally so tests can patch them on their
-    source modules (`fitness.db.runs` / `fitness.db.rides`).
+    DB lookups go through the `runs_db` / `rides_db` / `tags_db` module handles
+    so tests can patch them on their source modules.
     """
-    from fitness.db.runs import get_run_details_in_date_range, get_all_run_details
-    from fitness.db.rides import get_ride_details_in_date_range, get_all_ride_details
-
     if start != DEFAULT_START or end != DEFAULT_END:
-        all_runs = get_run_details_in_date_range(
+        all_runs = runs_db.get_run_details_in_date_range(
+            start, end, user_timezone=user_timezone
+        )
+        rides = rides_db.get_ride_details_in_date_range(
             start, end, user_timezone=user_timezone
         )
-        rides = get_ride_details_in_date_range(start, end, user_timezone=user_timezone)
         if user_timezone is not None:
             tz = ZoneInfo(user_timezone)
             all_runs = [
@@ -277,18 +280,16 @@ def fetch_cardio_activity_feed(
                 <= end
             ]
     else:
-        all_runs = get_all_run_details()
-        rides = get_all_ride_details()
+        all_runs = runs_db.get_all_run_details()
+        rides = rides_db.get_all_ride_details()
 
     # Batch-enrich with tags. Only the feed does this — other endpoints
     # returning RunDetail/RideDetail (e.g. GET /runs/details, GET /rides-details)
     # intentionally leave `tags: []` for now.
-    from fitness.db.tags import get_tags_for_run_ids, get_tags_for_ride_ids
-
-    run_tag_map = get_tags_for_run_ids([r.id for r in all_runs])
+    run_tag_map = tags_db.get_tags_for_run_ids([r.id for r in all_runs])
     for r in all_runs:
         r.tags = run_tag_map.get(r.id, [])
-    ride_tag_map = get_tags_for_ride_ids([r.id for r in rides])
+    ride_tag_map = tags_db.get_tags_for_ride_ids([r.id for r in rides])
     for r in rides:
         r.tags = ride_tag_map.get(r.id, [])
 
@@ -306,23 +307,28 @@ def build_activity_feed(
     aggregates, appends rides as solo items (rides are not grouped), and
     returns the combined feed sorted by datetime.
     """
-    # Partition into solo runs and workout-grouped runs
+    # Partition into solo runs and workout-grouped runs. Sorting first leaves
+    # each workout's runs in start order; the readers return runs ordered by
+    # datetime already, so this is a linear pass for Timsort.
     solo_runs: list[RunDetail] = []
     workout_runs: dict[str, list[RunDetail]] = {}
-    for run in all_runs:
+    for run in sorted(all_runs, key=attrgetter("datetime_utc")):
         if run.run_workout_id:
             workout_runs.setdefault(run.run_workout_id, []).append(run)
         else:
             solo_runs.append(run)
 
-    # Build feed items
+    # Build feed items, each paired with its sort datetime
     feed: list[
-        ActivityFeedRunItem | ActivityFeedWorkoutItem | ActivityFeedRideItem
+        tuple[
+            datetime,
+            ActivityFeedRunItem | ActivityFeedWorkoutItem | ActivityFeedRideItem,
+        ]
     ] = []
 
     # Add solo runs
     for run in solo_runs:
-        feed.append(ActivityFeedRunItem(item=run))
+        feed.append((run.datetime_utc, ActivityFeedRunItem(item=run)))
 
     # Add workouts (batch-fetch to avoid N+1 queries)
     if workout_runs:
@@ -335,7 +341,7 @@ def build_activity_feed(
             if workout is None:
                 # Workout was deleted but runs still have FK — treat as solo
                 for run in runs:
-                    feed.append(ActivityFeedRunItem(item=run))
+                    feed.append((run.datetime_utc, ActivityFeedRunItem(item=run)))
                 continue
 
             detail = _compute_workout_detail(workout, runs)
@@ -345,37 +351,30 @@ def build_activity_feed(
                 detail.is_synced = sync_record.sync_status == "synced"
                 detail.sync_status = sync_record.sync_status
                 detail.google_event_id = sync_record.google_event_id
-            feed.append(ActivityFeedWorkoutItem(item=detail))
+            feed.append(
+                (detail.start_datetime_utc, ActivityFeedWorkoutItem(item=detail))
+            )
 
     # Add rides (always solo — no ride workouts in v1)
     for ride in rides or []:
-        feed.append(ActivityFeedRideItem(item=ride))
-
-    # Sort by effective datetime
-    def sort_key(
-        item: ActivityFeedRunItem | ActivityFeedWorkoutItem | ActivityFeedRideItem,
-    ) -> datetime:
-        if isinstance(item, ActivityFeedWorkoutItem):
-            return item.item.start_datetime_utc
-        return item.item.datetime_utc
+        feed.append((ride.datetime_utc, ActivityFeedRideItem(item=ride)))
 
-    reverse = sort_order == "desc"
-    feed.sort(key=sort_key, reverse=reverse)
+    # Sort by effective datetime. The feed is a concatenation of segments that
+    # arrive already ordered (the DB readers return runs and rides by datetime),
+    # and Timsort merges such pre-sorted runs in near-linear time, so this beats
+    # a heapq.merge of the segments, whose merge loop runs in Python.
+    feed.sort(key=itemgetter(0), reverse=sort_order == "desc")
 
-    return feed
+    return [item for _, item in feed]
 
 
 # --- Helpers ---
 
 
 def _build_workout_summary(
-    workout: RunWorkout, all_details: list[RunDetail]
+    workout: RunWorkout, runs: list[RunDetail]
 ) -> RunWorkoutSummary:
-    """Build a summary response for a workout from pre-fetched run details."""
-    run_ids = get_run_ids_for_workout(workout.id)
-    runs = [r for r in all_details if r.id in set(run_ids)]
-    runs.sort(key=lambda r: r.datetime_utc)
-
+    """Build a summary response for a workout from its pre-fetched run details."""
     return RunWorkoutSummary(
         id=workout.id,
         title=workout.title,
@@ -383,7 +382,7 @@ def _build_workout_summary(
         run_count=len(runs),
         total_distance=sum(r.distance for r in runs),
         total_duration=sum(r.duration for r in runs),
-        start_datetime_utc=runs[0].datetime_utc if runs else None,
+        start_datetime_utc=min((r.datetime_utc for r in runs), default=None),
         created_at=workout.created_at,
     )
 
@@ -392,9 +391,8 @@ def _build_workout_detail_response(
     workout: RunWorkout,
 ) -> RunWorkoutDetailResponse:
     """Build a detail response for a workout by querying its runs."""
-    run_ids = get_run_ids_for_workout(workout.id)
-    runs = get_run_details_by_ids(run_ids)
-    runs.sort(key=lambda r: r.datetime_utc)
+    # Already ordered by datetime_utc.
+    runs = get_run_details_for_workout(workout.id)
 
     if not runs:
         return RunWorkoutDetailResponse(
@@ -411,10 +409,7 @@ def _build_workout_detail_response(
             created_at=workout.created_at,
         )
 
-    total_distance = sum(r.distance for r in runs)
-    total_duration = sum(r.duration for r in runs)
-    elapsed = _compute_elapsed_seconds(runs)
-    avg_hr = _compute_weighted_avg_hr(runs)
+    total_distance, total_duration, elapsed, avg_hr = _aggregate_runs(runs)
 
     return RunWorkoutDetailResponse(
         id=workout.id,
@@ -434,13 +429,11 @@ def _build_workout_detail_response(
 def _compute_workout_detail(
     workout: RunWorkout, runs: list[RunDetail]
 ) -> RunWorkoutDetail:
-    """Compute aggregated RunWorkoutDetail from a workout and its runs."""
-    runs.sort(key=lambda r: r.datetime_utc)
+    """Compute aggregated RunWorkoutDetail from a workout and its runs.
 
-    total_distance = sum(r.distance for r in runs)
-    total_duration = sum(r.duration for r in runs)
-    elapsed = _compute_elapsed_seconds(runs)
-    avg_hr = _compute_weighted_avg_hr(runs)
+    The runs must already be sorted by start time.
+    """
+    total_distance, total_duration, elapsed, avg_hr = _aggregate_runs(runs)
 
     return RunWorkoutDetail(
         id=workout.id,
@@ -458,24 +451,32 @@ def _compute_workout_detail(
     )
 
 
-def _compute_elapsed_seconds(runs: list[RunDetail]) -> float:
-    """Elapsed time from first run's start to last run's end."""
-    if not runs:
-        return 0.0
-    first_start = runs[0].datetime_utc
-    last_run = runs[-1]
-    last_end = last_run.datetime_utc + timedelta(seconds=last_run.duration)
-    return (last_end - first_start).total_seconds()
-
+def _aggregate_runs(
+    runs: list[RunDetail],
+) -> tuple[float, float, float, Optional[float]]:
+    """Totals for runs sorted by start time, computed in one pass.
 
-def _compute_weighted_avg_hr(runs: list[RunDetail]) -> Optional[float]:
-    """Duration-weighted average heart rate across runs."""
-    total_weighted = 0.0
+    Returns:
+        (total_distance, total_duration, elapsed_seconds, avg_heart_rate), where
+        elapsed runs from the first start to the latest end and the heart rate
+        is duration-weighted (None if no run has one).
+    """
+    if not runs:
+        return 0.0, 0.0, 0.0, None
+    total_distance = 0.0
     total_duration = 0.0
+    hr_weighted = 0.0
+    hr_duration = 0.0
+    last_end = runs[0].datetime_utc
     for run in runs:
+        total_distance += run.distance
+        total_duration += run.duration
+        end = run.datetime_utc + timedelta(seconds=run.duration)
+        if end > last_end:
+            last_end = end
         if run.avg_heart_rate is not None:
-            total_weighted += run.avg_heart_rate * run.duration
-            total_duration += run.duration
-    if total_duration == 0:
-        return None
-    return round(total_weighted / total_duration, 1)
+            hr_weighted += run.avg_heart_rate * run.duration
+            hr_duration += run.duration
+    elapsed = (last_end - runs[0].datetime_utc).total_seconds()
+    avg_hr = round(hr_weighted / hr_duration, 1) if hr_duration else None
+    return total_distance, total_duration, elapsed, avg_hr
@@ -1,7 +1,8 @@
+import asyncio
 import logging
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, Query
 from fastapi.responses import RedirectResponse
 
 from fitness.app.dependencies import strava_client
@@ -10,10 +11,10 @@ from fitness.models.user import User
 from fitness.models.responses import DataImportResponse
 from fitness.integrations.strava.client import StravaClient
 from fitness.models import Run, Ride
-from fitness.db.runs import get_existing_run_ids, bulk_create_runs
-from fitness.db.rides import get_existing_ride_ids, bulk_create_rides
+from fitness.db.runs import bulk_create_runs
+from fitness.db.rides import bulk_create_rides
 from fitness.db.sync_metadata import get_last_sync_time, update_last_sync_time
-from fitness.load.strava import load_strava_runs, load_strava_rides
+from fitness.load.strava import load_strava_activities
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +25,7 @@ PROVIDER_NAME = "strava"
 
 @router.post("/sync", response_model=DataImportResponse)
 async def sync_strava_data(
+    background_tasks: BackgroundTasks,
     full_sync: bool = Query(
         False,
         description="Force a full sync instead of incremental. "
@@ -41,10 +43,12 @@ async def sync_strava_data(
 
     Returns a summary of the sync operation including count of new runs inserted.
     """
+    # The Strava client and the DB calls all block, so they run in worker
+    # threads to keep the event loop free while a sync is in flight.
     # Determine sync start time for incremental sync
     after = None
     if not full_sync:
-        after = get_last_sync_time(PROVIDER_NAME)
+        after = await asyncio.to_thread(get_last_sync_time, PROVIDER_NAME)
         if after:
             logger.info(f"Performing incremental Strava sync from {after.isoformat()}")
         else:
@@ -55,36 +59,21 @@ async def sync_strava_data(
     # Record sync start time before fetching
     sync_time = datetime.now(timezone.utc)
 
-    # Runs ingestion
-    strava_runs = [
-        Run.from_strava(run) for run in load_strava_runs(strava_client, after=after)
-    ]
-    existing_run_ids = get_existing_run_ids()
-    new_runs = [run for run in strava_runs if run.id not in existing_run_ids]
-    if new_runs:
-        inserted_runs = bulk_create_runs(new_runs)
-        logger.info(f"Inserted {inserted_runs} new runs into the database")
-    else:
-        inserted_runs = 0
-        logger.info("No new runs to insert")
-
-    # Rides ingestion
-    strava_rides = [
-        Ride.from_strava(ride) for ride in load_strava_rides(strava_client, after=after)
-    ]
-    existing_ride_ids = get_existing_ride_ids()
-    new_rides = [ride for ride in strava_rides if ride.id not in existing_ride_ids]
-    if new_rides:
-        inserted_rides = bulk_create_rides(new_rides)
-        logger.info(f"Inserted {inserted_rides} new rides into the database")
-    else:
-        inserted_rides = 0
-        logger.info("No new rides to insert")
-
+    # Fetch runs (with their gear) and rides from one listing of activities.
+    raw_runs, raw_rides = await asyncio.to_thread(
+        load_strava_activities, strava_client, after=after
+    )
+    inserted_runs, inserted_rides = await asyncio.to_thread(
+        _store_new_activities,
+        [Run.from_strava(run) for run in raw_runs],
+        [Ride.from_strava(ride) for ride in raw_rides],
+    )
     inserted_count = inserted_runs + inserted_rides
 
-    # Update last sync time on successful completion
-    update_last_sync_time(PROVIDER_NAME, sync_time)
+    # Update last sync time on successful completion. The response doesn't
+    # depend on it, so it is written after the response goes out; if the write
+    # fails, the next sync just re-fetches activities the inserts will skip.
+    background_tasks.add_task(update_last_sync_time, PROVIDER_NAME, sync_time)
 
     sync_type = "full" if full_sync or after is None else "incremental"
     return DataImportResponse(
@@ -99,6 +88,25 @@ async def sync_strava_data(
     )
 
 
+def _store_new_activities(
+    strava_runs: list[Run], strava_rides: list[Ride]
+) -> tuple[int, int]:
+    """Insert the fetched runs and rides, skipping any already in the database.
+
+    The inserts use ON CONFLICT (id) DO NOTHING, so the database skips existing
+    IDs (including soft-deleted ones) in the same round trip, with no separate
+    existence check and no window between checking and inserting.
+
+    Returns:
+        (inserted_runs, inserted_rides)
+    """
+    inserted_runs = bulk_create_runs(strava_runs)
+    logger.info(f"Inserted {inserted_runs} new runs into the database")
+    inserted_rides = bulk_create_rides(strava_rides)
+    logger.info(f"Inserted {inserted_rides} new rides into the database")
+    return inserted_runs, inserted_rides
+
+
 @router.post(
     "/update-data",
     response_class=RedirectResponse,
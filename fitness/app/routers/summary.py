@@ -6,8 +6,7 @@ from fastapi import APIRouter, Depends
 
 from fitness.app.models import TrmnlSummary, Sex, LoadSeries
 from fitness.app.auth import require_viewer_or_api_key
-from fitness.agg import total_mileage, total_seconds
-from fitness.agg.training_load import training_stress_balance
+from fitness.agg.fused import aggregate_all
 from fitness.db.runs import get_all_runs
 from fitness.models import User
 
@@ -27,8 +26,6 @@ def get_trmnl_summary(
 ) -> TrmnlSummary:
     """Get the summary of the fitness data."""
     runs = get_all_runs()
-    miles_all_time = total_mileage(runs, date.min, date.max)
-    minutes_all_time = total_seconds(runs, date.min, date.max) / 60
 
     # Get today's date in the user's timezone (or UTC if no timezone provided)
     if user_timezone is None:
@@ -41,36 +38,33 @@ def get_trmnl_summary(
     current_year = today.year
     days_this_year = today.timetuple().tm_yday
 
-    # Calendar month and year totals
-    month_start = today.replace(day=1)
-    year_start = today.replace(day=1, month=1)
-    miles_this_calendar_month = total_mileage(
-        runs, month_start, date.max, user_timezone
-    )
-    miles_this_calendar_year = total_mileage(runs, year_start, date.max, user_timezone)
-    # Last 30 and 365 days totals
-    last_30_days_start = today - timedelta(days=30)
-    last_365_days_start = today - timedelta(days=365)
-    miles_last_30_days = total_mileage(
-        runs, last_30_days_start, date.max, user_timezone
-    )
-    miles_last_365_days = total_mileage(
-        runs, last_365_days_start, date.max, user_timezone
-    )
-
-    # Calculate training load series for the last 60 days
-    training_load_data = training_stress_balance(
-        activities=runs,
+    # Bucket every run by local day (and score the training load for the last
+    # 60 days) in one pass; the range totals below are sums over those buckets.
+    snapshot = aggregate_all(
+        runs,
+        load_start=today - timedelta(days=60),
+        load_end=today,
         max_hr=max_hr,
         resting_hr=resting_hr,
         lthr=lthr,
         sex=sex,
-        start_date=today - timedelta(days=60),
-        end_date=today,
         user_timezone=user_timezone,
     )
+    miles_all_time = snapshot.mileage_between(date.min, date.max)
+    minutes_all_time = snapshot.seconds_between(date.min, date.max) / 60
+
+    # Calendar month and year totals
+    month_start = today.replace(day=1)
+    year_start = today.replace(day=1, month=1)
+    miles_this_calendar_month = snapshot.mileage_between(month_start, date.max)
+    miles_this_calendar_year = snapshot.mileage_between(year_start, date.max)
+    # Last 30 and 365 days totals
+    last_30_days_start = today - timedelta(days=30)
+    last_365_days_start = today - timedelta(days=365)
+    miles_last_30_days = snapshot.mileage_between(last_30_days_start, date.max)
+    miles_last_365_days = snapshot.mileage_between(last_365_days_start, date.max)
 
-    reversed_data = list(reversed(training_load_data))
+    reversed_data = list(reversed(snapshot.training_load))
     load_data = [
         LoadSeries(
             name="tsb",
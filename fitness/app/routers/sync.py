@@ -1,5 +1,6 @@
 """Google Calendar sync routes."""
 
+import asyncio
 from fastapi import APIRouter, HTTPException, status, Depends
 import logging
 
@@ -12,6 +13,7 @@ from fitness.db.synced_runs import (
     get_all_synced_runs,
     get_failed_syncs,
 )
+from fitness.integrations.google.calendar_client import run_calendar_call
 from fitness.models.sync import (
     SyncedRun,
     SyncResponse,
@@ -57,21 +59,22 @@ def get_sync_status(
 
 
 @router.post("/runs/{run_id}", response_model=SyncResponse)
-def sync_run_to_calendar(
+async def sync_run_to_calendar(
     run_id: str,
     user: User = Depends(require_editor),
 ) -> SyncResponse:
     """Sync a run to Google Calendar. Requires OAuth 2.0 Bearer token."""
-    existing_sync = get_synced_run(run_id)
+    existing_sync = await asyncio.to_thread(get_synced_run, run_id)
 
-    run = get_run_by_id(run_id)
+    run = await asyncio.to_thread(get_run_by_id, run_id)
     if run is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Run {run_id} not found",
         )
 
-    return perform_sync(
+    return await run_calendar_call(
+        perform_sync,
         entity_id=run_id,
         entity_type="run",
         existing_sync=existing_sync,
@@ -91,15 +94,16 @@ def sync_run_to_calendar(
 
 
 @router.delete("/runs/{run_id}", response_model=SyncResponse)
-def unsync_run_from_calendar(
+async def unsync_run_from_calendar(
     run_id: str,
     user: User = Depends(require_editor),
 ) -> SyncResponse:
     """Remove a run's sync from Google Calendar. Requires OAuth 2.0 Bearer token."""
-    return perform_unsync(
+    return await run_calendar_call(
+        perform_unsync,
         entity_id=run_id,
         entity_type="run",
-        synced_record=get_synced_run(run_id),
+        synced_record=await asyncio.to_thread(get_synced_run, run_id),
         delete_sync_record=lambda: delete_synced_run(run_id),
     )
 
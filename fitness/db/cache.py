@@ -0,0 +1,64 @@
+"""Short-lived in-memory caches for database reads."""
+
+import copy
+import functools
+import threading
+import time
+from collections.abc import Callable, Hashable, Iterable
+from typing import Any, ParamSpec, TypeVar
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class TTLCache:
+    """Values loaded from the database, kept per key for a fixed time.
+
+    Writers in this package call invalidate() after committing; the TTL bounds
+    staleness from writes made by other processes. Thread-safe.
+    """
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get_or_load(self, key: Hashable, load: Callable[[], R]) -> R:
+        """Return the cached value for key, calling load() if it's missing or expired."""
+        now = time.monotonic()
+        with self._lock:
+            cached = self._entries.get(key)
+            generation = self._generation
+        if cached is not None and now - cached[0] < self.ttl_seconds:
+            return cached[1]
+
+        value = load()
+        with self._lock:
+            # Skip storing if a write invalidated the cache while we were loading.
+            if generation == self._generation:
+                self._entries[key] = (now, value)
+        return value
+
+    def invalidate(self, keys: Iterable[Hashable] | None = None) -> None:
+        """Drop the given keys, or every entry."""
+        with self._lock:
+            if keys is None:
+                self._entries.clear()
+            else:
+                for key in keys:
+                    self._entries.pop(key, None)
+            self._generation += 1
+
+    def cached(self, func: Callable[P, R]) -> Callable[P, R]:
+        """Decorate a query to cache its result per arguments.
+
+        Callers get a shallow copy, so they may mutate a returned list.
+        """
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            key = (func, args, tuple(sorted(kwargs.items())))
+            return copy.copy(self.get_or_load(key, lambda: func(*args, **kwargs)))
+
+        return wrapper
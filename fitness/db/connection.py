@@ -7,6 +7,19 @@ from psycopg_pool import ConnectionPool
 
 _pool: ConnectionPool | None = None
 
+# Pool sizing. Sync handlers run on FastAPI's 40-thread pool and /lifts/stats
+# fans out to three queries, so ten connections queued threads behind each other
+# under load. Checkout waits at most POOL_TIMEOUT_SECONDS, then raises
+# PoolTimeout (served as a 503) instead of tying up the thread for 30s.
+POOL_MIN_SIZE = 2
+POOL_MAX_SIZE = 20
+POOL_TIMEOUT_SECONDS = 10.0
+# Close connections idle above min_size after 5 minutes, and recycle every
+# connection after 30, so the pool shrinks back and never holds one Neon has
+# long since dropped.
+POOL_MAX_IDLE_SECONDS = 300.0
+POOL_MAX_LIFETIME_SECONDS = 1800.0
+
 
 def get_database_url() -> str:
     """Get the database URL from environment variables."""
@@ -31,8 +44,11 @@ def init_pool() -> None:
     global _pool
     _pool = ConnectionPool(
         get_database_url(),
-        min_size=2,
-        max_size=10,
+        min_size=POOL_MIN_SIZE,
+        max_size=POOL_MAX_SIZE,
+        timeout=POOL_TIMEOUT_SECONDS,
+        max_idle=POOL_MAX_IDLE_SECONDS,
+        max_lifetime=POOL_MAX_LIFETIME_SECONDS,
         # Validate each connection as it's handed out of the pool. Neon closes
         # idle connections server-side (idle timeout / compute autosuspend), and
         # the pool can't see that a pooled connection has died until it's used.
@@ -2,21 +2,59 @@
 
 import json
 import logging
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import date, datetime
+from operator import attrgetter
+from typing import TYPE_CHECKING
 
+from .cache import TTLCache
 from .connection import get_db_cursor, get_db_connection
+from .synced_lifts import _row_to_synced_lift
 from fitness.models.lift import Lift, Exercise, Set, ExerciseTemplate
-from fitness.models.sync import SyncStatus
+from fitness.models.sync import SyncedLift, SyncStatus
+
+if TYPE_CHECKING:
+    from psycopg import sql
 
 logger = logging.getLogger(__name__)
 
+# Exercises are stored as JSONB, which discards formatting, so they're encoded
+# compactly with one reused encoder; the dicts are freshly built and acyclic.
+_encode_exercises = json.JSONEncoder(separators=(",", ":"), check_circular=False).encode
+
 
 # --- Lifts ---
 
 
+# get_all_lifts() reads and parses every lift's exercises, and backs the lift
+# stats endpoints that dashboards load together, so results are kept in memory
+# briefly (as with get_all_runs). Lifts only change through bulk_create_lifts,
+# which invalidates the cache; the TTL bounds staleness from other processes.
+# The SQL aggregates behind those endpoints, and date-range reads, are cached
+# the same way, keyed on their arguments.
+ALL_LIFTS_CACHE_TTL_SECONDS = 30.0
+_lifts_cache = TTLCache(ALL_LIFTS_CACHE_TTL_SECONDS)
+
+
+def invalidate_all_lifts_cache() -> None:
+    """Drop cached lift reads. Call after writing lifts or exercise templates."""
+    _lifts_cache.invalidate()
+
+
 def get_all_lifts(include_deleted: bool = False) -> list[Lift]:
-    """Get all lifts from the database."""
+    """Get all lifts from the database.
+
+    Results are cached for ALL_LIFTS_CACHE_TTL_SECONDS; callers get their own
+    list but share the Lift objects, which they must not mutate.
+    """
+    lifts = _lifts_cache.get_or_load(
+        (get_all_lifts, include_deleted), lambda: _query_all_lifts(include_deleted)
+    )
+    return list(lifts)
+
+
+def _query_all_lifts(include_deleted: bool) -> list[Lift]:
     from psycopg import sql
 
     with get_db_cursor() as cursor:
@@ -33,6 +71,7 @@ def get_all_lifts(include_deleted: bool = False) -> list[Lift]:
         return [_row_to_lift(row) for row in rows]
 
 
+@_lifts_cache.cached
 def get_lifts_in_date_range(
     start_date: date | None = None,
     end_date: date | None = None,
@@ -47,6 +86,7 @@ def get_lifts_in_date_range(
 
     Returns:
         List of lifts matching the criteria, ordered by start_time descending.
+        Cached like get_all_lifts(), so the Lift objects must not be mutated.
     """
     from psycopg import sql
 
@@ -84,10 +124,20 @@ def get_lifts_in_date_range(
 
 
 @dataclass
-class LiftWithSync:
-    """A lift with its sync metadata from synced_lifts."""
+class LiftSummaryWithSync:
+    """A lift's summary columns with its sync metadata from synced_lifts.
+
+    Built from the totals stored alongside each lift at insert time, so the
+    exercises JSON is never read or parsed.
+    """
 
-    lift: Lift
+    id: str
+    title: str
+    start_time: datetime
+    end_time: datetime
+    total_volume_kg: float
+    total_sets: int
+    exercise_count: int
     is_synced: bool
     sync_status: SyncStatus | None
     synced_at: datetime | None
@@ -96,36 +146,55 @@ class LiftWithSync:
 
 
 _LIFT_WITH_SYNC_QUERY = """
-    SELECT l.id, l.title, l.description, l.start_time, l.end_time, l.exercises,
-           l.source, l.deleted_at,
+    SELECT l.id, l.title, l.start_time, l.end_time,
+           l.total_volume_kg, l.total_sets, l.exercise_count,
            sl.sync_status, sl.synced_at, sl.google_event_id, sl.error_message
     FROM lifts l
     LEFT JOIN synced_lifts sl ON sl.lift_id = l.id
 """
 
 
-def get_all_lifts_with_sync(include_deleted: bool = False) -> list[LiftWithSync]:
-    """Get all lifts with sync metadata from synced_lifts."""
+def get_all_lifts_with_sync(
+    include_deleted: bool = False,
+    limit: int | None = None,
+    offset: int = 0,
+    after: tuple[datetime, str] | None = None,
+) -> list[LiftSummaryWithSync]:
+    """Get summaries of all lifts with sync metadata from synced_lifts.
+
+    Args:
+        include_deleted: If True, include soft-deleted lifts.
+        limit: If provided, return at most this many lifts.
+        offset: Number of lifts to skip, newest first.
+        after: If provided, the (start_time, id) of the last lift on the
+            previous page; only lifts after it in newest-first order are returned.
+    """
     from psycopg import sql
 
     with get_db_cursor() as cursor:
         conditions: list[sql.Composable] = []
+        params: list = []
         if not include_deleted:
             conditions.append(sql.SQL("l.deleted_at IS NULL"))
+        if after is not None:
+            conditions.append(sql.SQL("(l.start_time, l.id) < (%s, %s)"))
+            params.extend(after)
 
         where_clause = (
             sql.SQL("WHERE ") + sql.SQL(" AND ").join(conditions)
             if conditions
             else sql.SQL("")
         )
+        page_clause, page_params = _page_clause(limit, offset)
         query = sql.SQL(
             _LIFT_WITH_SYNC_QUERY
             + """
             {where_clause}
-            ORDER BY l.start_time DESC
+            ORDER BY l.start_time DESC, l.id DESC
+            {page_clause}
         """
-        ).format(where_clause=where_clause)
-        cursor.execute(query)
+        ).format(where_clause=where_clause, page_clause=page_clause)
+        cursor.execute(query, params + page_params)
         return [_row_to_lift_with_sync(row) for row in cursor.fetchall()]
 
 
@@ -133,8 +202,21 @@ def get_lifts_in_date_range_with_sync(
     start_date: date | None = None,
     end_date: date | None = None,
     include_deleted: bool = False,
-) -> list[LiftWithSync]:
-    """Get lifts with sync metadata within a date range."""
+    limit: int | None = None,
+    offset: int = 0,
+    after: tuple[datetime, str] | None = None,
+) -> list[LiftSummaryWithSync]:
+    """Get summaries of lifts with sync metadata within a date range.
+
+    Args:
+        start_date: If provided, only include lifts on or after this date.
+        end_date: If provided, only include lifts before this date.
+        include_deleted: If True, include soft-deleted lifts.
+        limit: If provided, return at most this many lifts.
+        offset: Number of lifts to skip, newest first.
+        after: If provided, the (start_time, id) of the last lift on the
+            previous page; only lifts after it in newest-first order are returned.
+    """
     from psycopg import sql
 
     with get_db_cursor() as cursor:
@@ -149,21 +231,41 @@ def get_lifts_in_date_range_with_sync(
         if end_date is not None:
             conditions.append(sql.SQL("l.start_time < %s"))
             params.append(end_date)
+        if after is not None:
+            conditions.append(sql.SQL("(l.start_time, l.id) < (%s, %s)"))
+            params.extend(after)
 
         where_clause = (
             sql.SQL(" AND ").join(conditions) if conditions else sql.SQL("TRUE")
         )
+        page_clause, page_params = _page_clause(limit, offset)
         query = sql.SQL(
             _LIFT_WITH_SYNC_QUERY
             + """
             WHERE {where_clause}
-            ORDER BY l.start_time DESC
+            ORDER BY l.start_time DESC, l.id DESC
+            {page_clause}
         """
-        ).format(where_clause=where_clause)
-        cursor.execute(query, params)
+        ).format(where_clause=where_clause, page_clause=page_clause)
+        cursor.execute(query, params + page_params)
         return [_row_to_lift_with_sync(row) for row in cursor.fetchall()]
 
 
+def _page_clause(limit: int | None, offset: int) -> tuple["sql.Composable", list]:
+    """LIMIT/OFFSET clause (and params) for a page of results."""
+    from psycopg import sql
+
+    clause: sql.Composable = sql.SQL("")
+    params: list = []
+    if limit is not None:
+        clause += sql.SQL(" LIMIT %s")
+        params.append(limit)
+    if offset:
+        clause += sql.SQL(" OFFSET %s")
+        params.append(offset)
+    return clause, params
+
+
 def get_lift_by_id(lift_id: str) -> Lift | None:
     """Get a single lift by ID."""
     with get_db_cursor() as cursor:
@@ -182,6 +284,63 @@ def get_lift_by_id(lift_id: str) -> Lift | None:
         return _row_to_lift(row)
 
 
+def get_lift_with_sync(lift_id: str) -> tuple[Lift | None, SyncedLift | None]:
+    """Get a non-deleted lift and its sync record (if any) in one query."""
+    with get_db_cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT l.id, l.title, l.description, l.start_time, l.end_time,
+                   l.exercises, l.source, l.deleted_at,
+                   sl.id, sl.lift_id, sl.lift_version, sl.google_event_id,
+                   sl.synced_at, sl.sync_status, sl.error_message,
+                   sl.created_at, sl.updated_at
+            FROM lifts l
+            LEFT JOIN synced_lifts sl ON sl.lift_id = l.id
+            WHERE l.id = %s AND l.deleted_at IS NULL
+            """,
+            (lift_id,),
+        )
+        row = cursor.fetchone()
+        if row is None:
+            return None, None
+        sync_row = row[8:]
+        synced_lift = None if sync_row[0] is None else _row_to_synced_lift(sync_row)
+        return _row_to_lift(row[:8]), synced_lift
+
+
+def get_lifts_with_sync(
+    lift_ids: list[str],
+) -> dict[str, tuple[Lift, SyncedLift | None]]:
+    """Get non-deleted lifts and their sync records (if any) in one query.
+
+    Returns:
+        Map of lift ID to (lift, sync record); IDs with no live lift are absent.
+    """
+    if not lift_ids:
+        return {}
+    with get_db_cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT l.id, l.title, l.description, l.start_time, l.end_time,
+                   l.exercises, l.source, l.deleted_at,
+                   sl.id, sl.lift_id, sl.lift_version, sl.google_event_id,
+                   sl.synced_at, sl.sync_status, sl.error_message,
+                   sl.created_at, sl.updated_at
+            FROM lifts l
+            LEFT JOIN synced_lifts sl ON sl.lift_id = l.id
+            WHERE l.id = ANY(%s) AND l.deleted_at IS NULL
+            """,
+            (list(lift_ids),),
+        )
+        found = {}
+        for row in cursor.fetchall():
+            sync_row = row[8:]
+            synced_lift = None if sync_row[0] is None else _row_to_synced_lift(sync_row)
+            found[row[0]] = (_row_to_lift(row[:8]), synced_lift)
+        return found
+
+
+@_lifts_cache.cached
 def get_lift_count(include_deleted: bool = False) -> int:
     """Get total count of lifts."""
     from psycopg import sql
@@ -196,17 +355,191 @@ def get_lift_count(include_deleted: bool = False) -> int:
         return result[0] if result else 0
 
 
-def get_existing_lift_ids() -> set[str]:
-    """Get the set of all existing lift IDs in the database."""
+@dataclass(frozen=True)
+class LiftTotals:
+    """Summed stats over a set of lifts."""
+
+    sessions: int
+    volume_kg: float
+    sets: int
+    duration_seconds: int
+
+
+@_lifts_cache.cached
+def get_lift_totals(
+    start_date: date | None = None, end_date: date | None = None
+) -> LiftTotals:
+    """Sum session count, volume, sets, and duration over non-deleted lifts.
+
+    Aggregates in SQL over the per-lift total_volume_kg and total_sets columns
+    written at insert time, so no lift's exercises are loaded or parsed.
+
+    Args:
+        start_date: If provided, only count lifts on or after this date.
+        end_date: If provided, only count lifts before this date.
+    """
+    from psycopg import sql
+
+    where_clause, params = _lift_period_filter(start_date, end_date)
+    query = sql.SQL("""
+        SELECT COUNT(*),
+               COALESCE(SUM(total_volume_kg), 0),
+               COALESCE(SUM(total_sets), 0),
+               COALESCE(SUM(TRUNC(EXTRACT(EPOCH FROM end_time - start_time))), 0)
+        FROM lifts
+        WHERE {where_clause}
+    """).format(where_clause=where_clause)
+
     with get_db_cursor() as cursor:
-        cursor.execute("SELECT id FROM lifts")
-        return {row[0] for row in cursor.fetchall()}
+        cursor.execute(query, params)
+        row = cursor.fetchone()
+    sessions, volume, sets, duration = row if row else (0, 0, 0, 0)
+    return LiftTotals(
+        sessions=sessions,
+        volume_kg=float(volume),
+        sets=int(sets),
+        duration_seconds=int(duration),
+    )
+
+
+@_lifts_cache.cached
+def get_lift_avg_rpe(
+    start_date: date | None = None, end_date: date | None = None
+) -> float | None:
+    """Average RPE over the non-warmup sets of non-deleted lifts that have one.
+
+    Unnests the exercises JSON in the database, so only the average comes
+    back. Returns None if no set in the range has an RPE.
+
+    Args:
+        start_date: If provided, only include lifts on or after this date.
+        end_date: If provided, only include lifts before this date.
+    """
+    from psycopg import sql
+
+    where_clause, params = _lift_period_filter(start_date, end_date)
+    query = sql.SQL("""
+        SELECT AVG((s->>'rpe')::float)
+        FROM lifts,
+             jsonb_array_elements(exercises) AS e,
+             jsonb_array_elements(e->'sets') AS s
+        WHERE {where_clause}
+          AND s->>'set_type' IS DISTINCT FROM 'warmup'
+          AND s->>'rpe' IS NOT NULL
+    """).format(where_clause=where_clause)
+
+    with get_db_cursor() as cursor:
+        cursor.execute(query, params)
+        row = cursor.fetchone()
+    avg_rpe = row[0] if row else None
+    return None if avg_rpe is None else float(avg_rpe)
+
+
+@_lifts_cache.cached
+def get_set_counts_by_muscle(
+    start_date: date | None = None, end_date: date | None = None
+) -> list[tuple[str, int]]:
+    """Count non-warmup sets per primary muscle group, most sets first.
+
+    Unnests the exercises JSON and joins each exercise to its template in the
+    database. Exercises without a template, or whose template has no muscle
+    group, are skipped.
+
+    Args:
+        start_date: If provided, only count lifts on or after this date.
+        end_date: If provided, only count lifts before this date.
+    """
+    from psycopg import sql
+
+    where_clause, params = _lift_period_filter(start_date, end_date)
+    query = sql.SQL("""
+        SELECT t.primary_muscle_group,
+               COUNT(s) FILTER (WHERE s->>'set_type' IS DISTINCT FROM 'warmup')
+        FROM lifts
+        CROSS JOIN jsonb_array_elements(exercises) AS e
+        JOIN exercise_templates t ON t.id = e->>'exercise_template_id'
+        LEFT JOIN LATERAL jsonb_array_elements(e->'sets') AS s ON TRUE
+        WHERE {where_clause}
+          AND t.primary_muscle_group <> ''
+        GROUP BY t.primary_muscle_group
+        ORDER BY 2 DESC, 1
+    """).format(where_clause=where_clause)
+
+    with get_db_cursor() as cursor:
+        cursor.execute(query, params)
+        return [(muscle, count) for muscle, count in cursor.fetchall()]
+
+
+@_lifts_cache.cached
+def get_frequent_exercise_counts(
+    start_date: date | None = None, end_date: date | None = None, limit: int = 5
+) -> list[tuple[str, int]]:
+    """Count how many times each exercise (by title) was performed.
+
+    Returns the ``limit`` most frequent exercises, most frequent first.
+
+    Args:
+        start_date: If provided, only count lifts on or after this date.
+        end_date: If provided, only count lifts before this date.
+        limit: Maximum number of exercises to return.
+    """
+    from psycopg import sql
+
+    where_clause, params = _lift_period_filter(start_date, end_date)
+    query = sql.SQL("""
+        SELECT COALESCE(e->>'title', ''), COUNT(*)
+        FROM lifts, jsonb_array_elements(exercises) AS e
+        WHERE {where_clause}
+        GROUP BY 1
+        ORDER BY 2 DESC, 1
+        LIMIT %s
+    """).format(where_clause=where_clause)
+
+    with get_db_cursor() as cursor:
+        cursor.execute(query, [*params, limit])
+        return [(title, count) for title, count in cursor.fetchall()]
+
+
+def _lift_period_filter(
+    start_date: date | None, end_date: date | None
+) -> tuple["sql.Composable", list]:
+    """WHERE clause (and params) for non-deleted lifts in [start_date, end_date)."""
+    from psycopg import sql
+
+    conditions: list[sql.Composable] = [sql.SQL("deleted_at IS NULL")]
+    params: list = []
+    if start_date is not None:
+        conditions.append(sql.SQL("start_time >= %s"))
+        params.append(start_date)
+    if end_date is not None:
+        conditions.append(sql.SQL("start_time < %s"))
+        params.append(end_date)
+    return sql.SQL(" AND ").join(conditions), params
+
+
+def get_existing_lift_ids(
+    prefix: str | None = None, among: Iterable[str] | None = None
+) -> set[str]:
+    """Get the set of existing lift IDs in the database.
+
+    Args:
+        prefix: If given, only return IDs with this provider prefix (e.g.
+            "hevy_"), with the prefix stripped so they match the provider's
+            own IDs.
+        among: If given, only check these IDs (unprefixed if `prefix` is
+            given) and return the ones that exist, rather than loading every
+            ID in the table.
+    """
+    return _get_existing_ids("lifts", prefix, among)
 
 
 def bulk_create_lifts(lifts: list[Lift]) -> int:
     """Bulk insert new lifts. Returns count of inserted rows.
 
-    Skips lifts that already exist (by ID) to preserve local edits.
+    Skips lifts that already exist (by ID) to preserve local edits. Rows are
+    streamed with COPY into a temporary table, serializing one lift's
+    exercises at a time, then moved into lifts with ON CONFLICT DO NOTHING,
+    all within a single transaction.
 
     Args:
         lifts: List of Lift objects to insert (already converted from provider format)
@@ -214,38 +547,56 @@ def bulk_create_lifts(lifts: list[Lift]) -> int:
     if not lifts:
         return 0
 
+    from psycopg import sql
+
     logger.info(f"Bulk inserting {len(lifts)} lifts")
+    columns = sql.SQL("""
+        id, title, source, description, start_time, end_time,
+        exercises, total_volume_kg, total_sets, exercise_count
+    """)
 
     with get_db_connection() as conn:
         with conn.transaction():
             with conn.cursor() as cursor:
-                count = 0
-                for lift in lifts:
-                    exercises_json = json.dumps(
-                        [_generic_exercise_to_dict(e) for e in lift.exercises]
-                    )
-                    cursor.execute(
-                        """
-                        INSERT INTO lifts (
-                            id, title, source, description, start_time, end_time,
-                            exercises, total_volume_kg, total_sets
-                        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+                # COPY can't skip conflicting rows itself, so it fills a
+                # staging table that the INSERT below filters.
+                cursor.execute(
+                    "CREATE TEMP TABLE tmp_lifts (LIKE lifts INCLUDING DEFAULTS) "
+                    "ON COMMIT DROP"
+                )
+                with cursor.copy(
+                    sql.SQL("COPY tmp_lifts ({}) FROM STDIN").format(columns)
+                ) as copy:
+                    for lift in lifts:
+                        copy.write_row(
+                            (
+                                lift.id,
+                                lift.title,
+                                lift.source,
+                                lift.description,
+                                lift.start_time,
+                                lift.end_time,
+                                _encode_exercises(
+                                    [
+                                        _generic_exercise_to_dict(e)
+                                        for e in lift.exercises
+                                    ]
+                                ),
+                                lift.total_volume(),
+                                lift.total_sets(),
+                                len(lift.exercises),
+                            )
+                        )
+                cursor.execute(
+                    sql.SQL("""
+                        INSERT INTO lifts ({columns})
+                        SELECT {columns} FROM tmp_lifts
                         ON CONFLICT (id) DO NOTHING
-                        """,
-                        (
-                            lift.id,
-                            lift.title,
-                            lift.source,
-                            lift.description,
-                            lift.start_time,
-                            lift.end_time,
-                            exercises_json,
-                            lift.total_volume(),
-                            lift.total_sets(),
-                        ),
-                    )
-                    count += cursor.rowcount  # Only count actually inserted rows
+                    """).format(columns=columns)
+                )
+                count = cursor.rowcount  # Only counts actually inserted rows
 
+    invalidate_all_lifts_cache()
     logger.info(f"Successfully inserted {count} new lifts")
     return count
 
@@ -253,15 +604,57 @@ def bulk_create_lifts(lifts: list[Lift]) -> int:
 # --- Exercise Templates ---
 
 
-def get_existing_exercise_template_ids() -> set[str]:
-    """Get the set of all cached exercise template IDs."""
+def get_existing_exercise_template_ids(
+    prefix: str | None = None, among: Iterable[str] | None = None
+) -> set[str]:
+    """Get the set of cached exercise template IDs.
+
+    Args:
+        prefix: If given, only return IDs with this provider prefix, stripped
+            (see get_existing_lift_ids).
+        among: If given, only check these IDs (see get_existing_lift_ids).
+    """
+    return _get_existing_ids("exercise_templates", prefix, among)
+
+
+def _get_existing_ids(
+    table: str, prefix: str | None, among: Iterable[str] | None
+) -> set[str]:
+    from psycopg import sql
+
+    prefix = prefix or ""
+    # One array row rather than a 1-tuple per ID; array_agg gives NULL when
+    # nothing matches.
+    query = sql.SQL("SELECT array_agg(id) FROM {table}").format(
+        table=sql.Identifier(table)
+    )
+    params: tuple = ()
+    if among is not None:
+        candidates = [f"{prefix}{id_}" for id_ in among]
+        if not candidates:
+            return set()
+        query += sql.SQL(" WHERE id = ANY(%s)")
+        params = (candidates,)
+    elif prefix:
+        # Escape LIKE wildcards; "_" in particular appears in provider prefixes.
+        escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        query += sql.SQL(" WHERE id LIKE %s")
+        params = (escaped + "%",)
+
     with get_db_cursor() as cursor:
-        cursor.execute("SELECT id FROM exercise_templates")
-        return {row[0] for row in cursor.fetchall()}
+        cursor.execute(query, params)
+        row = cursor.fetchone()
+    ids = row[0] if row else None
+    return {id_.removeprefix(prefix) for id_ in ids or ()}
 
 
+@_lifts_cache.cached
 def get_all_exercise_templates() -> list[ExerciseTemplate]:
-    """Get all cached exercise templates."""
+    """Get all cached exercise templates.
+
+    Results are cached like the lift aggregates and cleared when templates are
+    upserted; callers share the ExerciseTemplate objects and must not mutate them.
+    """
     with get_db_cursor() as cursor:
         cursor.execute("""
             SELECT id, title, type, primary_muscle_group, secondary_muscle_groups,
@@ -291,13 +684,17 @@ def get_exercise_template_by_id(template_id: str) -> ExerciseTemplate | None:
         return _row_to_exercise_template(row)
 
 
-def bulk_upsert_exercise_templates(templates: list[ExerciseTemplate]) -> int:
+def bulk_upsert_exercise_templates(
+    templates: list[ExerciseTemplate], chunk_size: int = 500
+) -> int:
     """Bulk upsert exercise templates. Returns count of rows affected.
 
     Uses ON CONFLICT DO UPDATE, so rowcount reflects actual database operations.
+    Rows are sent in chunks of `chunk_size` within a single transaction.
 
     Args:
         templates: List of ExerciseTemplate objects to upsert (already converted from provider format)
+        chunk_size: Number of templates per executemany batch
 
     Returns:
         Number of rows actually inserted or updated in the database.
@@ -307,12 +704,13 @@ def bulk_upsert_exercise_templates(templates: list[ExerciseTemplate]) -> int:
 
     logger.info(f"Bulk upserting {len(templates)} exercise templates")
 
+    count = 0
     with get_db_connection() as conn:
         with conn.transaction():
             with conn.cursor() as cursor:
-                count = 0
-                for template in templates:
-                    cursor.execute(
+                for i in range(0, len(templates), chunk_size):
+                    chunk = templates[i : i + chunk_size]
+                    cursor.executemany(
                         """
                         INSERT INTO exercise_templates (
                             id, title, source, type, primary_muscle_group,
@@ -326,18 +724,23 @@ def bulk_upsert_exercise_templates(templates: list[ExerciseTemplate]) -> int:
                             is_custom = EXCLUDED.is_custom,
                             updated_at = CURRENT_TIMESTAMP
                         """,
-                        (
-                            template.id,
-                            template.title,
-                            template.source,
-                            template.type,
-                            template.primary_muscle_group,
-                            template.secondary_muscle_groups,
-                            template.is_custom,
-                        ),
+                        [
+                            (
+                                template.id,
+                                template.title,
+                                template.source,
+                                template.type,
+                                template.primary_muscle_group,
+                                template.secondary_muscle_groups,
+                                template.is_custom,
+                            )
+                            for template in chunk
+                        ],
                     )
                     count += cursor.rowcount
 
+    # Template muscle groups feed get_set_counts_by_muscle.
+    invalidate_all_lifts_cache()
     logger.info(f"Successfully upserted {count} exercise templates")
     return count
 
@@ -358,13 +761,8 @@ def _row_to_lift(row: tuple) -> Lift:
         deleted_at,
     ) = row
 
-    # Parse exercises from JSON
-    exercises_data = (
-        exercises_json
-        if isinstance(exercises_json, list)
-        else json.loads(exercises_json or "[]")
-    )
-    exercises = [_dict_to_exercise(e) for e in exercises_data]
+    # exercises is JSONB, which psycopg already decodes to a list.
+    exercises = [_dict_to_exercise(e) for e in exercises_json or []]
 
     return Lift(
         id=id_,
@@ -378,14 +776,30 @@ def _row_to_lift(row: tuple) -> Lift:
     )
 
 
-def _row_to_lift_with_sync(row: tuple) -> LiftWithSync:
-    """Convert a database row (with sync columns) to a LiftWithSync."""
-    # First 8 columns are the lift fields, last 4 are sync metadata
-    lift = _row_to_lift(row[:8])
-    sync_status, synced_at, google_event_id, error_message = row[8:]
+def _row_to_lift_with_sync(row: tuple) -> LiftSummaryWithSync:
+    """Convert a database row (with sync columns) to a LiftSummaryWithSync."""
+    (
+        id_,
+        title,
+        start_time,
+        end_time,
+        total_volume_kg,
+        total_sets,
+        exercise_count,
+        sync_status,
+        synced_at,
+        google_event_id,
+        error_message,
+    ) = row
 
-    return LiftWithSync(
-        lift=lift,
+    return LiftSummaryWithSync(
+        id=id_,
+        title=title,
+        start_time=start_time,
+        end_time=end_time,
+        total_volume_kg=total_volume_kg or 0.0,
+        total_sets=total_sets or 0,
+        exercise_count=exercise_count or 0,
         is_synced=(sync_status == "synced"),
         sync_status=sync_status,
         synced_at=synced_at,
@@ -408,29 +822,32 @@ def _row_to_exercise_template(row: tuple) -> ExerciseTemplate:
     )
 
 
+# Field order for the stored exercise/set JSON, read in one attrgetter call
+# each rather than attribute by attribute.
+_EXERCISE_KEYS = ("index", "title", "notes", "exercise_template_id", "superset_id")
+_get_exercise_fields = attrgetter(*_EXERCISE_KEYS)
+_SET_KEYS = (
+    "index",
+    "set_type",
+    "weight_kg",
+    "reps",
+    "distance_meters",
+    "duration_seconds",
+    "rpe",
+)
+_get_set_fields = attrgetter(*_SET_KEYS)
+
+
 def _generic_exercise_to_dict(exercise: Exercise) -> dict:
     """Convert a generic Exercise to a dictionary for JSON serialization."""
-    return {
-        "index": exercise.index,
-        "title": exercise.title,
-        "notes": exercise.notes,
-        "exercise_template_id": exercise.exercise_template_id,
-        "superset_id": exercise.superset_id,
-        "sets": [_generic_set_to_dict(s) for s in exercise.sets],
-    }
+    data = dict(zip(_EXERCISE_KEYS, _get_exercise_fields(exercise)))
+    data["sets"] = [_generic_set_to_dict(s) for s in exercise.sets]
+    return data
 
 
 def _generic_set_to_dict(set_: Set) -> dict:
     """Convert a generic Set to a dictionary for JSON serialization."""
-    return {
-        "index": set_.index,
-        "set_type": set_.set_type,
-        "weight_kg": set_.weight_kg,
-        "reps": set_.reps,
-        "distance_meters": set_.distance_meters,
-        "duration_seconds": set_.duration_seconds,
-        "rpe": set_.rpe,
-    }
+    return dict(zip(_SET_KEYS, _get_set_fields(set_)))
 
 
 def _dict_to_exercise(data: dict) -> Exercise:
@@ -5,6 +5,7 @@ from psycopg import sql
 
 from fitness.models import Ride
 from fitness.models.ride_detail import RideDetail
+from fitness.utils.timezone import utc_day_bounds
 from .connection import get_db_cursor, get_db_connection
 
 logger = logging.getLogger(__name__)
@@ -88,9 +89,9 @@ def get_rides_in_date_range(
         if not include_deleted:
             deleted_filter = sql.SQL(" AND deleted_at IS NULL")
         query = sql.SQL(
-            "{select} WHERE DATE(datetime_utc) BETWEEN %s AND %s{deleted_filter} ORDER BY datetime_utc"
+            "{select} WHERE datetime_utc >= %s AND datetime_utc < %s{deleted_filter} ORDER BY datetime_utc"
         ).format(select=_RIDE_SELECT, deleted_filter=deleted_filter)
-        cursor.execute(query, [start_date, end_date])
+        cursor.execute(query, utc_day_bounds(start_date, end_date))
         rows = cursor.fetchall()
         return [_row_to_ride(row) for row in rows]
 
@@ -113,8 +114,12 @@ def get_rides_for_date_range(
     return get_rides_in_date_range(start, end)
 
 
-def bulk_create_rides(rides: list[Ride], chunk_size: int = 20) -> int:
-    """Insert multiple rides into the database in chunks. Returns the number of inserted rows."""
+def bulk_create_rides(rides: list[Ride], chunk_size: int = 500) -> int:
+    """Insert multiple rides into the database in chunks. Returns the number of inserted rows.
+
+    Each chunk is one pipelined executemany call, so chunks match the runs and
+    lifts writers; ride rows are narrow and smaller chunks only add round trips.
+    """
     if not rides:
         return 0
 
@@ -179,9 +184,9 @@ def get_ride_details_in_date_range(
             end_date = end_date + timedelta(days=1)
 
     conditions: list[sql.Composable] = [
-        sql.SQL("DATE(r.datetime_utc) BETWEEN %s AND %s")
+        sql.SQL("r.datetime_utc >= %s AND r.datetime_utc < %s")
     ]
-    params: list = [start_date, end_date]
+    params: list = list(utc_day_bounds(start_date, end_date))
     if not include_deleted:
         conditions.append(sql.SQL("r.deleted_at IS NULL"))
     if synced is True:
@@ -390,21 +395,6 @@ def find_candidate_duplicate_rides(
         return [_row_to_ride_detail(row) for row in cursor.fetchall()]
 
 
-def get_existing_ride_ids() -> set[str]:
-    """Get all existing ride IDs from the database, including soft-deleted ones.
-
-    Soft-deleted IDs are included so that re-imports from external providers
-    (e.g. Strava) skip rides the user has explicitly deleted, rather than
-    attempting to re-insert and hitting a primary-key conflict.
-    """
-    with get_db_cursor() as cursor:
-        cursor.execute("SELECT id FROM rides")
-        rows = cursor.fetchall()
-        existing_ids = {row[0] for row in rows}
-        logger.info(f"Found {len(existing_ids)} existing ride IDs in database")
-        return existing_ids
-
-
 def _row_to_ride(row) -> Ride:
     (
         ride_id,
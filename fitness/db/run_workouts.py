@@ -85,17 +85,14 @@ def get_run_workouts_by_ids(workout_ids: list[str]) -> dict[str, RunWorkout]:
     """Get multiple run workouts by ID (non-deleted only). Returns a dict keyed by ID."""
     if not workout_ids:
         return {}
-    from psycopg import sql as psql
-
     with get_db_cursor() as cursor:
-        placeholders = psql.SQL(", ").join(psql.Placeholder() * len(workout_ids))
         cursor.execute(
-            psql.SQL("""
-                SELECT id, title, notes, created_at, updated_at, deleted_at
-                FROM run_workouts
-                WHERE id IN ({}) AND deleted_at IS NULL
-            """).format(placeholders),
-            workout_ids,
+            """
+            SELECT id, title, notes, created_at, updated_at, deleted_at
+            FROM run_workouts
+            WHERE id = ANY(%s) AND deleted_at IS NULL
+            """,
+            (list(workout_ids),),
         )
         return {row[0]: _row_to_run_workout(row) for row in cursor.fetchall()}
 
@@ -153,11 +150,14 @@ def update_run_workout(
         return _row_to_run_workout(row) if row else None
 
 
-def set_run_workout_runs(workout_id: str, run_ids: list[str]) -> None:
+def set_run_workout_runs(workout_id: str, run_ids: list[str]) -> RunWorkout:
     """Replace the runs in a workout.
 
     Clears existing run associations and sets the new ones.
 
+    Returns:
+        The workout with its updated timestamp.
+
     Raises:
         ValueError: If validation fails.
     """
@@ -167,12 +167,18 @@ def set_run_workout_runs(workout_id: str, run_ids: list[str]) -> None:
     with get_db_connection() as conn:
         with conn.transaction():
             with conn.cursor() as cursor:
-                # Validate the workout exists
+                # Touch the workout first: this checks it exists and returns it,
+                # saving the caller a re-read. A failed validation rolls it back.
                 cursor.execute(
-                    "SELECT id FROM run_workouts WHERE id = %s AND deleted_at IS NULL",
+                    """
+                    UPDATE run_workouts SET updated_at = CURRENT_TIMESTAMP
+                    WHERE id = %s AND deleted_at IS NULL
+                    RETURNING id, title, notes, created_at, updated_at, deleted_at
+                    """,
                     (workout_id,),
                 )
-                if cursor.fetchone() is None:
+                row = cursor.fetchone()
+                if row is None:
                     raise ValueError(f"Run workout {workout_id} not found")
 
                 # Validate new run IDs (exclude runs currently in THIS workout)
@@ -187,11 +193,7 @@ def set_run_workout_runs(workout_id: str, run_ids: list[str]) -> None:
                 # Set new associations
                 _assign_runs_to_workout(cursor, workout_id, run_ids)
 
-                # Update timestamp
-                cursor.execute(
-                    "UPDATE run_workouts SET updated_at = CURRENT_TIMESTAMP WHERE id = %s",
-                    (workout_id,),
-                )
+                return _row_to_run_workout(row)
 
 
 def delete_run_workout(workout_id: str) -> bool:
@@ -216,18 +218,26 @@ def delete_run_workout(workout_id: str) -> bool:
                 return cursor.rowcount > 0
 
 
-def get_run_ids_for_workout(workout_id: str) -> list[str]:
-    """Get the run IDs belonging to a workout, ordered by datetime."""
+def get_run_ids_for_workouts(workout_ids: list[str]) -> dict[str, list[str]]:
+    """Get the run IDs belonging to each of several workouts, ordered by datetime.
+
+    Workouts with no runs are absent from the result.
+    """
+    if not workout_ids:
+        return {}
+    run_ids: dict[str, list[str]] = {}
     with get_db_cursor() as cursor:
         cursor.execute(
             """
-            SELECT id FROM runs
-            WHERE run_workout_id = %s AND deleted_at IS NULL
+            SELECT run_workout_id, id FROM runs
+            WHERE run_workout_id = ANY(%s) AND deleted_at IS NULL
             ORDER BY datetime_utc
             """,
-            (workout_id,),
+            (list(workout_ids),),
         )
-        return [row[0] for row in cursor.fetchall()]
+        for workout_id, run_id in cursor.fetchall():
+            run_ids.setdefault(workout_id, []).append(run_id)
+    return run_ids
 
 
 # --- Helpers ---
@@ -5,6 +5,8 @@ from psycopg import sql
 
 from fitness.models import Run
 from fitness.models.run_detail import RunDetail
+from fitness.utils.timezone import utc_day_bounds
+from .cache import TTLCache
 from .connection import get_db_cursor, get_db_connection
 from .runs_history import insert_run_history_with_cursor
 
@@ -19,7 +21,7 @@ _RUN_SELECT = sql.SQL("""
 
 _RUN_DETAIL_SELECT = sql.SQL("""
     SELECT r.id, r.datetime_utc, r.type, r.distance, r.duration, r.source, r.avg_heart_rate, r.shoe_id, r.deleted_at,
-           COALESCE(NULLIF(CONCAT_WS(' ', s.brand, s.model), ''), 'Unknown') as shoe_name, s.retirement_notes,
+           NULLIF(CONCAT_WS(' ', s.brand, s.model), '') as shoe_name, s.retirement_notes,
            sr.sync_status, sr.synced_at, sr.google_event_id, sr.run_version, sr.error_message, r.version,
            r.run_workout_id, r.notes, r.duplicate_of_id, r.name
     FROM runs r
@@ -27,6 +29,31 @@ _RUN_DETAIL_SELECT = sql.SQL("""
     LEFT JOIN synced_runs sr ON sr.run_id = r.id
 """)
 
+# Queries whose text never varies are composed once here. Passing psycopg the
+# same statement each call also lets it prepare the statement server-side once
+# a connection has run it a few times (prepare_threshold), so list lookups bind
+# the whole list to one ANY(%s) parameter rather than a placeholder per ID.
+_RUN_DETAILS_BY_IDS_QUERY = sql.SQL(
+    "{select} WHERE r.id = ANY(%s) AND r.deleted_at IS NULL ORDER BY r.datetime_utc ASC"
+).format(select=_RUN_DETAIL_SELECT)
+_RUNS_BY_IDS_QUERY = sql.SQL(
+    "{select} WHERE r.id = ANY(%s) AND r.deleted_at IS NULL ORDER BY r.datetime_utc ASC"
+).format(select=_RUN_SELECT)
+_RUN_DETAILS_FOR_WORKOUT_QUERY = sql.SQL(
+    "{select} WHERE r.run_workout_id = %s AND r.deleted_at IS NULL "
+    "ORDER BY r.datetime_utc ASC"
+).format(select=_RUN_DETAIL_SELECT)
+_RUNS_FOR_WORKOUT_QUERY = sql.SQL(
+    "{select} WHERE r.run_workout_id = %s AND r.deleted_at IS NULL "
+    "ORDER BY r.datetime_utc ASC"
+).format(select=_RUN_SELECT)
+_RUN_BY_ID_QUERY = sql.SQL("{select} WHERE r.id = %s AND r.deleted_at IS NULL").format(
+    select=_RUN_SELECT
+)
+_RUN_BY_ID_INCLUDING_DELETED_QUERY = sql.SQL("{select} WHERE r.id = %s").format(
+    select=_RUN_SELECT
+)
+
 
 def _build_run_detail_filters(
     include_deleted: bool = False,
@@ -48,8 +75,32 @@ def _build_run_detail_filters(
     return conditions
 
 
+# get_all_runs() reads the whole runs table and backs endpoints that dashboards
+# poll, so results are kept in memory briefly. Writers in this package call
+# invalidate_all_runs_cache(); the TTL bounds staleness from writes made by
+# other processes.
+ALL_RUNS_CACHE_TTL_SECONDS = 30.0
+_all_runs_cache = TTLCache(ALL_RUNS_CACHE_TTL_SECONDS)
+
+
+def invalidate_all_runs_cache() -> None:
+    """Drop cached get_all_runs() results. Call after writing runs or shoes."""
+    _all_runs_cache.invalidate()
+
+
 def get_all_runs(include_deleted: bool = False) -> list[Run]:
-    """Get all runs from the database with shoe information."""
+    """Get all runs from the database with shoe information.
+
+    Results are cached for ALL_RUNS_CACHE_TTL_SECONDS; callers get their own
+    list but share the Run objects, which they must not mutate.
+    """
+    runs = _all_runs_cache.get_or_load(
+        include_deleted, lambda: _query_all_runs(include_deleted)
+    )
+    return list(runs)
+
+
+def _query_all_runs(include_deleted: bool) -> list[Run]:
     with get_db_cursor() as cursor:
         deleted_filter = sql.SQL("") if include_deleted else sql.SQL(" WHERE r.deleted_at IS NULL")
         query = sql.SQL("{select} {deleted_filter} ORDER BY r.datetime_utc").format(
@@ -71,9 +122,9 @@ def get_runs_in_date_range(
         if not include_deleted:
             deleted_filter = sql.SQL(" AND r.deleted_at IS NULL")
         query = sql.SQL(
-            "{select} WHERE DATE(r.datetime_utc) BETWEEN %s AND %s{deleted_filter} ORDER BY r.datetime_utc"
+            "{select} WHERE r.datetime_utc >= %s AND r.datetime_utc < %s{deleted_filter} ORDER BY r.datetime_utc"
         ).format(select=_RUN_SELECT, deleted_filter=deleted_filter)
-        cursor.execute(query, [start_date, end_date])
+        cursor.execute(query, utc_day_bounds(start_date, end_date))
         rows = cursor.fetchall()
         return [_row_to_run(row) for row in rows]
 
@@ -96,8 +147,18 @@ def get_runs_for_date_range(
     return get_runs_in_date_range(start, end)
 
 
-def bulk_create_runs(runs: list[Run], chunk_size: int = 20) -> int:
-    """Insert multiple runs into the database in chunks with automatic history creation. Returns the number of inserted rows."""
+_RUN_INSERT_COLUMNS = sql.SQL(
+    "id, datetime_utc, type, distance, duration, source, avg_heart_rate, shoe_id, deleted_at, max_heart_rate, step_cadence, end_datetime_utc, source_name, imported_shoe_name"
+)
+_RUN_INSERT_ROW = sql.SQL("({})").format(sql.SQL(", ").join([sql.Placeholder()] * 14))
+
+
+def bulk_create_runs(runs: list[Run], chunk_size: int = 500) -> int:
+    """Insert multiple runs into the database in chunks with automatic history creation. Returns the number of inserted rows.
+
+    Runs whose ID already exists (including soft-deleted ones) are skipped by
+    the database, so callers need not filter them out first.
+    """
     if not runs:
         return 0
 
@@ -115,76 +176,90 @@ def bulk_create_runs(runs: list[Run], chunk_size: int = 20) -> int:
                 for i in range(0, len(runs), chunk_size):
                     chunk = runs[i : i + chunk_size]
 
-                    chunk_inserted = 0
+                    # One multi-row INSERT per chunk. ON CONFLICT DO NOTHING
+                    # ensures a previously-imported run (including soft-deleted
+                    # ones) is silently skipped rather than failing the whole
+                    # batch on a PK conflict; RETURNING says which rows landed.
+                    query = sql.SQL("""
+                        INSERT INTO runs ({columns})
+                        VALUES {rows}
+                        ON CONFLICT (id) DO NOTHING
+                        RETURNING id
+                    """).format(
+                        columns=_RUN_INSERT_COLUMNS,
+                        rows=sql.SQL(", ").join([_RUN_INSERT_ROW] * len(chunk)),
+                    )
+                    params = [
+                        value
+                        for run in chunk
+                        for value in (
+                            run.id,
+                            run.datetime_utc,
+                            run.type,
+                            run.distance,
+                            run.duration,
+                            run.source,
+                            run.avg_heart_rate,
+                            # Imports never assign a shoe; keep the raw gear
+                            # name so it can be assigned manually later.
+                            None,
+                            run.deleted_at,
+                            run.max_heart_rate,
+                            run.step_cadence,
+                            run.end_datetime_utc,
+                            run.source_name,
+                            run.shoe_name,
+                        )
+                    ]
+                    cursor.execute(query, params)
+                    inserted_ids = {row[0] for row in cursor.fetchall()}
+
+                    # Only write history rows for runs that were actually
+                    # inserted, to keep history rows in lockstep with runs.
+                    history_rows = []
                     for run in chunk:
-                        # Imports never assign a shoe; keep the raw gear name so
-                        # it can be assigned manually later.
-                        shoe_id = None
-                        imported_shoe_name = run.shoe_name
-
-                        # ON CONFLICT DO NOTHING ensures a previously-imported
-                        # run (including soft-deleted ones) is silently skipped
-                        # rather than failing the whole batch on a PK conflict.
-                        cursor.execute(
-                            """
-                            INSERT INTO runs (id, datetime_utc, type, distance, duration, source, avg_heart_rate, shoe_id, deleted_at, max_heart_rate, step_cadence, end_datetime_utc, source_name, imported_shoe_name)
-                            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                            ON CONFLICT (id) DO NOTHING
-                            """,
+                        if run.id not in inserted_ids:
+                            continue
+                        # A repeated ID within the upload is only inserted once.
+                        inserted_ids.discard(run.id)
+                        history_rows.append(
                             (
                                 run.id,
+                                1,  # version_number
+                                "original",  # change_type
                                 run.datetime_utc,
                                 run.type,
                                 run.distance,
                                 run.duration,
                                 run.source,
                                 run.avg_heart_rate,
-                                shoe_id,
-                                run.deleted_at,
-                                run.max_heart_rate,
-                                run.step_cadence,
-                                run.end_datetime_utc,
-                                run.source_name,
-                                imported_shoe_name,
-                            ),
+                                None,  # shoe_id
+                                "system",  # changed_by
+                                "Initial import",  # change_reason
+                                run.name,
+                            )
                         )
-
-                        # Only write the history row when the run was actually
-                        # inserted, to keep history rows in lockstep with runs.
-                        if cursor.rowcount == 1:
-                            chunk_inserted += 1
-                            cursor.execute(
-                                """
-                                INSERT INTO runs_history (
-                                    run_id, version_number, change_type, datetime_utc, type,
-                                    distance, duration, source, avg_heart_rate, shoe_id,
-                                    changed_by, change_reason, name
-                                )
-                                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                                """,
-                                (
-                                    run.id,
-                                    1,  # version_number
-                                    "original",  # change_type
-                                    run.datetime_utc,
-                                    run.type,
-                                    run.distance,
-                                    run.duration,
-                                    run.source,
-                                    run.avg_heart_rate,
-                                    shoe_id,
-                                    "system",  # changed_by
-                                    "Initial import",  # change_reason
-                                    run.name,
-                                ),
+                    if history_rows:
+                        cursor.executemany(
+                            """
+                            INSERT INTO runs_history (
+                                run_id, version_number, change_type, datetime_utc, type,
+                                distance, duration, source, avg_heart_rate, shoe_id,
+                                changed_by, change_reason, name
                             )
+                            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                            """,
+                            history_rows,
+                        )
 
+                    chunk_inserted = len(history_rows)
                     total_inserted += chunk_inserted
 
                     logger.info(
                         f"Inserted {chunk_inserted} runs with history in chunk {i // chunk_size + 1} (runs {i + 1}-{min(i + chunk_size, len(runs))})"
                     )
 
+    invalidate_all_runs_cache()
     logger.info(
         f"Bulk insert completed: {total_inserted} total runs inserted with original history entries"
     )
@@ -249,6 +324,7 @@ def mark_run_duplicate(
                     changed_by,
                     f"Marked as duplicate of {duplicate_of_id}",
                 )
+    invalidate_all_runs_cache()
     logger.info(f"Marked run {run_id} as duplicate of {duplicate_of_id}")
     return True
 
@@ -296,6 +372,7 @@ def unmark_run_duplicate(run_id: str, changed_by: str = "user") -> bool:
                     changed_by,
                     "Unmarked as duplicate",
                 )
+    invalidate_all_runs_cache()
     logger.info(f"Unmarked run {run_id} as duplicate")
     return True
 
@@ -328,21 +405,6 @@ def find_candidate_duplicate_runs(
         return [_row_to_run_detail(row) for row in rows]
 
 
-def get_existing_run_ids() -> set[str]:
-    """Get all existing run IDs from the database, including soft-deleted ones.
-
-    Soft-deleted IDs are included so that re-imports from external providers
-    (e.g. Strava) skip runs the user has explicitly deleted, rather than
-    attempting to re-insert and hitting a primary-key conflict.
-    """
-    with get_db_cursor() as cursor:
-        cursor.execute("SELECT id FROM runs")
-        rows = cursor.fetchall()
-        existing_ids = {row[0] for row in rows}
-        logger.info(f"Found {len(existing_ids)} existing run IDs in database")
-        return existing_ids
-
-
 def get_run_details_in_date_range(
     start_date: date,
     end_date: date,
@@ -365,10 +427,10 @@ def get_run_details_in_date_range(
             end_date = end_date + timedelta(days=1)
     with get_db_cursor() as cursor:
         conditions: list[sql.Composable] = [
-            sql.SQL("DATE(r.datetime_utc) BETWEEN %s AND %s")
+            sql.SQL("r.datetime_utc >= %s AND r.datetime_utc < %s")
         ]
         conditions.extend(_build_run_detail_filters(include_deleted, synced))
-        params: list = [start_date, end_date]
+        params: list = list(utc_day_bounds(start_date, end_date))
 
         where_clause = sql.SQL(" AND ").join(conditions)
         query = sql.SQL("{select} WHERE {where_clause} ORDER BY r.datetime_utc DESC").format(
@@ -404,16 +466,34 @@ def get_run_details_by_ids(run_ids: list[str]) -> list[RunDetail]:
     if not run_ids:
         return []
     with get_db_cursor() as cursor:
-        placeholders = sql.SQL(", ").join(sql.Placeholder() * len(run_ids))
-        query = sql.SQL(
-            "{select} WHERE r.id IN ({placeholders}) AND r.deleted_at IS NULL "
-            "ORDER BY r.datetime_utc ASC"
-        ).format(select=_RUN_DETAIL_SELECT, placeholders=placeholders)
-        cursor.execute(query, run_ids)
+        cursor.execute(_RUN_DETAILS_BY_IDS_QUERY, (list(run_ids),))
         rows = cursor.fetchall()
         return [_row_to_run_detail(row) for row in rows]
 
 
+def get_runs_by_ids(run_ids: list[str]) -> list[Run]:
+    """Get non-deleted runs for a specific set of run IDs, oldest first."""
+    if not run_ids:
+        return []
+    with get_db_cursor() as cursor:
+        cursor.execute(_RUNS_BY_IDS_QUERY, (list(run_ids),))
+        return [_row_to_run(row) for row in cursor.fetchall()]
+
+
+def get_run_details_for_workout(workout_id: str) -> list[RunDetail]:
+    """Get the detailed, non-deleted runs of a run workout, oldest first."""
+    with get_db_cursor() as cursor:
+        cursor.execute(_RUN_DETAILS_FOR_WORKOUT_QUERY, (workout_id,))
+        return [_row_to_run_detail(row) for row in cursor.fetchall()]
+
+
+def get_runs_for_workout(workout_id: str) -> list[Run]:
+    """Get the non-deleted runs of a run workout, oldest first."""
+    with get_db_cursor() as cursor:
+        cursor.execute(_RUNS_FOR_WORKOUT_QUERY, (workout_id,))
+        return [_row_to_run(row) for row in cursor.fetchall()]
+
+
 def get_run_by_id(run_id: str, include_deleted: bool = False) -> Run | None:
     """Get a single run by its ID.
 
@@ -421,11 +501,8 @@ def get_run_by_id(run_id: str, include_deleted: bool = False) -> Run | None:
         run_id: The ID of the run to retrieve.
         include_deleted: If True, include soft-deleted runs. Defaults to False.
     """
+    query = _RUN_BY_ID_INCLUDING_DELETED_QUERY if include_deleted else _RUN_BY_ID_QUERY
     with get_db_cursor() as cursor:
-        deleted_filter = sql.SQL("") if include_deleted else sql.SQL(" AND r.deleted_at IS NULL")
-        query = sql.SQL("{select} WHERE r.id = %s{deleted_filter}").format(
-            select=_RUN_SELECT, deleted_filter=deleted_filter
-        )
         cursor.execute(query, (run_id,))
         row = cursor.fetchone()
         if not row:
@@ -450,7 +527,9 @@ def update_run_notes(run_id: str, notes: str | None) -> bool:
             """,
             (notes, run_id),
         )
-        return cursor.rowcount > 0
+        updated = cursor.rowcount > 0
+    invalidate_all_runs_cache()
+    return updated
 
 
 def _row_to_run(row) -> Run:
@@ -511,8 +590,8 @@ def _row_to_run_detail(row) -> RunDetail:
         name,
     ) = row
 
-    # Normalize shoe_name
-    if shoe_name == "Unknown" or shoe_name is None:
+    # A shoe literally named "Unknown" reads as no shoe, as it always has.
+    if shoe_name == "Unknown":
         shoe_name = None
 
     return RunDetail(
@@ -210,7 +210,7 @@ def update_run_with_history(
     Update a run and record the change in history.
     This function performs both operations in a single transaction.
     """
-    from .runs import get_run_by_id
+    from .runs import get_run_by_id, invalidate_all_runs_cache
 
     # Validate allowed fields BEFORE any database operations
     allowed_fields = {
@@ -307,6 +307,8 @@ def update_run_with_history(
                     f"Updated run {run_id} to version {new_version} by {changed_by}"
                 )
 
+    invalidate_all_runs_cache()
+
 
 def insert_run_history_with_cursor(
     cursor,
@@ -6,6 +6,7 @@ from psycopg import sql
 
 from fitness.models.shoe import Shoe, ShoeRecentUse
 from .connection import get_db_cursor, get_db_connection
+from .runs import invalidate_all_runs_cache
 
 logger = logging.getLogger(__name__)
 
@@ -211,7 +212,10 @@ def update_shoe(shoe_id: str, fields: dict) -> bool:
 
     with get_db_cursor() as cursor:
         cursor.execute(query, params)
-        return cursor.rowcount > 0
+        updated = cursor.rowcount > 0
+    # Runs carry the shoe's display name.
+    invalidate_all_runs_cache()
+    return updated
 
 
 def delete_shoe_by_id(shoe_id: str) -> bool:
@@ -327,3 +331,4 @@ def merge_shoes(keep_shoe_id: str, merge_shoe_id: str, merge_shoe_name: str) ->
                     "UPDATE shoes SET deleted_at = CURRENT_TIMESTAMP WHERE id = %s",
                     (merge_shoe_id,),
                 )
+    invalidate_all_runs_cache()
@@ -1,15 +1,29 @@
 """Database access functions for synced lifts (Google Calendar sync tracking)."""
 
 import logging
+from collections.abc import Iterable
 from datetime import datetime, timezone
 
 from psycopg import sql
 
 from fitness.models.sync import SyncedLift, SyncStatus
+from .cache import TTLCache
 from .connection import get_db_cursor
 
 logger = logging.getLogger(__name__)
 
+# Clients poll /sync/lifts/{lift_id}/status while a background sync runs, so
+# get_synced_lift() results (including "no record") are kept briefly per lift.
+# Every writer in this module evicts the lifts it touched once its write has
+# committed; the short TTL bounds staleness from writes by other processes.
+SYNCED_LIFT_CACHE_TTL_SECONDS = 10.0
+_synced_lift_cache = TTLCache(SYNCED_LIFT_CACHE_TTL_SECONDS)
+
+
+def invalidate_synced_lift_cache(lift_ids: Iterable[str] | None = None) -> None:
+    """Drop cached sync records for the given lifts, or for all lifts."""
+    _synced_lift_cache.invalidate(lift_ids)
+
 
 def _row_to_synced_lift(row: tuple) -> SyncedLift:
     """Convert a database row to a SyncedLift object."""
@@ -38,7 +52,15 @@ def _row_to_synced_lift(row: tuple) -> SyncedLift:
 
 
 def get_synced_lift(lift_id: str) -> SyncedLift | None:
-    """Get sync record for a specific lift."""
+    """Get sync record for a specific lift.
+
+    Results are cached for SYNCED_LIFT_CACHE_TTL_SECONDS.
+    """
+    return _synced_lift_cache.get_or_load(lift_id, lambda: _query_synced_lift(lift_id))
+
+
+def _query_synced_lift(lift_id: str) -> SyncedLift | None:
+    """Read a lift's sync record from the database."""
     try:
         with get_db_cursor() as cursor:
             logger.debug(f"Querying sync record for lift_id={lift_id}")
@@ -136,6 +158,8 @@ def create_synced_lift(
             f"exception_type={type(e).__name__}, error={e}"
         )
         raise
+    finally:
+        invalidate_synced_lift_cache([lift_id])
 
 
 def update_synced_lift(
@@ -225,6 +249,110 @@ def update_synced_lift(
             f"exception_type={type(e).__name__}, error={e}"
         )
         raise
+    finally:
+        invalidate_synced_lift_cache([lift_id])
+
+
+def upsert_synced_lift(
+    lift_id: str,
+    google_event_id: str,
+    sync_status: SyncStatus,
+    error_message: str | None = None,
+) -> SyncedLift:
+    """Create or overwrite a lift's sync record in one statement.
+
+    On conflict the event ID, status, error message, and sync time are replaced;
+    an empty google_event_id keeps the one already recorded (failures have no
+    event to record).
+    """
+    try:
+        logger.info(
+            f"Upserting sync record: lift_id={lift_id}, google_event_id={google_event_id}, "
+            f"sync_status={sync_status}"
+        )
+
+        with get_db_cursor() as cursor:
+            now = datetime.now(timezone.utc)
+            cursor.execute(
+                """
+                INSERT INTO synced_lifts
+                (lift_id, lift_version, google_event_id, synced_at, sync_status, error_message, created_at, updated_at)
+                VALUES (%s, 1, %s, %s, %s, %s, %s, %s)
+                ON CONFLICT (lift_id) DO UPDATE SET
+                    google_event_id = COALESCE(
+                        NULLIF(EXCLUDED.google_event_id, ''), synced_lifts.google_event_id
+                    ),
+                    synced_at = EXCLUDED.synced_at,
+                    sync_status = EXCLUDED.sync_status,
+                    error_message = EXCLUDED.error_message,
+                    updated_at = EXCLUDED.updated_at
+                RETURNING id, lift_id, lift_version, google_event_id, synced_at,
+                          sync_status, error_message, created_at, updated_at
+            """,
+                (lift_id, google_event_id, now, sync_status, error_message, now, now),
+            )
+
+            row = cursor.fetchone()
+            if row is None:
+                raise RuntimeError(
+                    f"Failed to upsert sync record for lift_id={lift_id}"
+                )
+            synced_lift = _row_to_synced_lift(row)
+
+            logger.info(
+                f"Successfully upserted sync record: sync_id={synced_lift.id}, lift_id={lift_id}, "
+                f"google_event_id={synced_lift.google_event_id}, sync_status={sync_status}"
+            )
+            return synced_lift
+    except Exception as e:
+        logger.exception(
+            f"Database error upserting sync record: lift_id={lift_id}, "
+            f"google_event_id={google_event_id}, sync_status={sync_status}, "
+            f"exception_type={type(e).__name__}, error={e}"
+        )
+        raise
+    finally:
+        invalidate_synced_lift_cache([lift_id])
+
+
+def bulk_upsert_synced_lifts(
+    records: list[tuple[str, str, SyncStatus, str | None]],
+) -> int:
+    """Create or overwrite many lifts' sync records in one batch.
+
+    Each record is (lift_id, google_event_id, sync_status, error_message) and
+    is written with the same conflict handling as upsert_synced_lift.
+
+    Returns:
+        Number of rows written.
+    """
+    if not records:
+        return 0
+    now = datetime.now(timezone.utc)
+    with get_db_cursor() as cursor:
+        cursor.executemany(
+            """
+            INSERT INTO synced_lifts
+            (lift_id, lift_version, google_event_id, synced_at, sync_status, error_message, created_at, updated_at)
+            VALUES (%s, 1, %s, %s, %s, %s, %s, %s)
+            ON CONFLICT (lift_id) DO UPDATE SET
+                google_event_id = COALESCE(
+                    NULLIF(EXCLUDED.google_event_id, ''), synced_lifts.google_event_id
+                ),
+                synced_at = EXCLUDED.synced_at,
+                sync_status = EXCLUDED.sync_status,
+                error_message = EXCLUDED.error_message,
+                updated_at = EXCLUDED.updated_at
+            """,
+            [
+                (lift_id, google_event_id, now, sync_status, error_message, now, now)
+                for lift_id, google_event_id, sync_status, error_message in records
+            ],
+        )
+        written = cursor.rowcount
+    invalidate_synced_lift_cache(record[0] for record in records)
+    logger.info(f"Bulk upserted {written} lift sync records")
+    return written
 
 
 def delete_synced_lift(lift_id: str) -> bool:
@@ -254,6 +382,8 @@ def delete_synced_lift(lift_id: str) -> bool:
             f"exception_type={type(e).__name__}, error={e}"
         )
         raise
+    finally:
+        invalidate_synced_lift_cache([lift_id])
 
 
 def get_all_synced_lifts() -> list[SyncedLift]:
@@ -1,15 +1,31 @@
 """Database access functions for synced run workouts (Google Calendar sync tracking)."""
 
 import logging
+from collections.abc import Iterable
 from datetime import datetime, timezone
 
 from psycopg import sql
 
 from fitness.models.sync import SyncedRunWorkout, SyncStatus
+from .cache import TTLCache
 from .connection import get_db_cursor
 
 logger = logging.getLogger(__name__)
 
+# The UI polls /sync/run-workouts/{run_workout_id}/status after triggering a
+# sync, so get_synced_run_workout() results (including "no record") are kept
+# briefly per workout, as with synced lifts. Every writer in this module evicts
+# the workouts it touched; the TTL bounds staleness from other processes.
+SYNCED_RUN_WORKOUT_CACHE_TTL_SECONDS = 5.0
+_synced_run_workout_cache = TTLCache(SYNCED_RUN_WORKOUT_CACHE_TTL_SECONDS)
+
+
+def invalidate_synced_run_workout_cache(
+    run_workout_ids: Iterable[str] | None = None,
+) -> None:
+    """Drop cached sync records for the given run workouts, or for all of them."""
+    _synced_run_workout_cache.invalidate(run_workout_ids)
+
 
 def _row_to_synced_run_workout(row: tuple) -> SyncedRunWorkout:
     """Convert a database row to a SyncedRunWorkout object."""
@@ -38,7 +54,16 @@ def _row_to_synced_run_workout(row: tuple) -> SyncedRunWorkout:
 
 
 def get_synced_run_workout(run_workout_id: str) -> SyncedRunWorkout | None:
-    """Get sync record for a specific run workout."""
+    """Get sync record for a specific run workout.
+
+    Results are cached for SYNCED_RUN_WORKOUT_CACHE_TTL_SECONDS.
+    """
+    return _synced_run_workout_cache.get_or_load(
+        run_workout_id, lambda: _query_synced_run_workout(run_workout_id)
+    )
+
+
+def _query_synced_run_workout(run_workout_id: str) -> SyncedRunWorkout | None:
     try:
         with get_db_cursor() as cursor:
             logger.debug(f"Querying sync record for run_workout_id={run_workout_id}")
@@ -73,162 +98,59 @@ def get_synced_run_workout(run_workout_id: str) -> SyncedRunWorkout | None:
         raise
 
 
-def create_synced_run_workout(
-    run_workout_id: str,
-    google_event_id: str | None,
-    run_workout_version: int = 1,
-    sync_status: SyncStatus = "synced",
-    error_message: str | None = None,
-) -> SyncedRunWorkout:
-    """Create a new sync record for a run workout."""
-    try:
-        logger.info(
-            f"Creating sync record: run_workout_id={run_workout_id}, google_event_id={google_event_id}, "
-            f"sync_status={sync_status}, run_workout_version={run_workout_version}"
-        )
-
-        with get_db_cursor() as cursor:
-            now = datetime.now(timezone.utc)
-            cursor.execute(
-                """
-                INSERT INTO synced_run_workouts
-                (run_workout_id, run_workout_version, google_event_id, synced_at, sync_status, error_message, created_at, updated_at)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                RETURNING id, created_at, updated_at
-            """,
-                (
-                    run_workout_id,
-                    run_workout_version,
-                    google_event_id,
-                    now,
-                    sync_status,
-                    error_message,
-                    now,
-                    now,
-                ),
-            )
-
-            result = cursor.fetchone()
-            if result is None:
-                raise RuntimeError(
-                    f"Failed to create sync record for run_workout_id={run_workout_id}"
-                )
-            sync_id, created_at, updated_at = result
-
-            logger.info(
-                f"Successfully created sync record: sync_id={sync_id}, run_workout_id={run_workout_id}, "
-                f"google_event_id={google_event_id}, sync_status={sync_status}"
-            )
-
-            return SyncedRunWorkout(
-                id=sync_id,
-                run_workout_id=run_workout_id,
-                run_workout_version=run_workout_version,
-                google_event_id=google_event_id,
-                synced_at=now,
-                sync_status=sync_status,
-                error_message=error_message,
-                created_at=created_at,
-                updated_at=updated_at,
-            )
-    except Exception as e:
-        logger.exception(
-            f"Database error creating sync record: run_workout_id={run_workout_id}, "
-            f"google_event_id={google_event_id}, sync_status={sync_status}, "
-            f"exception_type={type(e).__name__}, error={e}"
-        )
-        raise
+def bulk_upsert_synced_run_workouts(
+    records: list[tuple[str, str, SyncStatus, str | None]],
+) -> list[SyncedRunWorkout]:
+    """Create or overwrite many run workouts' sync records in one statement.
 
+    Each record is (run_workout_id, google_event_id, sync_status,
+    error_message), and each run workout ID may appear only once. An empty
+    google_event_id keeps any event ID already stored.
 
-def update_synced_run_workout(
-    run_workout_id: str,
-    run_workout_version: int | None = None,
-    google_event_id: str | None = None,
-    sync_status: SyncStatus | None = None,
-    error_message: str | None = None,
-    clear_error_message: bool = False,
-) -> SyncedRunWorkout | None:
-    """Update an existing sync record."""
-    try:
-        update_details = []
-        if run_workout_version is not None:
-            update_details.append(f"run_workout_version={run_workout_version}")
-        if google_event_id is not None:
-            update_details.append(f"google_event_id={google_event_id}")
-        if sync_status is not None:
-            update_details.append(f"sync_status={sync_status}")
-        if error_message is not None:
-            update_details.append(f"error_message={error_message[:100]}...")
-        if clear_error_message:
-            update_details.append("clear_error_message=True")
-
-        logger.info(
-            f"Updating sync record: run_workout_id={run_workout_id}, updates=[{', '.join(update_details)}]"
+    Returns:
+        The records as written, in no particular order.
+    """
+    if not records:
+        return []
+    now = datetime.now(timezone.utc)
+    query = sql.SQL("""
+        INSERT INTO synced_run_workouts
+        (run_workout_id, run_workout_version, google_event_id, synced_at, sync_status, error_message, created_at, updated_at)
+        VALUES {rows}
+        ON CONFLICT (run_workout_id) DO UPDATE SET
+            google_event_id = COALESCE(
+                NULLIF(EXCLUDED.google_event_id, ''), synced_run_workouts.google_event_id
+            ),
+            synced_at = EXCLUDED.synced_at,
+            sync_status = EXCLUDED.sync_status,
+            error_message = EXCLUDED.error_message,
+            updated_at = EXCLUDED.updated_at
+        RETURNING id, run_workout_id, run_workout_version, google_event_id, synced_at,
+                  sync_status, error_message, created_at, updated_at
+    """).format(
+        rows=sql.SQL(", ").join(
+            [sql.SQL("(%s, 1, %s, %s, %s, %s, %s, %s)")] * len(records)
         )
-
-        with get_db_cursor() as cursor:
-            update_fields: list[sql.Composable] = []
-            params: list = []
-
-            if run_workout_version is not None:
-                update_fields.append(sql.SQL("run_workout_version = %s"))
-                params.append(run_workout_version)
-
-            if google_event_id is not None:
-                update_fields.append(sql.SQL("google_event_id = %s"))
-                params.append(google_event_id)
-
-            if sync_status is not None:
-                update_fields.append(sql.SQL("sync_status = %s"))
-                params.append(sync_status)
-
-            if error_message is not None:
-                update_fields.append(sql.SQL("error_message = %s"))
-                params.append(error_message)
-            elif clear_error_message:
-                update_fields.append(sql.SQL("error_message = NULL"))
-
-            if not update_fields:
-                logger.debug(
-                    f"No fields to update for run_workout_id={run_workout_id}, returning existing record"
-                )
-                return get_synced_run_workout(run_workout_id)
-
-            update_fields.append(sql.SQL("updated_at = %s"))
-            params.append(datetime.now(timezone.utc))
-
-            params.append(run_workout_id)
-
-            query = sql.SQL("""
-                UPDATE synced_run_workouts
-                SET {update_fields}
-                WHERE run_workout_id = %s
-                RETURNING id, run_workout_id, run_workout_version, google_event_id, synced_at,
-                          sync_status, error_message, created_at, updated_at
-            """).format(update_fields=sql.SQL(", ").join(update_fields))
-
-            cursor.execute(query, params)
-            row = cursor.fetchone()
-
-            if row is None:
-                logger.warning(
-                    f"No sync record found to update: run_workout_id={run_workout_id}"
-                )
-                return None
-
-            synced = _row_to_synced_run_workout(row)
-            logger.info(
-                f"Successfully updated sync record: run_workout_id={run_workout_id}, "
-                f"new_sync_status={synced.sync_status}, google_event_id={synced.google_event_id}"
-            )
-
-            return synced
-    except Exception as e:
-        logger.exception(
-            f"Database error updating sync record: run_workout_id={run_workout_id}, "
-            f"exception_type={type(e).__name__}, error={e}"
+    )
+    params = [
+        value
+        for workout_id, google_event_id, sync_status, error_message in records
+        for value in (
+            workout_id,
+            google_event_id,
+            now,
+            sync_status,
+            error_message,
+            now,
+            now,
         )
-        raise
+    ]
+    with get_db_cursor() as cursor:
+        cursor.execute(query, params)
+        written = [_row_to_synced_run_workout(row) for row in cursor.fetchall()]
+    invalidate_synced_run_workout_cache(record[0] for record in records)
+    logger.info(f"Bulk upserted {len(written)} run workout sync records")
+    return written
 
 
 def delete_synced_run_workout(run_workout_id: str) -> bool:
@@ -261,6 +183,8 @@ def delete_synced_run_workout(run_workout_id: str) -> bool:
             f"exception_type={type(e).__name__}, error={e}"
         )
         raise
+    finally:
+        invalidate_synced_run_workout_cache([run_workout_id])
 
 
 def get_synced_run_workouts_by_ids(
@@ -273,16 +197,15 @@ def get_synced_run_workouts_by_ids(
         logger.debug(f"Querying sync records for {len(run_workout_ids)} workout IDs")
 
         with get_db_cursor() as cursor:
-            placeholders = sql.SQL(", ").join(
-                [sql.Placeholder()] * len(run_workout_ids)
-            )
-            query = sql.SQL("""
+            cursor.execute(
+                """
                 SELECT id, run_workout_id, run_workout_version, google_event_id, synced_at,
                        sync_status, error_message, created_at, updated_at
                 FROM synced_run_workouts
-                WHERE run_workout_id IN ({placeholders})
-            """).format(placeholders=placeholders)
-            cursor.execute(query, run_workout_ids)
+                WHERE run_workout_id = ANY(%s)
+            """,
+                (list(run_workout_ids),),
+            )
 
             results = [_row_to_synced_run_workout(row) for row in cursor.fetchall()]
 
@@ -1,9 +1,21 @@
 """Google Calendar API client for syncing workout events."""
 
+import asyncio
+import email
+import email.message
+import email.policy
+import functools
+import json
 import os
 import logging
+import random
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any, ParamSpec, TypeVar
 
 import httpx
 from fitness.models.run import Run
@@ -14,6 +26,41 @@ from fitness.db.oauth_credentials import get_credentials, update_access_token
 
 logger = logging.getLogger(__name__)
 
+P = ParamSpec("P")
+T = TypeVar("T")
+
+# Rate-limit and server errors from the Calendar API are usually transient, so
+# requests that hit them are retried with exponential backoff and jitter. A
+# rate-limited request was rejected without being applied, so any method is
+# resent; after a 5xx only idempotent methods are, since an event insert may
+# still have been committed and resending it would duplicate the event. The
+# total backoff is capped because callers are waiting on an HTTP request.
+RETRY_ATTEMPTS = 4
+RETRY_BASE_DELAY_SECONDS = 1.0
+RETRY_MAX_TOTAL_DELAY_SECONDS = 4.0
+_IDEMPOTENT_METHODS = {"GET", "DELETE"}
+_RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded"}
+
+# The batch endpoint takes up to 50 calls in one multipart request.
+BATCH_URL = "https://www.googleapis.com/batch/calendar/v3"
+BATCH_MAX_REQUESTS = 50
+
+
+def _is_transient_error(response: httpx.Response, method: str) -> bool:
+    """Whether a Calendar API error response to `method` is worth retrying."""
+    if response.status_code == 429:
+        return True
+    if response.status_code >= 500:
+        return method in _IDEMPOTENT_METHODS
+    if response.status_code != 403:
+        return False
+    # 403 is also used for permission errors; only rate limits are transient.
+    try:
+        errors = response.json()["error"]["errors"]
+        return any(error.get("reason") in _RATE_LIMIT_REASONS for error in errors)
+    except Exception:
+        return False
+
 
 class GoogleCalendarClient:
     """Client for interacting with Google Calendar API."""
@@ -46,6 +93,19 @@ class GoogleCalendarClient:
         self.base_url = "https://www.googleapis.com/calendar/v3"
         # Allow selecting a specific calendar; default to primary.
         self.calendar_id = os.getenv("GOOGLE_CALENDAR_ID") or "primary"
+        # The shared client (get_calendar_client) serves several request
+        # threads; only one of them should refresh an expiring token.
+        self._refresh_lock = threading.Lock()
+        # Kept open for the life of the client so consecutive calls reuse
+        # connections instead of paying a TCP and TLS handshake each time.
+        # httpx.Client is safe to share across threads.
+        self._http = httpx.Client(
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=8)
+        )
+
+    def close(self) -> None:
+        """Close the client's connection pool; it can't make requests afterwards."""
+        self._http.close()
 
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for API requests."""
@@ -81,96 +141,95 @@ class GoogleCalendarClient:
             Raises ValueError if refresh token is revoked/expired (invalid_grant error).
         """
         try:
-            with httpx.Client() as client:
-                response = client.post(
-                    "https://oauth2.googleapis.com/token",
-                    data={
-                        "client_id": self.client_id,
-                        "client_secret": self.client_secret,
-                        "refresh_token": self.refresh_token,
-                        "grant_type": "refresh_token",
-                    },
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
-                )
+            response = self._http.post(
+                "https://oauth2.googleapis.com/token",
+                data={
+                    "client_id": self.client_id,
+                    "client_secret": self.client_secret,
+                    "refresh_token": self.refresh_token,
+                    "grant_type": "refresh_token",
+                },
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+            )
 
-                if response.status_code == 200:
-                    token_data = response.json()
-                    new_access_token = token_data["access_token"]
+            if response.status_code == 200:
+                token_data = response.json()
+                new_access_token = token_data["access_token"]
 
-                    # Extract expiration time from expires_in (seconds)
-                    expires_at = None
-                    if "expires_in" in token_data:
-                        expires_in_seconds = token_data["expires_in"]
-                        expires_at = datetime.now(timezone.utc) + timedelta(
-                            seconds=expires_in_seconds
-                        )
+                # Extract expiration time from expires_in (seconds)
+                expires_at = None
+                if "expires_in" in token_data:
+                    expires_in_seconds = token_data["expires_in"]
+                    expires_at = datetime.now(timezone.utc) + timedelta(
+                        seconds=expires_in_seconds
+                    )
 
-                    # Google may return a new refresh token
-                    new_refresh_token = token_data.get("refresh_token")
-
-                    # Update in-memory tokens
-                    self.access_token = new_access_token
-                    if new_refresh_token:
-                        self.refresh_token = new_refresh_token
-                        logger.info("Google provided a new refresh token")
-                    if expires_at:
-                        self.expires_at = expires_at
-
-                    # Persist to database
-                    try:
-                        update_access_token(
-                            "google",
-                            new_access_token,
-                            expires_at=expires_at,
-                            refresh_token=new_refresh_token,
-                        )
-                        logger.info(
-                            "Successfully refreshed Google access token and persisted to database"
-                        )
-                    except Exception as db_error:
-                        logger.exception(
-                            f"Failed to persist refreshed token to database: "
-                            f"exception_type={type(db_error).__name__}, error={db_error}"
-                        )
-                        logger.warning(
-                            "Token refreshed in memory but not persisted - may need to refresh again on restart"
-                        )
+                # Google may return a new refresh token
+                new_refresh_token = token_data.get("refresh_token")
 
-                    return True
-                else:
-                    error_text = response.text
-                    error_data = {}
-                    try:
-                        error_data = response.json()
-                    except Exception as json_error:
-                        # Failed to parse error response as JSON; proceed with empty error_data.
-                        logger.warning(
-                            f"Failed to parse token refresh error response as JSON: "
-                            f"exception_type={type(json_error).__name__}, error={json_error}, "
-                            f"raw_response={error_text[:500]}"
-                        )
+                # Update in-memory tokens
+                self.access_token = new_access_token
+                if new_refresh_token:
+                    self.refresh_token = new_refresh_token
+                    logger.info("Google provided a new refresh token")
+                if expires_at:
+                    self.expires_at = expires_at
 
-                    # Check for revoked/expired refresh token
-                    if (
-                        response.status_code == 400
-                        and error_data.get("error") == "invalid_grant"
-                    ):
-                        logger.error(
-                            f"Refresh token has been expired or revoked. "
-                            f"Re-authorization required. status_code={response.status_code}, "
-                            f"error_code={error_data.get('error')}, "
-                            f"error_description={error_data.get('error_description', 'N/A')}"
-                        )
-                        # Raise a specific exception that callers can catch
-                        raise ValueError(
-                            "Refresh token expired or revoked. Re-authorization required."
-                        )
+                # Persist to database
+                try:
+                    update_access_token(
+                        "google",
+                        new_access_token,
+                        expires_at=expires_at,
+                        refresh_token=new_refresh_token,
+                    )
+                    logger.info(
+                        "Successfully refreshed Google access token and persisted to database"
+                    )
+                except Exception as db_error:
+                    logger.exception(
+                        f"Failed to persist refreshed token to database: "
+                        f"exception_type={type(db_error).__name__}, error={db_error}"
+                    )
+                    logger.warning(
+                        "Token refreshed in memory but not persisted - may need to refresh again on restart"
+                    )
+
+                return True
+            else:
+                error_text = response.text
+                error_data = {}
+                try:
+                    error_data = response.json()
+                except Exception as json_error:
+                    # Failed to parse error response as JSON; proceed with empty error_data.
+                    logger.warning(
+                        f"Failed to parse token refresh error response as JSON: "
+                        f"exception_type={type(json_error).__name__}, error={json_error}, "
+                        f"raw_response={error_text[:500]}"
+                    )
 
+                # Check for revoked/expired refresh token
+                if (
+                    response.status_code == 400
+                    and error_data.get("error") == "invalid_grant"
+                ):
                     logger.error(
-                        f"Failed to refresh token: status_code={response.status_code}, "
-                        f"error_data={error_data}, response_text={error_text[:500]}"
+                        f"Refresh token has been expired or revoked. "
+                        f"Re-authorization required. status_code={response.status_code}, "
+                        f"error_code={error_data.get('error')}, "
+                        f"error_description={error_data.get('error_description', 'N/A')}"
+                    )
+                    # Raise a specific exception that callers can catch
+                    raise ValueError(
+                        "Refresh token expired or revoked. Re-authorization required."
                     )
-                    return False
+
+                logger.error(
+                    f"Failed to refresh token: status_code={response.status_code}, "
+                    f"error_data={error_data}, response_text={error_text[:500]}"
+                )
+                return False
 
         except ValueError:
             # Re-raise ValueError (invalid_grant) so callers can handle it
@@ -187,60 +246,76 @@ class GoogleCalendarClient:
     ) -> Optional[httpx.Response]:
         """Make an API request with automatic token refresh on 401 or if token is expired."""
         # Proactively refresh token if it's expired or about to expire
-        if self.needs_token_refresh():
-            logger.info(
-                "Access token expired or about to expire, refreshing proactively..."
-            )
-            try:
-                if not self._refresh_access_token():
+        with self._refresh_lock:
+            if self.needs_token_refresh():
+                logger.info(
+                    "Access token expired or about to expire, refreshing proactively..."
+                )
+                try:
+                    if not self._refresh_access_token():
+                        logger.error(
+                            f"Failed to refresh token proactively before {method} request to {url}"
+                        )
+                        # Continue anyway - might still work, or will get 401
+                except ValueError as e:
+                    # Refresh token is revoked/expired - cannot proceed
                     logger.error(
-                        f"Failed to refresh token proactively before {method} request to {url}"
+                        f"Cannot refresh token for {method} request to {url}: "
+                        f"exception_type={type(e).__name__}, error={e}"
                     )
-                    # Continue anyway - might still work, or will get 401
-            except ValueError as e:
-                # Refresh token is revoked/expired - cannot proceed
-                logger.error(
-                    f"Cannot refresh token for {method} request to {url}: "
-                    f"exception_type={type(e).__name__}, error={e}"
-                )
-                return None
+                    return None
 
-        headers = self._get_headers()
-        kwargs.setdefault("headers", {}).update(headers)
+        # Caller-supplied headers (e.g. a multipart Content-Type) take precedence.
+        kwargs["headers"] = {**self._get_headers(), **kwargs.get("headers", {})}
 
         try:
-            with httpx.Client() as client:
-                response = client.request(method, url, **kwargs)
+            response = self._http.request(method, url, **kwargs)
 
-                # If unauthorized, try to refresh token and retry once
-                if response.status_code == 401:
-                    logger.warning(
-                        f"Received 401 Unauthorized for {method} request to {url}, "
-                        f"attempting token refresh and retry"
-                    )
-                    try:
-                        if self._refresh_access_token():
-                            # Update headers with new token and retry
-                            kwargs["headers"].update(self._get_headers())
-                            response = client.request(method, url, **kwargs)
-                            logger.info(
-                                f"Successfully retried {method} request to {url} after token refresh, "
-                                f"status_code={response.status_code}"
-                            )
-                        else:
-                            logger.error(
-                                f"Failed to refresh token after 401, cannot retry {method} request to {url}"
-                            )
-                            return response
-                    except ValueError as e:
-                        # Refresh token is revoked/expired - cannot retry
+            # If unauthorized, try to refresh token and retry once
+            if response.status_code == 401:
+                logger.warning(
+                    f"Received 401 Unauthorized for {method} request to {url}, "
+                    f"attempting token refresh and retry"
+                )
+                try:
+                    if self._refresh_access_token():
+                        # Update headers with new token and retry
+                        kwargs["headers"]["Authorization"] = self._get_headers()[
+                            "Authorization"
+                        ]
+                        response = self._http.request(method, url, **kwargs)
+                        logger.info(
+                            f"Successfully retried {method} request to {url} after token refresh, "
+                            f"status_code={response.status_code}"
+                        )
+                    else:
                         logger.error(
-                            f"Cannot refresh token after 401 for {method} request to {url}: "
-                            f"exception_type={type(e).__name__}, error={e}"
+                            f"Failed to refresh token after 401, cannot retry {method} request to {url}"
                         )
-                        return None
+                        return response
+                except ValueError as e:
+                    # Refresh token is revoked/expired - cannot retry
+                    logger.error(
+                        f"Cannot refresh token after 401 for {method} request to {url}: "
+                        f"exception_type={type(e).__name__}, error={e}"
+                    )
+                    return None
+
+            delay_budget = RETRY_MAX_TOTAL_DELAY_SECONDS
+            for attempt in range(1, RETRY_ATTEMPTS):
+                if not _is_transient_error(response, method) or delay_budget <= 0:
+                    break
+                delay = RETRY_BASE_DELAY_SECONDS * 2 ** (attempt - 1)
+                delay = min(delay + random.uniform(0, delay), delay_budget)
+                delay_budget -= delay
+                logger.warning(
+                    f"Received {response.status_code} for {method} request to {url}, "
+                    f"retrying in {delay:.1f}s (attempt {attempt + 1}/{RETRY_ATTEMPTS})"
+                )
+                time.sleep(delay)
+                response = self._http.request(method, url, **kwargs)
 
-                return response
+            return response
 
         except Exception as e:
             logger.exception(
@@ -389,26 +464,7 @@ class GoogleCalendarClient:
         Returns:
             Google Calendar event ID if successful, None otherwise.
         """
-        event_title = f"Lift: {lift.title}"
-
-        # Ensure timezone-aware datetimes
-        start_dt = lift.start_time
-        if start_dt.tzinfo is None:
-            start_dt = start_dt.replace(tzinfo=timezone.utc)
-        end_dt = lift.end_time
-        if end_dt.tzinfo is None:
-            end_dt = end_dt.replace(tzinfo=timezone.utc)
-
-        event_data = {
-            "summary": event_title,
-            "description": f"Workout synced from fitness app\nLift ID: {lift.id}",
-            "start": {
-                "dateTime": start_dt.isoformat(),
-            },
-            "end": {
-                "dateTime": end_dt.isoformat(),
-            },
-        }
+        event_data = self._lift_event_data(lift)
 
         url = f"{self.base_url}/calendars/{self.calendar_id}/events"
         response = self._make_request("POST", url, json=event_data)
@@ -438,22 +494,125 @@ class GoogleCalendarClient:
             )
             return None
 
-    def create_run_workout_event(
-        self, workout: RunWorkout, runs: list[Run]
-    ) -> Optional[str]:
-        """Create a calendar event for a run workout (grouped runs).
+    def _lift_event_data(self, lift: Lift) -> Dict[str, Any]:
+        """Build the Calendar event body for a lift."""
+        # Ensure timezone-aware datetimes
+        start_dt = lift.start_time
+        if start_dt.tzinfo is None:
+            start_dt = start_dt.replace(tzinfo=timezone.utc)
+        end_dt = lift.end_time
+        if end_dt.tzinfo is None:
+            end_dt = end_dt.replace(tzinfo=timezone.utc)
+
+        return {
+            "summary": f"Lift: {lift.title}",
+            "description": f"Workout synced from fitness app\nLift ID: {lift.id}",
+            "start": {
+                "dateTime": start_dt.isoformat(),
+            },
+            "end": {
+                "dateTime": end_dt.isoformat(),
+            },
+        }
+
+    def create_lift_events(self, lifts: list[Lift]) -> Dict[str, Optional[str]]:
+        """Create calendar events for many lifts using the batch endpoint.
+
+        Sends up to BATCH_MAX_REQUESTS events per HTTP request, so one token
+        check and one round-trip cover a whole batch.
 
         Args:
-            workout: The RunWorkout object.
-            runs: The constituent Run objects, sorted by datetime_utc.
+            lifts: The Lift objects to create events for.
 
         Returns:
-            Google Calendar event ID if successful, None otherwise.
+            Map of lift ID to its new Google Calendar event ID, or None for
+            each lift whose event could not be created.
         """
-        if not runs:
-            logger.error(f"No runs provided for workout {workout.id}")
-            return None
+        return self._create_events(
+            [(lift.id, self._lift_event_data(lift)) for lift in lifts], "lift_id"
+        )
+
+    def _create_events(
+        self, events: list[tuple[str, Dict[str, Any]]], id_label: str
+    ) -> Dict[str, Optional[str]]:
+        """Create (entity ID, event body) pairs in batches of BATCH_MAX_REQUESTS.
+
+        A batch that raises maps its own entities to None without discarding
+        the event IDs of batches already created, so callers can record those.
+        """
+        results: Dict[str, Optional[str]] = {}
+        for i in range(0, len(events), BATCH_MAX_REQUESTS):
+            batch = events[i : i + BATCH_MAX_REQUESTS]
+            try:
+                results.update(self._create_events_batch(batch, id_label))
+            except Exception as e:
+                logger.exception(
+                    f"Error creating calendar events in batch: count={len(batch)}, "
+                    f"calendar_id={self.calendar_id}, "
+                    f"exception_type={type(e).__name__}, error={e}"
+                )
+                results.update((entity_id, None) for entity_id, _ in batch)
+        return results
+
+    def _create_events_batch(
+        self, events: list[tuple[str, Dict[str, Any]]], id_label: str
+    ) -> Dict[str, Optional[str]]:
+        """Create at most BATCH_MAX_REQUESTS events in one request."""
+        results: Dict[str, Optional[str]] = {entity_id: None for entity_id, _ in events}
+        boundary = f"batch_{uuid.uuid4().hex}"
+        path = f"/calendar/v3/calendars/{self.calendar_id}/events"
+        body = "".join(
+            f"--{boundary}\r\n"
+            "Content-Type: application/http\r\n"
+            f"Content-ID: <item{i}>\r\n\r\n"
+            f"POST {path}\r\n"
+            "Content-Type: application/json\r\n\r\n"
+            f"{json.dumps(event_data)}\r\n"
+            for i, (_, event_data) in enumerate(events)
+        )
+        body += f"--{boundary}--\r\n"
+
+        response = self._make_request(
+            "POST",
+            BATCH_URL,
+            content=body.encode(),
+            headers={"Content-Type": f"multipart/mixed; boundary={boundary}"},
+        )
+        if response is None or not 200 <= response.status_code < 300:
+            status_code = response.status_code if response else "N/A"
+            error_text = response.text if response else "No response received"
+            logger.error(
+                f"Failed to create calendar events in batch: count={len(events)}, "
+                f"calendar_id={self.calendar_id}, status_code={status_code}, "
+                f"response_text={error_text[:500]}"
+            )
+            return results
+
+        for content_id, status_code, event in _parse_batch_response(response):
+            match = re.fullmatch(r"<?response-item(\d+)>?", content_id)
+            if match is None or int(match.group(1)) >= len(events):
+                continue
+            entity_id = events[int(match.group(1))][0]
+            if 200 <= status_code < 300 and event.get("id"):
+                results[entity_id] = event["id"]
+            else:
+                logger.error(
+                    f"Failed to create calendar event in batch: {id_label}={entity_id}, "
+                    f"calendar_id={self.calendar_id}, status_code={status_code}, "
+                    f"error_data={event}"
+                )
 
+        created = sum(1 for event_id in results.values() if event_id)
+        logger.info(
+            f"Created {created}/{len(events)} calendar events in batch, "
+            f"calendar_id={self.calendar_id}"
+        )
+        return results
+
+    def _run_workout_event_data(
+        self, workout: RunWorkout, runs: list[Run]
+    ) -> Dict[str, Any]:
+        """Build the Calendar event body for a run workout and its (non-empty) runs."""
         # Sort runs by start time
         sorted_runs = sorted(runs, key=lambda r: r.datetime_utc)
 
@@ -498,7 +657,7 @@ class GoogleCalendarClient:
             lines.append(f"  {i}. {run.distance:.2f} mi @ {pace_min}:{pace_sec:02d}/mi")
         lines.append(f"\nWorkout ID: {workout.id}")
 
-        event_data = {
+        return {
             "summary": f"Run Workout: {workout.title}",
             "description": "\n".join(lines),
             "start": {
@@ -509,33 +668,29 @@ class GoogleCalendarClient:
             },
         }
 
-        url = f"{self.base_url}/calendars/{self.calendar_id}/events"
-        response = self._make_request("POST", url, json=event_data)
+    def create_run_workout_events(
+        self, workouts: list[tuple[RunWorkout, list[Run]]]
+    ) -> Dict[str, Optional[str]]:
+        """Create calendar events for many run workouts using the batch endpoint.
 
-        if response and 200 <= response.status_code < 300:
-            event = response.json()
-            event_id = event.get("id")
-            logger.info(
-                f"Successfully created calendar event: run_workout_id={workout.id}, "
-                f"event_id={event_id}, calendar_id={self.calendar_id}"
-            )
-            return event_id
-        else:
-            status_code = response.status_code if response else "N/A"
-            error_text = response.text if response else "No response received"
-            error_data = None
-            if response:
-                try:
-                    error_data = response.json()
-                except Exception:
-                    pass
+        Args:
+            workouts: (RunWorkout, constituent runs) pairs; workouts with no
+                runs are skipped and map to None.
 
-            logger.error(
-                f"Failed to create calendar event: run_workout_id={workout.id}, "
-                f"calendar_id={self.calendar_id}, status_code={status_code}, "
-                f"error_data={error_data}, response_text={error_text[:500]}"
-            )
-            return None
+        Returns:
+            Map of run workout ID to its new Google Calendar event ID, or None
+            for each workout whose event could not be created.
+        """
+        results: Dict[str, Optional[str]] = {}
+        events = []
+        for workout, runs in workouts:
+            if runs:
+                events.append((workout.id, self._run_workout_event_data(workout, runs)))
+            else:
+                logger.error(f"No runs provided for workout {workout.id}")
+                results[workout.id] = None
+        results.update(self._create_events(events, "run_workout_id"))
+        return results
 
     def delete_workout_event(self, event_id: str) -> bool:
         """Delete a calendar event.
@@ -606,3 +761,92 @@ class GoogleCalendarClient:
                 f"error_data={error_data}, response_text={error_text[:500]}"
             )
             return None
+
+
+def _parse_batch_response(
+    response: httpx.Response,
+) -> list[tuple[str, int, Dict[str, Any]]]:
+    """Split a multipart batch response into (Content-ID, status, JSON body) parts."""
+    content_type = response.headers.get("content-type")
+    if content_type is None:
+        return []
+    message = email.message_from_bytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode() + response.content,
+        policy=email.policy.default,
+    )
+    if (
+        not isinstance(message, email.message.EmailMessage)
+        or not message.is_multipart()
+    ):
+        return []
+    parts = []
+    for part in message.iter_parts():
+        # Each part is itself an HTTP response: status line, headers, body.
+        payload = part.get_payload(decode=True)
+        if not isinstance(payload, bytes):
+            continue
+        text = payload.decode("utf-8", errors="replace").strip()
+        head, *rest = re.split(r"\r?\n\r?\n", text, maxsplit=1)
+        body = rest[0] if rest else ""
+        try:
+            status_code = int(head.split()[1])
+            data = json.loads(body) if body.strip() else {}
+        except (IndexError, ValueError):
+            continue
+        parts.append((part.get("Content-ID", ""), status_code, data))
+    return parts
+
+
+_shared_client: GoogleCalendarClient | None = None
+_shared_client_lock = threading.Lock()
+
+
+def get_calendar_client() -> GoogleCalendarClient:
+    """Get the process-wide calendar client, creating it on first use.
+
+    Credentials are read from the database once rather than per request; token
+    refreshes update the shared client in place. Raises ValueError like the
+    constructor if credentials are missing, and nothing is cached in that case.
+    """
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = GoogleCalendarClient()
+        return _shared_client
+
+
+# Calendar calls can take seconds (slow responses, retry backoff). Routers run
+# them on their own threads, as many as the client's connection pool, so they
+# never tie up the threadpool that plain-def handlers and asyncio.to_thread
+# database calls share.
+CALENDAR_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="gcal")
+
+
+async def run_calendar_call(
+    func: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs
+) -> T:
+    """Run a blocking function that calls Google Calendar on CALENDAR_EXECUTOR."""
+    return await asyncio.get_running_loop().run_in_executor(
+        CALENDAR_EXECUTOR, functools.partial(func, *args, **kwargs)
+    )
+
+
+def reset_calendar_client() -> None:
+    """Drop the shared client so the next call reloads credentials.
+
+    Call after storing new Google credentials (e.g. on re-authorization). The
+    old client is not closed, since other threads may still be mid-call on it;
+    its connections are released when the last of them lets it go.
+    """
+    global _shared_client
+    with _shared_client_lock:
+        _shared_client = None
+
+
+def close_calendar_client() -> None:
+    """Close the shared client, if one was created (e.g. on shutdown)."""
+    global _shared_client
+    with _shared_client_lock:
+        old_client, _shared_client = _shared_client, None
+    if old_client is not None:
+        old_client.close()
@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 import logging
 
 import httpx
@@ -21,6 +22,26 @@ WORKOUT_COUNT_URL = f"{BASE_URL}/v1/workouts/count"
 EXERCISE_TEMPLATES_URL = f"{BASE_URL}/v1/exercise_templates"
 
 
+@lru_cache(maxsize=1)
+def _http_client() -> httpx.Client:
+    """Connection pool shared by every HevyClient.
+
+    A sync makes many small requests (workout pages, then exercise templates
+    fetched concurrently), so keeping connections open saves a TCP and TLS
+    handshake per request. httpx.Client is safe to share across threads.
+    """
+    return httpx.Client(
+        limits=httpx.Limits(max_connections=16, max_keepalive_connections=8)
+    )
+
+
+def close_http_client() -> None:
+    """Close the shared connection pool, if one was opened (e.g. on shutdown)."""
+    if _http_client.cache_info().currsize:
+        _http_client().close()
+        _http_client.cache_clear()
+
+
 @dataclass
 class HevyClient:
     """Client for interacting with the Hevy API.
@@ -43,20 +64,19 @@ class HevyClient:
         """Make an API request to Hevy."""
         kwargs.setdefault("timeout", 30)
 
-        with httpx.Client() as client:
-            response = client.request(
-                method, url, headers=self._auth_headers(), **kwargs
-            )
+        response = _http_client().request(
+            method, url, headers=self._auth_headers(), **kwargs
+        )
 
-            if response.status_code == 401:
-                logger.error("Hevy API returned 401 Unauthorized - check your API key")
-                return None
+        if response.status_code == 401:
+            logger.error("Hevy API returned 401 Unauthorized - check your API key")
+            return None
 
-            if response.status_code == 429:
-                logger.warning("Hevy API rate limit exceeded")
-                return None
+        if response.status_code == 429:
+            logger.warning("Hevy API rate limit exceeded")
+            return None
 
-            return response
+        return response
 
     def get_workout_count(self) -> int:
         """Get the total number of workouts."""
@@ -1,6 +1,7 @@
 import logging
 import os
 import csv
+import io
 import zoneinfo
 from typing import BinaryIO
 
@@ -47,10 +48,11 @@ def load_mmf_data_from_file(
     tz = zoneinfo.ZoneInfo(mmf_timezone)
 
     try:
-        # Decode the file content as UTF-8
+        # Decode the file as UTF-8 while reading it row by row, rather than
+        # holding the whole upload in memory as bytes and again as text.
         file_obj.seek(0)  # Ensure we're at the start
-        text_file = file_obj.read().decode("utf-8")
-        reader = csv.DictReader(text_file.splitlines())
+        text_file = io.TextIOWrapper(file_obj, encoding="utf-8", newline="")
+        reader = csv.DictReader(text_file)
         records = []
         for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is row 1)
             try:
@@ -66,6 +68,8 @@ def load_mmf_data_from_file(
                 )
                 logger.debug(f"Problematic row data: {row}")
                 # Continue processing other rows
+        # Hand the file back to the caller open; closing the wrapper would close it.
+        text_file.detach()
 
         logger.info(f"Successfully loaded {len(records)} activities from MMF CSV file")
         return records
@@ -8,6 +8,40 @@ from fitness.integrations.strava.models import StravaActivity, StravaActivityWit
 logger = logging.getLogger(__name__)
 
 
+def load_strava_activities(
+    client: StravaClient, after: Optional[datetime] = None
+) -> tuple[list[StravaActivityWithGear], list[StravaActivity]]:
+    """Fetch runs (with their gear) and rides from a single activity listing.
+
+    Equivalent to calling load_strava_runs and load_strava_rides, but pages
+    through and parses the athlete's activities once rather than once each.
+
+    Args:
+        client: The Strava API client.
+        after: Only fetch activities after this datetime (for incremental sync).
+
+    Returns:
+        The runs with gear information, and the cycling activities.
+    """
+    if after:
+        logger.info(
+            f"Starting Strava activity load (incremental, after {after.isoformat()})"
+        )
+    else:
+        logger.info("Starting Strava activity load (full sync)")
+
+    try:
+        activities = client.get_activities(after=after)
+        logger.info(f"Retrieved {len(activities)} total activities from Strava")
+        return _runs_with_gear(client, activities), _rides(activities)
+    except Exception as e:
+        logger.error(
+            f"Failed to load Strava activities: {type(e).__name__}: {str(e)}",
+            exc_info=True,
+        )
+        raise
+
+
 def load_strava_rides(
     client: StravaClient, after: Optional[datetime] = None
 ) -> list[StravaActivity]:
@@ -33,11 +67,7 @@ def load_strava_rides(
     try:
         activities = client.get_activities(after=after)
         logger.info(f"Retrieved {len(activities)} total activities from Strava")
-        rides = [a for a in activities if a.type in ("Ride", "VirtualRide")]
-        logger.info(
-            f"Filtered to {len(rides)} rides (excluded {len(activities) - len(rides)} non-ride activities)"
-        )
-        return rides
+        return _rides(activities)
     except Exception as e:
         logger.error(
             f"Failed to load Strava rides: {type(e).__name__}: {str(e)}",
@@ -70,48 +100,58 @@ def load_strava_runs(
         logger.info("Fetching activities from Strava API")
         activities = client.get_activities(after=after)
         logger.info(f"Retrieved {len(activities)} total activities from Strava")
-
-        # Limit down to only runs.
-        initial_count = len(activities)
-        runs = [
-            activity
-            for activity in activities
-            if activity.type in ("Run", "Indoor Run")
-        ]
-        non_run_count = initial_count - len(runs)
-        logger.info(
-            f"Filtered to {len(runs)} runs (excluded {non_run_count} non-run activities)"
-        )
-
-        # Get gear information for runs that have gear
-        gear_ids = {run.gear_id for run in runs if run.gear_id}
-        logger.info(f"Found {len(gear_ids)} unique gear items used in runs")
-
-        if gear_ids:
-            logger.info(
-                f"Fetching gear details for {len(gear_ids)} items from Strava API"
-            )
-            gear = client.get_gear(gear_ids)
-            logger.info(f"Retrieved details for {len(gear)} gear items")
-        else:
-            logger.info("No gear to fetch (runs have no gear assigned)")
-            gear = []
-
-        gear_by_id = {g.id: g for g in gear}
-        runs_w_gear = [
-            run.with_gear(gear=gear_by_id[run.gear_id])
-            for run in runs
-            if run.gear_id is not None and run.gear_id in gear_by_id
-        ]
-
-        logger.info(
-            f"Successfully loaded {len(runs_w_gear)} Strava runs with gear information"
-        )
-        return runs_w_gear
-
+        return _runs_with_gear(client, activities)
     except Exception as e:
         logger.error(
             f"Failed to load Strava runs: {type(e).__name__}: {str(e)}",
             exc_info=True,
         )
         raise
+
+
+def _rides(activities: list[StravaActivity]) -> list[StravaActivity]:
+    """Keep only the cycling activities."""
+    rides = [a for a in activities if a.type in ("Ride", "VirtualRide")]
+    logger.info(
+        f"Filtered to {len(rides)} rides (excluded {len(activities) - len(rides)} non-ride activities)"
+    )
+    return rides
+
+
+def _runs_with_gear(
+    client: StravaClient, activities: list[StravaActivity]
+) -> list[StravaActivityWithGear]:
+    """Keep only the runs, and join each with the gear it used."""
+    # Limit down to only runs.
+    initial_count = len(activities)
+    runs = [
+        activity for activity in activities if activity.type in ("Run", "Indoor Run")
+    ]
+    non_run_count = initial_count - len(runs)
+    logger.info(
+        f"Filtered to {len(runs)} runs (excluded {non_run_count} non-run activities)"
+    )
+
+    # Get gear information for runs that have gear
+    gear_ids = {run.gear_id for run in runs if run.gear_id}
+    logger.info(f"Found {len(gear_ids)} unique gear items used in runs")
+
+    if gear_ids:
+        logger.info(f"Fetching gear details for {len(gear_ids)} items from Strava API")
+        gear = client.get_gear(gear_ids)
+        logger.info(f"Retrieved details for {len(gear)} gear items")
+    else:
+        logger.info("No gear to fetch (runs have no gear assigned)")
+        gear = []
+
+    gear_by_id = {g.id: g for g in gear}
+    runs_w_gear = [
+        run.with_gear(gear=gear_by_id[run.gear_id])
+        for run in runs
+        if run.gear_id is not None and run.gear_id in gear_by_id
+    ]
+
+    logger.info(
+        f"Successfully loaded {len(runs_w_gear)} Strava runs with gear information"
+    )
+    return runs_w_gear
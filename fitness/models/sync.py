@@ -127,6 +127,22 @@ class SyncedLift(BaseModel):
     updated_at: datetime
 
 
+class BatchLiftSyncRequest(BaseModel):
+    """Request to sync several lifts to Google Calendar at once."""
+
+    lift_ids: list[str] = Field(
+        min_length=1, max_length=200, description="IDs of the lifts to sync"
+    )
+
+
+class BatchRunWorkoutSyncRequest(BaseModel):
+    """Request to sync several run workouts to Google Calendar at once."""
+
+    run_workout_ids: list[str] = Field(
+        min_length=1, max_length=200, description="IDs of the run workouts to sync"
+    )
+
+
 class SyncedRunWorkout(BaseModel):
     """Represents a run workout that has been synced to Google Calendar."""
 
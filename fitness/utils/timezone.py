@@ -1,9 +1,56 @@
 """Timezone utility functions for converting between UTC and user timezones."""
 
+from bisect import bisect_left
 from collections.abc import Sequence
-from datetime import date
+from datetime import date, datetime, time, timedelta, timezone
+from operator import attrgetter
+from typing import NamedTuple
+import zoneinfo
 
-from fitness.models import Run, LocalizedRun, Ride, LocalizedRide
+from fitness.models import Run, LocalizedRun, Ride
+
+
+class LocalActivity(NamedTuple):
+    """The fields of a run or ride that aggregations read, keyed by local date.
+
+    A plain tuple rather than a `Localized*` model: aggregation loops only read
+    these fields, and building (then attribute-accessing) a validated Pydantic
+    model per activity dominated their cost.
+    """
+
+    local_date: date
+    distance: float
+    duration: float
+    avg_heart_rate: float | None
+
+
+def localize_activities(
+    activities: Sequence[Run | Ride], user_timezone: str | None = None
+) -> list[LocalActivity]:
+    """
+    Reduce runs and/or rides to `LocalActivity` tuples in the user's timezone.
+
+    If user_timezone is None, local dates are UTC dates. Preserves the input order.
+    """
+    if not activities:
+        return []
+    if user_timezone is None:
+        return [
+            LocalActivity(
+                a.datetime_utc.date(), a.distance, a.duration, a.avg_heart_rate
+            )
+            for a in activities
+        ]
+    tz = zoneinfo.ZoneInfo(user_timezone)
+    return [
+        LocalActivity(
+            a.datetime_utc.replace(tzinfo=timezone.utc).astimezone(tz).date(),
+            a.distance,
+            a.duration,
+            a.avg_heart_rate,
+        )
+        for a in activities
+    ]
 
 
 def convert_runs_to_user_timezone(
@@ -37,59 +84,65 @@ def convert_runs_to_user_timezone(
     return [LocalizedRun.from_run(run, user_timezone) for run in runs]
 
 
-def convert_rides_to_user_timezone(
-    rides: list[Ride], user_timezone: str | None = None
-) -> list[LocalizedRide]:
-    """
-    Convert a list of rides to use the user's local timezone.
+_datetime_utc = attrgetter("datetime_utc")
 
-    Mirrors convert_runs_to_user_timezone for the Ride model.
-    If user_timezone is None, returns LocalizedRide objects with UTC datetime as localized_datetime.
-    """
-    if user_timezone is None:
-        return [
-            LocalizedRide(
-                id=ride.id,
-                datetime_utc=ride.datetime_utc,
-                localized_datetime=ride.datetime_utc,
-                type=ride.type,
-                distance=ride.distance,
-                duration=ride.duration,
-                source=ride.source,
-                avg_heart_rate=ride.avg_heart_rate,
-                deleted_at=ride.deleted_at,
-            )
-            for ride in rides
-        ]
-    return [LocalizedRide.from_ride(ride, user_timezone) for ride in rides]
 
+def _local_midnight_utc(day: date, tz: zoneinfo.ZoneInfo | None) -> datetime:
+    """The naive-UTC instant at which `day` begins in `tz` (UTC if None)."""
+    midnight = datetime.combine(day, time.min)
+    if tz is None:
+        return midnight
+    return midnight.replace(tzinfo=tz).astimezone(timezone.utc).replace(tzinfo=None)
 
-def convert_activities_to_user_timezone(
-    activities: Sequence[Run | Ride], user_timezone: str | None = None
-) -> list[LocalizedRun | LocalizedRide]:
-    """
-    Convert a mixed list of runs and rides to the user's local timezone.
 
-    Dispatches per element so each activity is returned with its concrete
-    `Localized*` type intact. Preserves the input order.
+def utc_day_bounds(start: date, end: date) -> tuple[datetime, datetime]:
+    """Half-open naive-UTC bounds `[start 00:00, day after end 00:00)`.
+
+    Lets SQL compare `datetime_utc` directly, so its index can be used, where
+    `DATE(datetime_utc) BETWEEN start AND end` cannot. `end == date.max` maps
+    to `datetime.max`.
     """
-    result: list[LocalizedRun | LocalizedRide] = []
-    for a in activities:
-        if isinstance(a, Run):
-            result.extend(convert_runs_to_user_timezone([a], user_timezone))
-        else:
-            result.extend(convert_rides_to_user_timezone([a], user_timezone))
-    return result
+    upper = (
+        datetime.max
+        if end >= date.max
+        else datetime.combine(end + timedelta(days=1), time.min)
+    )
+    return datetime.combine(start, time.min), upper
 
 
 def filter_runs_by_local_date_range(
-    runs: list[Run], start: date, end: date, user_timezone: str | None = None
+    runs: list[Run],
+    start: date,
+    end: date,
+    user_timezone: str | None = None,
+    presorted: bool = False,
 ) -> list[Run]:
     """
     Filter runs to only include those that fall within the date range in the user's timezone.
 
     If user_timezone is None, uses UTC dates (existing behavior).
+
+    Pass `presorted=True` when `runs` is ordered by `datetime_utc` (as the
+    `fitness.db.runs` readers return them). The local range is then turned into
+    the UTC instants at which `start` begins and the day after `end` begins, and
+    the list is sliced between them with two binary searches, so no run is
+    tested or converted. The slice holds the original `Run` objects.
     """
+    if presorted:
+        tz = zoneinfo.ZoneInfo(user_timezone) if user_timezone is not None else None
+        lo = 0
+        if start > date.min:
+            lo = bisect_left(runs, _local_midnight_utc(start, tz), key=_datetime_utc)
+        hi = len(runs)
+        if end < date.max:
+            hi = bisect_left(
+                runs,
+                _local_midnight_utc(end + timedelta(days=1), tz),
+                lo=lo,
+                key=_datetime_utc,
+            )
+        return runs[lo:hi]
+
     if user_timezone is None:
         return [run for run in runs if start <= run.datetime_utc.date() <= end]
 
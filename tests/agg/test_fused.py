@@ -0,0 +1,103 @@
+import pytest
+from datetime import date, datetime
+from typing import TypedDict
+
+from fitness.agg import total_mileage, total_seconds, training_stress_balance
+from fitness.agg.fused import aggregate_all
+from fitness.models import Sex
+
+
+class _HRParams(TypedDict):
+    max_hr: float
+    resting_hr: float
+    lthr: float
+    sex: Sex
+
+
+HR_PARAMS: _HRParams = {"max_hr": 190, "resting_hr": 50, "lthr": 165, "sex": "M"}
+
+
+@pytest.fixture
+def runs(run_factory):
+    return [
+        run_factory.make(
+            update={"distance": 5.0, "duration": 1800, "date": date(2024, 1, 1)}
+        ),
+        run_factory.make(
+            update={"distance": 3.0, "duration": 1200, "date": date(2024, 1, 15)}
+        ),
+        # Late-evening UTC run that lands on the previous day in Chicago.
+        run_factory.make(
+            update={
+                "distance": 6.5,
+                "duration": 3000,
+                "datetime_utc": datetime(2024, 2, 1, 3, 0, 0),
+            }
+        ),
+        run_factory.make(
+            update={
+                "distance": 4.0,
+                "duration": 1500,
+                "avg_heart_rate": None,
+                "date": date(2024, 2, 10),
+            }
+        ),
+    ]
+
+
+@pytest.mark.parametrize("user_timezone", [None, "America/Chicago"])
+@pytest.mark.parametrize(
+    "start, end",
+    [
+        (date.min, date.max),
+        (date(2024, 1, 1), date(2024, 1, 31)),
+        (date(2024, 2, 1), date.max),
+    ],
+)
+def test_totals_match_individual_aggregations(runs, start, end, user_timezone):
+    snapshot = aggregate_all(
+        runs,
+        load_start=date(2024, 1, 1),
+        load_end=date(2024, 2, 10),
+        user_timezone=user_timezone,
+        **HR_PARAMS,
+    )
+    assert snapshot.mileage_between(start, end) == pytest.approx(
+        total_mileage(runs, start, end, user_timezone)
+    )
+    assert snapshot.seconds_between(start, end) == pytest.approx(
+        total_seconds(runs, start, end, user_timezone)
+    )
+
+
+@pytest.mark.parametrize("user_timezone", [None, "America/Chicago"])
+def test_training_load_matches_training_stress_balance(runs, user_timezone):
+    snapshot = aggregate_all(
+        runs,
+        load_start=date(2024, 1, 10),
+        load_end=date(2024, 2, 10),
+        user_timezone=user_timezone,
+        **HR_PARAMS,
+    )
+    expected = training_stress_balance(
+        activities=runs,
+        start_date=date(2024, 1, 10),
+        end_date=date(2024, 2, 10),
+        user_timezone=user_timezone,
+        **HR_PARAMS,
+    )
+    assert snapshot.training_load == expected
+
+
+def test_no_runs():
+    snapshot = aggregate_all(
+        [], load_start=date(2024, 1, 1), load_end=date(2024, 1, 3), **HR_PARAMS
+    )
+    assert snapshot.mileage_between(date.min, date.max) == 0
+    assert snapshot.seconds_between(date.min, date.max) == 0
+    assert [d.date for d in snapshot.training_load] == [
+        date(2024, 1, 1),
+        date(2024, 1, 2),
+        date(2024, 1, 3),
+    ]
+    assert all(d.training_load.tsb == 0.0 for d in snapshot.training_load)
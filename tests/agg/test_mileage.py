@@ -1,5 +1,5 @@
 import pytest
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 
 from fitness.agg.mileage import (
     total_mileage,
@@ -94,6 +94,27 @@ def test_rolling_sum(run_factory):
     ]
 
 
+def test_rolling_sum_has_no_drift_over_long_ranges(run_factory):
+    start = date(2020, 1, 1)
+    runs = [
+        run_factory.make(
+            update={"distance": 0.1, "date": start + timedelta(days=offset)}
+        )
+        for offset in range(1000)
+    ]
+    results = rolling_sum(
+        runs=runs, start=start + timedelta(days=6), end=date(2022, 9, 26), window=7
+    )
+    assert len(results) == 994
+    assert all(miles == 0.7 for _, miles in results)
+
+
+def test_rolling_sum_rejects_non_positive_window(run_factory):
+    runs = [run_factory.make(update={"distance": 5.0, "date": date(2023, 10, 1)})]
+    with pytest.raises(ValueError, match="window must be at least 1"):
+        rolling_sum(runs=runs, start=date(2023, 10, 1), end=date(2023, 10, 6), window=0)
+
+
 def test_week_anchor_monday():
     # 2023-10-02 is a Monday.
     assert week_anchor(date(2023, 10, 2)) == date(2023, 10, 2)
@@ -136,3 +136,25 @@ def test_mileage_by_shoes_include_retired(run_factory):
     assert brooks_result.shoe.is_retired is False
     assert brooks_result.shoe.retired_at is None
     assert brooks_result.shoe.retirement_notes is None
+
+
+def test_mileage_by_shoes_all_retired(run_factory):
+    """With every shoe retired and include_retired=False, nothing is reported."""
+    from fitness.models.shoe import Shoe, generate_shoe_id
+
+    nikes_id = generate_shoe_id("Nike Air Zoom Pegasus 37")
+    mock_shoes = [
+        Shoe(
+            id=nikes_id,
+            brand="Nike",
+            model="Air Zoom Pegasus 37",
+            retired_at=date(2024, 12, 15),
+        ),
+    ]
+    runs = [run_factory.make(update={"distance": 5.0, "shoe_id": nikes_id})]
+
+    assert mileage_by_shoes(runs, shoes=mock_shoes) == []
+    assert [
+        result.mileage
+        for result in mileage_by_shoes(runs, shoes=mock_shoes, include_retired=True)
+    ] == [5.0]
@@ -1,3 +1,5 @@
+import math
+
 import pytest
 from datetime import date, timedelta
 from fitness.agg.training_load import (
@@ -5,9 +7,11 @@ from fitness.agg.training_load import (
     threshold_trimp,
     hrtss,
     hrtss_by_day,
+    hrtss_scorer,
     training_stress_balance,
     _exponential_training_load,
     _calculate_atl_and_ctl,
+    _banister_trimp,
 )
 from tests._factories.run import RunFactory
 from tests._factories.ride import RideFactory
@@ -102,6 +106,24 @@ class TestTrimp:
         assert result_low == 0.0
 
 
+    def test_trimp_reuses_cached_score(self):
+        """Identical inputs are scored once; a changed input is rescored."""
+        run = RunFactory().make(
+            {"date": date(2024, 1, 1), "duration": 2400, "avg_heart_rate": 150}
+        )
+        edited = run.model_copy(update={"avg_heart_rate": 151})
+        _banister_trimp.cache_clear()
+
+        first = trimp(run, max_hr=190, resting_hr=50, sex="M")
+        second = trimp(run, max_hr=190, resting_hr=50, sex="M")
+        rescored = trimp(edited, max_hr=190, resting_hr=50, sex="M")
+
+        assert first == second
+        assert rescored != first
+        info = _banister_trimp.cache_info()
+        assert (info.hits, info.misses) == (1, 2)
+
+
 class TestThresholdTrimp:
     """Tests for the threshold_trimp() function."""
 
@@ -177,6 +199,40 @@ class TestHrtss:
         assert result == 0.0
 
 
+class TestHrtssScorer:
+    """Tests for the hrtss_scorer() function."""
+
+    @pytest.mark.parametrize("sex", ["M", "F"])
+    @pytest.mark.parametrize("avg_heart_rate", [40, 120, 150, 165, 200])
+    @pytest.mark.parametrize("lthr", [50, 165])
+    def test_matches_hrtss(self, sex, avg_heart_rate, lthr):
+        """The bound scorer should give exactly what hrtss() gives."""
+        run = RunFactory().make(
+            {
+                "date": date(2024, 1, 1),
+                "duration": 2400,
+                "avg_heart_rate": avg_heart_rate,
+            }
+        )
+        score = hrtss_scorer(max_hr=190, resting_hr=50, lthr=lthr, sex=sex)
+        assert score(run) == hrtss(
+            run, max_hr=190, resting_hr=50, lthr=lthr, sex=sex
+        )
+
+    def test_no_heart_rate(self):
+        """The scorer should raise ValueError when no heart rate, like hrtss()."""
+        run = RunFactory().make(
+            {
+                "date": date(2024, 1, 1),
+                "duration": 2400,
+                "avg_heart_rate": None,
+            }
+        )
+        score = hrtss_scorer(max_hr=190, resting_hr=50, lthr=165, sex="M")
+        with pytest.raises(ValueError, match="Activity must have an average heart rate"):
+            score(run)
+
+
 class TestHrtssByDay:
     """Tests for the hrtss_by_day() function."""
 
@@ -470,6 +526,24 @@ class TestExponentialTrainingLoad:
         assert result_fast[2] < result_fast[1]
         assert result_slow[2] < result_slow[1]
 
+    def test_exponential_training_load_matches_recurrence(self):
+        """Test each value follows load = prev + alpha * (trimp - prev)."""
+        trimp_values = [80.0, 0.0, 120.0, 35.5, 0.0, 60.0]
+        tau = 42
+        alpha = 1 - math.exp(-1 / tau)
+
+        expected = []
+        prev = 0.0
+        for value in trimp_values:
+            prev = prev + alpha * (value - prev)
+            expected.append(prev)
+
+        assert _exponential_training_load(trimp_values, tau) == expected
+
+    def test_exponential_training_load_empty(self):
+        """Test that no input days produces no load values."""
+        assert _exponential_training_load([], tau=7) == []
+
 
 class TestCalculateAtlAndCtl:
     """Tests for the _calculate_atl_and_ctl() function."""
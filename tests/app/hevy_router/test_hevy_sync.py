@@ -1,13 +1,15 @@
 """Test the /hevy/sync endpoint."""
 
+import asyncio
+import threading
 from datetime import datetime, timezone
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, patch, MagicMock
 from typing import Generator
 import pytest
 from fastapi.testclient import TestClient
 
 from fitness.app.app import app
-from fitness.app.routers.hevy import hevy_client
+from fitness.app.routers.hevy import HevySyncResponse, hevy_client, sync_hevy_data
 from tests._factories.hevy import HevyWorkoutFactory, HevyExerciseTemplateFactory
 
 
@@ -56,11 +58,11 @@ class TestSyncHevyData:
         ]
         mock_hevy_client.get_exercise_template_by_id.return_value = None
 
-        # Mock existing lift IDs in DB (prefixed) - "200" already exists
-        mock_get_existing_lift_ids.return_value = {"hevy_200"}
+        # Mock existing Hevy lift IDs in DB (prefix stripped) - "200" already exists
+        mock_get_existing_lift_ids.return_value = {"200"}
 
-        # Mock existing template IDs (prefixed, all templates already cached)
-        mock_get_existing_template_ids.return_value = {"hevy_bp_001", "hevy_ip_001"}
+        # Mock existing Hevy template IDs (prefix stripped, all already cached)
+        mock_get_existing_template_ids.return_value = {"bp_001", "ip_001"}
 
         # Mock bulk operations
         mock_bulk_upsert_templates.return_value = 0
@@ -80,8 +82,10 @@ class TestSyncHevyData:
         # Verify get_all_workouts was called
         mock_hevy_client.get_all_workouts.assert_called_once()
 
-        # Verify existing IDs were checked
-        mock_get_existing_lift_ids.assert_called_once()
+        # Verify only the fetched workouts were checked against the DB
+        mock_get_existing_lift_ids.assert_called_once_with(
+            prefix="hevy_", among=["100", "200", "300"]
+        )
 
         # Verify bulk_create_lifts was called with only new Lift objects (prefixed IDs)
         mock_bulk_create_lifts.assert_called_once()
@@ -122,9 +126,9 @@ class TestSyncHevyData:
 
         mock_hevy_client.get_all_workouts.return_value = [workout_1, workout_2]
 
-        # All workouts already exist in DB (prefixed IDs)
-        mock_get_existing_lift_ids.return_value = {"hevy_100", "hevy_200"}
-        mock_get_existing_template_ids.return_value = {"hevy_bp_001", "hevy_ip_001"}
+        # All workouts already exist in DB
+        mock_get_existing_lift_ids.return_value = {"100", "200"}
+        mock_get_existing_template_ids.return_value = {"bp_001", "ip_001"}
 
         mock_bulk_upsert_templates.return_value = 0
         mock_bulk_create_lifts.return_value = 0
@@ -139,9 +143,10 @@ class TestSyncHevyData:
         assert data["workouts_synced"] == 0
         assert data["templates_synced"] == 0
 
-        # bulk_create should be called with empty list
-        mock_bulk_create_lifts.assert_called_once()
-        assert mock_bulk_create_lifts.call_args[0][0] == []
+        # Nothing new, so templates and inserts are skipped entirely
+        mock_get_existing_template_ids.assert_not_called()
+        mock_bulk_upsert_templates.assert_not_called()
+        mock_bulk_create_lifts.assert_not_called()
 
         # Verify sync time was still updated
         mock_update_last_sync_time.assert_called_once()
@@ -181,8 +186,8 @@ class TestSyncHevyData:
         # No existing workouts
         mock_get_existing_lift_ids.return_value = set()
 
-        # ip_001 is cached (prefixed), but bp_001 is not
-        mock_get_existing_template_ids.return_value = {"hevy_ip_001"}
+        # ip_001 is cached, but bp_001 is not
+        mock_get_existing_template_ids.return_value = {"ip_001"}
 
         mock_bulk_upsert_templates.return_value = 1
         mock_bulk_create_lifts.return_value = 1
@@ -200,6 +205,52 @@ class TestSyncHevyData:
         # Verify template was fetched for bp_001 only (unprefixed API ID)
         mock_hevy_client.get_exercise_template_by_id.assert_called_once_with("bp_001")
 
+    @patch("fitness.app.routers.hevy.update_last_sync_time")
+    @patch("fitness.app.routers.hevy.get_last_sync_time")
+    @patch("fitness.app.routers.hevy.bulk_create_lifts")
+    @patch("fitness.app.routers.hevy.bulk_upsert_exercise_templates")
+    @patch("fitness.app.routers.hevy.get_existing_exercise_template_ids")
+    @patch("fitness.app.routers.hevy.get_existing_lift_ids")
+    def test_sync_fetches_missing_templates_concurrently(
+        self,
+        mock_get_existing_lift_ids: MagicMock,
+        mock_get_existing_template_ids: MagicMock,
+        mock_bulk_upsert_templates: MagicMock,
+        mock_bulk_create_lifts: MagicMock,
+        mock_get_last_sync_time: MagicMock,
+        mock_update_last_sync_time: MagicMock,
+        mock_hevy_client: MagicMock,
+        auth_client: TestClient,
+    ):
+        """Test that missing templates are fetched in parallel, not one by one."""
+        template_factory = HevyExerciseTemplateFactory()
+        # The default workout uses templates bp_001 and ip_001; neither is cached.
+        mock_hevy_client.get_all_workouts.return_value = [
+            HevyWorkoutFactory().make({"id": "100"})
+        ]
+        mock_get_existing_lift_ids.return_value = set()
+        mock_get_existing_template_ids.return_value = set()
+        mock_get_last_sync_time.return_value = None
+        mock_bulk_upsert_templates.side_effect = len
+        mock_bulk_create_lifts.return_value = 1
+
+        # Each fetch waits for the other, so this only completes if both are
+        # in flight at the same time.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fetch_template(template_id: str):
+            barrier.wait()
+            return template_factory.make({"id": template_id})
+
+        mock_hevy_client.get_exercise_template_by_id.side_effect = fetch_template
+
+        response = auth_client.post("/hevy/sync")
+
+        assert response.status_code == 200
+        assert response.json()["templates_synced"] == 2
+        upserted = mock_bulk_upsert_templates.call_args[0][0]
+        assert {t.id for t in upserted} == {"hevy_bp_001", "hevy_ip_001"}
+
     @patch("fitness.app.routers.hevy.update_last_sync_time")
     @patch("fitness.app.routers.hevy.get_last_sync_time")
     @patch("fitness.app.routers.hevy.bulk_create_lifts")
@@ -273,7 +324,102 @@ class TestSyncHevyData:
         # get_last_sync_time should NOT be called when full_sync=true
         mock_get_last_sync_time.assert_not_called()
 
+    @patch("fitness.app.routers.hevy.EXISTING_ID_PROBE_LIMIT", 2)
+    @patch("fitness.app.routers.hevy.update_last_sync_time")
+    @patch("fitness.app.routers.hevy.get_last_sync_time")
+    @patch("fitness.app.routers.hevy.bulk_create_lifts")
+    @patch("fitness.app.routers.hevy.bulk_upsert_exercise_templates")
+    @patch("fitness.app.routers.hevy.get_existing_exercise_template_ids")
+    @patch("fitness.app.routers.hevy.get_existing_lift_ids")
+    def test_large_sync_scans_existing_ids_instead_of_probing(
+        self,
+        mock_get_existing_lift_ids: MagicMock,
+        mock_get_existing_template_ids: MagicMock,
+        mock_bulk_upsert_templates: MagicMock,
+        mock_bulk_create_lifts: MagicMock,
+        mock_get_last_sync_time: MagicMock,
+        mock_update_last_sync_time: MagicMock,
+        mock_hevy_client: MagicMock,
+        auth_client: TestClient,
+    ):
+        """Test that past the probe limit, all stored Hevy IDs are loaded once."""
+        workout_factory = HevyWorkoutFactory()
+        mock_hevy_client.get_all_workouts.return_value = [
+            workout_factory.make({"id": str(i)}) for i in range(3)
+        ]
+        mock_get_existing_lift_ids.return_value = {"0", "1", "2"}
+        mock_get_existing_template_ids.return_value = set()
+        mock_get_last_sync_time.return_value = None
+        mock_bulk_upsert_templates.return_value = 0
+        mock_bulk_create_lifts.return_value = 0
+
+        response = auth_client.post("/hevy/sync")
+
+        assert response.status_code == 200
+        assert response.json()["workouts_synced"] == 0
+        mock_get_existing_lift_ids.assert_called_once_with(prefix="hevy_")
+
     def test_sync_requires_auth(self, client: TestClient):
         """Test that sync endpoint requires authentication."""
         response = client.post("/hevy/sync")
         assert response.status_code == 401
+
+
+class TestConcurrentSyncs:
+    """Test that overlapping sync requests share a single run."""
+
+    @staticmethod
+    def _response(message: str) -> HevySyncResponse:
+        return HevySyncResponse(
+            workouts_synced=0,
+            templates_synced=0,
+            message=message,
+            synced_at=datetime(2024, 1, 15, tzinfo=timezone.utc),
+        )
+
+    @pytest.mark.asyncio
+    async def test_overlapping_syncs_share_one_run(self):
+        release = asyncio.Event()
+        run_sync = AsyncMock(return_value=self._response("done"))
+
+        async def slow_sync(full_sync, client):
+            await release.wait()
+            return await run_sync(full_sync, client)
+
+        with patch("fitness.app.routers.hevy._run_sync", slow_sync):
+            first = asyncio.ensure_future(
+                sync_hevy_data(full_sync=False, user=MagicMock(), client=MagicMock())
+            )
+            second = asyncio.ensure_future(
+                sync_hevy_data(full_sync=False, user=MagicMock(), client=MagicMock())
+            )
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(first, second)
+
+        run_sync.assert_awaited_once()
+        assert results[0] is results[1]
+
+    @pytest.mark.asyncio
+    async def test_sync_after_completion_runs_again(self):
+        run_sync = AsyncMock(return_value=self._response("done"))
+
+        with patch("fitness.app.routers.hevy._run_sync", run_sync):
+            for _ in range(2):
+                await sync_hevy_data(
+                    full_sync=False, user=MagicMock(), client=MagicMock()
+                )
+
+        assert run_sync.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_full_and_incremental_syncs_run_separately(self):
+        run_sync = AsyncMock(return_value=self._response("done"))
+
+        with patch("fitness.app.routers.hevy._run_sync", run_sync):
+            await asyncio.gather(
+                sync_hevy_data(full_sync=False, user=MagicMock(), client=MagicMock()),
+                sync_hevy_data(full_sync=True, user=MagicMock(), client=MagicMock()),
+            )
+
+        assert sorted(c.args[0] for c in run_sync.await_args_list) == [False, True]
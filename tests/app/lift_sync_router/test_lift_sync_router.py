@@ -0,0 +1,272 @@
+"""Tests for /sync/lifts/* endpoints."""
+
+import threading
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+from fastapi.testclient import TestClient
+
+from fitness.models.sync import SyncedLift
+from tests._factories.lift import LiftFactory
+
+
+def _synced_lift_record(lift_id: str, status: str = "synced") -> SyncedLift:
+    now = datetime.now(timezone.utc)
+    return SyncedLift(
+        id=1,
+        lift_id=lift_id,
+        lift_version=1,
+        google_event_id="evt_abc123",
+        synced_at=now,
+        sync_status=status,  # ty: ignore[invalid-argument-type]
+        error_message=None,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+class TestSyncLift:
+    @patch("fitness.app.routers.lift_sync.upsert_synced_lift")
+    @patch("fitness.app.routers._sync_helpers.get_calendar_client")
+    @patch("fitness.app.routers.lift_sync.get_lift_with_sync")
+    def test_sync_queues_then_creates_event(
+        self,
+        mock_get: MagicMock,
+        mock_get_client: MagicMock,
+        mock_upsert: MagicMock,
+        editor_client: TestClient,
+    ):
+        lift = LiftFactory().make({"id": "hevy_100"})
+        mock_get.return_value = (lift, None)
+        client_instance = MagicMock()
+        client_instance.create_lift_event.return_value = "evt_abc123"
+        mock_get_client.return_value = client_instance
+        mock_upsert.side_effect = [
+            _synced_lift_record(lift.id, "pending"),
+            _synced_lift_record(lift.id),
+        ]
+
+        response = editor_client.post(f"/sync/lifts/{lift.id}")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["success"] is True
+        assert body["sync_status"] == "pending"
+        # The test client runs background tasks before returning.
+        client_instance.create_lift_event.assert_called_once_with(lift)
+        assert [c.args for c in mock_upsert.call_args_list] == [
+            (lift.id, "", "pending"),
+            (lift.id, "evt_abc123", "synced"),
+        ]
+
+    @patch("fitness.app.routers.lift_sync.upsert_synced_lift")
+    @patch("fitness.app.routers._sync_helpers.get_calendar_client")
+    @patch("fitness.app.routers.lift_sync.get_lift_with_sync")
+    def test_retry_after_failure_upserts_same_record(
+        self,
+        mock_get: MagicMock,
+        mock_get_client: MagicMock,
+        mock_upsert: MagicMock,
+        editor_client: TestClient,
+    ):
+        lift = LiftFactory().make({"id": "hevy_100"})
+        mock_get.return_value = (lift, _synced_lift_record(lift.id, "failed"))
+        mock_get_client.return_value.create_lift_event.return_value = "evt_new"
+        mock_upsert.side_effect = [
+            _synced_lift_record(lift.id, "pending"),
+            _synced_lift_record(lift.id),
+        ]
+
+        response = editor_client.post(f"/sync/lifts/{lift.id}")
+
+        assert response.json()["success"] is True
+        mock_upsert.assert_called_with(lift.id, "evt_new", "synced")
+
+    @patch("fitness.app.routers.lift_sync.upsert_synced_lift")
+    @patch("fitness.app.routers._sync_helpers.get_calendar_client")
+    @patch("fitness.app.routers.lift_sync.get_lift_with_sync")
+    def test_event_is_created_on_the_calendar_executor(
+        self,
+        mock_get: MagicMock,
+        mock_get_client: MagicMock,
+        mock_upsert: MagicMock,
+        editor_client: TestClient,
+    ):
+        lift = LiftFactory().make({"id": "hevy_100"})
+        mock_get.return_value = (lift, None)
+        mock_get_client.return_value.create_lift_event.side_effect = lambda _lift: (
+            threading.current_thread().name
+        )
+        mock_upsert.return_value = _synced_lift_record(lift.id, "pending")
+
+        editor_client.post(f"/sync/lifts/{lift.id}")
+
+        [_, event_id, _] = mock_upsert.call_args.args
+        assert event_id.startswith("gcal")
+
+    @patch("fitness.app.routers.lift_sync.upsert_synced_lift")
+    @patch("fitness.app.routers._sync_helpers.get_calendar_client")
+    @patch("fitness.app.routers.lift_sync.get_lift_with_sync")
+    def test_calendar_failure_records_failed_status(
+        self,
+        mock_get: MagicMock,
+        mock_get_client: MagicMock,
+        mock_upsert: MagicMock,
+        editor_client: TestClient,
+    ):
+        lift = LiftFactory().make({"id": "hevy_100"})
+        mock_get.return_value = (lift, None)
+        mock_get_client.return_value.create_lift_event.return_value = None
+        mock_upsert.return_value = _synced_lift_record(lift.id, "pending")
+
+        response = editor_client.post(f"/sync/lifts/{lift.id}")
+
+        assert response.json()["sync_status"] == "pending"
+        args, kwargs = mock_upsert.call_args
+        assert args == (lift.id, "", "failed")
+        assert "Failed to create Google Calendar event" in kwargs["error_message"]
+
+    @patch("fitness.app.routers.lift_sync.upsert_synced_lift")
+    @patch("fitness.app.routers.lift_sync.get_lift_with_sync")
+    def test_recent_pending_sync_is_not_queued_again(
+        self,
+        mock_get: MagicMock,
+        mock_upsert: MagicMock,
+        editor_client: TestClient,
+    ):
+        lift = LiftFactory().make({"id": "hevy_100"})
+        mock_get.return_value = (lift, _synced_lift_record(lift.id, "pending"))
+
+        response = editor_client.post(f"/sync/lifts/{lift.id}")
+
+        assert response.json()["success"] is False
+        assert response.json()["sync_status"] == "pending"
+        mock_upsert.assert_not_called()
+
+    @patch("fitness.app.routers.lift_sync.upsert_synced_lift")
+    @patch("fitness.app.routers._sync_helpers.get_calendar_client")
+    @patch("fitness.app.routers.lift_sync.get_lift_with_sync")
+    def test_stale_pending_sync_is_queued_again(
+        self,
+        mock_get: MagicMock,
+        mock_get_client: MagicMock,
+        mock_upsert: MagicMock,
+        editor_client: TestClient,
+    ):
+        lift = LiftFactory().make({"id": "hevy_100"})
+        stale = _synced_lift_record(lift.id, "pending")
+        # Stored as naive UTC, like the database returns it.
+        stale.updated_at = (datetime.now(timezone.utc) - timedelta(hours=1)).replace(
+            tzinfo=None
+        )
+        mock_get.return_value = (lift, stale)
+        mock_get_client.return_value.create_lift_event.return_value = "evt_abc123"
+        mock_upsert.side_effect = [
+            _synced_lift_record(lift.id, "pending"),
+            _synced_lift_record(lift.id),
+        ]
+
+        response = editor_client.post(f"/sync/lifts/{lift.id}")
+
+        assert response.json()["success"] is True
+        mock_upsert.assert_called_with(lift.id, "evt_abc123", "synced")
+
+    @patch("fitness.app.routers.lift_sync.get_lift_with_sync")
+    def test_sync_404_when_lift_missing(
+        self,
+        mock_get: MagicMock,
+        editor_client: TestClient,
+    ):
+        mock_get.return_value = (None, None)
+        response = editor_client.post("/sync/lifts/hevy_missing")
+        assert response.status_code == 404
+
+    @patch("fitness.app.routers.lift_sync.get_lift_with_sync")
+    def test_sync_already_synced_returns_no_op(
+        self,
+        mock_get: MagicMock,
+        editor_client: TestClient,
+    ):
+        lift = LiftFactory().make({"id": "hevy_100"})
+        mock_get.return_value = (lift, _synced_lift_record(lift.id))
+
+        response = editor_client.post(f"/sync/lifts/{lift.id}")
+        assert response.status_code == 200
+        assert response.json()["success"] is False
+        assert "already synced" in response.json()["message"].lower()
+
+
+class TestSyncLiftsBatch:
+    @patch("fitness.app.routers.lift_sync.bulk_upsert_synced_lifts")
+    @patch("fitness.app.routers.lift_sync.get_calendar_client")
+    @patch("fitness.app.routers.lift_sync.get_lifts_with_sync")
+    def test_batch_queues_unsynced_lifts_and_records_outcomes(
+        self,
+        mock_get: MagicMock,
+        mock_get_client: MagicMock,
+        mock_bulk_upsert: MagicMock,
+        editor_client: TestClient,
+    ):
+        factory = LiftFactory()
+        new, failing, done = (
+            factory.make({"id": lift_id}) for lift_id in ("hevy_1", "hevy_2", "hevy_3")
+        )
+        mock_get.return_value = {
+            new.id: (new, None),
+            failing.id: (failing, _synced_lift_record(failing.id, "failed")),
+            done.id: (done, _synced_lift_record(done.id)),
+        }
+        client_instance = mock_get_client.return_value
+        client_instance.create_lift_events.return_value = {
+            new.id: "evt_1",
+            failing.id: None,
+        }
+
+        response = editor_client.post(
+            "/sync/lifts/batch",
+            json={"lift_ids": ["hevy_1", "hevy_2", "hevy_3", "hevy_missing"]},
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [body[i]["sync_status"] for i in body] == [
+            "pending",
+            "pending",
+            "synced",
+            "failed",
+        ]
+        assert "not found" in body["hevy_missing"]["message"]
+        mock_get.assert_called_once_with(["hevy_1", "hevy_2", "hevy_3", "hevy_missing"])
+        # The test client runs background tasks before returning.
+        client_instance.create_lift_events.assert_called_once_with([new, failing])
+        pending_call, outcome_call = mock_bulk_upsert.call_args_list
+        assert pending_call.args[0] == [
+            ("hevy_1", "", "pending", None),
+            ("hevy_2", "", "pending", None),
+        ]
+        assert [row[:3] for row in outcome_call.args[0]] == [
+            ("hevy_1", "evt_1", "synced"),
+            ("hevy_2", "", "failed"),
+        ]
+
+    @patch("fitness.app.routers.lift_sync.bulk_upsert_synced_lifts")
+    @patch("fitness.app.routers.lift_sync.get_lifts_with_sync")
+    def test_batch_with_nothing_to_sync_writes_nothing(
+        self,
+        mock_get: MagicMock,
+        mock_bulk_upsert: MagicMock,
+        editor_client: TestClient,
+    ):
+        lift = LiftFactory().make({"id": "hevy_100"})
+        mock_get.return_value = {
+            lift.id: (lift, _synced_lift_record(lift.id, "pending"))
+        }
+
+        response = editor_client.post("/sync/lifts/batch", json={"lift_ids": [lift.id]})
+
+        assert "already being synced" in response.json()[lift.id]["message"]
+        mock_bulk_upsert.assert_not_called()
+
+    def test_batch_requires_lift_ids(self, editor_client: TestClient):
+        response = editor_client.post("/sync/lifts/batch", json={"lift_ids": []})
+        assert response.status_code == 422
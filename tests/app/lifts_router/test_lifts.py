@@ -1,16 +1,27 @@
 """Test the /lifts endpoints."""
 
+import inspect
+import threading
+from datetime import date
 from unittest.mock import patch, MagicMock
+from fastapi.routing import APIRoute
 from fastapi.testclient import TestClient
 
-from fitness.db.lifts import LiftWithSync
+from fitness.app.routers.lifts import router
+from fitness.db.lifts import LiftSummaryWithSync, LiftTotals
 from tests._factories.lift import LiftFactory
 
 
-def _unsynced(lift) -> LiftWithSync:
-    """Wrap a Lift in a LiftWithSync with no sync data."""
-    return LiftWithSync(
-        lift=lift,
+def _unsynced(lift) -> LiftSummaryWithSync:
+    """Summarize a Lift as a LiftSummaryWithSync with no sync data."""
+    return LiftSummaryWithSync(
+        id=lift.id,
+        title=lift.title,
+        start_time=lift.start_time,
+        end_time=lift.end_time,
+        total_volume_kg=lift.total_volume(),
+        total_sets=lift.total_sets(),
+        exercise_count=len(lift.exercises),
         is_synced=False,
         sync_status=None,
         synced_at=None,
@@ -19,6 +30,19 @@ def _unsynced(lift) -> LiftWithSync:
     )
 
 
+def test_handlers_run_off_the_event_loop():
+    """The DB calls block, so handlers must be sync to run in the threadpool.
+
+    The exception is /stats, which runs its queries with asyncio.to_thread.
+    """
+    async_handlers = [
+        route.path
+        for route in router.routes
+        if isinstance(route, APIRoute) and inspect.iscoroutinefunction(route.endpoint)
+    ]
+    assert async_handlers == ["/lifts/stats"]
+
+
 class TestGetLifts:
     """Test GET /lifts endpoint."""
 
@@ -65,6 +89,74 @@ class TestGetLifts:
         response = client.get("/lifts")
         assert response.status_code == 401
 
+    @patch("fitness.app.routers.lifts.get_lift_totals")
+    @patch("fitness.app.routers.lifts.get_lifts_in_date_range_with_sync")
+    def test_get_lifts_paginated(
+        self,
+        mock_get_lifts: MagicMock,
+        mock_get_totals: MagicMock,
+        viewer_client: TestClient,
+    ):
+        """Test that a page of lifts reports the total across all pages."""
+        workout = LiftFactory().make({"id": "hevy_100"})
+        mock_get_lifts.return_value = [_unsynced(workout)]
+        mock_get_totals.return_value = LiftTotals(
+            sessions=42, volume_kg=0.0, sets=0, duration_seconds=0
+        )
+
+        response = viewer_client.get("/lifts?start_date=2024-01-01&limit=1&offset=10")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["lifts"]) == 1
+        assert data["total_count"] == 42
+        mock_get_lifts.assert_called_once_with(
+            date(2024, 1, 1), None, limit=1, offset=10, after=None
+        )
+        mock_get_totals.assert_called_once_with(date(2024, 1, 1), None)
+
+    def test_get_lifts_limit_bounds(self, viewer_client: TestClient):
+        """Test that oversized pages are rejected."""
+        response = viewer_client.get("/lifts?limit=501")
+        assert response.status_code == 422
+
+    @patch("fitness.app.routers.lifts.get_lift_totals")
+    @patch("fitness.app.routers.lifts.get_all_lifts_with_sync")
+    def test_get_lifts_cursor_round_trip(
+        self,
+        mock_get_lifts: MagicMock,
+        mock_get_totals: MagicMock,
+        viewer_client: TestClient,
+    ):
+        """A full page's next_cursor fetches the lifts after its last one."""
+        workouts = [LiftFactory().make({"id": f"hevy_{i}"}) for i in range(2)]
+        mock_get_lifts.return_value = [_unsynced(w) for w in workouts]
+        mock_get_totals.return_value = LiftTotals(
+            sessions=5, volume_kg=0.0, sets=0, duration_seconds=0
+        )
+
+        first = viewer_client.get("/lifts?limit=2").json()
+        assert first["next_cursor"] is not None
+
+        mock_get_lifts.return_value = [_unsynced(workouts[0])]
+        second = viewer_client.get(
+            "/lifts", params={"limit": 2, "cursor": first["next_cursor"]}
+        ).json()
+
+        assert mock_get_lifts.call_args.kwargs["after"] == (
+            workouts[1].start_time,
+            "hevy_1",
+        )
+        # A short page is the last one.
+        assert second["next_cursor"] is None
+        assert second["total_count"] == 5
+
+    def test_get_lifts_rejects_bad_cursor(self, viewer_client: TestClient):
+        assert viewer_client.get("/lifts?cursor=not-a-cursor").status_code == 400
+        cursor = "2024-01-01T00:00:00|hevy_1"
+        response = viewer_client.get("/lifts", params={"cursor": cursor, "offset": 5})
+        assert response.status_code == 400
+
 
 class TestGetLiftsCount:
     """Test GET /lifts/count endpoint."""
@@ -291,381 +383,248 @@ class TestGetLiftsTimezoneFiltering:
 class TestGetLiftsStats:
     """Test GET /lifts/stats endpoint."""
 
-    @patch("fitness.app.routers.lifts.get_all_lifts")
+    ALL_TIME = LiftTotals(sessions=2, volume_kg=5000.0, sets=20, duration_seconds=10800)
+
+    @patch("fitness.app.routers.lifts.get_lift_avg_rpe", return_value=None)
+    @patch("fitness.app.routers.lifts.get_lift_totals")
     def test_get_lifts_stats(
         self,
-        mock_get_lifts: MagicMock,
+        mock_get_totals: MagicMock,
+        mock_get_avg_rpe: MagicMock,
         viewer_client: TestClient,
     ):
         """Test that lift stats are returned."""
-        workout_factory = LiftFactory()
-        workout1 = workout_factory.make({"id": "hevy_100"})
-        workout2 = workout_factory.make({"id": "hevy_200"})
-
-        mock_get_lifts.return_value = [workout1, workout2]
+        mock_get_totals.return_value = self.ALL_TIME
 
         response = viewer_client.get("/lifts/stats")
 
         assert response.status_code == 200
         data = response.json()
         assert data["total_sessions"] == 2
-        assert "total_volume_kg" in data
-        assert "total_sets" in data
-        assert "sets_in_period" in data
-        # When no date filter, sets_in_period equals total_sets
+        assert data["total_volume_kg"] == 5000.0
+        assert data["total_sets"] == 20
+        # When no date filter, the period is all time (and is only queried once)
+        mock_get_totals.assert_called_once_with()
+        assert data["sessions_in_period"] == 2
         assert data["sets_in_period"] == data["total_sets"]
+        assert data["avg_rpe"] is None
 
-    @patch("fitness.app.routers.lifts.get_lifts_in_date_range")
-    @patch("fitness.app.routers.lifts.get_all_lifts")
+    @patch("fitness.app.routers.lifts.get_lift_avg_rpe", return_value=8.04)
+    @patch("fitness.app.routers.lifts.get_lift_totals")
     def test_get_lifts_stats_with_date_filter(
         self,
-        mock_get_all: MagicMock,
-        mock_get_range: MagicMock,
+        mock_get_totals: MagicMock,
+        mock_get_avg_rpe: MagicMock,
         viewer_client: TestClient,
     ):
-        """Test that sets_in_period is calculated from filtered lifts."""
-        workout_factory = LiftFactory()
-        # All-time: 2 workouts
-        workout1 = workout_factory.make({"id": "hevy_100"})
-        workout2 = workout_factory.make({"id": "hevy_200"})
-        mock_get_all.return_value = [workout1, workout2]
-
-        # Period: only 1 workout
-        mock_get_range.return_value = [workout1]
+        """Test that period stats are aggregated over the filtered range."""
+        period = LiftTotals(sessions=1, volume_kg=2500.0, sets=8, duration_seconds=3600)
+        mock_get_totals.side_effect = lambda start=None, end=None: (
+            self.ALL_TIME if start is None and end is None else period
+        )
 
         response = viewer_client.get("/lifts/stats?start_date=2024-01-01")
 
         assert response.status_code == 200
         data = response.json()
-        # Total stats are from all lifts
+        # Total stats are over all lifts
         assert data["total_sessions"] == 2
-        # Period stats are from filtered lifts
+        assert data["total_volume_kg"] == 5000.0
+        assert data["duration_all_time_seconds"] == 10800
+        # Period stats are over the filtered range
         assert data["sessions_in_period"] == 1
-        # sets_in_period should be from the filtered workout only
-        assert data["sets_in_period"] == workout1.total_sets()
+        assert data["volume_in_period_kg"] == 2500.0
+        assert data["sets_in_period"] == 8
+        assert data["duration_in_period_seconds"] == 3600
+        assert data["avg_duration_seconds"] == 3600
+        assert data["avg_rpe"] == 8.0
+        mock_get_totals.assert_any_call(date(2024, 1, 1), None)
+        mock_get_avg_rpe.assert_called_once_with(date(2024, 1, 1), None)
+
+    @patch("fitness.app.routers.lifts.get_lift_avg_rpe")
+    @patch("fitness.app.routers.lifts.get_lift_totals")
+    def test_get_lifts_stats_queries_run_concurrently(
+        self,
+        mock_get_totals: MagicMock,
+        mock_get_avg_rpe: MagicMock,
+        viewer_client: TestClient,
+    ):
+        """Each query waits for the other two to start, so serial calls would hang."""
+        started = threading.Barrier(3, timeout=5)
+
+        def totals(start=None, end=None):
+            started.wait()
+            return self.ALL_TIME
+
+        def avg_rpe(start=None, end=None):
+            started.wait()
+            return None
+
+        mock_get_totals.side_effect = totals
+        mock_get_avg_rpe.side_effect = avg_rpe
+
+        response = viewer_client.get("/lifts/stats?end_date=2024-01-01")
+
+        assert response.status_code == 200
+        assert mock_get_totals.call_count == 2
 
-    @patch("fitness.app.routers.lifts.get_lifts_in_date_range")
-    @patch("fitness.app.routers.lifts.get_all_lifts")
+    @patch("fitness.app.routers.lifts.get_lift_avg_rpe", return_value=None)
+    @patch("fitness.app.routers.lifts.get_lift_totals")
     def test_get_lifts_stats_empty_period(
         self,
-        mock_get_all: MagicMock,
-        mock_get_range: MagicMock,
+        mock_get_totals: MagicMock,
+        mock_get_avg_rpe: MagicMock,
         viewer_client: TestClient,
     ):
-        """Test stats when date filter returns no lifts."""
-        workout_factory = LiftFactory()
-        workout = workout_factory.make({"id": "hevy_100"})
-        mock_get_all.return_value = [workout]
-        mock_get_range.return_value = []
+        """Test stats when date filter matches no lifts."""
+        empty = LiftTotals(sessions=0, volume_kg=0.0, sets=0, duration_seconds=0)
+        mock_get_totals.side_effect = [self.ALL_TIME, empty]
 
         response = viewer_client.get("/lifts/stats?start_date=2025-01-01")
 
         assert response.status_code == 200
         data = response.json()
-        assert data["total_sessions"] == 1
+        assert data["total_sessions"] == 2
         assert data["sessions_in_period"] == 0
         assert data["sets_in_period"] == 0
         assert data["volume_in_period_kg"] == 0
+        assert data["avg_duration_seconds"] == 0
 
     def test_get_lifts_stats_requires_auth(self, client: TestClient):
         """Test that lift stats endpoint requires authentication."""
         response = client.get("/lifts/stats")
         assert response.status_code == 401
 
-    @patch("fitness.app.routers.lifts.get_all_lifts")
+    @patch("fitness.app.routers.lifts.get_lift_avg_rpe", return_value=None)
+    @patch("fitness.app.routers.lifts.get_lift_totals")
     def test_get_lifts_stats_includes_duration_fields(
         self,
-        mock_get_lifts: MagicMock,
+        mock_get_totals: MagicMock,
+        mock_get_avg_rpe: MagicMock,
         viewer_client: TestClient,
     ):
         """Test that lift stats includes duration fields."""
-        workout_factory = LiftFactory()
-        workout = workout_factory.make({"id": "hevy_100"})
-        mock_get_lifts.return_value = [workout]
+        mock_get_totals.return_value = self.ALL_TIME
 
         response = viewer_client.get("/lifts/stats")
 
         assert response.status_code == 200
         data = response.json()
-        assert "duration_all_time_seconds" in data
-        assert "duration_in_period_seconds" in data
-        assert "avg_duration_seconds" in data
-        # Default workout is 1.5 hours = 5400 seconds
-        assert data["duration_all_time_seconds"] == 5400
-        assert data["duration_in_period_seconds"] == 5400
+        assert data["duration_all_time_seconds"] == 10800
+        assert data["duration_in_period_seconds"] == 10800
+        # Two sessions totalling 3 hours
         assert data["avg_duration_seconds"] == 5400
 
 
 class TestGetSetsByMuscle:
     """Test GET /lifts/sets-by-muscle endpoint."""
 
-    @patch("fitness.app.routers.lifts.get_all_exercise_templates")
-    @patch("fitness.app.routers.lifts.get_all_lifts")
+    @patch("fitness.app.routers.lifts.get_set_counts_by_muscle")
     def test_get_sets_by_muscle(
         self,
-        mock_get_lifts: MagicMock,
-        mock_get_templates: MagicMock,
+        mock_get_counts: MagicMock,
         viewer_client: TestClient,
     ):
         """Test that sets by muscle returns muscle groups with counts."""
-        from tests._factories.lift import ExerciseTemplateFactory, ExerciseFactory
-
-        exercise_factory = ExerciseFactory()
-        template_factory = ExerciseTemplateFactory()
-        workout_factory = LiftFactory()
-
-        # Create exercises with known template IDs
-        chest_exercise = exercise_factory.make(
-            {
-                "title": "Bench Press",
-                "exercise_template_id": "hevy_bp_001",
-            }
-        )
-        back_exercise = exercise_factory.make(
-            {
-                "title": "Rows",
-                "exercise_template_id": "hevy_row_001",
-            }
-        )
-
-        workout = workout_factory.make(
-            {"id": "hevy_100"},
-            exercises=[chest_exercise, back_exercise],
-        )
-        mock_get_lifts.return_value = [workout]
-
-        # Create matching templates with muscle groups
-        chest_template = template_factory.make(
-            {
-                "id": "hevy_bp_001",
-                "primary_muscle_group": "chest",
-            }
-        )
-        back_template = template_factory.make(
-            {
-                "id": "hevy_row_001",
-                "primary_muscle_group": "lats",
-            }
-        )
-        mock_get_templates.return_value = [chest_template, back_template]
+        mock_get_counts.return_value = [("chest", 6), ("lats", 3)]
 
         response = viewer_client.get("/lifts/sets-by-muscle")
 
         assert response.status_code == 200
-        data = response.json()
-        assert len(data) == 2
-        # Each exercise has 3 normal sets
-        muscles = {item["muscle"]: item["sets"] for item in data}
-        assert muscles["chest"] == 3
-        assert muscles["lats"] == 3
-
-    @patch("fitness.app.routers.lifts.get_all_exercise_templates")
-    @patch("fitness.app.routers.lifts.get_lifts_in_date_range")
+        assert response.json() == [
+            {"muscle": "chest", "sets": 6},
+            {"muscle": "lats", "sets": 3},
+        ]
+        mock_get_counts.assert_called_once_with(None, None)
+
+    @patch("fitness.app.routers.lifts.get_set_counts_by_muscle", return_value=[])
     def test_get_sets_by_muscle_with_date_filter(
         self,
-        mock_get_lifts: MagicMock,
-        mock_get_templates: MagicMock,
+        mock_get_counts: MagicMock,
         viewer_client: TestClient,
     ):
         """Test that sets by muscle respects date filtering."""
-        from tests._factories.lift import ExerciseTemplateFactory
-
-        workout_factory = LiftFactory()
-        template_factory = ExerciseTemplateFactory()
-
-        workout = workout_factory.make({"id": "hevy_100"})
-        mock_get_lifts.return_value = [workout]
-
-        template = template_factory.make(
-            {
-                "id": "hevy_bp_001",
-                "primary_muscle_group": "chest",
-            }
-        )
-        mock_get_templates.return_value = [template]
-
         response = viewer_client.get("/lifts/sets-by-muscle?start_date=2024-01-01")
 
         assert response.status_code == 200
-        mock_get_lifts.assert_called_once()
-        # Verify correct date arguments were passed
-        from datetime import date
-
-        call_args = mock_get_lifts.call_args
-        assert call_args[0][0] == date(2024, 1, 1)
-        assert call_args[0][1] is None
+        mock_get_counts.assert_called_once_with(date(2024, 1, 1), None)
 
     def test_get_sets_by_muscle_requires_auth(self, client: TestClient):
         """Test that sets by muscle endpoint requires authentication."""
         response = client.get("/lifts/sets-by-muscle")
         assert response.status_code == 401
 
-    @patch("fitness.app.routers.lifts.get_all_exercise_templates")
-    @patch("fitness.app.routers.lifts.get_all_lifts")
+    @patch("fitness.app.routers.lifts.get_set_counts_by_muscle", return_value=[])
     def test_get_sets_by_muscle_empty(
         self,
-        mock_get_lifts: MagicMock,
-        mock_get_templates: MagicMock,
+        mock_get_counts: MagicMock,
         viewer_client: TestClient,
     ):
         """Test that sets by muscle returns empty list when no lifts."""
-        mock_get_lifts.return_value = []
-        mock_get_templates.return_value = []
-
         response = viewer_client.get("/lifts/sets-by-muscle")
 
         assert response.status_code == 200
         assert response.json() == []
 
-    @patch("fitness.app.routers.lifts.get_all_exercise_templates")
-    @patch("fitness.app.routers.lifts.get_all_lifts")
-    def test_get_sets_by_muscle_unmatched_template(
-        self,
-        mock_get_lifts: MagicMock,
-        mock_get_templates: MagicMock,
-        viewer_client: TestClient,
-    ):
-        """Test that exercises with unmatched template_id are skipped."""
-        from tests._factories.lift import ExerciseTemplateFactory, ExerciseFactory
-
-        exercise_factory = ExerciseFactory()
-        template_factory = ExerciseTemplateFactory()
-        workout_factory = LiftFactory()
-
-        # Create exercise with a template ID that won't match any template
-        exercise = exercise_factory.make(
-            {
-                "title": "Unknown Exercise",
-                "exercise_template_id": "hevy_unknown_001",
-            }
-        )
-        workout = workout_factory.make({"id": "hevy_100"}, exercises=[exercise])
-        mock_get_lifts.return_value = [workout]
-
-        # Templates list doesn't include the exercise's template_id
-        template = template_factory.make(
-            {
-                "id": "hevy_other_001",
-                "primary_muscle_group": "chest",
-            }
-        )
-        mock_get_templates.return_value = [template]
-
-        response = viewer_client.get("/lifts/sets-by-muscle")
-
-        assert response.status_code == 200
-        # Exercise should be skipped, resulting in empty list
-        assert response.json() == []
-
 
 class TestGetFrequentExercises:
     """Test GET /lifts/frequent-exercises endpoint."""
 
-    @patch("fitness.app.routers.lifts.get_all_lifts")
+    @patch("fitness.app.routers.lifts.get_frequent_exercise_counts")
     def test_get_frequent_exercises(
         self,
-        mock_get_lifts: MagicMock,
+        mock_get_counts: MagicMock,
         viewer_client: TestClient,
     ):
         """Test that frequent exercises returns exercise counts."""
-        from tests._factories.lift import ExerciseFactory
-
-        exercise_factory = ExerciseFactory()
-        workout_factory = LiftFactory()
-
-        # Create workouts with overlapping exercises
-        workout1 = workout_factory.make(
-            {"id": "hevy_100"},
-            exercises=[
-                exercise_factory.make({"title": "Bench Press"}),
-                exercise_factory.make({"title": "Squats"}),
-            ],
-        )
-        workout2 = workout_factory.make(
-            {"id": "hevy_200"},
-            exercises=[
-                exercise_factory.make({"title": "Bench Press"}),
-                exercise_factory.make({"title": "Deadlift"}),
-            ],
-        )
-        mock_get_lifts.return_value = [workout1, workout2]
+        mock_get_counts.return_value = [("Bench Press", 2), ("Deadlift", 1)]
 
         response = viewer_client.get("/lifts/frequent-exercises")
 
         assert response.status_code == 200
-        data = response.json()
-        # Bench Press appears in both, others appear once
-        exercise_counts = {item["name"]: item["count"] for item in data}
-        assert exercise_counts["Bench Press"] == 2
-        assert exercise_counts["Squats"] == 1
-        assert exercise_counts["Deadlift"] == 1
-
-    @patch("fitness.app.routers.lifts.get_all_lifts")
+        assert response.json() == [
+            {"name": "Bench Press", "count": 2},
+            {"name": "Deadlift", "count": 1},
+        ]
+        # Default limit is 5
+        mock_get_counts.assert_called_once_with(None, None, 5)
+
+    @patch("fitness.app.routers.lifts.get_frequent_exercise_counts", return_value=[])
     def test_get_frequent_exercises_respects_limit(
         self,
-        mock_get_lifts: MagicMock,
+        mock_get_counts: MagicMock,
         viewer_client: TestClient,
     ):
-        """Test that limit parameter limits results."""
-        from tests._factories.lift import ExerciseFactory
-
-        exercise_factory = ExerciseFactory()
-        workout_factory = LiftFactory()
-
-        workout = workout_factory.make(
-            {"id": "hevy_100"},
-            exercises=[
-                exercise_factory.make({"title": "Ex1"}),
-                exercise_factory.make({"title": "Ex2"}),
-                exercise_factory.make({"title": "Ex3"}),
-                exercise_factory.make({"title": "Ex4"}),
-                exercise_factory.make({"title": "Ex5"}),
-            ],
-        )
-        mock_get_lifts.return_value = [workout]
-
+        """Test that limit parameter is passed to the query."""
         response = viewer_client.get("/lifts/frequent-exercises?limit=3")
 
         assert response.status_code == 200
-        data = response.json()
-        assert len(data) == 3
+        mock_get_counts.assert_called_once_with(None, None, 3)
 
-    @patch("fitness.app.routers.lifts.get_lifts_in_date_range")
+    @patch("fitness.app.routers.lifts.get_frequent_exercise_counts", return_value=[])
     def test_get_frequent_exercises_with_date_filter(
         self,
-        mock_get_lifts: MagicMock,
+        mock_get_counts: MagicMock,
         viewer_client: TestClient,
     ):
         """Test that frequent exercises respects date filtering."""
-        workout_factory = LiftFactory()
-        workout = workout_factory.make({"id": "hevy_100"})
-        mock_get_lifts.return_value = [workout]
-
         response = viewer_client.get("/lifts/frequent-exercises?start_date=2024-01-01")
 
         assert response.status_code == 200
-        mock_get_lifts.assert_called_once()
-        # Verify correct date arguments were passed
-        from datetime import date
-
-        call_args = mock_get_lifts.call_args
-        assert call_args[0][0] == date(2024, 1, 1)
-        assert call_args[0][1] is None
+        mock_get_counts.assert_called_once_with(date(2024, 1, 1), None, 5)
 
     def test_get_frequent_exercises_requires_auth(self, client: TestClient):
         """Test that frequent exercises endpoint requires authentication."""
         response = client.get("/lifts/frequent-exercises")
         assert response.status_code == 401
 
-    @patch("fitness.app.routers.lifts.get_all_lifts")
+    @patch("fitness.app.routers.lifts.get_frequent_exercise_counts", return_value=[])
     def test_get_frequent_exercises_empty(
         self,
-        mock_get_lifts: MagicMock,
+        mock_get_counts: MagicMock,
         viewer_client: TestClient,
     ):
         """Test that frequent exercises returns empty list when no lifts."""
-        mock_get_lifts.return_value = []
-
         response = viewer_client.get("/lifts/frequent-exercises")
 
         assert response.status_code == 200
@@ -0,0 +1,45 @@
+"""Test the /mmf/upload-csv endpoint."""
+
+from unittest.mock import patch, MagicMock
+from fastapi.testclient import TestClient
+
+from tests.load.test_mmf import FAKE_MMF_DATA
+
+
+def _upload(client: TestClient):
+    return client.post(
+        "/mmf/upload-csv",
+        files={"file": ("mmf.csv", FAKE_MMF_DATA.encode("utf-8"), "text/csv")},
+    )
+
+
+class TestUploadMmfCsv:
+    """Test POST /mmf/upload-csv endpoint."""
+
+    @patch("fitness.app.routers.mmf.bulk_create_runs")
+    def test_existing_runs_counted_from_insert(
+        self,
+        mock_bulk_create_runs: MagicMock,
+        editor_client: TestClient,
+    ):
+        """All uploaded runs go to the insert, which skips existing ones."""
+        mock_bulk_create_runs.return_value = 2
+
+        response = _upload(editor_client)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_runs_found"] == 3
+        assert data["existing_runs"] == 1
+        assert data["inserted_count"] == 2
+        runs = mock_bulk_create_runs.call_args.args[0]
+        assert {run.id for run in runs} == {
+            "mmf_1374173327",
+            "mmf_8550068398",
+            "mmf_8551842508",
+        }
+
+    def test_requires_editor(self, viewer_client: TestClient):
+        """Viewers cannot upload data."""
+        response = _upload(viewer_client)
+        assert response.status_code == 403
@@ -53,14 +53,14 @@ def _synced_ride_record(ride_id: str, status: str = "synced") -> SyncedRide:
 
 class TestSyncRide:
     @patch("fitness.app.routers.ride_sync.create_synced_ride")
-    @patch("fitness.app.routers._sync_helpers.GoogleCalendarClient")
+    @patch("fitness.app.routers._sync_helpers.get_calendar_client")
     @patch("fitness.app.routers.ride_sync.get_synced_ride")
     @patch("fitness.app.routers.ride_sync.get_ride_by_id")
     def test_sync_outdoor_ride_creates_event_with_outdoor_title(
         self,
         mock_get: MagicMock,
         mock_get_synced: MagicMock,
-        mock_client_cls: MagicMock,
+        mock_get_client: MagicMock,
         mock_create_record: MagicMock,
         outdoor_ride: Ride,
         editor_client: TestClient,
@@ -69,7 +69,7 @@ class TestSyncRide:
         mock_get_synced.return_value = None
         client_instance = MagicMock()
         client_instance.create_ride_event.return_value = "evt_abc123"
-        mock_client_cls.return_value = client_instance
+        mock_get_client.return_value = client_instance
         mock_create_record.return_value = _synced_ride_record(outdoor_ride.id)
 
         response = editor_client.post(f"/sync/rides/{outdoor_ride.id}")
@@ -114,19 +114,19 @@ class TestSyncRide:
 
 class TestUnsyncRide:
     @patch("fitness.app.routers.ride_sync.delete_synced_ride")
-    @patch("fitness.app.routers._sync_helpers.GoogleCalendarClient")
+    @patch("fitness.app.routers._sync_helpers.get_calendar_client")
     @patch("fitness.app.routers.ride_sync.get_synced_ride")
     def test_unsync_calls_calendar_delete_and_removes_record(
         self,
         mock_get_synced: MagicMock,
-        mock_client_cls: MagicMock,
+        mock_get_client: MagicMock,
         mock_delete_record: MagicMock,
         editor_client: TestClient,
     ):
         mock_get_synced.return_value = _synced_ride_record("strava_ride_1")
         client_instance = MagicMock()
         client_instance.delete_workout_event.return_value = True
-        mock_client_cls.return_value = client_instance
+        mock_get_client.return_value = client_instance
         mock_delete_record.return_value = True
 
         response = editor_client.delete("/sync/rides/strava_ride_1")
@@ -157,9 +157,7 @@ class TestSyncStatus:
         assert response.json()["is_synced"] is False
 
     @patch("fitness.app.routers.ride_sync.get_synced_ride")
-    def test_status_synced(
-        self, mock_get_synced: MagicMock, viewer_client: TestClient
-    ):
+    def test_status_synced(self, mock_get_synced: MagicMock, viewer_client: TestClient):
         mock_get_synced.return_value = _synced_ride_record("strava_x")
         response = viewer_client.get("/sync/rides/strava_x/status")
         body = response.json()
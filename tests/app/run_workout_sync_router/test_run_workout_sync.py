@@ -1,12 +1,20 @@
 """Tests for run workout Google Calendar sync endpoints."""
 
+import asyncio
+import inspect
+import threading
 from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
+import pytest
 from fastapi.testclient import TestClient
 
+from fitness.app.routers import run_workout_sync
+
+from fitness.models.run import Run
 from fitness.models.run_workout import RunWorkout
 from fitness.models.sync import SyncedRunWorkout, SyncStatus
+from tests._factories.run import RunFactory
 
 _MOD = "fitness.app.routers.run_workout_sync"
 _SYNC_HELPERS = "fitness.app.routers._sync_helpers"
@@ -111,43 +119,44 @@ class TestGetSyncStatus:
 class TestSyncRunWorkout:
     """Test POST /sync/run-workouts/{id}."""
 
-    @patch(f"{_SYNC_HELPERS}.GoogleCalendarClient")
-    @patch(f"{_MOD}.get_run_by_id")
-    @patch(f"{_MOD}.get_run_ids_for_workout")
+    @patch(f"{_SYNC_HELPERS}.get_calendar_client")
+    @patch(f"{_MOD}.get_runs_for_workout")
     @patch(f"{_MOD}.get_run_workout_by_id")
-    @patch(f"{_MOD}.create_synced_run_workout")
+    @patch(f"{_MOD}.bulk_upsert_synced_run_workouts")
     @patch(f"{_MOD}.get_synced_run_workout", return_value=None)
     def test_sync_success(
         self,
         _mock_get_sync: MagicMock,
-        mock_create_sync: MagicMock,
+        mock_upsert: MagicMock,
         mock_get_workout: MagicMock,
-        mock_get_run_ids: MagicMock,
         mock_get_run: MagicMock,
-        mock_calendar_cls: MagicMock,
+        mock_get_calendar: MagicMock,
         editor_client: TestClient,
     ):
         mock_get_workout.return_value = _make_workout()
-        mock_get_run_ids.return_value = ["run_1", "run_2"]
-        mock_get_run.side_effect = [
+        mock_get_run.return_value = [
             _make_run_detail("run_1"),
             _make_run_detail(
                 "run_2", dt=datetime(2024, 6, 1, 8, 30, 0, tzinfo=timezone.utc)
             ),
         ]
         mock_calendar = MagicMock()
-        mock_calendar.create_run_workout_event.return_value = "gcal_456"
-        mock_calendar_cls.return_value = mock_calendar
-        mock_create_sync.return_value = _make_synced_run_workout(
-            google_event_id="gcal_456"
-        )
+        mock_calendar.create_run_workout_events.return_value = {"rw_1": "gcal_456"}
+        mock_get_calendar.return_value = mock_calendar
+        mock_upsert.return_value = [
+            _make_synced_run_workout(google_event_id="gcal_456")
+        ]
 
-        response = editor_client.post("/sync/run-workouts/rw_1")
+        with patch(f"{_MOD}.get_calendar_client", mock_get_calendar):
+            response = editor_client.post("/sync/run-workouts/rw_1")
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
         assert data["google_event_id"] == "gcal_456"
         assert data["sync_status"] == "synced"
+        # All runs are fetched in one query.
+        mock_get_run.assert_called_once_with("rw_1")
+        mock_upsert.assert_called_once_with([("rw_1", "gcal_456", "synced", None)])
 
     @patch(f"{_MOD}.get_synced_run_workout")
     def test_already_synced(
@@ -173,15 +182,13 @@ class TestSyncRunWorkout:
         response = editor_client.post("/sync/run-workouts/rw_999")
         assert response.status_code == 404
 
-    @patch(f"{_MOD}.get_run_by_id", return_value=None)
-    @patch(f"{_MOD}.get_run_ids_for_workout", return_value=["run_1"])
+    @patch(f"{_MOD}.get_runs_for_workout", return_value=[])
     @patch(f"{_MOD}.get_run_workout_by_id")
     @patch(f"{_MOD}.get_synced_run_workout", return_value=None)
     def test_fewer_than_2_runs(
         self,
         _mock_sync: MagicMock,
         mock_workout: MagicMock,
-        _mock_ids: MagicMock,
         _mock_run: MagicMock,
         editor_client: TestClient,
     ):
@@ -190,98 +197,318 @@ class TestSyncRunWorkout:
         assert response.status_code == 400
         assert "fewer than 2" in response.json()["detail"]
 
-    @patch(f"{_MOD}.create_synced_run_workout")
-    @patch(f"{_SYNC_HELPERS}.GoogleCalendarClient")
-    @patch(f"{_MOD}.get_run_by_id")
-    @patch(f"{_MOD}.get_run_ids_for_workout")
+    @patch(f"{_MOD}.bulk_upsert_synced_run_workouts")
+    @patch(f"{_SYNC_HELPERS}.get_calendar_client")
+    @patch(f"{_MOD}.get_runs_for_workout")
     @patch(f"{_MOD}.get_run_workout_by_id")
     @patch(f"{_MOD}.get_synced_run_workout", return_value=None)
     def test_calendar_failure(
         self,
         _mock_sync: MagicMock,
         mock_workout: MagicMock,
-        mock_ids: MagicMock,
         mock_run: MagicMock,
-        mock_calendar_cls: MagicMock,
-        mock_create_sync: MagicMock,
+        mock_get_calendar: MagicMock,
+        mock_upsert: MagicMock,
         editor_client: TestClient,
     ):
         mock_workout.return_value = _make_workout()
-        mock_ids.return_value = ["run_1", "run_2"]
-        mock_run.side_effect = [_make_run_detail("run_1"), _make_run_detail("run_2")]
+        mock_run.return_value = [_make_run_detail("run_1"), _make_run_detail("run_2")]
         mock_calendar = MagicMock()
-        mock_calendar.create_run_workout_event.side_effect = Exception("API down")
-        mock_calendar_cls.return_value = mock_calendar
+        mock_calendar.create_run_workout_events.side_effect = Exception("API down")
+        mock_get_calendar.return_value = mock_calendar
+        mock_upsert.return_value = [_make_synced_run_workout(sync_status="failed")]
 
-        response = editor_client.post("/sync/run-workouts/rw_1")
+        with patch(f"{_MOD}.get_calendar_client", mock_get_calendar):
+            response = editor_client.post("/sync/run-workouts/rw_1")
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is False
         assert data["sync_status"] == "failed"
+        [(record,)] = [c.args for c in mock_upsert.call_args_list]
+        assert [row[:3] for row in record] == [("rw_1", "", "failed")]
 
-    @patch(f"{_MOD}.update_synced_run_workout")
-    @patch(f"{_SYNC_HELPERS}.GoogleCalendarClient")
-    @patch(f"{_MOD}.get_run_by_id")
-    @patch(f"{_MOD}.get_run_ids_for_workout")
+    @patch(f"{_MOD}.bulk_upsert_synced_run_workouts")
+    @patch(f"{_SYNC_HELPERS}.get_calendar_client")
+    @patch(f"{_MOD}.get_runs_for_workout")
     @patch(f"{_MOD}.get_run_workout_by_id")
     @patch(f"{_MOD}.get_synced_run_workout")
     def test_resync_after_failure(
         self,
         mock_get_sync: MagicMock,
         mock_workout: MagicMock,
-        mock_ids: MagicMock,
         mock_run: MagicMock,
-        mock_calendar_cls: MagicMock,
-        mock_update_sync: MagicMock,
+        mock_get_calendar: MagicMock,
+        mock_upsert: MagicMock,
         editor_client: TestClient,
     ):
         # Existing failed sync record
         mock_get_sync.return_value = _make_synced_run_workout(sync_status="failed")
         mock_workout.return_value = _make_workout()
-        mock_ids.return_value = ["run_1", "run_2"]
-        mock_run.side_effect = [_make_run_detail("run_1"), _make_run_detail("run_2")]
+        mock_run.return_value = [_make_run_detail("run_1"), _make_run_detail("run_2")]
         mock_calendar = MagicMock()
-        mock_calendar.create_run_workout_event.return_value = "gcal_789"
-        mock_calendar_cls.return_value = mock_calendar
-        mock_update_sync.return_value = _make_synced_run_workout(
-            google_event_id="gcal_789"
-        )
+        mock_calendar.create_run_workout_events.return_value = {"rw_1": "gcal_789"}
+        mock_get_calendar.return_value = mock_calendar
+        mock_upsert.return_value = [
+            _make_synced_run_workout(google_event_id="gcal_789")
+        ]
 
-        response = editor_client.post("/sync/run-workouts/rw_1")
+        with patch(f"{_MOD}.get_calendar_client", mock_get_calendar):
+            response = editor_client.post("/sync/run-workouts/rw_1")
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
         assert data["google_event_id"] == "gcal_789"
-        mock_update_sync.assert_called_once()
+        # The upsert overwrites the failed record and clears its error.
+        mock_upsert.assert_called_once_with([("rw_1", "gcal_789", "synced", None)])
 
     def test_viewer_cannot_sync(self, viewer_client: TestClient):
         response = viewer_client.post("/sync/run-workouts/rw_1")
         assert response.status_code == 403
 
+    def test_sync_waits_on_google_without_a_worker_thread(self):
+        # A def handler would hold a threadpool worker for the whole Google call.
+        assert inspect.iscoroutinefunction(
+            run_workout_sync.sync_run_workout_to_calendar
+        )
+
+
+class TestBatchSyncRunWorkouts:
+    """Test POST /sync/run-workouts/batch."""
+
+    @patch(f"{_MOD}.bulk_upsert_synced_run_workouts")
+    @patch(f"{_MOD}.get_calendar_client")
+    @patch(f"{_MOD}.get_runs_by_ids")
+    @patch(f"{_MOD}.get_run_ids_for_workouts")
+    @patch(f"{_MOD}.get_synced_run_workouts_by_ids")
+    @patch(f"{_MOD}.get_run_workouts_by_ids")
+    def test_batch_syncs_eligible_workouts(
+        self,
+        mock_get_workouts: MagicMock,
+        mock_get_synced: MagicMock,
+        mock_get_run_ids: MagicMock,
+        mock_get_runs: MagicMock,
+        mock_get_client: MagicMock,
+        mock_bulk_upsert: MagicMock,
+        editor_client: TestClient,
+    ):
+        workouts = {
+            w: _make_workout(w) for w in ("rw_new", "rw_fail", "rw_done", "rw_1run")
+        }
+        mock_get_workouts.return_value = workouts
+        mock_get_synced.return_value = [_make_synced_run_workout("rw_done")]
+        mock_get_run_ids.return_value = {
+            "rw_new": ["r1", "r2"],
+            "rw_fail": ["r3", "r4"],
+            "rw_done": ["r5", "r6"],
+            "rw_1run": ["r7"],
+        }
+        runs = {rid: _make_run_detail(rid) for rid in ("r1", "r2", "r3", "r4", "r7")}
+        mock_get_runs.return_value = list(runs.values())
+        client_instance = mock_get_client.return_value
+        client_instance.create_run_workout_events.return_value = {
+            "rw_new": "evt_1",
+            "rw_fail": None,
+        }
+        mock_bulk_upsert.return_value = [
+            _make_synced_run_workout("rw_new", "evt_1"),
+            _make_synced_run_workout("rw_fail", None, "failed"),
+        ]
+
+        response = editor_client.post(
+            "/sync/run-workouts/batch",
+            json={
+                "run_workout_ids": [
+                    "rw_new",
+                    "rw_fail",
+                    "rw_done",
+                    "rw_1run",
+                    "rw_missing",
+                    "rw_new",
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert {k: v["sync_status"] for k, v in body.items()} == {
+            "rw_new": "synced",
+            "rw_fail": "failed",
+            "rw_done": "synced",
+            "rw_1run": "failed",
+            "rw_missing": "failed",
+        }
+        assert body["rw_new"]["success"] is True
+        assert body["rw_new"]["google_event_id"] == "evt_1"
+        assert body["rw_new"]["synced_at"] is not None
+        assert body["rw_done"]["success"] is False
+        assert "fewer than 2" in body["rw_1run"]["message"]
+        assert "not found" in body["rw_missing"]["message"]
+        mock_get_workouts.assert_called_once_with(
+            ["rw_new", "rw_fail", "rw_done", "rw_1run", "rw_missing"]
+        )
+        client_instance.create_run_workout_events.assert_called_once_with(
+            [
+                (workouts["rw_new"], [runs["r1"], runs["r2"]]),
+                (workouts["rw_fail"], [runs["r3"], runs["r4"]]),
+            ]
+        )
+        [records] = mock_bulk_upsert.call_args.args
+        assert [row[:3] for row in records] == [
+            ("rw_new", "evt_1", "synced"),
+            ("rw_fail", "", "failed"),
+        ]
+
+    def test_batch_waits_on_google_without_a_worker_thread(self):
+        assert inspect.iscoroutinefunction(
+            run_workout_sync.sync_run_workouts_to_calendar
+        )
+
+    def test_viewer_cannot_batch_sync(self, viewer_client: TestClient):
+        response = viewer_client.post(
+            "/sync/run-workouts/batch", json={"run_workout_ids": ["rw_1"]}
+        )
+        assert response.status_code == 403
+
+
+def _make_runs() -> list[Run]:
+    factory = RunFactory()
+    return [
+        factory.make({"id": "run_1"}),
+        factory.make({"id": "run_2", "datetime_utc": datetime(2023, 10, 1, 12, 40, 0)}),
+    ]
+
+
+@pytest.fixture(autouse=True)
+def _reset_event_batching():
+    """Each test gets its own event loop, so no batch state may carry over."""
+    yield
+    run_workout_sync._pending_events.clear()
+    run_workout_sync._pending_flush = None
+    run_workout_sync._batch_tasks.clear()
+
+
+class TestEventBatching:
+    """Concurrent single-workout syncs share one Calendar batch request."""
+
+    @pytest.mark.asyncio
+    async def test_full_batch_task_is_kept_until_done(self):
+        client = MagicMock()
+        client.create_run_workout_events.side_effect = lambda pairs: {
+            workout.id: f"evt_{workout.id}" for workout, _ in pairs
+        }
+        runs = _make_runs()
+        workouts = [
+            _make_workout(f"rw_{i}") for i in range(run_workout_sync.BATCH_MAX_REQUESTS)
+        ]
+
+        pending = [
+            asyncio.ensure_future(
+                run_workout_sync._create_event_batched(client, workout, runs)
+            )
+            for workout in workouts
+        ]
+        await asyncio.sleep(0)
+        assert len(run_workout_sync._batch_tasks) == 1
+
+        results = await asyncio.gather(*pending)
+        assert results == [f"evt_{workout.id}" for workout in workouts]
+        assert not run_workout_sync._batch_tasks
+
+    @pytest.mark.asyncio
+    async def test_cancelled_flush_does_not_block_later_syncs(self):
+        client = MagicMock()
+        client.create_run_workout_events.return_value = {"rw_1": "evt_1"}
+        runs = _make_runs()
+
+        flush = asyncio.ensure_future(run_workout_sync._flush_after_window(client))
+        run_workout_sync._pending_flush = flush
+        await asyncio.sleep(0)
+        flush.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await flush
+
+        assert run_workout_sync._pending_flush is None
+        assert (
+            await run_workout_sync._create_event_batched(
+                client, _make_workout("rw_1"), runs
+            )
+            == "evt_1"
+        )
+
+    @pytest.mark.asyncio
+    async def test_concurrent_events_share_a_batch(self):
+        client = MagicMock()
+        client.create_run_workout_events.return_value = {"rw_1": "evt_1", "rw_2": None}
+        runs = _make_runs()
+
+        results = await asyncio.gather(
+            run_workout_sync._create_event_batched(client, _make_workout("rw_1"), runs),
+            run_workout_sync._create_event_batched(client, _make_workout("rw_2"), runs),
+        )
+
+        assert results == ["evt_1", None]
+        client.create_run_workout_events.assert_called_once()
+        [pairs] = client.create_run_workout_events.call_args.args
+        assert [workout.id for workout, _ in pairs] == ["rw_1", "rw_2"]
+
+    @pytest.mark.asyncio
+    async def test_batch_error_reaches_every_caller(self):
+        client = MagicMock()
+        client.create_run_workout_events.side_effect = RuntimeError("API down")
+        runs = _make_runs()
+
+        results = await asyncio.gather(
+            run_workout_sync._create_event_batched(client, _make_workout("rw_1"), runs),
+            run_workout_sync._create_event_batched(client, _make_workout("rw_2"), runs),
+            return_exceptions=True,
+        )
+
+        assert [type(r) for r in results] == [RuntimeError, RuntimeError]
+
+    @pytest.mark.asyncio
+    async def test_batch_runs_on_the_calendar_executor(self):
+        client = MagicMock()
+        client.create_run_workout_events.side_effect = lambda pairs: {
+            "rw_1": threading.current_thread().name
+        }
+        runs = _make_runs()
+
+        thread_name = await run_workout_sync._create_event_batched(
+            client, _make_workout("rw_1"), runs
+        )
+
+        assert thread_name is not None and thread_name.startswith("gcal")
+
 
 class TestUnsyncRunWorkout:
     """Test DELETE /sync/run-workouts/{id}."""
 
     @patch(f"{_MOD}.delete_synced_run_workout", return_value=True)
-    @patch(f"{_SYNC_HELPERS}.GoogleCalendarClient")
+    @patch(f"{_SYNC_HELPERS}.get_calendar_client")
     @patch(f"{_MOD}.get_synced_run_workout")
     def test_unsync_success(
         self,
         mock_get: MagicMock,
-        mock_calendar_cls: MagicMock,
+        mock_get_calendar: MagicMock,
         mock_delete: MagicMock,
         editor_client: TestClient,
     ):
         mock_get.return_value = _make_synced_run_workout()
         mock_calendar = MagicMock()
-        mock_calendar.delete_workout_event.return_value = True
-        mock_calendar_cls.return_value = mock_calendar
+        delete_threads: list[str] = []
+        mock_calendar.delete_workout_event.side_effect = lambda _id: (
+            delete_threads.append(threading.current_thread().name) or True
+        )
+        mock_get_calendar.return_value = mock_calendar
 
         response = editor_client.delete("/sync/run-workouts/rw_1")
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
         assert data["sync_status"] == "unsynced"
+        # The delete can sleep in retries, so it runs on the calendar executor.
+        [thread_name] = delete_threads
+        assert thread_name.startswith("gcal")
 
     @patch(f"{_MOD}.get_synced_run_workout", return_value=None)
     def test_not_synced(
@@ -8,6 +8,7 @@ from unittest.mock import patch, MagicMock
 import pytest
 from fastapi.testclient import TestClient
 
+from fitness.app.routers.run_workouts import _aggregate_runs
 from fitness.models.ride_detail import RideDetail
 from fitness.models.run_workout import RunWorkout
 from fitness.models.run_detail import RunDetail
@@ -75,19 +76,16 @@ _DB_MOD = "fitness.app.routers.run_workouts"
 class TestCreateRunWorkout:
     """Test POST /run-workouts."""
 
-    @patch(f"{_DB_MOD}.get_run_details_by_ids")
-    @patch(f"{_DB_MOD}.get_run_ids_for_workout")
+    @patch(f"{_DB_MOD}.get_run_details_for_workout")
     @patch(f"{_DB_MOD}.create_run_workout")
     def test_create_success(
         self,
         mock_create: MagicMock,
-        mock_get_ids: MagicMock,
         mock_get_details: MagicMock,
         editor_client: TestClient,
     ):
         workout = _make_workout()
         mock_create.return_value = workout
-        mock_get_ids.return_value = ["run_1", "run_2"]
         mock_get_details.return_value = [
             _make_run_detail("run_1", datetime(2024, 6, 1, 8, 0, 0)),
             _make_run_detail("run_2", datetime(2024, 6, 1, 8, 30, 0)),
@@ -142,28 +140,36 @@ class TestListRunWorkouts:
     """Test GET /run-workouts."""
 
     @patch(f"{_DB_MOD}.get_all_run_details")
-    @patch(f"{_DB_MOD}.get_run_ids_for_workout")
     @patch(f"{_DB_MOD}.get_all_run_workouts")
     def test_list_workouts(
         self,
         mock_list: MagicMock,
-        mock_get_ids: MagicMock,
         mock_get_details: MagicMock,
         viewer_client: TestClient,
     ):
-        mock_list.return_value = [_make_workout()]
-        mock_get_ids.return_value = ["run_1", "run_2"]
+        mock_list.return_value = [
+            _make_workout(),
+            _make_workout(id="rw_test-2", title="Empty"),
+        ]
+        # Runs are matched to workouts by their run_workout_id.
         mock_get_details.return_value = [
-            _make_run_detail("run_1", datetime(2024, 6, 1, 8, 0, 0)),
-            _make_run_detail("run_2", datetime(2024, 6, 1, 8, 30, 0)),
+            _make_run_detail(
+                "run_2", datetime(2024, 6, 1, 8, 30, 0), run_workout_id="rw_test-1"
+            ),
+            _make_run_detail(
+                "run_1", datetime(2024, 6, 1, 8, 0, 0), run_workout_id="rw_test-1"
+            ),
+            _make_run_detail("run_3", datetime(2024, 6, 2, 8, 0, 0)),
         ]
 
         response = viewer_client.get("/run-workouts")
         assert response.status_code == 200
         data = response.json()
-        assert len(data) == 1
+        assert len(data) == 2
         assert data[0]["title"] == "Speed Workout"
         assert data[0]["run_count"] == 2
+        assert data[0]["start_datetime_utc"].startswith("2024-06-01T08:00:00")
+        assert data[1]["run_count"] == 0
 
     @patch(f"{_DB_MOD}.get_all_run_details")
     @patch(f"{_DB_MOD}.get_all_run_workouts")
@@ -183,18 +189,15 @@ class TestListRunWorkouts:
 class TestGetRunWorkout:
     """Test GET /run-workouts/{id}."""
 
-    @patch(f"{_DB_MOD}.get_run_details_by_ids")
-    @patch(f"{_DB_MOD}.get_run_ids_for_workout")
+    @patch(f"{_DB_MOD}.get_run_details_for_workout")
     @patch(f"{_DB_MOD}.get_run_workout_by_id")
     def test_get_workout(
         self,
         mock_get: MagicMock,
-        mock_get_ids: MagicMock,
         mock_get_details: MagicMock,
         viewer_client: TestClient,
     ):
         mock_get.return_value = _make_workout()
-        mock_get_ids.return_value = ["run_1", "run_2"]
         mock_get_details.return_value = [
             _make_run_detail("run_1", datetime(2024, 6, 1, 8, 0, 0)),
             _make_run_detail("run_2", datetime(2024, 6, 1, 8, 30, 0)),
@@ -222,19 +225,16 @@ class TestUpdateRunWorkout:
     """Test PATCH /run-workouts/{id}."""
 
     @patch(f"{_DB_MOD}.is_run_workout_synced", return_value=False)
-    @patch(f"{_DB_MOD}.get_run_details_by_ids")
-    @patch(f"{_DB_MOD}.get_run_ids_for_workout")
+    @patch(f"{_DB_MOD}.get_run_details_for_workout")
     @patch(f"{_DB_MOD}.update_run_workout")
     def test_update_title(
         self,
         mock_update: MagicMock,
-        mock_get_ids: MagicMock,
         mock_get_details: MagicMock,
         _mock_synced: MagicMock,
         editor_client: TestClient,
     ):
         mock_update.return_value = _make_workout(title="Updated Title")
-        mock_get_ids.return_value = ["run_1", "run_2"]
         mock_get_details.return_value = [
             _make_run_detail("run_1"),
             _make_run_detail("run_2"),
@@ -311,22 +311,16 @@ class TestReplaceWorkoutRuns:
     """Test PUT /run-workouts/{id}/runs."""
 
     @patch(f"{_DB_MOD}.is_run_workout_synced", return_value=False)
-    @patch(f"{_DB_MOD}.get_run_details_by_ids")
-    @patch(f"{_DB_MOD}.get_run_ids_for_workout")
-    @patch(f"{_DB_MOD}.get_run_workout_by_id")
+    @patch(f"{_DB_MOD}.get_run_details_for_workout")
     @patch(f"{_DB_MOD}.set_run_workout_runs")
     def test_replace_runs(
         self,
         mock_set: MagicMock,
-        mock_get: MagicMock,
-        mock_get_ids: MagicMock,
         mock_get_details: MagicMock,
         _mock_synced: MagicMock,
         editor_client: TestClient,
     ):
-        mock_set.return_value = None
-        mock_get.return_value = _make_workout()
-        mock_get_ids.return_value = ["run_3", "run_4"]
+        mock_set.return_value = _make_workout()
         mock_get_details.return_value = [
             _make_run_detail("run_3"),
             _make_run_detail("run_4"),
@@ -546,6 +540,32 @@ class TestActivityFeed:
         # Elapsed: from 8:00:00 to 8:15:00 + 900s = 8:30:00 = 1800s
         assert workout["elapsed_seconds"] == 1800.0
 
+    @patch(f"{_DB_MOD}.get_synced_run_workouts_by_ids", return_value=[])
+    @patch(f"{_DB_MOD}.get_run_workouts_by_ids")
+    @patch("fitness.db.runs.get_all_run_details")
+    def test_workout_runs_in_start_order(
+        self,
+        mock_get_details: MagicMock,
+        mock_get_workouts: MagicMock,
+        _mock_syncs: MagicMock,
+        viewer_client: TestClient,
+    ):
+        """Runs arrive newest first, as the readers return them."""
+        mock_get_details.return_value = [
+            _make_run_detail(
+                "run_2", datetime(2024, 6, 1, 8, 15, 0), run_workout_id="rw_1"
+            ),
+            _make_run_detail(
+                "run_1", datetime(2024, 6, 1, 8, 0, 0), run_workout_id="rw_1"
+            ),
+        ]
+        mock_get_workouts.return_value = {"rw_1": _make_workout(id="rw_1")}
+
+        response = viewer_client.get("/cardio-activity-feed")
+        workout = response.json()[0]["item"]
+        assert [r["id"] for r in workout["runs"]] == ["run_1", "run_2"]
+        assert workout["start_datetime_utc"].startswith("2024-06-01T08:00:00")
+
     @patch("fitness.db.runs.get_run_details_in_date_range")
     def test_filters_by_local_date_across_utc_midnight_boundary(
         self,
@@ -885,3 +905,16 @@ class TestActivityFeedTagEnrichment:
         runs_by_id = {r["id"]: r for r in workout_item["item"]["runs"]}
         assert [t["name"] for t in runs_by_id["run_2"]["tags"]] == ["Tempo"]
         assert runs_by_id["run_3"]["tags"] == []
+
+
+def test_elapsed_runs_to_the_latest_end():
+    """A long first run that outlasts a later one still bounds the elapsed time."""
+    runs = [
+        _make_run_detail("run_1", datetime(2024, 6, 1, 8, 0, 0), duration=3600.0),
+        _make_run_detail(
+            "run_2", datetime(2024, 6, 1, 8, 10, 0), duration=600.0, avg_heart_rate=None
+        ),
+    ]
+
+    assert _aggregate_runs(runs) == (6.0, 4200.0, 3600.0, 150.0)
+    assert _aggregate_runs([]) == (0.0, 0.0, 0.0, None)
@@ -1,5 +1,6 @@
 """Test the /strava/sync endpoint."""
 
+import asyncio
 from datetime import datetime, timezone
 from unittest.mock import patch, MagicMock
 from fastapi.testclient import TestClient
@@ -16,42 +17,33 @@ class TestSyncStravaData:
     @patch("fitness.app.routers.strava.update_last_sync_time")
     @patch("fitness.app.routers.strava.get_last_sync_time")
     @patch("fitness.app.routers.strava.bulk_create_rides")
-    @patch("fitness.app.routers.strava.get_existing_ride_ids")
-    @patch("fitness.app.routers.strava.load_strava_rides")
     @patch("fitness.app.routers.strava.bulk_create_runs")
-    @patch("fitness.app.routers.strava.get_existing_run_ids")
-    @patch("fitness.app.routers.strava.load_strava_runs")
-    def test_sync_identifies_new_runs(
+    @patch("fitness.app.routers.strava.load_strava_activities")
+    def test_sync_inserts_fetched_runs(
         self,
-        mock_load_strava_runs: MagicMock,
-        mock_get_existing_run_ids: MagicMock,
+        mock_load_strava_activities: MagicMock,
         mock_bulk_create_runs: MagicMock,
-        mock_load_strava_rides: MagicMock,
-        mock_get_existing_ride_ids: MagicMock,
         mock_bulk_create_rides: MagicMock,
         mock_get_last_sync_time: MagicMock,
         mock_update_last_sync_time: MagicMock,
         auth_client: TestClient,
     ):
-        """Test that sync correctly identifies and inserts only new runs."""
+        """All fetched runs go to one insert; the database skips existing IDs."""
         # Create 3 Strava activities
         factory = StravaActivityWithGearFactory()
         strava_run_1 = factory.make({"id": 100, "name": "Morning Run"})
         strava_run_2 = factory.make({"id": 200, "name": "Evening Run"})
         strava_run_3 = factory.make({"id": 300, "name": "Weekend Run"})
 
-        # Mock load_strava_runs to return these 3 activities
-        mock_load_strava_runs.return_value = [strava_run_1, strava_run_2, strava_run_3]
+        # Mock load_strava_activities to return these 3 runs and no rides
+        mock_load_strava_activities.return_value = (
+            [strava_run_1, strava_run_2, strava_run_3],
+            [],
+        )
 
-        # Mock get_existing_run_ids to return one existing run (strava_200)
-        mock_get_existing_run_ids.return_value = {"strava_200"}
-
-        # Mock bulk_create_runs to return the count of inserted runs
+        # One of them (strava_200) already exists, so only 2 are inserted
         mock_bulk_create_runs.return_value = 2
-
-        # No rides in this test
-        mock_load_strava_rides.return_value = []
-        mock_get_existing_ride_ids.return_value = set()
+        mock_bulk_create_rides.return_value = 0
 
         # Mock sync metadata - no previous sync
         mock_get_last_sync_time.return_value = None
@@ -64,26 +56,18 @@ class TestSyncStravaData:
         assert "2 new runs" in data["message"]
         assert "updated_at" in data
 
-        # Verify load_strava_runs was called with the strava_client and after=None
-        mock_load_strava_runs.assert_called_once()
-
-        # Verify get_existing_run_ids was called
-        mock_get_existing_run_ids.assert_called_once()
+        # Verify load_strava_activities was called with the strava_client and after=None
+        mock_load_strava_activities.assert_called_once()
 
-        # Verify bulk_create_runs was called with the 2 new runs (strava_100 and strava_300)
+        # Verify bulk_create_runs was called once with every fetched run,
+        # with no separate existence check
         mock_bulk_create_runs.assert_called_once()
-        new_runs = mock_bulk_create_runs.call_args[0][0]
-        assert len(new_runs) == 2
+        runs = mock_bulk_create_runs.call_args[0][0]
 
         # Verify the runs are Run objects (converted from StravaActivityWithGear)
-        for run in new_runs:
+        for run in runs:
             assert isinstance(run, Run)
-
-        # Verify the correct runs were identified as new
-        new_run_ids = {run.id for run in new_runs}
-        assert "strava_100" in new_run_ids
-        assert "strava_300" in new_run_ids
-        assert "strava_200" not in new_run_ids  # This one already exists
+        assert [run.id for run in runs] == ["strava_100", "strava_200", "strava_300"]
 
         # Verify sync time was updated
         mock_update_last_sync_time.assert_called_once()
@@ -91,18 +75,12 @@ class TestSyncStravaData:
     @patch("fitness.app.routers.strava.update_last_sync_time")
     @patch("fitness.app.routers.strava.get_last_sync_time")
     @patch("fitness.app.routers.strava.bulk_create_rides")
-    @patch("fitness.app.routers.strava.get_existing_ride_ids")
-    @patch("fitness.app.routers.strava.load_strava_rides")
     @patch("fitness.app.routers.strava.bulk_create_runs")
-    @patch("fitness.app.routers.strava.get_existing_run_ids")
-    @patch("fitness.app.routers.strava.load_strava_runs")
+    @patch("fitness.app.routers.strava.load_strava_activities")
     def test_sync_no_new_runs(
         self,
-        mock_load_strava_runs: MagicMock,
-        mock_get_existing_run_ids: MagicMock,
+        mock_load_strava_activities: MagicMock,
         mock_bulk_create_runs: MagicMock,
-        mock_load_strava_rides: MagicMock,
-        mock_get_existing_ride_ids: MagicMock,
         mock_bulk_create_rides: MagicMock,
         mock_get_last_sync_time: MagicMock,
         mock_update_last_sync_time: MagicMock,
@@ -113,15 +91,12 @@ class TestSyncStravaData:
         strava_run_1 = factory.make({"id": 100, "name": "Morning Run"})
         strava_run_2 = factory.make({"id": 200, "name": "Evening Run"})
 
-        # Mock load_strava_runs to return 2 activities
-        mock_load_strava_runs.return_value = [strava_run_1, strava_run_2]
-
-        # Mock get_existing_run_ids to return both runs as existing
-        mock_get_existing_run_ids.return_value = {"strava_100", "strava_200"}
+        # Mock load_strava_activities to return 2 runs and no rides
+        mock_load_strava_activities.return_value = ([strava_run_1, strava_run_2], [])
 
-        # No rides in this test
-        mock_load_strava_rides.return_value = []
-        mock_get_existing_ride_ids.return_value = set()
+        # Both already exist, so the insert skips them
+        mock_bulk_create_runs.return_value = 0
+        mock_bulk_create_rides.return_value = 0
 
         # Mock sync metadata - no previous sync
         mock_get_last_sync_time.return_value = None
@@ -133,14 +108,11 @@ class TestSyncStravaData:
         assert data["inserted_count"] == 0
         assert "0 new runs" in data["message"]
 
-        # Verify load_strava_runs was called
-        mock_load_strava_runs.assert_called_once()
-
-        # Verify get_existing_run_ids was called
-        mock_get_existing_run_ids.assert_called_once()
+        # Verify load_strava_activities was called
+        mock_load_strava_activities.assert_called_once()
 
-        # Verify bulk_create_runs was NOT called since there are no new runs
-        mock_bulk_create_runs.assert_not_called()
+        # The database, not the caller, decides that nothing is new
+        mock_bulk_create_runs.assert_called_once()
 
         # Verify sync time was still updated
         mock_update_last_sync_time.assert_called_once()
@@ -148,30 +120,21 @@ class TestSyncStravaData:
     @patch("fitness.app.routers.strava.update_last_sync_time")
     @patch("fitness.app.routers.strava.get_last_sync_time")
     @patch("fitness.app.routers.strava.bulk_create_rides")
-    @patch("fitness.app.routers.strava.get_existing_ride_ids")
-    @patch("fitness.app.routers.strava.load_strava_rides")
     @patch("fitness.app.routers.strava.bulk_create_runs")
-    @patch("fitness.app.routers.strava.get_existing_run_ids")
-    @patch("fitness.app.routers.strava.load_strava_runs")
+    @patch("fitness.app.routers.strava.load_strava_activities")
     def test_incremental_sync_uses_last_sync_time(
         self,
-        mock_load_strava_runs: MagicMock,
-        mock_get_existing_run_ids: MagicMock,
+        mock_load_strava_activities: MagicMock,
         mock_bulk_create_runs: MagicMock,
-        mock_load_strava_rides: MagicMock,
-        mock_get_existing_ride_ids: MagicMock,
         mock_bulk_create_rides: MagicMock,
         mock_get_last_sync_time: MagicMock,
         mock_update_last_sync_time: MagicMock,
         auth_client: TestClient,
     ):
-        """Test that incremental sync passes the last sync time to load_strava_runs."""
+        """Test that incremental sync passes the last sync time to the Strava loader."""
         last_sync = datetime(2024, 1, 15, 10, 0, 0, tzinfo=timezone.utc)
         mock_get_last_sync_time.return_value = last_sync
-        mock_load_strava_runs.return_value = []
-        mock_get_existing_run_ids.return_value = set()
-        mock_load_strava_rides.return_value = []
-        mock_get_existing_ride_ids.return_value = set()
+        mock_load_strava_activities.return_value = ([], [])
 
         response = auth_client.post("/strava/sync")
 
@@ -179,26 +142,20 @@ class TestSyncStravaData:
         data = response.json()
         assert "incremental" in data["message"]
 
-        # Verify load_strava_runs was called with after parameter
-        mock_load_strava_runs.assert_called_once()
-        call_kwargs = mock_load_strava_runs.call_args[1]
+        # Verify load_strava_activities was called with after parameter
+        mock_load_strava_activities.assert_called_once()
+        call_kwargs = mock_load_strava_activities.call_args[1]
         assert call_kwargs["after"] == last_sync
 
     @patch("fitness.app.routers.strava.update_last_sync_time")
     @patch("fitness.app.routers.strava.get_last_sync_time")
     @patch("fitness.app.routers.strava.bulk_create_rides")
-    @patch("fitness.app.routers.strava.get_existing_ride_ids")
-    @patch("fitness.app.routers.strava.load_strava_rides")
     @patch("fitness.app.routers.strava.bulk_create_runs")
-    @patch("fitness.app.routers.strava.get_existing_run_ids")
-    @patch("fitness.app.routers.strava.load_strava_runs")
+    @patch("fitness.app.routers.strava.load_strava_activities")
     def test_full_sync_ignores_last_sync_time(
         self,
-        mock_load_strava_runs: MagicMock,
-        mock_get_existing_run_ids: MagicMock,
+        mock_load_strava_activities: MagicMock,
         mock_bulk_create_runs: MagicMock,
-        mock_load_strava_rides: MagicMock,
-        mock_get_existing_ride_ids: MagicMock,
         mock_bulk_create_rides: MagicMock,
         mock_get_last_sync_time: MagicMock,
         mock_update_last_sync_time: MagicMock,
@@ -207,10 +164,7 @@ class TestSyncStravaData:
         """Test that full_sync=true ignores the last sync time."""
         last_sync = datetime(2024, 1, 15, 10, 0, 0, tzinfo=timezone.utc)
         mock_get_last_sync_time.return_value = last_sync
-        mock_load_strava_runs.return_value = []
-        mock_get_existing_run_ids.return_value = set()
-        mock_load_strava_rides.return_value = []
-        mock_get_existing_ride_ids.return_value = set()
+        mock_load_strava_activities.return_value = ([], [])
 
         response = auth_client.post("/strava/sync?full_sync=true")
 
@@ -218,9 +172,9 @@ class TestSyncStravaData:
         data = response.json()
         assert "full" in data["message"]
 
-        # Verify load_strava_runs was called with after=None (full sync)
-        mock_load_strava_runs.assert_called_once()
-        call_kwargs = mock_load_strava_runs.call_args[1]
+        # Verify load_strava_activities was called with after=None (full sync)
+        mock_load_strava_activities.assert_called_once()
+        call_kwargs = mock_load_strava_activities.call_args[1]
         assert call_kwargs["after"] is None
 
         # get_last_sync_time should NOT be called when full_sync=true
@@ -229,18 +183,12 @@ class TestSyncStravaData:
     @patch("fitness.app.routers.strava.update_last_sync_time")
     @patch("fitness.app.routers.strava.get_last_sync_time")
     @patch("fitness.app.routers.strava.bulk_create_rides")
-    @patch("fitness.app.routers.strava.get_existing_ride_ids")
-    @patch("fitness.app.routers.strava.load_strava_rides")
     @patch("fitness.app.routers.strava.bulk_create_runs")
-    @patch("fitness.app.routers.strava.get_existing_run_ids")
-    @patch("fitness.app.routers.strava.load_strava_runs")
+    @patch("fitness.app.routers.strava.load_strava_activities")
     def test_sync_inserts_runs_and_rides_together(
         self,
-        mock_load_strava_runs: MagicMock,
-        mock_get_existing_run_ids: MagicMock,
+        mock_load_strava_activities: MagicMock,
         mock_bulk_create_runs: MagicMock,
-        mock_load_strava_rides: MagicMock,
-        mock_get_existing_ride_ids: MagicMock,
         mock_bulk_create_rides: MagicMock,
         mock_get_last_sync_time: MagicMock,
         mock_update_last_sync_time: MagicMock,
@@ -250,15 +198,14 @@ class TestSyncStravaData:
         run_factory = StravaActivityWithGearFactory()
         ride_factory = StravaRideActivityFactory()
 
-        mock_load_strava_runs.return_value = [run_factory.make({"id": 100})]
-        mock_get_existing_run_ids.return_value = set()
+        mock_load_strava_activities.return_value = (
+            [run_factory.make({"id": 100})],
+            [
+                ride_factory.make({"id": 500}),
+                ride_factory.make({"id": 600, "type": "VirtualRide", "trainer": True}),
+            ],
+        )
         mock_bulk_create_runs.return_value = 1
-
-        mock_load_strava_rides.return_value = [
-            ride_factory.make({"id": 500}),
-            ride_factory.make({"id": 600, "type": "VirtualRide", "trainer": True}),
-        ]
-        mock_get_existing_ride_ids.return_value = set()
         mock_bulk_create_rides.return_value = 2
 
         mock_get_last_sync_time.return_value = None
@@ -281,37 +228,55 @@ class TestSyncStravaData:
     @patch("fitness.app.routers.strava.update_last_sync_time")
     @patch("fitness.app.routers.strava.get_last_sync_time")
     @patch("fitness.app.routers.strava.bulk_create_rides")
-    @patch("fitness.app.routers.strava.get_existing_ride_ids")
-    @patch("fitness.app.routers.strava.load_strava_rides")
     @patch("fitness.app.routers.strava.bulk_create_runs")
-    @patch("fitness.app.routers.strava.get_existing_run_ids")
-    @patch("fitness.app.routers.strava.load_strava_runs")
-    def test_sync_dedupes_existing_rides(
+    @patch("fitness.app.routers.strava.load_strava_activities")
+    def test_sync_counts_only_inserted_rides(
         self,
-        mock_load_strava_runs: MagicMock,
-        mock_get_existing_run_ids: MagicMock,
+        mock_load_strava_activities: MagicMock,
         mock_bulk_create_runs: MagicMock,
-        mock_load_strava_rides: MagicMock,
-        mock_get_existing_ride_ids: MagicMock,
         mock_bulk_create_rides: MagicMock,
         mock_get_last_sync_time: MagicMock,
         mock_update_last_sync_time: MagicMock,
         auth_client: TestClient,
     ):
-        """Existing ride IDs should be filtered out before bulk insert."""
+        """Existing rides are skipped by the insert and not counted."""
         ride_factory = StravaRideActivityFactory()
-        mock_load_strava_runs.return_value = []
-        mock_get_existing_run_ids.return_value = set()
-        mock_load_strava_rides.return_value = [
-            ride_factory.make({"id": 700}),
-            ride_factory.make({"id": 800}),
-        ]
-        mock_get_existing_ride_ids.return_value = {"strava_700"}
+        mock_load_strava_activities.return_value = (
+            [],
+            [ride_factory.make({"id": 700}), ride_factory.make({"id": 800})],
+        )
         mock_bulk_create_rides.return_value = 1
         mock_get_last_sync_time.return_value = None
 
         response = auth_client.post("/strava/sync")
 
         assert response.status_code == 200
-        new_rides = mock_bulk_create_rides.call_args[0][0]
-        assert {r.id for r in new_rides} == {"strava_800"}
+        assert response.json()["inserted_rides"] == 1
+        rides = mock_bulk_create_rides.call_args[0][0]
+        assert {r.id for r in rides} == {"strava_700", "strava_800"}
+
+    @patch("fitness.app.routers.strava.update_last_sync_time")
+    @patch("fitness.app.routers.strava.get_last_sync_time", return_value=None)
+    @patch("fitness.app.routers.strava.load_strava_activities")
+    def test_sync_fetches_off_the_event_loop(
+        self,
+        mock_load_strava_activities: MagicMock,
+        mock_get_last_sync_time: MagicMock,
+        mock_update_last_sync_time: MagicMock,
+        auth_client: TestClient,
+    ):
+        """The blocking Strava fetches should run in worker threads."""
+
+        def on_event_loop(*args, **kwargs) -> tuple[list, list]:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return [], []
+            raise AssertionError("Strava fetch ran on the event loop")
+
+        mock_load_strava_activities.side_effect = on_event_loop
+
+        response = auth_client.post("/strava/sync")
+
+        assert response.status_code == 200
+        assert response.json()["inserted_count"] == 0
@@ -20,15 +20,9 @@ class TestAuthenticationEndpoints:
         """POST /strava/sync should succeed with valid OAuth token (editor)."""
         with monkeypatch.context() as m:
             m.setattr(
-                "fitness.app.routers.strava.load_strava_runs",
-                lambda client, after=None: [],
+                "fitness.app.routers.strava.load_strava_activities",
+                lambda client, after=None: ([], []),
             )
-            m.setattr("fitness.app.routers.strava.get_existing_run_ids", lambda: [])
-            m.setattr(
-                "fitness.app.routers.strava.load_strava_rides",
-                lambda client, after=None: [],
-            )
-            m.setattr("fitness.app.routers.strava.get_existing_ride_ids", lambda: [])
             m.setattr(
                 "fitness.app.routers.strava.get_last_sync_time", lambda provider: None
             )
@@ -64,6 +58,7 @@ class TestAuthenticationEndpoints:
         response = client.get("/health")
         assert response.status_code == 200
         assert response.json() == {"status": "healthy"}
+        assert response.headers["access-control-allow-origin"] == "*"
 
     def test_metrics_requires_viewer_auth(self, client: TestClient):
         """GET /metrics/* endpoints should require viewer authentication."""
@@ -199,3 +194,13 @@ class TestDualAuthentication:
         monkeypatch.setenv("TRMNL_API_KEY", TEST_API_KEY)
         response = client.get("/summary/trmnl", headers={"X-API-Key": "wrong_key"})
         assert response.status_code == 401
+
+    def test_trmnl_endpoint_with_non_ascii_api_key(
+        self, client: TestClient, monkeypatch
+    ):
+        """A non-ASCII API key is rejected with 401, not a server error."""
+        monkeypatch.setenv("TRMNL_API_KEY", TEST_API_KEY)
+        response = client.get(
+            "/summary/trmnl", headers={"X-API-Key": "wrong_k\xe9y".encode("latin-1")}
+        )
+        assert response.status_code == 401
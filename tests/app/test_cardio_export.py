@@ -5,6 +5,8 @@ import io
 import json
 from datetime import date, datetime
 
+from fastapi.encoders import jsonable_encoder
+
 from fitness.app.constants import DEFAULT_START, DEFAULT_END
 from fitness.app.cardio_export import (
     CSV_COLUMNS,
@@ -230,6 +232,14 @@ class TestBuildJson:
         assert {item["type"] for item in data} == {"run", "ride"}
         assert data[0]["item"]["id"] == "run_1"
 
+    def test_matches_live_endpoint_encoding(self):
+        runs = [_run("r2", run_workout_id="rw_1"), _run("r3", run_workout_id="rw_1")]
+        feed = [
+            ActivityFeedRunItem(item=_run("run_1")),
+            ActivityFeedWorkoutItem(item=_workout(runs)),
+        ]
+        assert json.loads(build_cardio_json(feed)) == jsonable_encoder(feed)
+
     def test_workout_runs_nested(self):
         runs = [_run("r2", run_workout_id="rw_1"), _run("r3", run_workout_id="rw_1")]
         data = json.loads(
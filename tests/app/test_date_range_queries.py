@@ -1,7 +1,7 @@
 """Test that endpoints call DB functions with correctly widened date ranges."""
 
 import sys
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 from unittest.mock import MagicMock
 
 from fastapi.testclient import TestClient
@@ -52,6 +52,39 @@ def test_runs_endpoint_no_buffer_without_timezone(
     mock.assert_called_once_with(date(2025, 6, 1), date(2025, 6, 30))
 
 
+def test_runs_endpoint_trims_to_local_range_for_timezone(
+    monkeypatch, viewer_client: TestClient, run_factory
+):
+    """Runs outside the local range are dropped; kept runs keep all their fields."""
+    runs = [
+        # 2025-05-31 evening in Chicago.
+        run_factory.make({"id": "before", "datetime_utc": datetime(2025, 6, 1, 3)}),
+        run_factory.make(
+            {"id": "kept", "datetime_utc": datetime(2025, 6, 1, 12), "notes": "hi"}
+        ),
+        # 2025-06-30 evening in Chicago.
+        run_factory.make({"id": "last", "datetime_utc": datetime(2025, 7, 1, 3)}),
+    ]
+    monkeypatch.setattr(
+        sys.modules["fitness.app.app"],
+        "get_runs_for_date_range",
+        MagicMock(return_value=runs),
+    )
+
+    res = viewer_client.get(
+        "/runs",
+        params={
+            "start": "2025-06-01",
+            "end": "2025-06-30",
+            "user_timezone": "America/Chicago",
+            "sort_order": "asc",
+        },
+    )
+
+    assert [r["id"] for r in res.json()] == ["kept", "last"]
+    assert res.json()[0]["notes"] == "hi"
+
+
 # -- Endpoint wiring tests for /metrics --
 
 
@@ -130,6 +163,19 @@ def test_rolling_mileage_includes_lookback_window(
     mock.assert_called_once_with(expected_start, date(2025, 6, 30), "America/Chicago")
 
 
+def test_rolling_mileage_rejects_non_positive_window(
+    monkeypatch, viewer_client: TestClient
+):
+    """A window under one day is a validation error, not a 500."""
+    mock = MagicMock(return_value=[])
+    monkeypatch.setattr("fitness.app.routers.metrics.get_runs_for_date_range", mock)
+
+    res = viewer_client.get("/metrics/mileage/rolling-by-day", params={"window": "0"})
+
+    assert res.status_code == 422
+    mock.assert_not_called()
+
+
 def test_training_load_fetches_bounded_warmup_window(
     monkeypatch, viewer_client: TestClient
 ):
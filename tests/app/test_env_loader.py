@@ -0,0 +1,49 @@
+import logging
+
+import pytest
+
+from fitness.app.env_loader import get_current_environment, get_log_level
+
+
+@pytest.fixture
+def fresh_environment():
+    get_current_environment.cache_clear()
+    yield
+    get_current_environment.cache_clear()
+
+
+def test_log_level_unset(monkeypatch):
+    monkeypatch.delenv("LOG_LEVEL", raising=False)
+    assert get_log_level() is None
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("debug", logging.DEBUG), ("INFO", logging.INFO), ("Warning", logging.WARNING)],
+)
+def test_log_level_is_case_insensitive(monkeypatch, value, expected):
+    monkeypatch.setenv("LOG_LEVEL", value)
+    assert get_log_level() == expected
+
+
+def test_invalid_log_level_raises(monkeypatch):
+    monkeypatch.setenv("LOG_LEVEL", "loud")
+    with pytest.raises(ValueError, match="Invalid log level: loud"):
+        get_log_level()
+
+
+@pytest.mark.parametrize("value", ["dev", "staging", "prod"])
+def test_current_environment(monkeypatch, fresh_environment, value):
+    monkeypatch.setenv("ENV", value)
+    assert get_current_environment() == value
+
+
+def test_current_environment_defaults_to_dev(monkeypatch, fresh_environment):
+    monkeypatch.delenv("ENV", raising=False)
+    assert get_current_environment() == "dev"
+
+
+def test_invalid_environment_raises(monkeypatch, fresh_environment):
+    monkeypatch.setenv("ENV", "qa")
+    with pytest.raises(ValueError, match="Invalid ENV value: qa"):
+        get_current_environment()
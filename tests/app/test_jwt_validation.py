@@ -19,6 +19,7 @@ from fitness.app.oauth import (
     get_jwt_audience,
     get_jwt_issuer,
     JWKS_CACHE_DURATION,
+    VERIFIED_TOKEN_CACHE_DURATION,
 )
 
 
@@ -31,6 +32,16 @@ def generate_ec_key_pair():
 
 
 # Test fixtures
+@pytest.fixture(autouse=True)
+def clear_verified_tokens():
+    """Don't let a token verified in one test skip verification in another."""
+    import fitness.app.oauth as oauth_module
+
+    oauth_module._verified_tokens.clear()
+    yield
+    oauth_module._verified_tokens.clear()
+
+
 @pytest.fixture
 def ec_key_pair():
     """Generate a fresh EC key pair for each test."""
@@ -269,6 +280,67 @@ class TestValidateJwtToken:
         assert claims["sub"] == "user-123"
 
 
+class TestVerifiedTokenCache:
+    """Test that verified tokens skip re-verification until they expire."""
+
+    @pytest.fixture(autouse=True)
+    def _config(self):
+        with patch(
+            "fitness.app.oauth.get_jwt_issuer", return_value="http://localhost:8080"
+        ):
+            with patch(
+                "fitness.app.oauth.get_jwt_audience", return_value="test-audience"
+            ):
+                yield
+
+    def test_repeat_validation_uses_cache(self, ec_key_pair, mock_jwks_client):
+        private_key, _ = ec_key_pair
+        token = create_test_token(private_key, audience="test-audience")
+
+        with patch("fitness.app.oauth.get_jwks_client", return_value=mock_jwks_client):
+            first = validate_jwt_token(token)
+            second = validate_jwt_token(token)
+
+        assert first == second
+        assert first is not None
+        assert mock_jwks_client.get_signing_key_from_jwt.call_count == 1
+
+    def test_cache_entry_expires(self, ec_key_pair, mock_jwks_client):
+        private_key, _ = ec_key_pair
+        token = create_test_token(private_key, audience="test-audience")
+
+        with patch("fitness.app.oauth.get_jwks_client", return_value=mock_jwks_client):
+            validate_jwt_token(token)
+            with patch(
+                "fitness.app.oauth.time.time",
+                return_value=time.time() + VERIFIED_TOKEN_CACHE_DURATION + 1,
+            ):
+                assert validate_jwt_token(token) is not None
+
+        assert mock_jwks_client.get_signing_key_from_jwt.call_count == 2
+
+    def test_cache_entry_never_outlives_token(self, ec_key_pair, mock_jwks_client):
+        private_key, _ = ec_key_pair
+        token = create_test_token(private_key, audience="test-audience", expires_in=5)
+
+        with patch("fitness.app.oauth.get_jwks_client", return_value=mock_jwks_client):
+            validate_jwt_token(token)
+            with patch("fitness.app.oauth.time.time", return_value=time.time() + 10):
+                validate_jwt_token(token)
+
+        # Past `exp` the token is verified again (and rejected) rather than
+        # served from the cache.
+        assert mock_jwks_client.get_signing_key_from_jwt.call_count == 2
+
+    def test_invalid_tokens_are_not_cached(self, mock_jwks_client):
+        import fitness.app.oauth as oauth_module
+
+        with patch("fitness.app.oauth.get_jwks_client", return_value=mock_jwks_client):
+            assert validate_jwt_token("not.a.jwt") is None
+
+        assert oauth_module._verified_tokens == {}
+
+
 class TestGetJwksClient:
     """Test the JWKS client caching behavior."""
 
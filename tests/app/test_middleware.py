@@ -1,7 +1,10 @@
 """Tests for app-level middleware wiring."""
 
+from unittest.mock import patch
+
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
+from psycopg_pool import PoolTimeout
 
 from fitness.app.app import app
 
@@ -15,3 +18,27 @@ def test_gzip_and_cors_middleware_registered():
     # In Starlette, add_middleware inserts at index 0, so a lower index == added
     # later == outer layer. CORS was added after GZip, so it must be outermost.
     assert classes.index(CORSMiddleware) < classes.index(GZipMiddleware)
+
+
+def test_cors_allows_dashboard_origin_only(client):
+    allowed = client.get("/runs", headers={"Origin": "http://localhost:5173"})
+    assert allowed.headers["access-control-allow-origin"] == "http://localhost:5173"
+
+    preflight = client.options(
+        "/runs",
+        headers={
+            "Origin": "https://evil.example.com",
+            "Access-Control-Request-Method": "GET",
+        },
+    )
+    assert preflight.status_code == 400
+
+
+def test_pool_timeout_returns_503(viewer_client):
+    with patch(
+        "fitness.app.routers.lifts.get_lift_count", side_effect=PoolTimeout("busy")
+    ):
+        response = viewer_client.get("/lifts/count")
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
@@ -0,0 +1,30 @@
+"""Every JSON route should declare its response type.
+
+FastAPI serializes a declared response type straight to JSON bytes with
+pydantic-core. Without one, the return value goes through jsonable_encoder
+and json.dumps instead, which is several times slower on large list
+responses.
+"""
+
+import sys
+
+from fastapi.routing import APIRoute
+
+# Import the module (not the `app` attribute the package re-exports).
+import fitness.app.app  # noqa: F401
+
+app = sys.modules["fitness.app.app"].app
+
+# Routes that build their own Response, so there is nothing to serialize.
+RAW_RESPONSE_ROUTES = {"/health", "/cardio-activity-feed/export"}
+
+
+def test_json_routes_declare_response_type():
+    untyped = sorted(
+        route.path
+        for route in app.routes
+        if isinstance(route, APIRoute)
+        and route.response_field is None
+        and route.path not in RAW_RESPONSE_ROUTES
+    )
+    assert untyped == []
@@ -0,0 +1,149 @@
+"""Tests for sort_runs_generic across the run models it supports."""
+
+import sys
+from datetime import datetime
+
+import pytest
+
+from fitness.models import LocalizedRun
+from fitness.models.run_detail import RunDetail
+from tests._factories.run import RunFactory
+
+# Import the module (not the `app` attribute the package re-exports).
+import fitness.app.app  # noqa: F401
+
+sort_runs_generic = sys.modules["fitness.app.app"].sort_runs_generic
+
+
+def _runs():
+    factory = RunFactory()
+    runs = [
+        factory.make(
+            {
+                "id": "a",
+                "datetime_utc": datetime(2024, 1, 2, 3, 0),
+                "distance": 5.0,
+                "duration": 2400,
+                "avg_heart_rate": None,
+                "source": "Strava",
+                "type": "Outdoor Run",
+            }
+        ),
+        factory.make(
+            {
+                "id": "b",
+                "datetime_utc": datetime(2024, 1, 1, 12, 0),
+                "distance": 0.0,
+                "duration": 600,
+                "avg_heart_rate": 150.0,
+                "source": "MapMyFitness",
+                "type": "Treadmill Run",
+            }
+        ),
+        factory.make(
+            {
+                "id": "c",
+                "datetime_utc": datetime(2024, 1, 3, 8, 0),
+                "distance": 3.0,
+                "duration": 1500,
+                "avg_heart_rate": 140.0,
+                "source": "Apple Health",
+                "type": "Outdoor Run",
+            }
+        ),
+    ]
+    runs[0]._shoe_name = "Brooks Ghost"
+    runs[1]._shoe_name = None
+    runs[2]._shoe_name = "Asics Novablast"
+    return runs
+
+
+def _details(runs):
+    return [
+        RunDetail(
+            id=run.id,
+            datetime_utc=run.datetime_utc,
+            type=run.type,
+            distance=run.distance,
+            duration=run.duration,
+            source=run.source,
+            avg_heart_rate=run.avg_heart_rate,
+            shoes=run.shoe_name,
+        )
+        for run in runs
+    ]
+
+
+@pytest.mark.parametrize(
+    "sort_by, expected",
+    [
+        ("date", ["b", "a", "c"]),
+        ("distance", ["b", "c", "a"]),
+        ("duration", ["b", "c", "a"]),
+        # Zero-distance runs sort last by pace.
+        ("pace", ["a", "c", "b"]),
+        # Missing heart rate sorts first ascending.
+        ("heart_rate", ["a", "c", "b"]),
+        ("source", ["c", "b", "a"]),
+        ("type", ["a", "c", "b"]),
+        # Missing shoes sort first ascending.
+        ("shoes", ["b", "c", "a"]),
+    ],
+)
+@pytest.mark.parametrize("as_detail", [False, True])
+def test_sort_ascending(sort_by, expected, as_detail):
+    runs = _details(_runs()) if as_detail else _runs()
+    result = sort_runs_generic(runs, sort_by, "asc")
+    assert [r.id for r in result] == expected
+
+
+def test_sort_descending_reverses():
+    result = sort_runs_generic(_runs(), "distance", "desc")
+    assert [r.id for r in result] == ["a", "c", "b"]
+
+
+def test_sort_localized_runs_by_local_datetime():
+    localized = [LocalizedRun.from_run(run, "Asia/Tokyo") for run in _runs()]
+    # Give the runs local times in the opposite order to their UTC times, so
+    # the result shows which field was used.
+    localized = [
+        run.model_copy(update={"localized_datetime": datetime(2024, 2, 1, hour, 0)})
+        for run, hour in zip(localized, (9, 10, 8))
+    ]
+    result = sort_runs_generic(localized, "date", "asc")
+    assert [r.id for r in result] == ["c", "a", "b"]
+
+
+def test_sort_key_computed_once_per_run(monkeypatch):
+    calls = []
+    pace_key = sys.modules["fitness.app.app"]._pace_sort_key
+
+    def counting_key(run):
+        calls.append(run.id)
+        return pace_key(run)
+
+    monkeypatch.setitem(sys.modules["fitness.app.app"]._SORT_KEYS, "pace", counting_key)
+    runs = _details(_runs())
+    sort_runs_generic(runs, "pace", "asc")
+    assert sorted(calls) == sorted(r.id for r in runs)
+
+
+def test_sort_empty():
+    assert sort_runs_generic([], "date", "desc") == []
+
+
+@pytest.mark.parametrize("sort_order", ["asc", "desc"])
+@pytest.mark.parametrize("presorted", ["asc", "desc"])
+def test_presorted_date_sort_matches_full_sort(sort_order, presorted):
+    runs = sort_runs_generic(_runs(), "date", presorted)
+    result = sort_runs_generic(runs, "date", sort_order, presorted=presorted)
+    assert [r.id for r in result] == [
+        r.id for r in sort_runs_generic(_runs(), "date", sort_order)
+    ]
+    assert result is not runs
+
+
+def test_presorted_ignored_for_other_fields():
+    runs = sort_runs_generic(_runs(), "date", "asc")
+    result = sort_runs_generic(runs, "distance", "asc", presorted="asc")
+    assert [r.id for r in result] == ["b", "c", "a"]
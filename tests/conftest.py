@@ -47,6 +47,21 @@ def prevent_db_access_in_unit_tests(request, monkeypatch):
     yield
 
 
+@pytest.fixture(autouse=True)
+def clear_db_caches():
+    """Start every test without runs or lifts cached by an earlier one."""
+    from fitness.db.lifts import invalidate_all_lifts_cache
+    from fitness.db.runs import invalidate_all_runs_cache
+    from fitness.db.synced_lifts import invalidate_synced_lift_cache
+    from fitness.db.synced_run_workouts import invalidate_synced_run_workout_cache
+
+    invalidate_all_runs_cache()
+    invalidate_all_lifts_cache()
+    invalidate_synced_lift_cache()
+    invalidate_synced_run_workout_cache()
+    yield
+
+
 @pytest.fixture(scope="session")
 def run_factory() -> RunFactory:
     return RunFactory()
@@ -0,0 +1,77 @@
+"""Tests for the TTL cache shared by the database modules."""
+
+from unittest.mock import MagicMock, patch
+
+from fitness.db.cache import TTLCache
+
+
+def test_loads_once_per_key_including_none():
+    cache = TTLCache(10.0)
+    load = MagicMock(return_value=None)
+
+    assert cache.get_or_load("a", load) is None
+    assert cache.get_or_load("a", load) is None
+    cache.get_or_load("b", load)
+
+    assert load.call_count == 2
+
+
+@patch("fitness.db.cache.time.monotonic")
+def test_entries_expire_after_ttl(mock_monotonic):
+    cache = TTLCache(10.0)
+    load = MagicMock(return_value=[])
+
+    mock_monotonic.return_value = 1000.0
+    cache.get_or_load("a", load)
+    mock_monotonic.return_value = 1009.9
+    cache.get_or_load("a", load)
+    assert load.call_count == 1
+
+    mock_monotonic.return_value = 1010.0
+    cache.get_or_load("a", load)
+    assert load.call_count == 2
+
+
+def test_invalidate_drops_given_keys_or_everything():
+    cache = TTLCache(10.0)
+    load = MagicMock(return_value=1)
+    for key in ("a", "b", "c"):
+        cache.get_or_load(key, load)
+
+    cache.invalidate(["a"])
+    cache.get_or_load("a", load)
+    cache.get_or_load("b", load)
+    assert load.call_count == 4
+
+    cache.invalidate()
+    cache.get_or_load("b", load)
+    cache.get_or_load("c", load)
+    assert load.call_count == 6
+
+
+def test_load_racing_a_write_is_not_stored():
+    cache = TTLCache(10.0)
+
+    def load_then_write() -> str:
+        # A writer commits and invalidates while this read is in flight.
+        cache.invalidate(["a"])
+        return "stale"
+
+    assert cache.get_or_load("a", load_then_write) == "stale"
+    assert cache.get_or_load("a", lambda: "fresh") == "fresh"
+
+
+def test_cached_decorator_keys_on_arguments_and_copies_results():
+    cache = TTLCache(10.0)
+    query = MagicMock(side_effect=lambda *args, **kwargs: [args, kwargs])
+
+    @cache.cached
+    def read(x: int, *, y: int = 0) -> list:
+        return query(x, y=y)
+
+    first = read(1, y=2)
+    first.clear()
+    assert read(1, y=2) == [(1,), {"y": 2}]
+    read(2)
+
+    assert query.call_count == 2
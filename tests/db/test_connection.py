@@ -28,6 +28,24 @@ def test_init_pool_enables_connection_check(mock_pool_cls, _mock_url):
     assert kwargs.get("check") is connection.ConnectionPool.check_connection
 
 
+@patch("fitness.db.connection.get_database_url", return_value="postgresql://x/y")
+@patch("fitness.db.connection.ConnectionPool")
+def test_init_pool_bounds_checkout_wait_and_connection_age(mock_pool_cls, _mock_url):
+    from fitness.db import connection
+
+    connection._pool = None
+    try:
+        connection.init_pool()
+    finally:
+        connection._pool = None
+
+    _, kwargs = mock_pool_cls.call_args
+    assert kwargs["max_size"] == connection.POOL_MAX_SIZE
+    assert kwargs["timeout"] == connection.POOL_TIMEOUT_SECONDS
+    assert kwargs["max_idle"] == connection.POOL_MAX_IDLE_SECONDS
+    assert kwargs["max_lifetime"] == connection.POOL_MAX_LIFETIME_SECONDS
+
+
 @patch("fitness.db.connection.get_db_connection")
 def test_get_db_cursor_commits_on_success(mock_get_conn):
     from fitness.db.connection import get_db_cursor
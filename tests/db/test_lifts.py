@@ -0,0 +1,275 @@
+"""Tests for the ID readers, totals, and bulk writers in fitness.db.lifts."""
+
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from fitness.db.lifts import (
+    _dict_to_exercise,
+    _generic_exercise_to_dict,
+    bulk_create_lifts,
+    bulk_upsert_exercise_templates,
+    get_existing_exercise_template_ids,
+    get_existing_lift_ids,
+    get_all_lifts_with_sync,
+    get_frequent_exercise_counts,
+    get_lift_avg_rpe,
+    get_lift_totals,
+    get_lift_with_sync,
+    get_lifts_in_date_range_with_sync,
+    get_lifts_with_sync,
+    get_set_counts_by_muscle,
+    LiftTotals,
+)
+from tests._factories import ExerciseTemplateFactory, LiftFactory
+
+
+@pytest.fixture
+def mock_cursor():
+    with patch("fitness.db.lifts.get_db_cursor") as mock_get_cursor:
+        cursor = MagicMock()
+        mock_get_cursor.return_value.__enter__.return_value = cursor
+        yield cursor
+
+
+@pytest.mark.parametrize(
+    "read", [get_existing_lift_ids, get_existing_exercise_template_ids]
+)
+def test_without_prefix_returns_ids_as_stored(mock_cursor, read):
+    mock_cursor.fetchone.return_value = (["hevy_1", "mmf_2"],)
+
+    assert read() == {"hevy_1", "mmf_2"}
+    assert mock_cursor.execute.call_args.args[1] == ()
+
+
+@pytest.mark.parametrize(
+    "read", [get_existing_lift_ids, get_existing_exercise_template_ids]
+)
+def test_prefix_filters_and_strips(mock_cursor, read):
+    mock_cursor.fetchone.return_value = (["hevy_1", "hevy_hevy_2"],)
+
+    assert read(prefix="hevy_") == {"1", "hevy_2"}
+    # The "_" in the prefix must not act as a LIKE wildcard.
+    assert mock_cursor.execute.call_args.args[1] == ("hevy\\_%",)
+
+
+@pytest.mark.parametrize(
+    "read", [get_existing_lift_ids, get_existing_exercise_template_ids]
+)
+def test_among_checks_only_the_given_ids(mock_cursor, read):
+    mock_cursor.fetchone.return_value = (["hevy_2"],)
+
+    assert read(prefix="hevy_", among=["1", "2"]) == {"2"}
+    assert mock_cursor.execute.call_args.args[1] == (["hevy_1", "hevy_2"],)
+
+
+def test_no_matching_ids(mock_cursor):
+    mock_cursor.fetchone.return_value = (None,)
+
+    assert get_existing_lift_ids(prefix="hevy_", among=["1"]) == set()
+    query = mock_cursor.execute.call_args.args[0].as_string(None)
+    assert query.startswith("SELECT array_agg(id) FROM")
+
+
+def test_among_empty_skips_the_query(mock_cursor):
+    assert get_existing_lift_ids(prefix="hevy_", among=[]) == set()
+    mock_cursor.execute.assert_not_called()
+
+
+@patch("fitness.db.lifts.get_db_connection")
+def test_template_upsert_sends_one_batch(mock_get_conn):
+    """All rows go in one executemany call; the count is its rowcount."""
+    cursor = MagicMock()
+    cursor.rowcount = 2
+    conn = mock_get_conn.return_value.__enter__.return_value
+    conn.cursor.return_value.__enter__.return_value = cursor
+
+    items = [ExerciseTemplateFactory().make({"id": f"hevy_{i}"}) for i in range(3)]
+
+    assert bulk_upsert_exercise_templates(items) == 2
+    cursor.execute.assert_not_called()
+    cursor.executemany.assert_called_once()
+    rows = cursor.executemany.call_args.args[1]
+    assert [row[0] for row in rows] == ["hevy_0", "hevy_1", "hevy_2"]
+
+
+def test_lift_totals_converts_aggregate_row(mock_cursor):
+    # SUM over numeric columns comes back as Decimal.
+    mock_cursor.fetchone.return_value = (3, Decimal("7500.5"), 30, Decimal("16200"))
+
+    assert get_lift_totals(start_date=date(2024, 1, 1)) == LiftTotals(
+        sessions=3, volume_kg=7500.5, sets=30, duration_seconds=16200
+    )
+    assert mock_cursor.execute.call_args.args[1] == [date(2024, 1, 1)]
+
+
+@pytest.mark.parametrize("row, expected", [((None,), None), ((7.75,), 7.75)])
+def test_lift_avg_rpe(mock_cursor, row, expected):
+    mock_cursor.fetchone.return_value = row
+
+    assert get_lift_avg_rpe(end_date=date(2024, 2, 1)) == expected
+    assert mock_cursor.execute.call_args.args[1] == [date(2024, 2, 1)]
+
+
+def test_set_counts_by_muscle_grouped_in_sql(mock_cursor):
+    mock_cursor.fetchall.return_value = [("chest", 6), ("lats", 3)]
+
+    assert get_set_counts_by_muscle(start_date=date(2024, 1, 1)) == [
+        ("chest", 6),
+        ("lats", 3),
+    ]
+    query = mock_cursor.execute.call_args.args[0].as_string(None)
+    assert "GROUP BY t.primary_muscle_group" in query
+    assert mock_cursor.execute.call_args.args[1] == [date(2024, 1, 1)]
+
+
+def test_frequent_exercise_counts_pass_limit_last(mock_cursor):
+    mock_cursor.fetchall.return_value = [("Bench Press", 2)]
+
+    assert get_frequent_exercise_counts(end_date=date(2024, 2, 1), limit=3) == [
+        ("Bench Press", 2)
+    ]
+    assert mock_cursor.execute.call_args.args[1] == [date(2024, 2, 1), 3]
+
+
+def test_lift_summaries_page_in_sql(mock_cursor):
+    mock_cursor.fetchall.return_value = []
+
+    get_all_lifts_with_sync(limit=50, offset=100)
+
+    query = mock_cursor.execute.call_args.args[0].as_string(None)
+    assert "LIMIT %s OFFSET %s" in query
+    assert mock_cursor.execute.call_args.args[1] == [50, 100]
+
+
+def test_lift_summaries_seek_past_cursor(mock_cursor):
+    mock_cursor.fetchall.return_value = []
+    after = (datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc), "hevy_9")
+
+    get_lifts_in_date_range_with_sync(date(2024, 1, 1), limit=20, after=after)
+
+    query = mock_cursor.execute.call_args.args[0].as_string(None)
+    assert "(l.start_time, l.id) < (%s, %s)" in query
+    assert "ORDER BY l.start_time DESC, l.id DESC" in query
+    assert "OFFSET" not in query
+    assert mock_cursor.execute.call_args.args[1] == [date(2024, 1, 1), *after, 20]
+
+
+def test_lift_summaries_skip_exercises_json(mock_cursor):
+    start = datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc)
+    end = datetime(2024, 6, 1, 13, 0, tzinfo=timezone.utc)
+    mock_cursor.fetchall.return_value = [
+        ("hevy_1", "Push Day", start, end, 2500.0, 12, 4, "synced", end, "evt", None)
+    ]
+
+    [summary] = get_all_lifts_with_sync()
+
+    query = mock_cursor.execute.call_args.args[0].as_string(None)
+    assert "exercises" not in query.replace("exercise_count", "")
+    assert (summary.total_volume_kg, summary.total_sets, summary.exercise_count) == (
+        2500.0,
+        12,
+        4,
+    )
+    assert summary.is_synced
+
+
+@patch("fitness.db.lifts.get_db_connection")
+def test_bulk_create_lifts_copies_through_temp_table(mock_get_conn):
+    cursor = MagicMock(rowcount=2)
+    conn = mock_get_conn.return_value.__enter__.return_value
+    conn.cursor.return_value.__enter__.return_value = cursor
+    copy = cursor.copy.return_value.__enter__.return_value
+    lifts = [LiftFactory().make({"id": f"hevy_{i}"}) for i in range(3)]
+
+    # The count comes from the INSERT ... SELECT, which skips existing IDs.
+    assert bulk_create_lifts(lifts) == 2
+
+    conn.transaction.assert_called_once()
+    cursor.copy.assert_called_once()
+    assert [c.args[0][0] for c in copy.write_row.call_args_list] == [
+        "hevy_0",
+        "hevy_1",
+        "hevy_2",
+    ]
+    exercises_json = copy.write_row.call_args.args[0][6]
+    assert json.loads(exercises_json) == [
+        _generic_exercise_to_dict(e) for e in lifts[2].exercises
+    ]
+    assert ", " not in exercises_json
+    insert = cursor.execute.call_args.args[0].as_string(None)
+    assert "FROM tmp_lifts" in insert
+    assert "ON CONFLICT (id) DO NOTHING" in insert
+    cursor.executemany.assert_not_called()
+
+
+def test_exercise_dict_round_trips():
+    [exercise, *_] = LiftFactory().make().exercises
+
+    data = _generic_exercise_to_dict(exercise)
+
+    assert list(data) == [
+        "index",
+        "title",
+        "notes",
+        "exercise_template_id",
+        "superset_id",
+        "sets",
+    ]
+    assert list(data["sets"][0]) == [
+        "index",
+        "set_type",
+        "weight_kg",
+        "reps",
+        "distance_meters",
+        "duration_seconds",
+        "rpe",
+    ]
+    assert _dict_to_exercise(data) == exercise
+
+
+def test_lift_with_sync_splits_joined_row(mock_cursor):
+    lift = LiftFactory().make({"id": "hevy_1"})
+    lift_row = (
+        "hevy_1",
+        lift.title,
+        None,
+        lift.start_time,
+        lift.end_time,
+        [],
+        "Hevy",
+        None,
+    )
+    mock_cursor.fetchone.return_value = lift_row + (None,) * 9
+
+    found, synced = get_lift_with_sync("hevy_1")
+
+    assert found is not None and found.id == "hevy_1"
+    assert synced is None
+
+
+def test_lifts_with_sync_keyed_by_id(mock_cursor):
+    lift = LiftFactory().make({"id": "hevy_1"})
+    lift_row = (
+        "hevy_1",
+        lift.title,
+        None,
+        lift.start_time,
+        lift.end_time,
+        [],
+        "Hevy",
+        None,
+    )
+    mock_cursor.fetchall.return_value = [lift_row + (None,) * 9]
+
+    found = get_lifts_with_sync(["hevy_1", "hevy_2"])
+
+    assert list(found) == ["hevy_1"]
+    assert found["hevy_1"][1] is None
+    assert mock_cursor.execute.call_args.args[1] == (["hevy_1", "hevy_2"],)
+    mock_cursor.reset_mock()
+    assert get_lifts_with_sync([]) == {}
+    mock_cursor.execute.assert_not_called()
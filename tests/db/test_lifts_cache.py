@@ -0,0 +1,104 @@
+"""Tests for the in-memory cache in front of get_all_lifts and lift aggregates."""
+
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+from fitness.db import lifts as lifts_db
+from tests._factories import ExerciseTemplateFactory, LiftFactory
+
+
+@patch("fitness.db.lifts._query_all_lifts")
+def test_repeat_calls_hit_cache(mock_query):
+    mock_query.return_value = [LiftFactory().make()]
+
+    first = lifts_db.get_all_lifts()
+    second = lifts_db.get_all_lifts()
+
+    assert mock_query.call_count == 1
+    assert first == second
+    # Each caller gets its own list.
+    assert first is not second
+
+
+@patch("fitness.db.lifts._query_all_lifts", return_value=[])
+def test_cache_is_keyed_on_include_deleted(mock_query):
+    lifts_db.get_all_lifts()
+    lifts_db.get_all_lifts(include_deleted=True)
+
+    assert [c.args for c in mock_query.call_args_list] == [(False,), (True,)]
+
+
+@patch("fitness.db.lifts.get_db_connection")
+def test_bulk_create_invalidates_cache(mock_get_conn):
+    cursor = MagicMock(rowcount=1)
+    conn = mock_get_conn.return_value.__enter__.return_value
+    conn.cursor.return_value.__enter__.return_value = cursor
+    with patch("fitness.db.lifts._query_all_lifts", return_value=[]) as mock_query:
+        lifts_db.get_all_lifts()
+        assert lifts_db.bulk_create_lifts([LiftFactory().make()]) == 1
+        lifts_db.get_all_lifts()
+
+    assert mock_query.call_count == 2
+
+
+@patch("fitness.db.lifts.get_db_cursor")
+def test_aggregates_cached_per_arguments(mock_get_cursor):
+    cursor = mock_get_cursor.return_value.__enter__.return_value
+    cursor.fetchall.return_value = [("chest", 6)]
+
+    first = lifts_db.get_set_counts_by_muscle(date(2024, 1, 1))
+    first.clear()
+    assert lifts_db.get_set_counts_by_muscle(date(2024, 1, 1)) == [("chest", 6)]
+    lifts_db.get_set_counts_by_muscle(date(2024, 2, 1))
+
+    assert cursor.execute.call_count == 2
+
+
+@patch("fitness.db.lifts.get_db_connection")
+@patch("fitness.db.lifts.get_db_cursor")
+def test_date_range_reads_cached_until_bulk_create(mock_get_cursor, mock_get_conn):
+    cursor = mock_get_cursor.return_value.__enter__.return_value
+    cursor.fetchall.return_value = []
+    conn = mock_get_conn.return_value.__enter__.return_value
+    conn.cursor.return_value.__enter__.return_value = MagicMock(rowcount=1)
+
+    lifts_db.get_lifts_in_date_range(date(2024, 1, 1))
+    lifts_db.get_lifts_in_date_range(date(2024, 1, 1))
+    lifts_db.get_lifts_in_date_range(date(2024, 1, 1), date(2024, 2, 1))
+    assert cursor.execute.call_count == 2
+
+    lifts_db.bulk_create_lifts([LiftFactory().make()])
+    lifts_db.get_lifts_in_date_range(date(2024, 1, 1))
+    assert cursor.execute.call_count == 3
+
+
+@patch("fitness.db.lifts.get_db_connection")
+@patch("fitness.db.lifts.get_db_cursor")
+def test_template_upsert_invalidates_aggregates(mock_get_cursor, mock_get_conn):
+    cursor = mock_get_cursor.return_value.__enter__.return_value
+    cursor.fetchall.return_value = []
+    conn = mock_get_conn.return_value.__enter__.return_value
+    conn.cursor.return_value.__enter__.return_value = MagicMock(rowcount=1)
+
+    lifts_db.get_set_counts_by_muscle()
+    lifts_db.bulk_upsert_exercise_templates([ExerciseTemplateFactory().make()])
+    lifts_db.get_set_counts_by_muscle()
+
+    assert cursor.execute.call_count == 2
+
+
+@patch("fitness.db.lifts.get_db_connection")
+@patch("fitness.db.lifts.get_db_cursor")
+def test_templates_cached_until_upsert(mock_get_cursor, mock_get_conn):
+    cursor = mock_get_cursor.return_value.__enter__.return_value
+    cursor.fetchall.return_value = []
+    conn = mock_get_conn.return_value.__enter__.return_value
+    conn.cursor.return_value.__enter__.return_value = MagicMock(rowcount=1)
+
+    lifts_db.get_all_exercise_templates()
+    lifts_db.get_all_exercise_templates()
+    assert cursor.execute.call_count == 1
+
+    lifts_db.bulk_upsert_exercise_templates([ExerciseTemplateFactory().make()])
+    lifts_db.get_all_exercise_templates()
+    assert cursor.execute.call_count == 2
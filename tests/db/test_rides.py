@@ -8,7 +8,6 @@ import pytest
 from fitness.models import Ride
 from fitness.db.rides import (
     bulk_create_rides,
-    get_existing_ride_ids,
     get_rides_for_date_range,
 )
 
@@ -52,21 +51,18 @@ class TestBulkCreateRides:
         # No history table interaction (rides have no history table in v1)
         assert "rides_history" not in call_args[0][0]
 
+    @patch("fitness.db.rides.get_db_connection")
+    def test_a_full_sync_goes_in_one_batch(self, mock_get_conn, sample_ride):
+        mock_cursor = MagicMock(rowcount=300)
+        mock_conn = mock_get_conn.return_value.__enter__.return_value
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        rides = [
+            sample_ride.model_copy(update={"id": f"strava_{i}"}) for i in range(300)
+        ]
 
-class TestGetExistingRideIds:
-    @patch("fitness.db.rides.get_db_cursor")
-    def test_returns_all_ids_including_soft_deleted(self, mock_get_cursor):
-        mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = [("strava_1",), ("strava_2",)]
-        mock_get_cursor.return_value.__enter__.return_value = mock_cursor
-
-        result = get_existing_ride_ids()
-
-        assert result == {"strava_1", "strava_2"}
-        # Soft-deleted rides must appear here so re-imports skip them
-        # instead of attempting an insert that hits a PK conflict.
-        executed_sql = mock_cursor.execute.call_args[0][0]
-        assert "deleted_at" not in executed_sql
+        assert bulk_create_rides(rides) == 300
+        mock_cursor.executemany.assert_called_once()
+        assert len(mock_cursor.executemany.call_args[0][1]) == 300
 
 
 class TestGetRidesForDateRange:
@@ -0,0 +1,79 @@
+"""Tests for the RunDetail readers in fitness.db.runs."""
+
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from fitness.db.runs import (
+    get_all_run_details,
+    get_run_details_by_ids,
+    get_run_details_for_workout,
+    get_run_details_in_date_range,
+)
+
+
+def _detail_row(run_id: str, shoe_name: str | None) -> tuple:
+    return (
+        run_id,
+        datetime(2024, 6, 1, 14, 0, 0),
+        "Outdoor Run",
+        5.0,
+        1800.0,
+        "Strava",
+        150.0,
+        "shoe_1" if shoe_name else None,
+        None,  # deleted_at
+        shoe_name,
+        None,  # retirement_notes
+        None,  # sync_status
+        None,  # synced_at
+        None,  # google_event_id
+        None,  # synced run_version
+        None,  # error_message
+        1,  # version
+        None,  # run_workout_id
+        None,  # notes
+        None,  # duplicate_of_id
+        None,  # name
+    )
+
+
+@pytest.mark.parametrize(
+    "read",
+    [
+        lambda: get_all_run_details(),
+        lambda: get_run_details_in_date_range(date(2024, 6, 1), date(2024, 6, 30)),
+        lambda: get_run_details_by_ids(["run_1", "run_2"]),
+        lambda: get_run_details_for_workout("rw_1"),
+    ],
+)
+@patch("fitness.db.runs.get_db_cursor")
+def test_shoes_come_from_the_same_query(mock_get_cursor, read):
+    """Shoe names are joined in, not looked up per run."""
+    mock_cursor = MagicMock()
+    mock_cursor.fetchall.return_value = [
+        _detail_row("run_1", "Brooks Ghost"),
+        _detail_row("run_2", None),
+    ]
+    mock_get_cursor.return_value.__enter__.return_value = mock_cursor
+
+    details = read()
+
+    mock_cursor.execute.assert_called_once()
+    assert [d.shoes for d in details] == ["Brooks Ghost", None]
+
+
+@patch("fitness.db.runs.get_db_cursor")
+def test_by_ids_query_is_the_same_for_any_number_of_ids(mock_get_cursor):
+    """The IDs bind to one parameter, so psycopg can reuse a prepared statement."""
+    mock_cursor = MagicMock()
+    mock_cursor.fetchall.return_value = []
+    mock_get_cursor.return_value.__enter__.return_value = mock_cursor
+
+    get_run_details_by_ids(["run_1"])
+    get_run_details_by_ids(["run_1", "run_2", "run_3"])
+
+    first, second = mock_cursor.execute.call_args_list
+    assert first.args[0] is second.args[0]
+    assert second.args[1] == (["run_1", "run_2", "run_3"],)
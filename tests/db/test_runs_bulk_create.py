@@ -0,0 +1,36 @@
+"""Tests for bulk_create_runs batching and history writes."""
+
+from unittest.mock import MagicMock, patch
+
+from fitness.db.runs import bulk_create_runs
+
+
+@patch("fitness.db.runs.get_db_connection")
+def test_one_insert_per_chunk_and_history_for_inserted_only(mock_get_conn, run_factory):
+    cursor = MagicMock()
+    conn = mock_get_conn.return_value.__enter__.return_value
+    conn.cursor.return_value.__enter__.return_value = cursor
+    runs = [run_factory.make({"id": f"mmf_{i}"}) for i in range(5)]
+    # mmf_1 and mmf_3 already exist, so the database returns the rest.
+    cursor.fetchall.side_effect = [[("mmf_0",)], [("mmf_2",)], [("mmf_4",)]]
+
+    assert bulk_create_runs(runs, chunk_size=2) == 3
+
+    conn.transaction.assert_called_once()
+    assert cursor.execute.call_count == 3
+    history_ids = [
+        row[0] for c in cursor.executemany.call_args_list for row in c.args[1]
+    ]
+    assert history_ids == ["mmf_0", "mmf_2", "mmf_4"]
+
+
+@patch("fitness.db.runs.get_db_connection")
+def test_repeated_id_gets_one_history_row(mock_get_conn, run_factory):
+    cursor = MagicMock()
+    conn = mock_get_conn.return_value.__enter__.return_value
+    conn.cursor.return_value.__enter__.return_value = cursor
+    run = run_factory.make({"id": "mmf_1"})
+    cursor.fetchall.return_value = [("mmf_1",)]
+
+    assert bulk_create_runs([run, run]) == 1
+    assert len(cursor.executemany.call_args.args[1]) == 1
@@ -0,0 +1,42 @@
+"""Tests for get_runs_by_ids."""
+
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from fitness.db.runs import get_runs_by_ids
+
+
+def _run_row(run_id: str) -> tuple:
+    return (
+        run_id,
+        datetime(2024, 6, 1, 14, 0, 0),
+        "Outdoor Run",
+        5.0,
+        1800.0,
+        "Strava",
+        150.0,
+        None,  # shoe_id
+        None,  # deleted_at
+        None,  # shoe name
+        None,  # notes
+        None,  # name
+    )
+
+
+@patch("fitness.db.runs.get_db_cursor")
+def test_runs_fetched_in_one_query(mock_get_cursor):
+    mock_cursor = MagicMock()
+    mock_cursor.fetchall.return_value = [_run_row("run_1"), _run_row("run_2")]
+    mock_get_cursor.return_value.__enter__.return_value = mock_cursor
+
+    runs = get_runs_by_ids(["run_1", "run_2", "run_missing"])
+
+    assert [r.id for r in runs] == ["run_1", "run_2"]
+    mock_cursor.execute.assert_called_once()
+    assert mock_cursor.execute.call_args.args[1] == (["run_1", "run_2", "run_missing"],)
+
+
+@patch("fitness.db.runs.get_db_cursor")
+def test_no_ids_skips_the_query(mock_get_cursor):
+    assert get_runs_by_ids([]) == []
+    mock_get_cursor.assert_not_called()
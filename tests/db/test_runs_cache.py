@@ -0,0 +1,46 @@
+"""Tests for the in-memory cache in front of get_all_runs."""
+
+from unittest.mock import patch
+
+from fitness.db import runs as runs_db
+
+
+@patch("fitness.db.runs._query_all_runs")
+def test_repeat_calls_hit_cache(mock_query, run_factory):
+    mock_query.return_value = [run_factory.make()]
+
+    first = runs_db.get_all_runs()
+    second = runs_db.get_all_runs()
+
+    assert mock_query.call_count == 1
+    assert first == second
+    # Each caller gets its own list.
+    assert first is not second
+
+
+@patch("fitness.db.runs._query_all_runs", return_value=[])
+def test_cache_is_keyed_on_include_deleted(mock_query):
+    runs_db.get_all_runs()
+    runs_db.get_all_runs(include_deleted=True)
+
+    assert [c.args for c in mock_query.call_args_list] == [(False,), (True,)]
+
+
+@patch("fitness.db.runs._query_all_runs", return_value=[])
+def test_invalidate_forces_reload(mock_query):
+    runs_db.get_all_runs()
+    runs_db.invalidate_all_runs_cache()
+    runs_db.get_all_runs()
+
+    assert mock_query.call_count == 2
+
+
+@patch("fitness.db.runs.get_db_cursor")
+def test_writes_invalidate_cache(mock_get_cursor):
+    mock_get_cursor.return_value.__enter__.return_value.rowcount = 1
+    with patch("fitness.db.runs._query_all_runs", return_value=[]) as mock_query:
+        runs_db.get_all_runs()
+        assert runs_db.update_run_notes("run-1", "easy day") is True
+        runs_db.get_all_runs()
+
+    assert mock_query.call_count == 2
@@ -0,0 +1,26 @@
+"""Tests for the in-memory cache in front of get_synced_lift."""
+
+from unittest.mock import patch
+
+from fitness.db import synced_lifts as synced_lifts_db
+
+
+@patch("fitness.db.synced_lifts.get_db_cursor")
+@patch("fitness.db.synced_lifts._query_synced_lift", return_value=None)
+def test_writes_evict_the_lifts_they_touch(mock_query, mock_get_cursor):
+    cursor = mock_get_cursor.return_value.__enter__.return_value
+    cursor.rowcount = 1
+    synced_lifts_db.get_synced_lift("hevy_1")
+    synced_lifts_db.get_synced_lift("hevy_2")
+
+    synced_lifts_db.delete_synced_lift("hevy_1")
+    synced_lifts_db.bulk_upsert_synced_lifts([("hevy_2", "", "pending", None)])
+    synced_lifts_db.get_synced_lift("hevy_1")
+    synced_lifts_db.get_synced_lift("hevy_2")
+
+    assert [c.args for c in mock_query.call_args_list] == [
+        ("hevy_1",),
+        ("hevy_2",),
+        ("hevy_1",),
+        ("hevy_2",),
+    ]
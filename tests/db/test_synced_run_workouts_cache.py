@@ -0,0 +1,27 @@
+"""Tests for the in-memory cache in front of get_synced_run_workout."""
+
+from unittest.mock import patch
+
+from fitness.db import synced_run_workouts as synced_db
+
+
+@patch("fitness.db.synced_run_workouts.get_db_cursor")
+@patch("fitness.db.synced_run_workouts._query_synced_run_workout", return_value=None)
+def test_writes_evict_the_workouts_they_touch(mock_query, mock_get_cursor):
+    cursor = mock_get_cursor.return_value.__enter__.return_value
+    cursor.rowcount = 1
+    cursor.fetchall.return_value = []
+    synced_db.get_synced_run_workout("w1")
+    synced_db.get_synced_run_workout("w2")
+
+    synced_db.delete_synced_run_workout("w1")
+    synced_db.bulk_upsert_synced_run_workouts([("w2", "", "pending", None)])
+    synced_db.get_synced_run_workout("w1")
+    synced_db.get_synced_run_workout("w2")
+
+    assert [c.args for c in mock_query.call_args_list] == [
+        ("w1",),
+        ("w2",),
+        ("w1",),
+        ("w2",),
+    ]
@@ -41,6 +41,7 @@ def make_shoe(
 def assign_shoe_to_runs(shoe_id: str, run_ids: Iterable[str]) -> None:
     """Attribute already-inserted runs to a shoe (imports no longer do this)."""
     from fitness.db.connection import get_db_connection
+    from fitness.db.runs import invalidate_all_runs_cache
 
     with get_db_connection() as conn:
         with conn.cursor() as cur:
@@ -49,6 +50,7 @@ def assign_shoe_to_runs(shoe_id: str, run_ids: Iterable[str]) -> None:
                 (shoe_id, list(run_ids)),
             )
         conn.commit()
+    invalidate_all_runs_cache()
 
 
 # Shared test user data
@@ -1,13 +1,26 @@
 """Tests for Google Calendar client."""
 
+import json
+import threading
 from datetime import datetime, timezone
 from unittest.mock import Mock, patch
 import pytest
 import httpx
 
-from fitness.integrations.google.calendar_client import GoogleCalendarClient
+from fitness.integrations.google.calendar_client import (
+    BATCH_MAX_REQUESTS,
+    BATCH_URL,
+    GoogleCalendarClient,
+    RETRY_ATTEMPTS,
+    RETRY_MAX_TOTAL_DELAY_SECONDS,
+    close_calendar_client,
+    get_calendar_client,
+    reset_calendar_client,
+    run_calendar_call,
+)
 from fitness.models.run import Run
 from fitness.models.lift import Lift
+from fitness.models.run_workout import RunWorkout
 from fitness.db.oauth_credentials import OAuthCredentials
 
 
@@ -37,8 +50,8 @@ def mock_get_credentials():
     with patch(
         "fitness.integrations.google.calendar_client.get_credentials",
         return_value=mock_creds,
-    ):
-        yield
+    ) as mock:
+        yield mock
 
 
 class TestGoogleCalendarClientInit:
@@ -126,7 +139,7 @@ class TestGoogleCalendarClientTokenRefresh:
             }
 
             mock_client_instance = Mock()
-            mock_client.return_value.__enter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
             mock_client_instance.post.return_value = mock_response
 
             client = GoogleCalendarClient()
@@ -170,7 +183,7 @@ class TestGoogleCalendarClientTokenRefresh:
             mock_response.text = "Invalid refresh token"
 
             mock_client_instance = Mock()
-            mock_client.return_value.__enter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
             mock_client_instance.post.return_value = mock_response
 
             client = GoogleCalendarClient()
@@ -201,7 +214,7 @@ class TestGoogleCalendarClientTokenRefresh:
             }
 
             mock_client_instance = Mock()
-            mock_client.return_value.__enter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
             mock_client_instance.post.return_value = mock_response
 
             client = GoogleCalendarClient()
@@ -227,7 +240,7 @@ class TestGoogleCalendarClientTokenRefresh:
             "fitness.integrations.google.calendar_client.get_credentials",
             return_value=mock_creds,
         ):
-            mock_client.return_value.__enter__.side_effect = httpx.RequestError(
+            mock_client.return_value.post.side_effect = httpx.RequestError(
                 "Network error"
             )
 
@@ -253,7 +266,7 @@ class TestGoogleCalendarClientMakeRequest:
             mock_response.json.return_value = {"id": "event123"}
 
             mock_client_instance = Mock()
-            mock_client.return_value.__enter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
             mock_client_instance.request.return_value = mock_response
 
             client = GoogleCalendarClient()
@@ -298,7 +311,7 @@ class TestGoogleCalendarClientMakeRequest:
             }
 
             mock_client_instance = Mock()
-            mock_client.return_value.__enter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             # First call returns 401, second call for refresh returns 200, third call returns 200
             mock_client_instance.request.side_effect = [
@@ -336,7 +349,7 @@ class TestGoogleCalendarClientMakeRequest:
             mock_token_response.text = "Invalid refresh token"
 
             mock_client_instance = Mock()
-            mock_client.return_value.__enter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
             mock_client_instance.request.return_value = mock_401_response
             mock_client_instance.post.return_value = mock_token_response
 
@@ -346,6 +359,102 @@ class TestGoogleCalendarClientMakeRequest:
             assert response == mock_401_response  # Should return the original 401
 
 
+def _response(status_code: int, reason: str | None = None) -> httpx.Response:
+    body = {"error": {"errors": [{"reason": reason}]}} if reason else {}
+    return httpx.Response(status_code, json=body)
+
+
+class TestGoogleCalendarClientRetries:
+    """Test backoff on transient Calendar API errors."""
+
+    @pytest.mark.parametrize(
+        "first",
+        [
+            _response(503),
+            _response(429),
+            _response(403, "rateLimitExceeded"),
+            _response(403, "userRateLimitExceeded"),
+        ],
+    )
+    @patch("fitness.integrations.google.calendar_client.time.sleep")
+    @patch("httpx.Client")
+    def test_transient_error_retried(self, mock_client, mock_sleep, first):
+        ok = _response(200)
+        mock_client_instance = Mock()
+        mock_client.return_value = mock_client_instance
+        mock_client_instance.request.side_effect = [first, ok]
+
+        response = GoogleCalendarClient()._make_request("GET", "https://test.com/api")
+
+        assert response is ok
+        assert mock_client_instance.request.call_count == 2
+        mock_sleep.assert_called_once()
+
+    @patch("fitness.integrations.google.calendar_client.time.sleep")
+    @patch("httpx.Client")
+    def test_permission_error_not_retried(self, mock_client, mock_sleep):
+        forbidden = _response(403, "forbidden")
+        mock_client_instance = Mock()
+        mock_client.return_value = mock_client_instance
+        mock_client_instance.request.return_value = forbidden
+
+        response = GoogleCalendarClient()._make_request("GET", "https://test.com/api")
+
+        assert response is forbidden
+        mock_client_instance.request.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @patch("fitness.integrations.google.calendar_client.time.sleep")
+    @patch("httpx.Client")
+    def test_gives_up_after_max_attempts(self, mock_client, mock_sleep):
+        mock_client_instance = Mock()
+        mock_client.return_value = mock_client_instance
+        mock_client_instance.request.return_value = _response(500)
+
+        response = GoogleCalendarClient()._make_request("GET", "https://test.com/api")
+
+        assert response is not None and response.status_code == 500
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert mock_client_instance.request.call_count == len(delays) + 1
+        assert mock_client_instance.request.call_count <= RETRY_ATTEMPTS
+        # Exponential with up to 100% jitter, within the total budget.
+        assert 1 <= delays[0] <= 2
+        assert sum(delays) <= RETRY_MAX_TOTAL_DELAY_SECONDS + 1e-9
+
+    @pytest.mark.parametrize(
+        "first",
+        [_response(429), _response(403, "rateLimitExceeded")],
+    )
+    @patch("fitness.integrations.google.calendar_client.time.sleep")
+    @patch("httpx.Client")
+    def test_rate_limited_post_retried(self, mock_client, mock_sleep, first):
+        """A rate-limited insert was rejected outright, so resending is safe."""
+        ok = _response(200)
+        mock_client_instance = Mock()
+        mock_client.return_value = mock_client_instance
+        mock_client_instance.request.side_effect = [first, ok]
+
+        response = GoogleCalendarClient()._make_request("POST", "https://test.com/api")
+
+        assert response is ok
+        assert mock_client_instance.request.call_count == 2
+        mock_sleep.assert_called_once()
+
+    @patch("fitness.integrations.google.calendar_client.time.sleep")
+    @patch("httpx.Client")
+    def test_post_not_retried_on_server_error(self, mock_client, mock_sleep):
+        """Inserts aren't idempotent; a 5xx may still have created the event."""
+        mock_client_instance = Mock()
+        mock_client.return_value = mock_client_instance
+        mock_client_instance.request.return_value = _response(503)
+
+        response = GoogleCalendarClient()._make_request("POST", "https://test.com/api")
+
+        assert response is not None and response.status_code == 503
+        mock_client_instance.request.assert_called_once()
+        mock_sleep.assert_not_called()
+
+
 class TestGoogleCalendarClientCreateEvent:
     """Test event creation functionality."""
 
@@ -376,7 +485,7 @@ class TestGoogleCalendarClientCreateEvent:
             }
 
             mock_client_instance = Mock()
-            mock_client.return_value.__enter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
             mock_client_instance.request.return_value = mock_response
 
             with patch("os.getenv", return_value=None):
@@ -427,7 +536,7 @@ class TestGoogleCalendarClientCreateEvent:
             mock_response.json.return_value = {"id": "google_event_123"}
 
             mock_client_instance = Mock()
-            mock_client.return_value.__enter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
             mock_client_instance.request.return_value = mock_response
 
             client = GoogleCalendarClient()
@@ -465,7 +574,7 @@ class TestGoogleCalendarClientCreateEvent:
             mock_response.json.return_value = {"id": "google_event_123"}
 
             mock_client_instance = Mock()
-            mock_client.return_value.__enter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
             mock_client_instance.request.return_value = mock_response
 
             client = GoogleCalendarClient()
@@ -498,7 +607,7 @@ class TestGoogleCalendarClientCreateEvent:
             mock_response.json.return_value = {"id": "google_event_123"}
 
             mock_client_instance = Mock()
-            mock_client.return_value.__enter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
             mock_client_instance.request.return_value = mock_response
 
             client = GoogleCalendarClient()
@@ -530,7 +639,7 @@ class TestGoogleCalendarClientCreateEvent:
             mock_response.text = "Invalid event data"
 
             mock_client_instance = Mock()
-            mock_client.return_value.__enter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
             mock_client_instance.request.return_value = mock_response
 
             client = GoogleCalendarClient()
@@ -556,7 +665,7 @@ class TestGoogleCalendarClientCreateEvent:
             )
 
             mock_client_instance = Mock()
-            mock_client.return_value.__enter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
             mock_client_instance.request.return_value = None
 
             client = GoogleCalendarClient()
@@ -582,7 +691,7 @@ class TestGoogleCalendarClientDeleteEvent:
             )
 
             mock_client_instance = Mock()
-            mock_client.return_value.__enter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
             mock_client_instance.request.return_value = mock_response
 
             with patch("os.getenv", return_value=None):
@@ -615,7 +724,7 @@ class TestGoogleCalendarClientDeleteEvent:
             mock_response.text = "Event not found"
 
             mock_client_instance = Mock()
-            mock_client.return_value.__enter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
             mock_client_instance.request.return_value = mock_response
 
             client = GoogleCalendarClient()
@@ -647,7 +756,7 @@ class TestGoogleCalendarClientGetEvent:
             mock_response.json.return_value = expected_event
 
             mock_client_instance = Mock()
-            mock_client.return_value.__enter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
             mock_client_instance.request.return_value = mock_response
 
             client = GoogleCalendarClient()
@@ -668,7 +777,7 @@ class TestGoogleCalendarClientGetEvent:
             mock_response.text = "Event not found"
 
             mock_client_instance = Mock()
-            mock_client.return_value.__enter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
             mock_client_instance.request.return_value = mock_response
 
             client = GoogleCalendarClient()
@@ -714,7 +823,7 @@ class TestGoogleCalendarClientCreateLiftEvent:
             }
 
             mock_client_instance = Mock()
-            mock_client.return_value.__enter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
             mock_client_instance.request.return_value = mock_response
 
             with patch("os.getenv", return_value=None):
@@ -755,7 +864,7 @@ class TestGoogleCalendarClientCreateLiftEvent:
             mock_response.json.return_value = {"id": "google_event_456"}
 
             mock_client_instance = Mock()
-            mock_client.return_value.__enter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
             mock_client_instance.request.return_value = mock_response
 
             client = GoogleCalendarClient()
@@ -782,7 +891,7 @@ class TestGoogleCalendarClientCreateLiftEvent:
             mock_response.text = "Invalid event data"
 
             mock_client_instance = Mock()
-            mock_client.return_value.__enter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
             mock_client_instance.request.return_value = mock_response
 
             client = GoogleCalendarClient()
@@ -801,10 +910,241 @@ class TestGoogleCalendarClientCreateLiftEvent:
             lift = _make_test_lift()
 
             mock_client_instance = Mock()
-            mock_client.return_value.__enter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
             mock_client_instance.request.return_value = None
 
             client = GoogleCalendarClient()
             event_id = client.create_lift_event(lift)
 
             assert event_id is None
+
+
+def _batch_response(parts: list[tuple[int, int, dict]]) -> httpx.Response:
+    """Build a multipart batch response from (item index, status, body) parts."""
+    boundary = "batch_response_boundary"
+    body = "".join(
+        f"--{boundary}\r\n"
+        "Content-Type: application/http\r\n"
+        f"Content-ID: <response-item{index}>\r\n\r\n"
+        f"HTTP/1.1 {status_code} OK\r\n"
+        "Content-Type: application/json; charset=UTF-8\r\n\r\n"
+        f"{json.dumps(data)}\r\n"
+        for index, status_code, data in parts
+    )
+    return httpx.Response(
+        200,
+        content=f"{body}--{boundary}--\r\n".encode(),
+        headers={"Content-Type": f"multipart/mixed; boundary={boundary}"},
+    )
+
+
+class TestGoogleCalendarClientCreateLiftEvents:
+    """Test batched lift event creation."""
+
+    @patch("httpx.Client")
+    def test_batch_maps_event_ids_to_lifts(self, mock_client):
+        lifts = [
+            _make_test_lift().model_copy(update={"id": f"hevy_{i}"}) for i in range(3)
+        ]
+        mock_client_instance = Mock()
+        mock_client.return_value = mock_client_instance
+        # Parts may come back in any order; one of them failed.
+        mock_client_instance.request.return_value = _batch_response(
+            [
+                (2, 200, {"id": "evt_2"}),
+                (0, 200, {"id": "evt_0"}),
+                (1, 400, {"error": {"message": "Bad Request"}}),
+            ]
+        )
+
+        client = GoogleCalendarClient()
+        results = client.create_lift_events(lifts)
+
+        assert results == {"hevy_0": "evt_0", "hevy_1": None, "hevy_2": "evt_2"}
+        mock_client_instance.request.assert_called_once()
+        args, kwargs = mock_client_instance.request.call_args
+        assert args[:2] == ("POST", BATCH_URL)
+        assert kwargs["headers"]["Content-Type"].startswith("multipart/mixed")
+        assert kwargs["headers"]["Authorization"] == "Bearer test_access_token"
+        sent = kwargs["content"].decode()
+        path = f"POST /calendar/v3/calendars/{client.calendar_id}/events"
+        assert sent.count(path) == 3
+        assert "Lift ID: hevy_1" in sent
+
+    @patch("httpx.Client")
+    def test_batch_split_by_max_requests(self, mock_client):
+        lifts = [
+            _make_test_lift().model_copy(update={"id": f"hevy_{i}"})
+            for i in range(BATCH_MAX_REQUESTS + 1)
+        ]
+        mock_client_instance = Mock()
+        mock_client.return_value = mock_client_instance
+        mock_client_instance.request.side_effect = [
+            _batch_response([(i, 200, {"id": f"evt_{i}"}) for i in range(50)]),
+            _batch_response([(0, 200, {"id": "evt_last"})]),
+        ]
+
+        results = GoogleCalendarClient().create_lift_events(lifts)
+
+        assert mock_client_instance.request.call_count == 2
+        assert results[f"hevy_{BATCH_MAX_REQUESTS}"] == "evt_last"
+        assert all(results.values())
+
+    @patch("httpx.Client")
+    def test_error_in_later_batch_keeps_earlier_event_ids(self, mock_client):
+        lifts = [
+            _make_test_lift().model_copy(update={"id": f"hevy_{i}"})
+            for i in range(BATCH_MAX_REQUESTS + 1)
+        ]
+        mock_client_instance = Mock()
+        mock_client.return_value = mock_client_instance
+        client = GoogleCalendarClient()
+
+        with patch.object(
+            client,
+            "_create_events_batch",
+            side_effect=[
+                {f"hevy_{i}": f"evt_{i}" for i in range(BATCH_MAX_REQUESTS)},
+                RuntimeError("boom"),
+            ],
+        ):
+            results = client.create_lift_events(lifts)
+
+        assert results[f"hevy_{BATCH_MAX_REQUESTS}"] is None
+        assert results["hevy_0"] == "evt_0"
+        assert len(results) == BATCH_MAX_REQUESTS + 1
+
+    @patch("httpx.Client")
+    def test_batch_response_without_content_type_fails_every_lift(self, mock_client):
+        mock_client_instance = Mock()
+        mock_client.return_value = mock_client_instance
+        response = _batch_response([(0, 200, {"id": "evt_0"})])
+        del response.headers["content-type"]
+        mock_client_instance.request.return_value = response
+
+        results = GoogleCalendarClient().create_lift_events([_make_test_lift()])
+
+        assert results == {"hevy_workout_123": None}
+
+    @patch("httpx.Client")
+    def test_batch_request_failure_fails_every_lift(self, mock_client):
+        mock_client_instance = Mock()
+        mock_client.return_value = mock_client_instance
+        mock_client_instance.request.return_value = _response(400)
+
+        results = GoogleCalendarClient().create_lift_events([_make_test_lift()])
+
+        assert results == {"hevy_workout_123": None}
+
+
+class TestGoogleCalendarClientCreateRunWorkoutEvents:
+    """Test batched run workout event creation."""
+
+    @patch("httpx.Client")
+    def test_batch_maps_event_ids_to_workouts(self, mock_client):
+        now = datetime(2025, 8, 9, 14, 30, 0, tzinfo=timezone.utc)
+        runs = [
+            Run(
+                id=f"run_{i}",
+                datetime_utc=now,
+                type="Outdoor Run",
+                distance=1.0,
+                duration=420.0,
+                source="Strava",
+            )
+            for i in range(2)
+        ]
+        workouts = [
+            RunWorkout(id=f"rw_{i}", title="Repeats", created_at=now, updated_at=now)
+            for i in range(3)
+        ]
+        mock_client_instance = Mock()
+        mock_client.return_value = mock_client_instance
+        mock_client_instance.request.return_value = _batch_response(
+            [(0, 200, {"id": "evt_0"}), (1, 200, {"id": "evt_2"})]
+        )
+
+        results = GoogleCalendarClient().create_run_workout_events(
+            [(workouts[0], runs), (workouts[1], []), (workouts[2], runs)]
+        )
+
+        # The workout without runs is not sent.
+        assert results == {"rw_0": "evt_0", "rw_1": None, "rw_2": "evt_2"}
+        mock_client_instance.request.assert_called_once()
+        sent = mock_client_instance.request.call_args.kwargs["content"].decode()
+        assert "Workout ID: rw_2" in sent
+        assert "Workout ID: rw_1" not in sent
+
+
+class TestSharedCalendarClient:
+    """Test the process-wide client accessor."""
+
+    def test_client_built_once_until_reset(self, mock_get_credentials):
+        reset_calendar_client()
+        try:
+            first = get_calendar_client()
+            assert get_calendar_client() is first
+            assert mock_get_credentials.call_count == 1
+
+            reset_calendar_client()
+            assert get_calendar_client() is not first
+            assert mock_get_credentials.call_count == 2
+        finally:
+            reset_calendar_client()
+
+    def test_missing_credentials_not_cached(self, mock_get_credentials):
+        reset_calendar_client()
+        mock_get_credentials.return_value = None
+
+        with pytest.raises(ValueError):
+            get_calendar_client()
+        mock_get_credentials.return_value = create_mock_google_credentials()
+        try:
+            assert isinstance(get_calendar_client(), GoogleCalendarClient)
+        finally:
+            reset_calendar_client()
+
+    @patch("httpx.Client")
+    def test_reset_leaves_the_old_client_usable(
+        self, mock_client, mock_get_credentials
+    ):
+        reset_calendar_client()
+        old_client = get_calendar_client()
+
+        # Another thread may still be mid-call on the old client.
+        reset_calendar_client()
+
+        assert get_calendar_client() is not old_client
+        mock_client.return_value.close.assert_not_called()
+        reset_calendar_client()
+
+    @patch("httpx.Client")
+    def test_close_closes_the_connection_pool(self, mock_client, mock_get_credentials):
+        reset_calendar_client()
+        get_calendar_client()
+
+        close_calendar_client()
+
+        mock_client.return_value.close.assert_called_once()
+
+    @patch("httpx.Client")
+    def test_requests_share_one_connection_pool(self, mock_client):
+        mock_client.return_value.request.return_value = _response(200)
+        client = GoogleCalendarClient()
+
+        client._make_request("GET", "https://test.com/a")
+        client._make_request("GET", "https://test.com/b")
+
+        mock_client.assert_called_once()
+        assert mock_client.return_value.request.call_count == 2
+
+
+class TestRunCalendarCall:
+    @pytest.mark.asyncio
+    async def test_runs_on_the_calendar_executor(self):
+        def whoami(prefix: str, *, suffix: str) -> str:
+            return prefix + threading.current_thread().name + suffix
+
+        result = await run_calendar_call(whoami, "<", suffix=">")
+
+        assert result.startswith("<gcal") and result.endswith(">")
@@ -0,0 +1,37 @@
+from unittest.mock import MagicMock, patch
+
+from fitness.integrations.hevy import HevyClient
+from fitness.integrations.hevy.client import _http_client, close_http_client
+
+
+def test_requests_share_one_connection_pool():
+    """Separate HevyClients and calls reuse the same httpx.Client."""
+    response = MagicMock(status_code=200)
+    response.json.return_value = {"workout_count": 3}
+    with patch.object(_http_client(), "request", return_value=response) as request:
+        assert HevyClient(api_key="a").get_workout_count() == 3
+        assert HevyClient(api_key="b").get_workout_count() == 3
+
+    assert request.call_count == 2
+    assert [c.kwargs["headers"]["api-key"] for c in request.call_args_list] == [
+        "a",
+        "b",
+    ]
+
+
+def test_rate_limited_request_returns_none():
+    with patch.object(
+        _http_client(), "request", return_value=MagicMock(status_code=429)
+    ):
+        assert HevyClient(api_key="a").get_exercise_template_by_id("bp_001") is None
+
+
+def test_close_http_client_closes_the_shared_pool():
+    client = _http_client()
+
+    close_http_client()
+
+    assert client.is_closed
+    assert _http_client() is not client
+    close_http_client()
+    close_http_client()  # No pool open: nothing to do.
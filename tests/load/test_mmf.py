@@ -51,3 +51,21 @@ def test_mmf_run_shoes(mmf_file_obj: BytesIO):
     runs = load_mmf_data_from_file(mmf_file_obj)
     assert runs[0].shoes() == "Karhu Fusion 3.5"
     assert runs[2].shoes() is None
+
+
+def test_load_mmf_leaves_file_open(mmf_file_obj: BytesIO):
+    """The caller's file is read in place and can be read again afterwards."""
+    load_mmf_data_from_file(mmf_file_obj)
+    assert not mmf_file_obj.closed
+    assert len(load_mmf_data_from_file(mmf_file_obj)) == 4
+
+
+def test_load_mmf_quoted_newline():
+    """A newline inside a quoted field stays part of that field."""
+    header, first_row = FAKE_MMF_DATA.splitlines()[:2]
+    row = first_row.replace(
+        "Shoes: Karhu Fusion 3.5", '"Felt good\nShoes: Karhu Fusion 3.5"'
+    )
+    records = load_mmf_data_from_file(BytesIO(f"{header}\n{row}".encode()))
+    assert len(records) == 1
+    assert records[0].notes == "Felt good\nShoes: Karhu Fusion 3.5"
@@ -5,7 +5,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from fitness.integrations.strava.models import StravaActivity, StravaAthlete, StravaGear
-from fitness.load.strava import load_strava_runs
+from fitness.load.strava import load_strava_activities, load_strava_runs
 
 
 @pytest.fixture()
@@ -112,3 +112,23 @@ def test_strava_load(make_sample_strava_activity, make_sample_strava_gear, monke
     assert runs[1].gear.nickname == "Nike Shoes"
 
     mock_client.get_gear.assert_called_once_with({"1", "2"})
+
+
+def test_strava_activities_listed_once(
+    make_sample_strava_activity, make_sample_strava_gear
+):
+    mock_client = MagicMock()
+    run = make_sample_strava_activity()
+    run.gear_id = "1"
+    ride = make_sample_strava_activity()
+    ride.type = "Ride"
+    mock_client.get_activities.return_value = [run, ride]
+    gear = make_sample_strava_gear()
+    gear.id = "1"
+    mock_client.get_gear.return_value = [gear]
+
+    runs, rides = load_strava_activities(mock_client)
+
+    assert [r.id for r in runs] == [run.id]
+    assert rides == [ride]
+    mock_client.get_activities.assert_called_once_with(after=None)
@@ -5,11 +5,15 @@ from zoneinfo import ZoneInfoNotFoundError
 import pytest
 
 from fitness.utils.timezone import (
+    LocalActivity,
     convert_runs_to_user_timezone,
     filter_runs_by_local_date_range,
+    localize_activities,
+    utc_day_bounds,
 )
 from fitness.models import LocalizedRun
 from tests._factories.run import RunFactory
+from tests._factories.ride import RideFactory
 
 
 def make_run(**kwargs):
@@ -45,6 +49,51 @@ class TestConvertRunsToUserTimezone:
         assert result[0].datetime_utc == runs[0].datetime_utc
 
 
+class TestLocalizeActivities:
+    """Test reducing runs and rides to LocalActivity tuples."""
+
+    def test_no_timezone_uses_utc_dates(self):
+        """Test that None timezone keys activities by their UTC date."""
+        runs = [make_run(datetime_utc=datetime(2025, 1, 15, 1, 0, 0))]
+        result = localize_activities(runs, user_timezone=None)
+
+        assert result == [
+            LocalActivity(
+                local_date=date(2025, 1, 15),
+                distance=runs[0].distance,
+                duration=runs[0].duration,
+                avg_heart_rate=runs[0].avg_heart_rate,
+            )
+        ]
+
+    def test_matches_localized_run_dates(self):
+        """Test that local dates agree with LocalizedRun.from_run."""
+        runs = [
+            make_run(datetime_utc=datetime(2025, 1, 15, 1, 0, 0)),
+            make_run(datetime_utc=datetime(2025, 7, 1, 4, 30, 0)),
+            make_run(datetime_utc=datetime(2025, 3, 9, 7, 59, 0)),
+        ]
+        result = localize_activities(runs, user_timezone="America/Chicago")
+
+        assert [a.local_date for a in result] == [
+            LocalizedRun.from_run(run, "America/Chicago").local_date for run in runs
+        ]
+
+    def test_mixed_runs_and_rides_preserve_order(self):
+        """Test that runs and rides are both accepted and order is preserved."""
+        ride = RideFactory().make({"distance": 20.0})
+        run = make_run(distance=3.0)
+        result = localize_activities([ride, run], user_timezone="Asia/Tokyo")
+
+        assert [a.distance for a in result] == [20.0, 3.0]
+
+    def test_invalid_timezone_raises_error(self):
+        """Test that invalid timezone raises appropriate error."""
+        runs = [make_run(datetime_utc=datetime(2025, 1, 15, 12, 0, 0))]
+        with pytest.raises(ZoneInfoNotFoundError):
+            localize_activities(runs, "Invalid/Timezone")
+
+
 class TestFilterRunsByLocalDateRange:
     """Test filtering runs by local date range."""
 
@@ -106,6 +155,49 @@ class TestFilterRunsByLocalDateRange:
         assert result[0].datetime_utc.date() == date(2025, 1, 15)
         assert result[1].datetime_utc.date() == date(2025, 1, 16)
 
+    def test_presorted_matches_linear_scan(self):
+        """Test that the binary-search path returns the same runs as the scan."""
+        runs = [
+            make_run(id=f"run_{day}", datetime_utc=datetime(2025, 1, day, 6, 0, 0))
+            for day in (10, 14, 15, 15, 16, 20)
+        ]
+        for start, end in [
+            (date(2025, 1, 15), date(2025, 1, 15)),
+            (date(2025, 1, 11), date(2025, 1, 16)),
+            (date(2025, 1, 1), date(2025, 1, 9)),
+            (date.min, date.max),
+        ]:
+            expected = filter_runs_by_local_date_range(runs, start, end)
+            result = filter_runs_by_local_date_range(runs, start, end, presorted=True)
+            assert [r.id for r in result] == [r.id for r in expected]
+
+    @pytest.mark.parametrize(
+        "user_timezone",
+        ["America/Chicago", "Pacific/Honolulu", "Asia/Tokyo", "Pacific/Kiritimati"],
+    )
+    def test_presorted_matches_linear_scan_with_timezone(self, user_timezone):
+        """Test the binary-search path against localizing every run."""
+        runs = [
+            make_run(
+                id=f"run_{day}_{hour}",
+                datetime_utc=datetime(2025, 3, day, hour, 30, 0),
+            )
+            for day in range(5, 15)
+            for hour in (0, 5, 11, 18, 23)
+        ]
+        for start, end in [
+            (date(2025, 3, 8), date(2025, 3, 8)),
+            (date(2025, 3, 9), date(2025, 3, 12)),
+            (date(2025, 3, 1), date(2025, 3, 5)),
+            (date(2025, 3, 14), date.max),
+            (date.min, date(2025, 3, 7)),
+        ]:
+            expected = filter_runs_by_local_date_range(runs, start, end, user_timezone)
+            result = filter_runs_by_local_date_range(
+                runs, start, end, user_timezone, presorted=True
+            )
+            assert [r.id for r in result] == [r.id for r in expected]
+
 
 class TestTimezoneEdgeCases:
     """Test edge cases for timezone conversion."""
@@ -263,3 +355,19 @@ class TestDatetimeBasedTimezoneConversion:
         # In Tokyo (UTC+9), this should be 11 AM on January 1st, 2025
         tokyo_date = LocalizedRun.from_run(dummy_run, "Asia/Tokyo").local_date
         assert tokyo_date == date(2025, 1, 1)
+
+
+class TestUtcDayBounds:
+    """Test the half-open UTC datetime bounds used by date-range queries."""
+
+    def test_bounds_cover_whole_days(self):
+        assert utc_day_bounds(date(2025, 1, 1), date(2025, 1, 31)) == (
+            datetime(2025, 1, 1),
+            datetime(2025, 2, 1),
+        )
+
+    def test_open_ended_range(self):
+        assert utc_day_bounds(date.min, date.max) == (
+            datetime.combine(date.min, datetime.min.time()),
+            datetime.max,
+        )